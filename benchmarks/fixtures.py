@@ -0,0 +1,275 @@
+"""
+벤치마크용 합성 입력 파일 생성
+
+같은 버전(FIXTURE_VERSION)이면 항상 같은 내용의 파일을 만듭니다 (난수는 이름별 고정 시드).
+사용자 파일 없이 크기/형식/페이지 수가 다양한 입력을 재현하기 위한 것입니다.
+
+- 이미지: 1/4/12MP, RGB(JPEG·WebP, EXIF 포함) / RGBA / L / P(팔레트) PNG
+- PDF: 텍스트 / 사진 삽입 / 스캔(페이지 전체 래스터) 문서, 페이지 수별
+- 영상: ffmpeg lavfi로 만든 짧은 MOV(재인코딩 필요 / remux 가능) · MP4 클립
+- 문서: python-docx로 만든 DOCX, LibreOffice로 변환한 XLSX/PPTX
+
+ffmpeg / soffice가 없으면 해당 입력은 FixtureUnavailable로 건너뜁니다.
+
+실행 (저장소 루트에서, 입력만 미리 생성):
+    python -m benchmarks.fixtures --dir /tmp/filepick-bench-fixtures
+"""
+
+import os
+import io
+import shutil
+import zlib
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+from PIL import Image
+
+# 생성 방식이 바뀌면 올려서 이전 입력을 다시 만들도록 함
+FIXTURE_VERSION = 1
+
+DEFAULT_DIR = os.path.join(tempfile.gettempdir(), 'filepick-bench-fixtures')
+
+# 메가픽셀별 이미지 크기 (4:3)
+IMAGE_SIZES = {1: (1152, 864), 4: (2304, 1728), 12: (4000, 3000)}
+
+# 스캔 문서 페이지 크기 (A4, 200dpi)
+SCAN_PAGE_SIZE = (1654, 2339)
+
+
+class FixtureUnavailable(Exception):
+    """입력 생성에 필요한 외부 도구(ffmpeg, soffice)가 없는 경우"""
+
+
+def _rng(name: str):
+    return np.random.default_rng(zlib.crc32(name.encode()))
+
+
+def synthetic_photo(name: str, size: tuple, mode: str = 'RGB') -> Image.Image:
+    """그라데이션 + 잡음으로 사진과 비슷한 압축 특성을 가진 이미지를 만듭니다."""
+    width, height = size
+    rng = _rng(name)
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    channels = []
+    for i in range(3):
+        fx, fy = rng.uniform(1, 6, 2)
+        base = 127 + 90 * np.sin(x / width * fx * np.pi + i) * np.cos(y / height * fy * np.pi)
+        channels.append(base + rng.standard_normal((height, width), dtype=np.float32) * 12)
+    pixels = np.clip(np.stack(channels, axis=-1), 0, 255).astype(np.uint8)
+    img = Image.fromarray(pixels)
+
+    if mode == 'RGBA':
+        alpha = np.clip(255 * (x / width), 0, 255).astype(np.uint8)
+        img.putalpha(Image.fromarray(alpha))
+    elif mode == 'L':
+        img = img.convert('L')
+    elif mode == 'P':
+        img = img.quantize(colors=64)
+    return img
+
+
+def _photo_exif() -> bytes:
+    exif = Image.Exif()
+    exif[0x010F] = 'FilePick'           # Make
+    exif[0x0110] = 'Benchmark Camera'   # Model
+    exif[0x0132] = '2025:01:01 12:00:00'
+    exif[0x010E] = 'x' * 2048          # ImageDescription (메타데이터 제거 대상)
+    return exif.tobytes()
+
+
+def make_image(path: str, megapixels: int, mode: str, fmt: str):
+    img = synthetic_photo(os.path.basename(path), IMAGE_SIZES[megapixels], mode)
+    if fmt == 'JPEG':
+        img.save(path, 'JPEG', quality=92, exif=_photo_exif())
+    elif fmt == 'WEBP':
+        img.save(path, 'WEBP', quality=90)
+    else:
+        img.save(path, 'PNG')
+
+
+def make_text_pdf(path: str, pages: int):
+    import fitz
+    rng = _rng(os.path.basename(path))
+    words = ['filepick', 'benchmark', 'document', 'convert', 'storage', 'latency', 'page', 'image',
+             'compress', 'merge', 'split', 'rotate', 'encrypt', 'metadata', 'stream', 'worker']
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        lines = [f"Page {number + 1}"] + [
+            ' '.join(rng.choice(words, 12)) for _ in range(45)
+        ]
+        page.insert_text((50, 60), '\n'.join(lines), fontsize=10)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def make_image_pdf(path: str, pages: int):
+    """페이지마다 1MP 사진(JPEG)과 캡션이 들어간 PDF"""
+    import fitz
+    doc = fitz.open()
+    for number in range(pages):
+        buffer = io.BytesIO()
+        synthetic_photo(f"{os.path.basename(path)}-{number}", IMAGE_SIZES[1]).save(buffer, 'JPEG', quality=85)
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(50, 80, 545, 451), stream=buffer.getvalue())
+        page.insert_text((50, 60), f"Figure {number + 1}", fontsize=14)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def make_scanned_pdf(path: str, pages: int):
+    """텍스트 레이어 없이 페이지 전체가 회색조 래스터인 스캔 문서"""
+    import fitz
+    doc = fitz.open()
+    width, height = SCAN_PAGE_SIZE
+    for number in range(pages):
+        rng = _rng(f"{os.path.basename(path)}-{number}")
+        pixels = np.full((height, width), 235, dtype=np.uint8)
+        # 글자 줄처럼 보이는 어두운 띠 + 스캔 잡음
+        for row in range(150, height - 150, 40):
+            length = int(rng.uniform(0.5, 0.9) * (width - 300))
+            pixels[row:row + 14, 150:150 + length] = rng.integers(20, 90, (14, length), dtype=np.uint8)
+        pixels = np.clip(pixels + rng.standard_normal(pixels.shape, dtype=np.float32) * 6, 0, 255).astype(np.uint8)
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, 'JPEG', quality=80)
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=buffer.getvalue())
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def _require(tool: str):
+    if shutil.which(tool) is None:
+        raise FixtureUnavailable(f"{tool}이(가) 설치되어 있지 않습니다.")
+
+
+def make_clip(path: str, duration: int, video_codec: list, audio_codec: list, size: str = '1280x720'):
+    _require('ffmpeg')
+    subprocess.run([
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', f'testsrc2=size={size}:rate=30',
+        '-f', 'lavfi', '-i', 'sine=frequency=440:sample_rate=48000',
+        '-t', str(duration),
+        *video_codec, *audio_codec,
+        '-fflags', '+bitexact', '-map_metadata', '-1',
+        path
+    ], check=True)
+
+
+def make_docx(path: str, sections: int):
+    from docx import Document
+    rng = _rng(os.path.basename(path))
+    document = Document()
+    for number in range(sections):
+        document.add_heading(f"Section {number + 1}", level=1)
+        for _ in range(6):
+            document.add_paragraph(' '.join(f"word{int(w)}" for w in rng.integers(0, 500, 80)))
+        table = document.add_table(rows=8, cols=5)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = str(int(rng.integers(0, 100000)))
+        document.add_page_break()
+    document.save(path)
+
+
+def _soffice_convert(source: str, target_ext: str, path: str):
+    _require('soffice')
+    outdir = os.path.dirname(path)
+    subprocess.run(['soffice', '--headless', '--convert-to', target_ext, '--outdir', outdir, source],
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=300)
+    os.replace(os.path.join(outdir, os.path.splitext(os.path.basename(source))[0] + '.' + target_ext), path)
+
+
+def make_xlsx(path: str, rows: int):
+    rng = _rng(os.path.basename(path))
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, 'sheet.csv')
+        with open(source, 'w') as f:
+            f.write('id,name,quantity,price,total\n')
+            for i in range(rows):
+                quantity, price = int(rng.integers(1, 100)), round(float(rng.uniform(1, 500)), 2)
+                f.write(f"{i},item{i},{quantity},{price},{round(quantity * price, 2)}\n")
+        _soffice_convert(source, 'xlsx', path)
+
+
+def make_pptx(path: str, slides: int):
+    """Flat ODP(XML 한 파일)로 슬라이드를 만든 뒤 LibreOffice로 PPTX 변환"""
+    pages = ''.join(
+        f'<draw:page draw:name="slide{i + 1}"><draw:frame svg:x="2cm" svg:y="2cm" svg:width="20cm" svg:height="3cm">'
+        f'<draw:text-box><text:p>Slide {i + 1}</text:p></draw:text-box></draw:frame>'
+        f'<draw:frame svg:x="2cm" svg:y="6cm" svg:width="20cm" svg:height="10cm"><draw:text-box>'
+        + ''.join(f'<text:p>Bullet {j + 1} of slide {i + 1}</text:p>' for j in range(8))
+        + '</draw:text-box></draw:frame></draw:page>'
+        for i in range(slides)
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<office:document xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+        'xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0" '
+        'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+        'xmlns:svg="urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0" '
+        'office:version="1.2" office:mimetype="application/vnd.oasis.opendocument.presentation">'
+        f'<office:body><office:presentation>{pages}</office:presentation></office:body></office:document>'
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, 'deck.fodp')
+        with open(source, 'w') as f:
+            f.write(document)
+        _soffice_convert(source, 'pptx', path)
+
+
+H264 = ['-c:v', 'libx264', '-preset', 'veryfast', '-pix_fmt', 'yuv420p']
+AAC = ['-c:a', 'aac', '-b:a', '128k']
+
+# 이름 → 생성 함수
+FIXTURES = {
+    **{f'photo_{mp}mp.jpg': (lambda p, mp=mp: make_image(p, mp, 'RGB', 'JPEG')) for mp in IMAGE_SIZES},
+    **{f'alpha_{mp}mp.png': (lambda p, mp=mp: make_image(p, mp, 'RGBA', 'PNG')) for mp in (1, 4)},
+    'gray_4mp.png': lambda p: make_image(p, 4, 'L', 'PNG'),
+    'palette_4mp.png': lambda p: make_image(p, 4, 'P', 'PNG'),
+    'photo_4mp.webp': lambda p: make_image(p, 4, 'RGB', 'WEBP'),
+
+    **{f'text_{n}p.pdf': (lambda p, n=n: make_text_pdf(p, n)) for n in (1, 20, 100)},
+    **{f'image_{n}p.pdf': (lambda p, n=n: make_image_pdf(p, n)) for n in (5, 20)},
+    **{f'scanned_{n}p.pdf': (lambda p, n=n: make_scanned_pdf(p, n)) for n in (5, 20)},
+
+    # mpeg2video + PCM: MP4로 담을 수 없어 재인코딩 / h264 + aac: remux
+    'clip_10s_mpeg2.mov': lambda p: make_clip(p, 10, ['-c:v', 'mpeg2video', '-q:v', '4'], ['-c:a', 'pcm_s16le']),
+    'clip_10s_h264.mov': lambda p: make_clip(p, 10, H264, AAC),
+    'clip_30s.mp4': lambda p: make_clip(p, 30, H264, AAC),
+
+    'report_2s.docx': lambda p: make_docx(p, 2),
+    'report_20s.docx': lambda p: make_docx(p, 20),
+    'sheet_2000r.xlsx': lambda p: make_xlsx(p, 2000),
+    'deck_10s.pptx': lambda p: make_pptx(p, 10),
+}
+
+
+def ensure_fixture(directory: str, name: str) -> str:
+    """입력 파일 경로를 반환합니다. 없거나 버전이 다르면 새로 생성합니다."""
+    version_dir = os.path.join(directory, f'v{FIXTURE_VERSION}')
+    os.makedirs(version_dir, exist_ok=True)
+    path = os.path.join(version_dir, name)
+    if not os.path.exists(path):
+        # 생성 도중 중단되어도 불완전한 파일이 남지 않도록 임시 이름으로 만든 뒤 이동
+        tmp_path = os.path.join(version_dir, f'.tmp-{name}')
+        FIXTURES[name](tmp_path)
+        os.replace(tmp_path, path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 입력 파일 생성")
+    parser.add_argument('--dir', default=DEFAULT_DIR, help='입력 파일 디렉터리')
+    args = parser.parse_args()
+
+    for name in FIXTURES:
+        try:
+            path = ensure_fixture(args.dir, name)
+            print(f"{name:<24}{os.path.getsize(path):>12,} bytes")
+        except FixtureUnavailable as e:
+            print(f"{name:<24}{'건너뜀':>12} ({e})")
+
+
+if __name__ == '__main__':
+    main()
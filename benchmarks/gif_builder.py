@@ -0,0 +1,91 @@
+"""
+GIF 생성 벤치마크
+
+Pillow 기본 저장(frames[0].save(save_all=True, append_images=...))과
+gif_chunks(공통 팔레트 + 프레임 스트리밍 + 변경 영역만 기록), encode_webp(애니메이션 WebP)의
+출력 크기와 wall-clock 시간을 비교합니다. 입력은 그라디언트 배경 위로 도형이 움직이는 합성 PNG 프레임입니다.
+
+실행 (저장소 루트에서):
+    python -m benchmarks.gif_builder --frames 60 --size 640x360
+"""
+
+import io
+import os
+import time
+import argparse
+from PIL import Image, ImageDraw
+
+
+def make_frames(count: int, size: tuple) -> list:
+    """그라디언트 배경 위로 원이 가로질러 움직이는 PNG 프레임(바이트)을 만듭니다."""
+    width, height = size
+    background = Image.merge('RGB', (
+        Image.linear_gradient('L').resize(size),
+        Image.radial_gradient('L').resize(size),
+        Image.linear_gradient('L').rotate(90).resize(size),
+    ))
+    radius = height // 6
+    frames = []
+    for i in range(count):
+        frame = background.copy()
+        x = int((width - 2 * radius) * i / max(count - 1, 1))
+        ImageDraw.Draw(frame).ellipse((x, height // 2 - radius, x + 2 * radius, height // 2 + radius),
+                                      fill=(255, 200, 40), outline=(20, 20, 20), width=3)
+        buffer = io.BytesIO()
+        frame.save(buffer, 'PNG')
+        frames.append(buffer.getvalue())
+    return frames
+
+
+def naive_gif(frames: list, size: tuple, duration: int) -> bytes:
+    """프레임을 모두 디코딩해 Pillow 기본 GIF 저장으로 기록합니다 (프레임마다 팔레트를 새로 계산)."""
+    images = [Image.open(io.BytesIO(data)).convert('RGB').resize(size, Image.Resampling.LANCZOS) for data in frames]
+    output = io.BytesIO()
+    images[0].save(output, 'GIF', save_all=True, append_images=images[1:], duration=duration, loop=0)
+    return output.getvalue()
+
+
+def timed(fn, *args) -> tuple:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def _setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'filepick.settings')
+    os.environ['STORAGE_BACKEND'] = 'memory'
+    import django
+    django.setup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pillow 기본 GIF 저장 vs 공통 팔레트 스트리밍 GIF / 애니메이션 WebP")
+    parser.add_argument('--frames', type=int, default=60, help='프레임 수')
+    parser.add_argument('--size', default='640x360', help='프레임 크기')
+    parser.add_argument('--fps', type=float, default=15, help='초당 프레임 수')
+    args = parser.parse_args()
+
+    _setup_django()
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from tools.image_tools.services.animation import gif_chunks, encode_webp, frame_duration
+
+    size = tuple(int(v) for v in args.size.split('x'))
+    duration = frame_duration(args.fps)
+    print(f"합성 입력 생성: {args.frames} 프레임 {args.size}")
+    frames = make_frames(args.frames, size)
+    uploads = [SimpleUploadedFile(f"frame{i:04d}.png", data, 'image/png') for i, data in enumerate(frames)]
+
+    results = [
+        ('pillow-gif', *timed(naive_gif, frames, size, duration)),
+        ('streamed-gif', *timed(lambda: b"".join(gif_chunks(uploads, size, duration)))),
+        ('webp', *timed(lambda: encode_webp(uploads, size, duration).getvalue())),
+    ]
+
+    baseline_size, baseline_time = len(results[0][1]), results[0][2]
+    print(f"{'mode':<14}{'bytes':>12}{'size':>8}{'seconds':>10}{'speedup':>9}")
+    for name, data, elapsed in results:
+        print(f"{name:<14}{len(data):>12}{len(data) / baseline_size:>7.2f}x{elapsed:>10.2f}{baseline_time / elapsed:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
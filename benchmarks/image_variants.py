@@ -0,0 +1,87 @@
+"""
+반응형 이미지 세트 벤치마크
+
+폭 × 형식마다 원본을 다시 디코딩해 리사이즈/인코딩하는 방식(resize를 N번 호출하는 것과 같음)과
+render_variants(한 번 디코딩 + 단계적 축소 + 병렬 인코딩)의 CPU 시간과 wall-clock 시간을 비교합니다.
+입력은 그라디언트와 노이즈로 합성한 JPEG입니다. 업로드는 포함하지 않습니다.
+
+실행 (저장소 루트에서):
+    python -m benchmarks.image_variants --size 4000x3000 --widths 320 640 1280 1920 --formats webp jpeg
+"""
+
+import io
+import os
+import time
+import argparse
+from PIL import Image
+
+
+def make_source(size: tuple) -> bytes:
+    """사진과 비슷하게 압축되도록 그라디언트에 노이즈를 섞은 JPEG를 만듭니다."""
+    gradient = Image.merge('RGB', (
+        Image.linear_gradient('L').resize(size),
+        Image.radial_gradient('L').resize(size),
+        Image.linear_gradient('L').rotate(90).resize(size),
+    ))
+    noise = Image.effect_noise(size, 40).convert('RGB')
+    output = io.BytesIO()
+    Image.blend(gradient, noise, 0.3).save(output, 'JPEG', quality=90)
+    return output.getvalue()
+
+
+def separate_calls(source: bytes, widths: list, formats: list) -> int:
+    """폭 × 형식마다 원본 디코딩 → 원본에서 바로 축소 → 인코딩 (요청을 따로 보낼 때와 같은 작업량)"""
+    from tools.image_tools.services.variants import encode_variant
+    total = 0
+    for width in widths:
+        for fmt in formats:
+            img = Image.open(io.BytesIO(source)).convert('RGB')
+            height = round(img.height * width / img.width)
+            total += len(encode_variant(img.resize((width, height), Image.Resampling.LANCZOS), fmt))
+    return total
+
+
+def single_decode(source: bytes, widths: list, formats: list) -> int:
+    from tools.image_tools.services.variants import render_variants
+    return sum(len(data) for _, data in render_variants(io.BytesIO(source), widths, formats))
+
+
+def measure(fn, *args) -> tuple:
+    # process_time은 프로세스의 모든 스레드 CPU 시간 합계
+    cpu, wall = time.process_time(), time.perf_counter()
+    total = fn(*args)
+    return total, time.process_time() - cpu, time.perf_counter() - wall
+
+
+def _setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'filepick.settings')
+    os.environ['STORAGE_BACKEND'] = 'memory'
+    import django
+    django.setup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="폭 × 형식별 개별 처리 vs 한 번 디코딩한 반응형 이미지 세트")
+    parser.add_argument('--size', default='4000x3000', help='합성 원본 크기')
+    parser.add_argument('--widths', type=int, nargs='+', default=[320, 640, 1280, 1920], help='출력 폭')
+    parser.add_argument('--formats', nargs='+', default=['webp', 'jpeg'], help='출력 형식')
+    args = parser.parse_args()
+
+    _setup_django()
+    size = tuple(int(v) for v in args.size.split('x'))
+    print(f"합성 입력 생성: {args.size}")
+    source = make_source(size)
+
+    results = [
+        ('separate', *measure(separate_calls, source, args.widths, args.formats)),
+        ('single-decode', *measure(single_decode, source, args.widths, args.formats)),
+    ]
+
+    baseline_cpu, baseline_wall = results[0][2], results[0][3]
+    print(f"{'mode':<15}{'bytes':>12}{'cpu s':>9}{'cpu':>8}{'wall s':>9}{'speedup':>9}")
+    for name, total, cpu, wall in results:
+        print(f"{name:<15}{total:>12}{cpu:>9.2f}{cpu / baseline_cpu:>7.2f}x{wall:>9.2f}{baseline_wall / wall:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+"""
+HTTP 부하 테스트
+
+로컬 Storage 대역 서버(benchmarks.storage_stub)를 띄우고 앱을 그 서버에 연결해 실행한 뒤,
+/api/image/*, /api/pdf/*, /api/convert/* 요청을 가중치에 따라 섞어 지정한 동시성으로 보냅니다.
+엔드포인트별 처리량, p50/p95/p99 지연, 오류율과 실행 중 서버 프로세스(자식 ffmpeg/soffice 포함)의
+RSS/CPU 사용량을 보고합니다. 워커 수 산정과 확장성 변경 검증에 사용합니다.
+
+입력 파일은 benchmarks.fixtures의 합성 입력을 사용합니다.
+
+실행 (저장소 루트에서):
+    python -m benchmarks.loadtest --concurrency 16 --duration 60
+    python -m benchmarks.loadtest --mix image=6 pdf=3 convert=1 --concurrency 32
+    python -m benchmarks.loadtest --server "gunicorn filepick.wsgi -w 4 -b {host}:{port}"
+    python -m benchmarks.loadtest --target http://127.0.0.1:8000 --server-pid 1234   # 이미 실행 중인 서버
+    python -m benchmarks.loadtest --direct   # 입력을 저장소에 직접 올리고 object_key로 호출
+
+--direct를 주면 요청마다 /api/uploads/direct/로 서명된 URL을 받아 Storage 대역 서버에 입력을 PUT한 뒤
+파일 대신 object_key로 도구를 호출합니다 (지연 시간은 세 단계를 합친 값).
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shlex
+import asyncio
+import argparse
+import threading
+import tempfile
+import subprocess
+import statistics
+import httpx
+from benchmarks.fixtures import DEFAULT_DIR, FixtureUnavailable, ensure_fixture
+from benchmarks.storage_stub import StorageStub, STUB_KEY
+
+DEFAULT_SERVER = f"{shlex.quote(sys.executable)} manage.py runserver --noreload {{host}}:{{port}}"
+
+# 서버 RSS/CPU 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.5
+
+
+class Scenario:
+    """요청 하나의 형태: 엔드포인트 + 입력 파일(필드 → 입력 이름 목록) + 폼 값 + 같은 그룹 안의 가중치"""
+
+    def __init__(self, group: str, path: str, files: dict, data: dict = None, weight: int = 1):
+        self.group = group
+        self.path = path
+        self.files = files
+        self.data = data or {}
+        self.weight = weight
+
+
+SCENARIOS = [
+    Scenario('image', '/api/image/resize/', {'images': ['photo_4mp.jpg']}, {'width': 1024, 'height': 768}, 3),
+    Scenario('image', '/api/image/compress/', {'images': ['photo_4mp.jpg']}, {'quality': 'medium'}, 4),
+    Scenario('image', '/api/image/compress/', {'images': ['photo_12mp.jpg']}, {'quality': 'high'}, 1),
+    Scenario('image', '/api/image/convert/', {'images': ['alpha_4mp.png']}, {'format': 'WEBP'}, 2),
+    Scenario('image', '/api/image/filter/', {'images': ['photo_1mp.jpg']}, {'filter': 'blur'}, 2),
+    Scenario('image', '/api/image/watermark/', {'images': ['photo_4mp.jpg']}, {'type': 'text', 'text': 'FilePick'}, 2),
+    Scenario('image', '/api/image/remove-exif/', {'images': ['photo_4mp.jpg']}, {}, 1),
+
+    Scenario('pdf', '/api/pdf/merge/', {'files': ['text_20p.pdf', 'image_5p.pdf']}, {}, 3),
+    Scenario('pdf', '/api/pdf/split/', {'files': ['text_100p.pdf']}, {'pages': '0,1,2,10,20'}, 2),
+    Scenario('pdf', '/api/pdf/compress/', {'files': ['image_20p.pdf']}, {'quality': 'medium'}, 2),
+    Scenario('pdf', '/api/pdf/rotate-delete/', {'files': ['text_20p.pdf']}, {'rotate': 90}, 1),
+    Scenario('pdf', '/api/pdf/extract-text/', {'file': ['text_100p.pdf']}, {}, 2),
+
+    Scenario('convert', '/api/convert/docx-to-pdf/', {'file': ['report_2s.docx']}, {}, 2),
+    Scenario('convert', '/api/convert/mov-to-mp4/', {'file': ['clip_10s_h264.mov']}, {}, 2),
+    Scenario('convert', '/api/convert/mp4-to-mp3/', {'file': ['clip_30s.mp4']}, {'format': 'mp3'}, 2),
+    Scenario('convert', '/api/convert/mov-to-mp4/', {'file': ['clip_10s_mpeg2.mov']}, {}, 1),
+]
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+
+    def record(self, latency: float, status):
+        self.latencies.append(latency)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status == 'exception' or status >= 400:
+            self.errors += 1
+
+
+class ProcessSampler:
+    """서버 프로세스와 모든 자손 프로세스의 RSS 합계/CPU 시간을 /proc에서 주기적으로 읽습니다 (Linux)."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._clock_ticks = os.sysconf('SC_CLK_TCK')
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+        # 종료된 자손이 쓴 CPU 시간도 포함하도록 프로세스별 마지막 값을 보관
+        self._cpu_by_pid = {}
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self) -> dict:
+        self._stop.set()
+        self._thread.join()
+        if len(self.samples) < 2:
+            return {}
+        (t0, _, cpu0), (t1, _, cpu1) = self.samples[0], self.samples[-1]
+        rss = [sample[1] for sample in self.samples]
+        return {
+            'rss_peak_mb': round(max(rss) / 1024 ** 2, 1),
+            'rss_mean_mb': round(statistics.mean(rss) / 1024 ** 2, 1),
+            'cpu_seconds': round(cpu1 - cpu0, 2),
+            'cpu_percent_mean': round((cpu1 - cpu0) / (t1 - t0) * 100, 1) if t1 > t0 else 0,
+        }
+
+    def _run(self):
+        while not self._stop.is_set():
+            rss, cpu = self._read_tree()
+            self.samples.append((time.monotonic(), rss, cpu))
+            self._stop.wait(SAMPLE_INTERVAL)
+
+    def _read_tree(self) -> tuple:
+        stats = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    fields = f.read().rsplit(')', 1)[1].split()
+                # fields[1]=ppid, [11]=utime, [12]=stime, [21]=rss(페이지)
+                stats[int(entry)] = (int(fields[1]), int(fields[11]) + int(fields[12]), int(fields[21]))
+            except (OSError, IndexError, ValueError):
+                continue
+
+        tree, frontier = set(), [self.pid]
+        while frontier:
+            pid = frontier.pop()
+            if pid in tree or pid not in stats:
+                continue
+            tree.add(pid)
+            frontier.extend(child for child, (ppid, _, _) in stats.items() if ppid == pid)
+
+        rss = 0
+        for pid in tree:
+            _, ticks, pages = stats[pid]
+            self._cpu_by_pid[pid] = max(self._cpu_by_pid.get(pid, 0), ticks)
+            rss += pages * self._page_size
+        return rss, sum(self._cpu_by_pid.values()) / self._clock_ticks
+
+
+def load_payloads(scenarios: list, fixtures_dir: str) -> dict:
+    """시나리오별 입력 파일을 미리 메모리에 읽어 둡니다 (부하 생성 측 디스크 I/O 제외)."""
+    payloads = {}
+    for scenario in scenarios:
+        files = []
+        for field, names in scenario.files.items():
+            for name in names:
+                with open(ensure_fixture(fixtures_dir, name), 'rb') as f:
+                    files.append((field, (name, f.read())))
+        payloads[id(scenario)] = files
+    return payloads
+
+
+def parse_mix(values: list) -> dict:
+    mix = {}
+    for value in values or []:
+        group, _, weight = value.partition('=')
+        mix[group] = float(weight or 1)
+    return mix or {'image': 5, 'pdf': 3, 'convert': 1}
+
+
+def weighted_scenarios(scenarios: list, mix: dict) -> tuple:
+    """그룹 가중치(mix)와 그룹 안의 시나리오 가중치를 곱해 선택 확률을 만듭니다."""
+    chosen, weights = [], []
+    for group, group_weight in mix.items():
+        members = [s for s in scenarios if s.group == group]
+        total = sum(s.weight for s in members)
+        for scenario in members:
+            chosen.append(scenario)
+            weights.append(group_weight * scenario.weight / total)
+    return chosen, weights
+
+
+async def direct_upload(client, files: list) -> str:
+    """입력 파일을 서명된 업로드 URL로 저장소에 직접 올리고 object_key 목록(쉼표 구분)을 반환합니다."""
+    keys = []
+    for _, (name, content) in files:
+        response = await client.post('/api/uploads/direct/', json={'filename': name, 'size': len(content)})
+        response.raise_for_status()
+        upload = response.json()
+        response = await client.put(upload['upload_url'], content=content, headers=upload['headers'])
+        response.raise_for_status()
+        keys.append(upload['object_key'])
+    return ','.join(keys)
+
+
+async def run_load(base_url: str, scenarios: list, weights: list, payloads: dict, concurrency: int,
+                   duration: float, requests: int, timeout: float, seed: int, direct: bool = False) -> tuple:
+    stats = {}
+    rng = random.Random(seed)
+    deadline = time.monotonic() + duration
+    issued = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def worker():
+            nonlocal issued
+            while time.monotonic() < deadline and (not requests or issued < requests):
+                issued += 1
+                scenario = rng.choices(scenarios, weights)[0]
+                started = time.perf_counter()
+                try:
+                    if direct:
+                        data = dict(scenario.data, object_key=await direct_upload(client, payloads[id(scenario)]))
+                        response = await client.post(scenario.path, data=data)
+                    else:
+                        response = await client.post(scenario.path, data=scenario.data, files=payloads[id(scenario)])
+                    status = response.status_code
+                except httpx.HTTPError:
+                    status = 'exception'
+                stats.setdefault(scenario.path, EndpointStats()).record(time.perf_counter() - started, status)
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+    return stats, elapsed
+
+
+def wait_until_ready(base_url: str, process, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"서버가 시작 중 종료되었습니다 (exit {process.returncode}).")
+        try:
+            httpx.get(base_url + '/', timeout=2)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    raise RuntimeError("서버 시작 대기 시간이 초과되었습니다.")
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(stats: dict, elapsed: float) -> dict:
+    summary = {}
+    for path, endpoint in sorted(stats.items()):
+        latencies = sorted(endpoint.latencies)
+        summary[path] = {
+            'requests': len(latencies),
+            'throughput_rps': round(len(latencies) / elapsed, 2),
+            'p50': round(percentile(latencies, 50), 4),
+            'p95': round(percentile(latencies, 95), 4),
+            'p99': round(percentile(latencies, 99), 4),
+            'error_rate': round(endpoint.errors / len(latencies), 4),
+            'statuses': {str(k): v for k, v in endpoint.statuses.items()},
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트")
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--duration', type=float, default=30, help='실행 시간 (초)')
+    parser.add_argument('--requests', type=int, default=0, help='총 요청 수 제한 (0이면 시간으로만 제한)')
+    parser.add_argument('--mix', nargs='+', help='그룹별 가중치 (예: image=5 pdf=3 convert=1)')
+    parser.add_argument('--timeout', type=float, default=300, help='요청 시간 제한 (초)')
+    parser.add_argument('--seed', type=int, default=1, help='요청 순서 난수 시드')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help='앱 서버 포트')
+    parser.add_argument('--server', default=DEFAULT_SERVER, help='앱 서버 실행 명령 ({host}, {port} 치환)')
+    parser.add_argument('--target', help='이미 실행 중인 서버 URL (서버를 띄우지 않음)')
+    parser.add_argument('--server-pid', type=int, help='--target 사용 시 RSS/CPU를 측정할 서버 PID')
+    parser.add_argument('--storage-latency', type=float, default=0.0, help='Storage 대역 서버 응답 지연 (초)')
+    parser.add_argument('--direct', action='store_true', help='입력을 저장소에 직접 올리고 object_key로 호출')
+    parser.add_argument('--fixtures-dir', default=DEFAULT_DIR, help='합성 입력 파일 디렉터리')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    scenarios, weights = weighted_scenarios(SCENARIOS, mix)
+    try:
+        payloads = load_payloads(scenarios, args.fixtures_dir)
+    except FixtureUnavailable as e:
+        # ffmpeg/soffice가 없는 환경: 해당 입력을 쓰는 시나리오를 빼고 다시 구성
+        print(f"일부 입력을 만들 수 없어 해당 시나리오를 제외합니다: {e}")
+        available = []
+        for scenario in SCENARIOS:
+            try:
+                load_payloads([scenario], args.fixtures_dir)
+                available.append(scenario)
+            except FixtureUnavailable:
+                continue
+        scenarios, weights = weighted_scenarios(available, mix)
+        payloads = load_payloads(scenarios, args.fixtures_dir)
+
+    storage = StorageStub(('127.0.0.1', 0), latency=args.storage_latency).start()
+    process = None
+    base_url = args.target
+    server_pid = args.server_pid
+    if not base_url:
+        env = dict(os.environ, SUPABASE_URL=storage.url, SUPABASE_SERVICE_KEY=STUB_KEY, STORAGE_BACKEND='supabase')
+        command = shlex.split(args.server.format(host=args.host, port=args.port))
+        # 서버 로그는 파일로 받음 (파이프를 읽지 않으면 로그가 쌓여 서버가 멈출 수 있음)
+        server_log = tempfile.NamedTemporaryFile(prefix='loadtest-server-', suffix='.log', delete=False)
+        process = subprocess.Popen(command, env=env, stdout=server_log, stderr=subprocess.STDOUT)
+        print(f"서버 로그: {server_log.name}")
+        base_url = f"http://{args.host}:{args.port}"
+        server_pid = process.pid
+    elif not server_pid:
+        print("--server-pid가 없어 서버 RSS/CPU는 측정하지 않습니다.")
+
+    try:
+        wait_until_ready(base_url, process)
+        print(f"서버: {base_url}, Storage 대역: {storage.url}, 동시성 {args.concurrency}, mix {mix}")
+        sampler = ProcessSampler(server_pid).start() if server_pid else None
+        stats, elapsed = asyncio.run(run_load(
+            base_url, scenarios, weights, payloads, args.concurrency,
+            args.duration, args.requests, args.timeout, args.seed, args.direct
+        ))
+        resources = sampler.stop() if sampler else {}
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        storage.shutdown()
+
+    summary = summarize(stats, elapsed)
+    total = sum(s['requests'] for s in summary.values())
+    errors = sum(round(s['error_rate'] * s['requests']) for s in summary.values())
+
+    print(f"\n{'endpoint':<30}{'reqs':>7}{'req/s':>9}{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}{'err %':>8}")
+    for path, s in summary.items():
+        print(f"{path:<30}{s['requests']:>7}{s['throughput_rps']:>9.2f}{s['p50']:>9.3f}{s['p95']:>9.3f}"
+              f"{s['p99']:>9.3f}{s['error_rate'] * 100:>8.1f}")
+    print(f"\n전체: {total}건 / {elapsed:.1f}s = {total / elapsed:.2f} req/s, 오류 {errors}건")
+    if resources:
+        print(f"서버: RSS 최대 {resources['rss_peak_mb']}MB (평균 {resources['rss_mean_mb']}MB), "
+              f"CPU {resources['cpu_seconds']}s (평균 {resources['cpu_percent_mean']}%)")
+    print(f"Storage 대역: 업로드 {storage.stats['uploads_total']}건, {storage.stats['bytes_total']:,} bytes, "
+          f"직접 업로드 {storage.stats['direct_uploads_total']}건, 내려받기 {storage.stats['downloads_total']}건")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'concurrency': args.concurrency, 'duration': elapsed, 'mix': mix, 'direct': args.direct,
+                'endpoints': summary, 'server': resources, 'storage': storage.stats,
+            }, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+세그먼트 병렬 인코딩 벤치마크
+
+단일 libx264 프로세스 변환과 transcode_segmented(키프레임 분할 + 병렬 인코딩 + concat)의
+wall-clock 시간을 비교합니다. ffmpeg lavfi로 합성한 MOV(mpeg2video + PCM, 재인코딩 필요)를 입력으로 사용합니다.
+
+실행 (저장소 루트에서):
+    python -m benchmarks.segmented_transcode --duration 600 --workers 2 4 8
+"""
+
+import os
+import time
+import argparse
+import tempfile
+from tools.common.process import run_process
+from tools.file_convert_tools.services.segmented import (
+    VIDEO_ENCODE_ARGS, probe_keyframes, choose_split_points, transcode_segmented
+)
+
+
+def make_source(path: str, duration: int, size: str):
+    """재인코딩이 필요한 합성 MOV를 생성합니다 (1초마다 키프레임)."""
+    run_process([
+        'ffmpeg', '-y',
+        '-f', 'lavfi', '-i', f'testsrc2=size={size}:rate=30',
+        '-f', 'lavfi', '-i', 'sine=frequency=440:sample_rate=48000',
+        '-t', str(duration),
+        '-c:v', 'mpeg2video', '-q:v', '4', '-g', '30',
+        '-c:a', 'pcm_s16le',
+        path
+    ])
+
+
+def run_single(src: str, dst: str):
+    run_process(
+        ['ffmpeg', '-y', '-i', src] + VIDEO_ENCODE_ARGS
+        + ['-c:a', 'aac', '-b:a', '192k', '-movflags', '+faststart', dst]
+    )
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세그먼트 병렬 인코딩 vs 단일 프로세스 인코딩")
+    parser.add_argument('--duration', type=int, default=300, help='합성 영상 길이 (초)')
+    parser.add_argument('--size', default='1920x1080', help='합성 영상 해상도')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8], help='비교할 동시 세그먼트 수')
+    parser.add_argument('--segment', type=float, default=30, help='세그먼트 목표 길이 (초)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-segmented-") as workdir:
+        src = os.path.join(workdir, 'source.mov')
+        print(f"합성 입력 생성: {args.duration}s {args.size}")
+        make_source(src, args.duration, args.size)
+
+        info = {'duration': float(args.duration), 'audio_codec': 'pcm_s16le'}
+        split_points = choose_split_points(probe_keyframes(src), info['duration'], target=args.segment)
+
+        baseline = timed(run_single, src, os.path.join(workdir, 'single.mp4'))
+        print(f"{'mode':<12}{'workers':>8}{'segments':>10}{'seconds':>10}{'speedup':>9}")
+        print(f"{'single':<12}{1:>8}{1:>10}{baseline:>10.2f}{1.0:>8.2f}x")
+
+        for workers in args.workers:
+            elapsed = timed(
+                transcode_segmented, src, os.path.join(workdir, f'segmented_{workers}.mp4'), info,
+                workers=workers, split_points=split_points
+            )
+            print(f"{'segmented':<12}{workers:>8}{len(split_points) + 1:>10}{elapsed:>10.2f}{baseline / elapsed:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Supabase Storage 대역 서버 (부하 테스트용)
+
+앱이 사용하는 Storage API만 구현한 작은 HTTP 서버입니다.
+- POST/PUT /storage/v1/object/<bucket>/<path>: 업로드 (multipart / 일반 본문 / chunked 전송)
+- POST /storage/v1/object/upload/sign/<bucket>/<path>: 서명된 업로드 URL 발급
+- PUT /storage/v1/object/upload/sign/<bucket>/<path>?token=...: 클라이언트 직접 업로드 (토큰 1회용)
+- GET /storage/v1/object/authenticated/<bucket>/<path>: 객체 내려받기 (Range: bytes=N- 지원)
+- GET /storage/v1/object/public/<bucket>/<path>: 객체 내려받기
+- GET /_stats: 업로드 수/바이트 통계
+
+서버 업로드(앱의 결과 파일)는 내용을 버리고 크기만 기록하므로 장시간 부하 테스트에서도 메모리를 차지하지 않으며,
+내려받으면 크기만큼의 0 바이트를 돌려줍니다. 직접 업로드한 객체만 앱이 다시 내려받아 처리하므로 내용을 보관합니다.
+--latency로 업로드 응답 지연(초)을 넣어 원격 저장소 왕복을 흉내 낼 수 있습니다.
+
+실행 (저장소 루트에서, 단독 실행):
+    python -m benchmarks.storage_stub --port 54321
+    SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_SERVICE_KEY=<STUB_KEY> python manage.py runserver
+"""
+
+import re
+import json
+import time
+import uuid
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 실제 서비스 키와 같은 JWT 형식만 맞춘 키 (대역 서버는 검사하지 않음)
+STUB_KEY = 'eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoic2VydmljZV9yb2xlIn0.c3R1Yg'
+
+OBJECT_PREFIX = '/storage/v1/object/'
+PUBLIC_PREFIX = '/storage/v1/object/public/'
+AUTHENTICATED_PREFIX = '/storage/v1/object/authenticated/'
+SIGN_PREFIX = '/storage/v1/object/upload/sign/'
+
+_RANGE_PATTERN = re.compile(r'^bytes=(\d+)-$')
+
+# 본문을 읽을 때의 버퍼 크기
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class StorageStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency: float = 0.0):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.objects = {}
+        self.blobs = {}
+        self.tokens = {}
+        self.lock = threading.Lock()
+        self.stats = {'uploads_total': 0, 'bytes_total': 0, 'errors_total': 0,
+                      'direct_uploads_total': 0, 'downloads_total': 0}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if self.path.startswith(SIGN_PREFIX):
+            return self._sign()
+        self._upload()
+
+    def do_PUT(self):
+        if self.path.startswith(SIGN_PREFIX):
+            return self._signed_upload()
+        self._upload()
+
+    def do_GET(self):
+        if self.path == '/_stats':
+            with self.server.lock:
+                body = dict(self.server.stats, objects=len(self.server.objects), tokens=len(self.server.tokens))
+            return self._json(200, body)
+        for prefix in (AUTHENTICATED_PREFIX, PUBLIC_PREFIX):
+            if self.path.startswith(prefix):
+                return self._download(self.path[len(prefix):].split('?', 1)[0])
+        self._json(404, {'error': 'not_found'})
+
+    def _sign(self):
+        key = self.path[len(SIGN_PREFIX):].split('?', 1)[0]
+        self._discard(int(self.headers.get('Content-Length') or 0))
+        token = uuid.uuid4().hex
+        with self.server.lock:
+            self.server.tokens[token] = key
+        # 실제 API와 같게 /storage/v1 기준 상대 경로를 돌려줌
+        self._json(200, {'url': f"/object/upload/sign/{key}?token={token}"})
+
+    def _signed_upload(self):
+        key, _, query = self.path[len(SIGN_PREFIX):].partition('?')
+        token = dict(p.partition('=')[::2] for p in query.split('&')).get('token')
+        with self.server.lock:
+            valid = token is not None and self.server.tokens.pop(token, None) == key
+        if not valid:
+            return self._json(400, {'statusCode': '403', 'error': 'invalid_signature'})
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = bytearray()
+        while len(body) < length:
+            chunk = self.rfile.read(min(length - len(body), READ_CHUNK_SIZE))
+            if not chunk:
+                return self._json(400, {'error': 'bad_request'})
+            body += chunk
+
+        with self.server.lock:
+            self.server.blobs[key] = bytes(body)
+            self.server.objects[key] = length
+            self.server.stats['direct_uploads_total'] += 1
+        self._json(200, {'Key': key})
+
+    def _download(self, key: str):
+        with self.server.lock:
+            blob = self.server.blobs.get(key)
+            size = len(blob) if blob is not None else self.server.objects.get(key)
+            if size is not None:
+                self.server.stats['downloads_total'] += 1
+        if size is None:
+            # 실제 API와 같게 없는 객체는 400 + statusCode 404
+            return self._json(400, {'statusCode': '404', 'error': 'not_found'})
+
+        start = 0
+        match = _RANGE_PATTERN.match(self.headers.get('Range', ''))
+        if match and int(match.group(1)) < size:
+            start = int(match.group(1))
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{size - 1}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(size - start))
+        self.end_headers()
+
+        if blob is not None:
+            self.wfile.write(blob[start:])
+            return
+        remaining = size - start
+        zeros = bytes(READ_CHUNK_SIZE)
+        while remaining > 0:
+            self.wfile.write(zeros[:min(remaining, READ_CHUNK_SIZE)])
+            remaining -= READ_CHUNK_SIZE
+
+    def _upload(self):
+        if not self.path.startswith(OBJECT_PREFIX):
+            return self._json(404, {'error': 'not_found'})
+        key = self.path[len(OBJECT_PREFIX):].split('?', 1)[0]
+        try:
+            size = self._drain_body()
+        except (ValueError, ConnectionError):
+            with self.server.lock:
+                self.server.stats['errors_total'] += 1
+            return self._json(400, {'error': 'bad_request'})
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.objects[key] = size
+            self.server.stats['uploads_total'] += 1
+            self.server.stats['bytes_total'] += size
+        self._json(200, {'Key': key})
+
+    def _drain_body(self) -> int:
+        """본문을 읽어 버리고 바이트 수를 반환합니다 (Content-Length 또는 chunked)."""
+        if 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            total = 0
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    raise ConnectionError("chunked 본문이 중간에 끊겼습니다.")
+                length = int(line.split(b';', 1)[0].strip(), 16)
+                if length == 0:
+                    # 트레일러 헤더 끝까지 읽음
+                    while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    return total
+                self._discard(length)
+                self.rfile.readline()  # 청크 끝의 CRLF
+                total += length
+
+        length = int(self.headers.get('Content-Length') or 0)
+        self._discard(length)
+        return length
+
+    def _discard(self, length: int):
+        remaining = length
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, READ_CHUNK_SIZE))
+            if not chunk:
+                raise ConnectionError("본문이 중간에 끊겼습니다.")
+            remaining -= len(chunk)
+
+    def _json(self, status: int, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase Storage 대역 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=54321)
+    parser.add_argument('--latency', type=float, default=0.0, help='업로드 응답 지연 (초)')
+    args = parser.parse_args()
+
+    server = StorageStub((args.host, args.port), latency=args.latency)
+    print(f"Storage 대역 서버: {server.url} (SUPABASE_SERVICE_KEY={STUB_KEY})")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
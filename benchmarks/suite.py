@@ -0,0 +1,295 @@
+"""
+도구 엔드포인트 벤치마크
+
+모든 도구 뷰를 합성 입력(benchmarks.fixtures)으로 실행하여 케이스별 wall 시간, CPU 시간
+(자식 프로세스 ffmpeg/soffice 포함), 최대 RSS, 출력 크기를 측정하고 기준값(baseline.json)과 비교합니다.
+
+- 저장소는 메모리 백엔드(STORAGE_BACKEND=memory)로 바꿔 네트워크 왕복 없이 처리 비용만 측정
+- 요청은 RequestFactory로 만든 multipart 요청을 뷰 함수에 직접 전달 (업로드 파싱 포함, 미들웨어 제외)
+- 케이스마다 새 프로세스에서 실행하여 최대 RSS가 케이스별 값이 되도록 함
+- 같은 입력을 반복 실행하므로 중복 제거 결과 재사용(SINGLEFLIGHT_RESULT_TTL)은 끔
+
+실행 (저장소 루트에서):
+    python -m benchmarks.suite                        # 전체 실행 후 benchmarks/baseline.json과 비교
+    python -m benchmarks.suite --only image. pdf.merge # 이름이 주어진 접두사로 시작하는 케이스만
+    python -m benchmarks.suite --save-baseline         # 현재 결과를 기준값으로 저장
+회귀가 있으면 종료 코드 1을 반환합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import resource
+import statistics
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.fixtures import DEFAULT_DIR, FIXTURE_VERSION, FixtureUnavailable, ensure_fixture
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# 이 비율 이상 느려지거나(시간) 커지면(RSS) 회귀로 표시
+DEFAULT_TIME_THRESHOLD = 0.15
+DEFAULT_RSS_THRESHOLD = 0.20
+
+# 이보다 작은 시간 차이(초)는 측정 잡음으로 보고 무시
+NOISE_FLOOR = 0.005
+
+
+class Case:
+    """벤치마크 케이스 하나: 뷰 함수 + 입력 파일(필드 → 입력 이름 목록) + 폼 값"""
+
+    def __init__(self, name: str, view: str, files: dict, data: dict = None):
+        self.name = name
+        self.view = view
+        self.files = files
+        self.data = data or {}
+
+
+IMAGE = 'tools.image_tools.views'
+PDF = 'tools.pdf_tools.views'
+CONVERT = 'tools.file_convert_tools.views'
+
+CASES = [
+    *[Case(f'image.resize.{mp}mp', f'{IMAGE}.resize.resize_image', {'images': [f'photo_{mp}mp.jpg']},
+           {'width': 1024, 'height': 768}) for mp in (1, 4, 12)],
+    *[Case(f'image.compress.{mp}mp', f'{IMAGE}.compress.compress_image', {'images': [f'photo_{mp}mp.jpg']},
+           {'quality': 'medium'}) for mp in (1, 4, 12)],
+    Case('image.compress.rgba_4mp', f'{IMAGE}.compress.compress_image', {'images': ['alpha_4mp.png']}),
+    Case('image.compress.gray_4mp', f'{IMAGE}.compress.compress_image', {'images': ['gray_4mp.png']}),
+    Case('image.compress.palette_4mp', f'{IMAGE}.compress.compress_image', {'images': ['palette_4mp.png']}),
+    Case('image.compress.batch', f'{IMAGE}.compress.compress_image',
+         {'images': ['photo_1mp.jpg', 'photo_4mp.jpg', 'alpha_4mp.png', 'photo_4mp.webp']}),
+    Case('image.convert.jpg_to_png_4mp', f'{IMAGE}.convert.convert_image_format',
+         {'images': ['photo_4mp.jpg']}, {'format': 'PNG'}),
+    Case('image.convert.jpg_to_webp_4mp', f'{IMAGE}.convert.convert_image_format',
+         {'images': ['photo_4mp.jpg']}, {'format': 'WEBP'}),
+    Case('image.convert.png_to_jpeg_4mp', f'{IMAGE}.convert.convert_image_format',
+         {'images': ['alpha_4mp.png']}, {'format': 'JPEG'}),
+    Case('image.convert.pdf_to_png_5p', f'{IMAGE}.convert.convert_image_format',
+         {'images': ['image_5p.pdf']}, {'format': 'PNG'}),
+    *[Case(f'image.filter.{name}_{mp}mp', f'{IMAGE}.filter.apply_filter', {'images': [f'photo_{mp}mp.jpg']},
+           {'filter': name}) for name, mp in (('grayscale', 4), ('blur', 4), ('edge', 4), ('contrast', 4),
+                                              ('sepia', 1))],
+    Case('image.watermark.text_4mp', f'{IMAGE}.watermark.add_watermark', {'images': ['photo_4mp.jpg']},
+         {'type': 'text', 'text': 'FilePick', 'position': 'bottom-right'}),
+    Case('image.watermark.image_4mp', f'{IMAGE}.watermark.add_watermark',
+         {'images': ['photo_4mp.jpg'], 'watermark_image': ['alpha_1mp.png']}, {'type': 'image'}),
+    *[Case(f'image.remove_exif.{mp}mp', f'{IMAGE}.exif_remove.remove_exif_metadata',
+           {'images': [f'photo_{mp}mp.jpg']}) for mp in (4, 12)],
+
+    Case('pdf.merge.mixed', f'{PDF}.merge.merge_pdfs', {'files': ['text_20p.pdf', 'image_5p.pdf', 'scanned_5p.pdf']}),
+    Case('pdf.merge.text_100p_x2', f'{PDF}.merge.merge_pdfs', {'files': ['text_100p.pdf', 'text_100p.pdf']}),
+    Case('pdf.split.text_100p', f'{PDF}.split.split_pdfs', {'files': ['text_100p.pdf']},
+         {'pages': ','.join(str(i) for i in range(0, 100, 3))}),
+    *[Case(f'pdf.compress.{name}', f'{PDF}.compress.compress_pdfs', {'files': [f'{name}.pdf']}, {'quality': 'medium'})
+      for name in ('text_100p', 'image_20p', 'scanned_20p')],
+    Case('pdf.rotate_delete.text_20p', f'{PDF}.rotate_delete.rotate_or_delete_pdfs', {'files': ['text_20p.pdf']},
+         {'rotate': 90, 'delete_pages': '1,3,5'}),
+    Case('pdf.encrypt.text_20p', f'{PDF}.encrypt_decrypt.encrypt_or_decrypt_pdfs', {'files': ['text_20p.pdf']},
+         {'mode': 'encrypt', 'password': 'benchmark'}),
+    *[Case(f'pdf.extract_text.{name}', f'{PDF}.extract_text.extract_text', {'file': [f'{name}.pdf']})
+      for name in ('text_1p', 'text_100p', 'scanned_5p')],
+
+    Case('convert.docx_to_pdf.2s', f'{CONVERT}.docx_to_pdf.convert_docx_to_pdf', {'file': ['report_2s.docx']}),
+    Case('convert.docx_to_pdf.20s', f'{CONVERT}.docx_to_pdf.convert_docx_to_pdf', {'file': ['report_20s.docx']}),
+    Case('convert.excel_to_pdf.2000r', f'{CONVERT}.excel_to_pdf.convert_excel_to_pdf', {'file': ['sheet_2000r.xlsx']}),
+    Case('convert.ppt_to_pdf.10s', f'{CONVERT}.ppt_to_pdf.convert_ppt_to_pdf', {'file': ['deck_10s.pptx']}),
+    Case('convert.mov_to_mp4.transcode', f'{CONVERT}.mov_to_mp4.convert_mov_to_mp4', {'file': ['clip_10s_mpeg2.mov']}),
+    Case('convert.mov_to_mp4.remux', f'{CONVERT}.mov_to_mp4.convert_mov_to_mp4', {'file': ['clip_10s_h264.mov']}),
+    Case('convert.mp4_to_mp3.cbr', f'{CONVERT}.mp4_to_mp3.convert_mp4_to_mp3', {'file': ['clip_30s.mp4']},
+         {'format': 'mp3', 'bitrate_mode': 'cbr', 'bitrate': '192k'}),
+    Case('convert.mp4_to_mp3.m4a_copy', f'{CONVERT}.mp4_to_mp3.convert_mp4_to_mp3', {'file': ['clip_30s.mp4']},
+         {'format': 'm4a'}),
+]
+
+
+def _setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'filepick.settings')
+    os.environ['STORAGE_BACKEND'] = 'memory'
+    os.environ['SINGLEFLIGHT_RESULT_TTL'] = '0'
+    import django
+    django.setup()
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def run_case(case: Case, fixtures_dir: str, repeat: int, warmup: int) -> dict:
+    """케이스 하나를 (새 프로세스 안에서) warmup + repeat회 실행하고 측정값을 반환합니다."""
+    _setup_django()
+    from django.test import RequestFactory
+    from tools.common.storage import MemoryStorage, set_storage
+
+    try:
+        paths = {field: [ensure_fixture(fixtures_dir, name) for name in names] for field, names in case.files.items()}
+    except FixtureUnavailable as e:
+        return {'skipped': str(e)}
+
+    module_name, func_name = case.view.rsplit('.', 1)
+    view = getattr(importlib.import_module(module_name), func_name)
+    storage = MemoryStorage()
+    set_storage(storage)
+    factory = RequestFactory()
+
+    walls, cpus, output_bytes = [], [], 0
+    for iteration in range(warmup + repeat):
+        handles = {field: [open(path, 'rb') for path in field_paths] for field, field_paths in paths.items()}
+        try:
+            # multipart 인코딩은 측정에서 제외 (본문 파싱은 뷰 안에서 일어나므로 포함)
+            request = factory.post('/', data={**case.data, **handles})
+        finally:
+            for field_handles in handles.values():
+                for handle in field_handles:
+                    handle.close()
+
+        storage.clear()
+        cpu_started = _cpu_seconds()
+        started = time.perf_counter()
+        response = view(request)
+        wall = time.perf_counter() - started
+        cpu = _cpu_seconds() - cpu_started
+
+        if response.status_code >= 400:
+            return {'error': f"HTTP {response.status_code}: {response.content[:300].decode(errors='replace')}"}
+        if iteration >= warmup:
+            walls.append(wall)
+            cpus.append(cpu)
+            output_bytes = storage.total_bytes() or len(response.content)
+
+    # Linux의 ru_maxrss는 KB 단위
+    return {
+        'wall_median': statistics.median(walls),
+        'wall_min': min(walls),
+        'cpu_median': statistics.median(cpus),
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'children_peak_rss_mb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+        'output_bytes': output_bytes,
+        'repeat': repeat,
+    }
+
+
+def run_isolated(case: Case, fixtures_dir: str, repeat: int, warmup: int) -> dict:
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        try:
+            return pool.submit(run_case, case, fixtures_dir, repeat, warmup).result()
+        except Exception as e:
+            return {'error': f"{type(e).__name__}: {e}"}
+
+
+def compare(results: dict, baseline: dict, time_threshold: float, rss_threshold: float) -> dict:
+    """케이스별로 기준값 대비 회귀 항목 목록을 반환합니다."""
+    regressions = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or 'wall_median' not in result or 'wall_median' not in base:
+            continue
+        found = []
+        for key in ('wall_median', 'cpu_median'):
+            if result[key] - base[key] > max(NOISE_FLOOR, base[key] * time_threshold):
+                found.append(f"{key} {base[key]:.3f}s → {result[key]:.3f}s (+{_percent(result[key], base[key])})")
+        if result['peak_rss_mb'] > base['peak_rss_mb'] * (1 + rss_threshold):
+            found.append(f"peak_rss {base['peak_rss_mb']:.0f}MB → {result['peak_rss_mb']:.0f}MB "
+                         f"(+{_percent(result['peak_rss_mb'], base['peak_rss_mb'])})")
+        if found:
+            regressions[name] = found
+    return regressions
+
+
+def _percent(value: float, base: float) -> str:
+    return f"{(value / base - 1) * 100:.0f}%" if base else 'n/a'
+
+
+def _print_result(name: str, result: dict, base: dict = None):
+    if 'skipped' in result:
+        print(f"{name:<40} 건너뜀: {result['skipped']}")
+        return
+    if 'error' in result:
+        print(f"{name:<40} 오류: {result['error']}")
+        return
+    delta = ''
+    if base and 'wall_median' in base:
+        delta = f"{(result['wall_median'] / base['wall_median'] - 1) * 100:+7.1f}%" if base['wall_median'] else ''
+    print(f"{name:<40}{result['wall_median']:>9.3f}{result['cpu_median']:>9.3f}"
+          f"{result['peak_rss_mb']:>9.0f}{result['output_bytes']:>13,}{delta:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도구 엔드포인트 벤치마크")
+    parser.add_argument('--only', nargs='+', help='이 접두사로 시작하는 케이스만 실행')
+    parser.add_argument('--repeat', type=int, default=5, help='측정 반복 횟수')
+    parser.add_argument('--warmup', type=int, default=1, help='측정 전 예열 실행 횟수')
+    parser.add_argument('--fixtures-dir', default=DEFAULT_DIR, help='합성 입력 파일 디렉터리')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준값 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='결과를 기준값으로 저장 (비교하지 않음)')
+    parser.add_argument('--time-threshold', type=float, default=DEFAULT_TIME_THRESHOLD, help='시간 회귀 기준 (비율)')
+    parser.add_argument('--rss-threshold', type=float, default=DEFAULT_RSS_THRESHOLD, help='RSS 회귀 기준 (비율)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--list', action='store_true', help='케이스 목록만 출력')
+    args = parser.parse_args()
+
+    cases = [c for c in CASES if not args.only or c.name.startswith(tuple(args.only))]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    baseline = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get('cases', {})
+
+    print(f"{'case':<40}{'wall s':>9}{'cpu s':>9}{'rss MB':>9}{'output B':>13}{'vs base':>9}")
+    results = {}
+    for case in cases:
+        results[case.name] = run_isolated(case, args.fixtures_dir, args.repeat, args.warmup)
+        _print_result(case.name, results[case.name], baseline.get(case.name))
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'fixture_version': FIXTURE_VERSION,
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'cpus': os.cpu_count()},
+        'cases': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        if os.path.exists(args.baseline):
+            # 일부 케이스만 실행한 경우 나머지 기준값은 유지
+            with open(args.baseline) as f:
+                report['cases'] = {**json.load(f).get('cases', {}), **results}
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\n기준값이 없습니다. --save-baseline으로 {args.baseline}을 만드세요.")
+        return 0
+
+    regressions = compare(results, baseline, args.time_threshold, args.rss_threshold)
+    errors = [name for name, result in results.items() if 'error' in result]
+    if regressions:
+        print("\n회귀:")
+        for name, found in regressions.items():
+            for item in found:
+                print(f"  {name}: {item}")
+    if errors:
+        print(f"\n실패한 케이스: {', '.join(errors)}")
+    if not regressions and not errors:
+        print("\n회귀 없음")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
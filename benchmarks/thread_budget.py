@@ -0,0 +1,79 @@
+"""
+스레드 예산 벤치마크
+
+호스트에서 워커 W개가 동시에 ffmpeg 인코딩을 하나씩 실행하는 상황을 재현하여,
+ffmpeg 기본값(-threads 0, 프로세스마다 전체 코어 사용)과 스레드 예산(-threads 코어수/W)의
+처리량(작업/분)과 작업 지연(p50/p95)을 비교합니다.
+입력은 ffmpeg lavfi로 합성한 짧은 영상이며 작업마다 libx264로 재인코딩합니다.
+
+실행 (저장소 루트에서):
+    python -m benchmarks.thread_budget --workers 1 2 4 8 --jobs 16
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from tools.common.process import run_process
+from tools.file_convert_tools.services.segmented import VIDEO_ENCODE_ARGS
+
+
+def make_source(path: str, duration: int, size: str):
+    """재인코딩 대상 합성 영상을 생성합니다."""
+    run_process([
+        'ffmpeg', '-y',
+        '-f', 'lavfi', '-i', f'testsrc2=size={size}:rate=30',
+        '-t', str(duration),
+        '-c:v', 'mpeg2video', '-q:v', '4',
+        path
+    ])
+
+
+def encode(src: str, dst: str, threads: int) -> float:
+    start = time.perf_counter()
+    run_process(['ffmpeg', '-y', '-i', src] + VIDEO_ENCODE_ARGS + ['-threads', str(threads), '-an', dst])
+    elapsed = time.perf_counter() - start
+    os.remove(dst)
+    return elapsed
+
+
+def run_batch(src: str, workdir: str, workers: int, jobs: int, threads: int) -> tuple:
+    """workers개를 동시에 실행하며 jobs개의 인코딩을 처리합니다. (전체 시간, 작업별 시간 목록)"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        latencies = list(pool.map(
+            lambda i: encode(src, os.path.join(workdir, f'out_{i}.mp4'), threads), range(jobs)
+        ))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+
+    parser = argparse.ArgumentParser(description="ffmpeg 기본 스레드 vs 스레드 예산")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='동시 실행 워커 수')
+    parser.add_argument('--jobs', type=int, default=16, help='워커 수마다 처리할 작업 수')
+    parser.add_argument('--duration', type=int, default=10, help='합성 영상 길이 (초)')
+    parser.add_argument('--size', default='1280x720', help='합성 영상 해상도')
+    parser.add_argument('--cpus', type=int, default=cpus, help='CPU 예산 (기본: 사용 가능한 코어 수)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-threads-") as workdir:
+        src = os.path.join(workdir, 'source.mpg')
+        print(f"합성 입력 생성: {args.duration}s {args.size}, CPU 예산 {args.cpus}")
+        make_source(src, args.duration, args.size)
+
+        print(f"{'workers':>8}{'mode':>9}{'threads':>9}{'jobs/min':>10}{'p50 s':>8}{'p95 s':>8}")
+        for workers in args.workers:
+            for mode, threads in (('default', 0), ('budget', max(1, args.cpus // workers))):
+                elapsed, latencies = run_batch(src, workdir, workers, args.jobs, threads)
+                latencies.sort()
+                p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                print(f"{workers:>8}{mode:>9}{threads or 'auto':>9}{args.jobs / elapsed * 60:>10.1f}"
+                      f"{statistics.median(latencies):>8.2f}{p95:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
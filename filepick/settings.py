@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import tempfile
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -28,6 +29,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'tools.image_tools',
+    'tools.jobs',
     'rest_framework',
     'drf_yasg',
 ]
@@ -40,6 +42,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'tools.common.middleware.MetricsMiddleware',
+    'tools.common.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'filepick.urls'
@@ -69,10 +73,27 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 비동기 작업 워커 스레드가 동시에 기록할 때 잠금 대기
+        'OPTIONS': {'timeout': 20},
     }
 }
 
 
+# Cache
+# 변환 진행률은 여러 워커 프로세스에서 조회하므로 파일 기반 캐시에 저장
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'progress': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'filepick-progress'),
+        'TIMEOUT': 60 * 60,
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -114,5 +135,143 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# File uploads
+# 업로드 파트를 받는 즉시 메모리/tmpfs/디스크에 기록하고 BLAKE2b 해시와 MIME을 계산
+
+FILE_UPLOAD_HANDLERS = ['tools.common.upload_handlers.ScratchFileUploadHandler']
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv('FILE_UPLOAD_MAX_MEMORY_SIZE', 2.5 * 1024 * 1024))
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_TMPFS_DIR = os.getenv('UPLOAD_TMPFS_DIR', '/dev/shm')
+UPLOAD_TMPFS_MAX_SIZE = int(os.getenv('UPLOAD_TMPFS_MAX_SIZE', 64 * 1024 * 1024))
+UPLOAD_SCRATCH_DIR = os.getenv('UPLOAD_SCRATCH_DIR', tempfile.gettempdir())
+
 MEDIA_URL = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# CPU 예산: 사용 가능한 코어(CPU affinity 기준)를 호스트의 워커 프로세스 수로 나눠 사용
+# (ffmpeg -threads, NumPy/OpenCV 스레드, 작업 풀 크기는 모두 이 값에서 계산)
+CPU_BUDGET = int(os.getenv('CPU_BUDGET', len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)))
+WORKER_PROCESSES = int(os.getenv('WEB_CONCURRENCY', 1))
+CORES_PER_WORKER = max(1, CPU_BUDGET // max(1, WORKER_PROCESSES))
+# True면 호스트 전체 변환기 슬롯(CONVERTER_HOST_WIDE)마다 서로 다른 CPU 묶음에 외부 프로세스를 고정
+CPU_PINNING = os.getenv('CPU_PINNING', 'false').lower() == 'true'
+
+# 프로세스 안 라이브러리 스레드 수 (NumPy BLAS / OpenMP / OpenCV) - 라이브러리 import 전에 설정되어야 함
+for _thread_env in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                    'NUMEXPR_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'OPENCV_FOR_THREADS_NUM'):
+    os.environ.setdefault(_thread_env, str(CORES_PER_WORKER))
+
+# 비동기 작업 큐별 동시 실행 수
+JOB_QUEUES = {
+    'media': int(os.getenv('JOB_MEDIA_CONCURRENCY', 2)),
+    'document': int(os.getenv('JOB_DOCUMENT_CONCURRENCY', 2)),
+    'pdf': int(os.getenv('JOB_PDF_CONCURRENCY', min(4, CORES_PER_WORKER))),
+}
+
+# 실행 중 작업의 상태 갱신 간격 / 이 시간(초) 동안 갱신이 없으면 중단된 작업으로 보고 재시작 시 회수
+JOB_HEARTBEAT_INTERVAL = int(os.getenv('JOB_HEARTBEAT_INTERVAL', 30))
+JOB_STALE_AFTER = int(os.getenv('JOB_STALE_AFTER', 5 * 60))
+
+# 긴 영상의 세그먼트 병렬 인코딩 (비디오 재인코딩이 필요하고 이 길이(초) 이상일 때 사용)
+SEGMENTED_TRANSCODE_MIN_DURATION = float(os.getenv('SEGMENTED_TRANSCODE_MIN_DURATION', 300))
+SEGMENTED_TRANSCODE_WORKERS = int(os.getenv('SEGMENTED_TRANSCODE_WORKERS', max(1, CORES_PER_WORKER // 4)))
+
+# 동영상 자르기: 컷 지점 주변에서 키프레임을 찾는 범위 (초)
+TRIM_KEYFRAME_WINDOW = float(os.getenv('TRIM_KEYFRAME_WINDOW', 20))
+
+# 비동기 뷰 (ASGI 서버로 실행할 때 사용: ASYNC_VIEWS=true uvicorn filepick.asgi:application)
+# 업로드/저장소 I/O와 외부 프로세스 대기는 이벤트 루프에서, CPU 작업은 크기가 제한된 스레드 풀에서 처리
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'false').lower() == 'true'
+ASYNC_CPU_WORKERS = int(os.getenv('ASYNC_CPU_WORKERS', CORES_PER_WORKER))
+ASYNC_IO_WORKERS = int(os.getenv('ASYNC_IO_WORKERS', 32))
+
+# 결과 파일 저장소 백엔드: supabase(기본) 또는 memory(벤치마크/로컬 실행용, 프로세스 메모리에 보관)
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'supabase')
+
+# 저장소 HTTP 클라이언트 (프로세스 공유 연결 풀, HTTP/2 다중화, 호출별 제한 시간, 일시적 오류 재시도)
+STORAGE_HTTP2 = os.getenv('STORAGE_HTTP2', 'true').lower() == 'true'
+STORAGE_MAX_CONNECTIONS = int(os.getenv('STORAGE_MAX_CONNECTIONS', 20))
+STORAGE_MAX_KEEPALIVE = int(os.getenv('STORAGE_MAX_KEEPALIVE', 10))
+STORAGE_KEEPALIVE_EXPIRY = float(os.getenv('STORAGE_KEEPALIVE_EXPIRY', 30))
+STORAGE_CONNECT_TIMEOUT = float(os.getenv('STORAGE_CONNECT_TIMEOUT', 5))
+STORAGE_READ_TIMEOUT = float(os.getenv('STORAGE_READ_TIMEOUT', 60))
+STORAGE_WRITE_TIMEOUT = float(os.getenv('STORAGE_WRITE_TIMEOUT', 60))
+STORAGE_POOL_TIMEOUT = float(os.getenv('STORAGE_POOL_TIMEOUT', 10))
+STORAGE_RETRIES = int(os.getenv('STORAGE_RETRIES', 3))
+STORAGE_BACKOFF_BASE = float(os.getenv('STORAGE_BACKOFF_BASE', 0.2))
+STORAGE_BACKOFF_MAX = float(os.getenv('STORAGE_BACKOFF_MAX', 5))
+
+# 저장소 직접 업로드 (클라이언트가 서명된 URL로 올린 입력을 워커가 내려받아 처리)
+DIRECT_UPLOAD_BUCKET = os.getenv('DIRECT_UPLOAD_BUCKET', 'incoming')
+DIRECT_UPLOAD_CACHE_DIR = os.getenv('DIRECT_UPLOAD_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'filepick-direct'))
+DIRECT_UPLOAD_CACHE_TTL = int(os.getenv('DIRECT_UPLOAD_CACHE_TTL', 60 * 60))
+
+# 아카이브 도구: 압축 해제 한도 (압축 폭탄 방어) / 입력 크기별 압축 수준 구간 / 7z(p7zip) 명령
+ARCHIVE_MAX_TOTAL_SIZE = int(os.getenv('ARCHIVE_MAX_TOTAL_SIZE', 4 * 1024 ** 3))
+ARCHIVE_MAX_MEMBERS = int(os.getenv('ARCHIVE_MAX_MEMBERS', 10000))
+ARCHIVE_MAX_RATIO = int(os.getenv('ARCHIVE_MAX_RATIO', 200))
+ARCHIVE_RATIO_MIN_SIZE = int(os.getenv('ARCHIVE_RATIO_MIN_SIZE', 1024 * 1024))
+ARCHIVE_SMALL_SIZE = int(os.getenv('ARCHIVE_SMALL_SIZE', 32 * 1024 * 1024))
+ARCHIVE_MEDIUM_SIZE = int(os.getenv('ARCHIVE_MEDIUM_SIZE', 512 * 1024 * 1024))
+SEVEN_ZIP_COMMAND = os.getenv('SEVEN_ZIP_COMMAND', '7z')
+
+# 문자셋 변환: 변환 청크 크기 / 자동 감지에 쓰는 앞부분 크기 / 감지 후보 (앞에서부터 시도)
+CHARSET_CHUNK_SIZE = int(os.getenv('CHARSET_CHUNK_SIZE', 1024 * 1024))
+CHARSET_DETECT_BYTES = int(os.getenv('CHARSET_DETECT_BYTES', 64 * 1024))
+CHARSET_DETECT_CANDIDATES = tuple(os.getenv('CHARSET_DETECT_CANDIDATES', 'utf-8,cp949').split(','))
+
+# GIF/애니메이션 WebP: 최대 프레임 수 / 프레임 수 × 가로 × 세로 한도 / 최대 가로 크기 / 동영상 구간 최대 길이 (초)
+ANIMATION_MAX_FRAMES = int(os.getenv('ANIMATION_MAX_FRAMES', 300))
+ANIMATION_MAX_PIXELS = int(os.getenv('ANIMATION_MAX_PIXELS', 50_000_000))
+ANIMATION_MAX_WIDTH = int(os.getenv('ANIMATION_MAX_WIDTH', 1280))
+ANIMATION_MAX_DURATION = float(os.getenv('ANIMATION_MAX_DURATION', 60))
+
+# 반응형 이미지 세트: 기본 폭 / 기본 형식 (마지막 형식이 대체 이미지) / 인코딩 스레드 수 / 동시 업로드 수
+IMAGE_VARIANT_WIDTHS = tuple(int(w) for w in os.getenv('IMAGE_VARIANT_WIDTHS', '320,640,1280,1920').split(','))
+IMAGE_VARIANT_FORMATS = tuple(os.getenv('IMAGE_VARIANT_FORMATS', 'webp,jpeg').split(','))
+IMAGE_VARIANT_ENCODE_WORKERS = int(os.getenv('IMAGE_VARIANT_ENCODE_WORKERS', 4))
+IMAGE_VARIANT_UPLOAD_WORKERS = int(os.getenv('IMAGE_VARIANT_UPLOAD_WORKERS', 8))
+
+# 변환 작업용 스크래치 공간 (예상 사용량이 SCRATCH_TMPFS_MAX_SIZE 이하면 tmpfs, 아니면 디스크)
+SCRATCH_DIR = os.getenv('SCRATCH_DIR', os.path.join(tempfile.gettempdir(), 'filepick-scratch'))
+SCRATCH_TMPFS_DIR = os.getenv('SCRATCH_TMPFS_DIR', '/dev/shm/filepick-scratch')
+SCRATCH_TMPFS_MAX_SIZE = int(os.getenv('SCRATCH_TMPFS_MAX_SIZE', 64 * 1024 * 1024))
+SCRATCH_JOB_QUOTA = int(os.getenv('SCRATCH_JOB_QUOTA', 20 * 1024 ** 3))
+SCRATCH_GLOBAL_QUOTA = int(os.getenv('SCRATCH_GLOBAL_QUOTA', 100 * 1024 ** 3))
+SCRATCH_QUOTA_POLL_INTERVAL = float(os.getenv('SCRATCH_QUOTA_POLL_INTERVAL', 2))
+SCRATCH_SWEEP_INTERVAL = int(os.getenv('SCRATCH_SWEEP_INTERVAL', 10 * 60))
+SCRATCH_MAX_AGE = int(os.getenv('SCRATCH_MAX_AGE', 6 * 60 * 60))
+
+# 변환기(외부 프로세스)별 동시 실행 수 / 최대 실행 시간 (초)
+CONVERTER_LIMITS = {
+    'ffmpeg': int(os.getenv('CONVERTER_FFMPEG_LIMIT', max(1, CORES_PER_WORKER // 2))),
+    'soffice': int(os.getenv('CONVERTER_SOFFICE_LIMIT', 2)),
+    'pdftoppm': int(os.getenv('CONVERTER_PDFTOPPM_LIMIT', max(1, CORES_PER_WORKER // 2))),
+    '7z': int(os.getenv('CONVERTER_7Z_LIMIT', max(1, CORES_PER_WORKER // 2))),
+}
+CONVERTER_TIMEOUTS = {
+    'ffmpeg': int(os.getenv('CONVERTER_FFMPEG_TIMEOUT', 60 * 60)),
+    'soffice': int(os.getenv('CONVERTER_SOFFICE_TIMEOUT', 5 * 60)),
+    'pdftoppm': int(os.getenv('CONVERTER_PDFTOPPM_TIMEOUT', 5 * 60)),
+    '7z': int(os.getenv('CONVERTER_7Z_TIMEOUT', 30 * 60)),
+    'ffprobe': 60,
+}
+# 슬롯 대기열 크기 / 최대 대기 시간 (초), 대기열이 가득 차면 429, 대기 시간을 넘기면 503
+CONVERTER_QUEUE_SIZE = int(os.getenv('CONVERTER_QUEUE_SIZE', 8))
+CONVERTER_WAIT_TIMEOUT = float(os.getenv('CONVERTER_WAIT_TIMEOUT', 30))
+# True면 파일 잠금으로 같은 호스트의 모든 워커 프로세스가 한도를 공유
+CONVERTER_HOST_WIDE = os.getenv('CONVERTER_HOST_WIDE', 'false').lower() == 'true'
+CONVERTER_LOCK_DIR = os.getenv('CONVERTER_LOCK_DIR', os.path.join(tempfile.gettempdir(), 'filepick-locks'))
+
+# 같은 입력/작업/옵션의 동시 요청 중복 제거 (프로세스 간에는 잠금 디렉터리로 합류)
+SINGLEFLIGHT_DIR = os.getenv('SINGLEFLIGHT_DIR', os.path.join(tempfile.gettempdir(), 'filepick-singleflight'))
+SINGLEFLIGHT_WAIT_TIMEOUT = float(os.getenv('SINGLEFLIGHT_WAIT_TIMEOUT', 10 * 60))
+SINGLEFLIGHT_RESULT_TTL = float(os.getenv('SINGLEFLIGHT_RESULT_TTL', 30))
+
+# 요청 프로파일링 (PROFILING_TOKEN과 PROFILING_SAMPLE_RATE가 모두 비어 있으면 비활성)
+# X-Profile: <토큰> 헤더(메모리 할당까지 기록하려면 <토큰>:memory) 또는 샘플링 비율로 선택된 요청만 프로파일링
+PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))
+PROFILING_TRACEMALLOC = os.getenv('PROFILING_TRACEMALLOC', 'false').lower() == 'true'
+PROFILING_DIR = os.getenv('PROFILING_DIR', os.path.join(tempfile.gettempdir(), 'filepick-profiles'))
+PROFILING_MAX_DUMPS = int(os.getenv('PROFILING_MAX_DUMPS', 50))
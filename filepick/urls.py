@@ -6,7 +6,7 @@ from django.conf.urls.static import static
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
-from .views import root_health
+from .views import root_health, metrics, profile_list, profile_download
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -22,10 +22,16 @@ schema_view = get_schema_view(
 
 urlpatterns = [
     path('', root_health), 
+    path('metrics', metrics),
+    path('admin/profiles/', profile_list),
+    path('admin/profiles/<str:name>/', profile_download),
     path('admin/', admin.site.urls),
     path('api/image/', include('tools.image_tools.urls')),
     path('api/pdf/', include('tools.pdf_tools.urls')),
     path('api/convert/', include('tools.file_convert_tools.urls')), 
+    path('api/jobs/', include('tools.jobs.urls')),
+    path('api/uploads/', include('tools.uploads.urls')),
+    path('api/archive/', include('tools.archive_tools.urls')),
 
     # ✅ Swagger / ReDoc 경로 추가
     re_path(r'^swagger(?P<format>\.json|\.yaml)$',
@@ -1,5 +1,44 @@
+from django.http import JsonResponse, HttpResponse, FileResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from tools.common.profiling import list_dumps, dump_path
+from tools.common.metrics import REGISTRY, render_metrics
+from tools.common.scratch import scratch_metrics
+from tools.common.governor import governor_metrics
+from tools.common.singleflight import singleflight_metrics
+from tools.common.aio import executor_metrics
+from tools.common.httpclient import pool_metrics
+
+# 호출 시점의 상태 값(대기열 깊이, 스크래치 사용량 등)을 gauge로 함께 내보냄
+REGISTRY.register_collector('filepick_scratch', scratch_metrics)
+REGISTRY.register_collector('filepick_converter', governor_metrics)
+REGISTRY.register_collector('filepick_singleflight', singleflight_metrics)
+REGISTRY.register_collector('filepick_async_executor', executor_metrics)
+REGISTRY.register_collector('filepick_storage_pool', pool_metrics)
 
-from django.http import JsonResponse
 
 def root_health(request):
     return JsonResponse({"message": "Welcome to FilePick API!"})
+
+
+def metrics(request):
+    """Prometheus 텍스트 형식의 메트릭 (이 요청을 처리한 워커 프로세스의 값)"""
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@staff_member_required
+def profile_list(request):
+    """저장된 요청 프로파일 목록 (관리자 전용)"""
+    return JsonResponse({'profiles': list_dumps()})
+
+
+@staff_member_required
+def profile_download(request, name):
+    """
+    프로파일 덤프 다운로드 (관리자 전용)
+    기본은 cProfile 결과(.prof, `python -m pstats` / snakeviz로 열기), ?format=json이면 메타데이터
+    """
+    ext = '.json' if request.GET.get('format') == 'json' else '.prof'
+    path = dump_path(name, ext)
+    if path is None:
+        return JsonResponse({'error': '프로파일을 찾을 수 없습니다.'}, status=404)
+    return FileResponse(open(path, 'rb'), as_attachment=True, filename=name + ext)
@@ -0,0 +1,10 @@
+# tests/conftest.py
+
+import os
+import django
+
+# 서비스 모듈이 import 시점에 settings를 읽으므로 테스트 수집 전에 Django를 초기화
+# (저장소는 메모리 백엔드를 사용해 외부 서비스 없이 실행)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'filepick.settings')
+os.environ['STORAGE_BACKEND'] = 'memory'
+django.setup()
@@ -0,0 +1,57 @@
+# tests/test_archive_create.py
+
+import io
+import os
+import tarfile
+import zipfile
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from tools.archive_tools.services.create import ArchiveError, tar_chunks, zip_chunks
+
+
+@pytest.fixture
+def files():
+    # 같은 이름은 unique_name으로 구분되고, 압축이 잘 되는 입력과 안 되는 입력을 함께 사용
+    return [
+        SimpleUploadedFile('a.txt', b'hello ' * 50_000),
+        SimpleUploadedFile('a.txt', b'second'),
+        SimpleUploadedFile('empty.bin', b''),
+        SimpleUploadedFile('한글 이름.jpg', os.urandom(300_000)),
+    ]
+
+
+def contents(files) -> list:
+    return [f.open().read() for f in files]
+
+
+def test_zip_chunks_round_trip(files):
+    expected = contents(files)
+    data = b''.join(zip_chunks(files, 6))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert len(set(names)) == len(files)
+        assert [archive.read(name) for name in names] == expected
+
+
+@pytest.mark.parametrize('gzip_level', [None, 1, 9])
+def test_tar_chunks_round_trip(files, gzip_level):
+    expected = contents(files)
+    data = b''.join(tar_chunks(files, gzip_level))
+    if gzip_level is None:
+        # tarfile.close()와 같이 레코드 단위로 끝남
+        assert len(data) % tarfile.RECORDSIZE == 0
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:*') as archive:
+        members = archive.getmembers()
+        assert len({m.name for m in members}) == len(files)
+        assert '한글 이름.jpg' in {m.name for m in members}
+        assert [archive.extractfile(m).read() for m in members] == expected
+
+
+def test_tar_chunks_rejects_size_mismatch():
+    changed = SimpleUploadedFile('a.txt', b'abc')
+    changed.size = 10
+    with pytest.raises(ArchiveError):
+        b''.join(tar_chunks([changed]))
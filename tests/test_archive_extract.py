@@ -0,0 +1,167 @@
+# tests/test_archive_extract.py
+
+import io
+import os
+import tarfile
+import zipfile
+import pytest
+from tools.archive_tools.services import extract
+from tools.archive_tools.services.extract import ArchiveError, _Budget, _iter_tar, _iter_zip
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    """한도를 작게 줄여 작은 입력으로 검사합니다."""
+    monkeypatch.setattr(extract, 'ARCHIVE_MAX_TOTAL_SIZE', 10_000)
+    monkeypatch.setattr(extract, 'ARCHIVE_MAX_MEMBERS', 3)
+    monkeypatch.setattr(extract, 'ARCHIVE_MAX_RATIO', 10)
+    monkeypatch.setattr(extract, 'ARCHIVE_RATIO_MIN_SIZE', 100)
+
+
+def write_zip(path, members: dict, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, 'w', compression) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def write_tar(path, members: dict, mode='w'):
+    with tarfile.open(path, mode) as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+def extracted(members) -> dict:
+    result = {}
+    for name, path in members:
+        with open(path, 'rb') as f:
+            result[name] = f.read()
+    return result
+
+
+# _Budget
+
+def test_budget_rejects_too_many_members(small_limits):
+    budget = _Budget(1000)
+    for _ in range(3):
+        budget.add_member(10)
+    with pytest.raises(ArchiveError) as e:
+        budget.add_member(10)
+    assert e.value.status == 413
+
+
+def test_budget_rejects_declared_total_over_limit(small_limits):
+    budget = _Budget(1000)
+    budget.consume(9_000)
+    with pytest.raises(ArchiveError) as e:
+        budget.add_member(1_001)
+    assert e.value.status == 413
+
+
+def test_budget_rejects_member_ratio(small_limits):
+    budget = _Budget(10_000)
+    # 압축률 검사 하한(100바이트) 이하는 압축률이 높아도 허용
+    budget.add_member(100, 1)
+    with pytest.raises(ArchiveError) as e:
+        budget.add_member(1_000, 10)
+    assert e.value.status == 413
+
+
+def test_budget_rejects_archive_ratio_while_consuming(small_limits):
+    budget = _Budget(50)
+    budget.consume(500)
+    with pytest.raises(ArchiveError) as e:
+        budget.consume(1)
+    assert e.value.status == 413
+
+
+def test_budget_rejects_actual_total_over_limit(small_limits):
+    budget = _Budget(10_000)
+    budget.consume(10_000)
+    with pytest.raises(ArchiveError):
+        budget.consume(1)
+
+
+# _iter_zip
+
+def test_iter_zip_extracts_members(tmp_path):
+    archive = write_zip(tmp_path / 'a.zip', {'a.txt': b'hello', 'dir/b.bin': os.urandom(300)})
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    result = extracted(_iter_zip(archive, str(out_dir), _Budget(os.path.getsize(archive))))
+    assert result['a.txt'] == b'hello'
+    assert len(result['dir/b.bin']) == 300
+
+
+def test_iter_zip_skips_unsafe_paths(tmp_path):
+    archive = write_zip(tmp_path / 'evil.zip', {'../evil.txt': b'x', '/abs.txt': b'x', 'C:/win.txt': b'x', 'ok.txt': b'ok'})
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    result = extracted(_iter_zip(archive, str(out_dir), _Budget(os.path.getsize(archive))))
+    assert list(result) == ['ok.txt']
+    # 항목은 out_dir 안의 일련번호 파일로만 기록됨
+    assert not (tmp_path / 'evil.txt').exists()
+    assert os.listdir(out_dir) == ['000003']
+
+
+def test_iter_zip_rejects_compression_bomb(tmp_path, small_limits):
+    archive = write_zip(tmp_path / 'bomb.zip', {'bomb.txt': b'\0' * 5_000})
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    with pytest.raises(ArchiveError) as e:
+        list(_iter_zip(archive, str(out_dir), _Budget(os.path.getsize(archive))))
+    assert e.value.status == 413
+
+
+def test_iter_zip_rejects_invalid_file(tmp_path):
+    path = tmp_path / 'broken.zip'
+    path.write_bytes(b'not a zip')
+    with pytest.raises(ArchiveError) as e:
+        list(_iter_zip(str(path), str(tmp_path), _Budget(9)))
+    assert e.value.status == 400
+
+
+# _iter_tar
+
+@pytest.mark.parametrize('mode', ['w', 'w:gz', 'w:xz'])
+def test_iter_tar_extracts_members(tmp_path, mode):
+    archive = write_tar(tmp_path / 'a.tar', {'a.txt': b'hello', 'dir/b.bin': b'\1' * 300}, mode)
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    result = extracted(_iter_tar(archive, str(out_dir), _Budget(os.path.getsize(archive))))
+    assert result == {'a.txt': b'hello', 'dir/b.bin': b'\1' * 300}
+
+
+def test_iter_tar_skips_unsafe_paths_and_links(tmp_path):
+    path = tmp_path / 'evil.tar'
+    with tarfile.open(path, 'w') as archive:
+        for name in ('../evil.txt', '/abs.txt', 'a/../../up.txt', 'ok/f.txt'):
+            info = tarfile.TarInfo(name)
+            info.size = 3
+            archive.addfile(info, io.BytesIO(b'abc'))
+        link = tarfile.TarInfo('link')
+        link.type, link.linkname = tarfile.SYMTYPE, '/etc/passwd'
+        archive.addfile(link)
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    result = extracted(_iter_tar(str(path), str(out_dir), _Budget(os.path.getsize(path))))
+    assert list(result) == ['ok/f.txt']
+    assert not (tmp_path / 'evil.txt').exists()
+
+
+def test_iter_tar_rejects_compression_bomb(tmp_path, small_limits):
+    archive = write_tar(tmp_path / 'bomb.tar.gz', {'bomb.txt': b'\0' * 5_000}, 'w:gz')
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    with pytest.raises(ArchiveError) as e:
+        list(_iter_tar(archive, str(out_dir), _Budget(os.path.getsize(archive))))
+    assert e.value.status == 413
@@ -0,0 +1,76 @@
+# tests/test_charset.py
+
+import pytest
+from tools.file_convert_tools.services.charset import CharsetError, transcode_chunks
+
+
+def split(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def transcode(chunks, source, target, errors='strict') -> bytes:
+    return b''.join(transcode_chunks(chunks, source, target, errors))
+
+
+TEXT = "id,이름,memo\n" + "1,홍길동,ascii only line\n" * 20 + "2,김철수,😀 emoji\n"
+
+
+@pytest.mark.parametrize('source, target', [
+    ('cp949', 'utf-8'),
+    ('utf-8', 'cp949'),
+    ('utf-8', 'utf-16'),
+    ('utf-16', 'utf-8'),
+])
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 4096])
+def test_chunk_boundaries_inside_multibyte_characters(source, target, size):
+    # 청크 크기 1~3이면 모든 멀티바이트 문자가 경계에서 잘림
+    text = TEXT if 'cp949' not in (source, target) else TEXT.replace('😀 ', '')
+    data = text.encode(source)
+    assert transcode(split(data, size), source, target) == text.encode(target)
+
+
+def test_ascii_chunks_pass_through_unchanged():
+    chunks = [b'abc,def\n', '가'.encode('utf-8')[:2], '가'.encode('utf-8')[2:] + b'xyz', b'tail\n']
+    output = list(transcode_chunks(chunks, 'utf-8', 'cp949'))
+    # 첫 ASCII 청크는 같은 객체 그대로, 잘린 문자 뒤의 청크는 디코더를 거쳐야 함
+    assert output[0] is chunks[0]
+    assert b''.join(output) == 'abc,def\n가xyztail\n'.encode('cp949')
+
+
+@pytest.mark.parametrize('size', [1, 3, 5, 1000])
+def test_decode_error_offset_is_absolute(size):
+    data = 'ab가나'.encode('utf-8') + b'\xff' + b'tail'
+    bad = data.index(b'\xff')
+    with pytest.raises(CharsetError) as e:
+        transcode(split(data, size), 'utf-8', 'cp949')
+    assert e.value.status == 422
+    assert str(e.value).startswith(f"{bad}바이트 위치")
+
+
+def test_decode_error_offset_counts_bytes_carried_from_previous_chunk():
+    # 3바이트 문자의 첫 바이트만 앞 청크에 있고, 다음 청크가 올바르지 않은 연속 바이트로 시작
+    chunks = [b'abcd\xea', b'Azz']
+    with pytest.raises(CharsetError) as e:
+        transcode(chunks, 'utf-8', 'cp949')
+    assert str(e.value).startswith("4바이트 위치")
+
+
+def test_encode_error_reports_character():
+    with pytest.raises(CharsetError) as e:
+        transcode(['ok 😀'.encode('utf-8')], 'utf-8', 'cp949')
+    assert e.value.status == 422
+    assert '😀' in str(e.value)
+
+
+def test_truncated_character_at_end_of_file():
+    with pytest.raises(CharsetError) as e:
+        transcode([b'ok', '가'.encode('utf-8')[:2]], 'utf-8', 'cp949')
+    assert e.value.status == 422
+
+
+@pytest.mark.parametrize('errors, expected', [
+    ('replace', 'a�b'.encode('utf-8')),
+    ('ignore', b'ab'),
+])
+def test_error_policies(errors, expected):
+    assert transcode([b'a\xff', b'b'], 'cp949', 'utf-8', errors) == expected
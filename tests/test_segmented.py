@@ -0,0 +1,39 @@
+# tests/test_segmented.py
+
+import pytest
+from tools.file_convert_tools.services.segmented import choose_split_points
+
+
+def test_splits_at_first_keyframe_after_target():
+    keyframes = [0, 10, 20, 31, 40, 50, 62, 70, 80, 95, 100]
+    assert choose_split_points(keyframes, 120, target=30) == [31, 62, 95]
+
+
+def test_drops_points_too_close_to_end():
+    # 마지막 세그먼트가 target/2(15초) 미만이 되는 지점은 제외
+    keyframes = [0, 30, 60, 90]
+    assert choose_split_points(keyframes, 100, target=30) == [30, 60]
+    assert choose_split_points(keyframes, 105, target=30) == [30, 60, 90]
+
+
+def test_sparse_keyframes_give_longer_segments():
+    # 키프레임 사이가 target보다 길면 다음 키프레임에서만 나눔
+    assert choose_split_points([0, 45, 130, 200], 260, target=30) == [45, 130, 200]
+
+
+@pytest.mark.parametrize('keyframes, duration', [
+    ([], 600),
+    ([0], 600),
+    ([0, 10, 20], 25),
+])
+def test_no_split_points(keyframes, duration):
+    assert choose_split_points(keyframes, duration, target=30) == []
+
+
+def test_points_are_increasing_keyframes():
+    keyframes = [i * 2.002 for i in range(1000)]
+    points = choose_split_points(keyframes, 2002, target=30)
+    assert points == sorted(points)
+    assert set(points) <= set(keyframes)
+    assert all(b - a >= 30 for a, b in zip([0.0] + points, points))
+    assert 2002 - points[-1] >= 15
@@ -0,0 +1,179 @@
+# tools/archive_tools/services/create.py
+
+import os
+import time
+import uuid
+import zlib
+import tarfile
+import subprocess
+from django.conf import settings
+from tools.common.zipstream import ZipStream, unique_name
+from tools.common.governor import converter_slot, converter_timeout
+from tools.common.threads import converter_threads, converter_cpus
+from tools.common.process import run_process
+from tools.common.scratch import scratch_workspace
+from tools.common.metrics import stage
+from tools.archive_tools.services.extract import ArchiveError, SEVEN_ZIP_COMMAND, CHUNK_SIZE
+from tools.archive_tools.services.uploader import upload_archive_file, upload_archive_stream
+
+# 형식별 확장자와 Content-Type
+ARCHIVE_FORMATS = {
+    'zip': ('.zip', 'application/zip'),
+    'tar': ('.tar', 'application/x-tar'),
+    'tar.gz': ('.tar.gz', 'application/gzip'),
+    '7z': ('.7z', 'application/x-7z-compressed'),
+}
+
+# 입력 전체 크기에 따른 압축 수준 구간 (바이트)
+# 작은 입력은 최고 압축률, 큰 입력은 CPU 시간이 크기에 비례해 늘어나므로 빠른 수준을 사용
+ARCHIVE_SMALL_SIZE = getattr(settings, 'ARCHIVE_SMALL_SIZE', 32 * 1024 * 1024)
+ARCHIVE_MEDIUM_SIZE = getattr(settings, 'ARCHIVE_MEDIUM_SIZE', 512 * 1024 * 1024)
+
+_TAR_BLOCK = tarfile.BLOCKSIZE
+_TAR_RECORD = tarfile.RECORDSIZE
+
+
+def compression_settings(total_size: int, fmt: str) -> tuple:
+    """
+    입력 전체 크기로 (압축 수준, 스레드 수)를 정합니다.
+
+    - ARCHIVE_SMALL_SIZE 이하: 수준 9, 1스레드 (금방 끝나므로 압축률 우선)
+    - ARCHIVE_MEDIUM_SIZE 이하: 수준 6 (zlib 기본값), 7z는 최대 2스레드
+    - 그 이상: 수준 1 (7z는 3), 7z는 변환기 슬롯에 배정된 스레드를 모두 사용
+    스레드 수는 멀티스레드 압축을 지원하는 7z에만 적용되며, ZIP/TAR.GZ는 항상 1스레드입니다.
+    """
+    if total_size <= ARCHIVE_SMALL_SIZE:
+        level, threads = 9, 1
+    elif total_size <= ARCHIVE_MEDIUM_SIZE:
+        level, threads = 6, min(2, converter_threads('7z'))
+    else:
+        level, threads = (3 if fmt == '7z' else 1), converter_threads('7z')
+    return level, (threads if fmt == '7z' else 1)
+
+
+def _member_chunks(uploaded_file):
+    # 디스크에 있는 입력(재개 업로드, 직접 업로드, 압축을 푼 항목)은 경로에서 바로 읽음
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        with open(uploaded_file.temporary_file_path(), 'rb') as src:
+            yield from iter(lambda: src.read(CHUNK_SIZE), b"")
+        return
+    yield from uploaded_file.chunks(CHUNK_SIZE)
+
+
+def zip_chunks(files: list, level: int):
+    """입력 파일들을 ZIP으로 묶으면서 생성된 바이트를 청크 단위로 내보냅니다."""
+    archive = ZipStream(compresslevel=level)
+    for f in files:
+        yield from archive.add_chunks(f.name, f.size, _member_chunks(f))
+    yield archive.close()
+
+
+def tar_chunks(files: list, gzip_level: int = None):
+    """
+    입력 파일들을 TAR(gzip_level이 있으면 TAR.GZ)로 묶으면서 청크 단위로 내보냅니다.
+    tarfile은 헤더 기록 후 파일 객체 전체를 복사하므로, 헤더/데이터/패딩을 직접 이어 붙여 항목 단위로 흘려보냅니다.
+    """
+    compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31) if gzip_level is not None else None
+    offset = 0
+
+    def emit(data: bytes) -> bytes:
+        nonlocal offset
+        offset += len(data)
+        return compressor.compress(data) if compressor else data
+
+    used, now = set(), int(time.time())
+    for f in files:
+        info = tarfile.TarInfo(unique_name(f.name, used))
+        info.size, info.mtime, info.mode = f.size, now, 0o644
+        yield emit(info.tobuf(format=tarfile.PAX_FORMAT, encoding='utf-8'))
+
+        written = 0
+        for chunk in _member_chunks(f):
+            written += len(chunk)
+            if written > info.size:
+                raise ArchiveError(f"입력 파일 크기가 바뀌었습니다: {f.name}")
+            yield emit(chunk)
+        if written != info.size:
+            raise ArchiveError(f"입력 파일 크기가 바뀌었습니다: {f.name}")
+        yield emit(b"\0" * (-info.size % _TAR_BLOCK))
+
+    # 아카이브 끝 표시(0으로 채운 블록 2개)와 레코드 단위 패딩 (tarfile.close()와 같은 형태)
+    end = _TAR_BLOCK * 2
+    end += -(offset + end) % _TAR_RECORD
+    yield emit(b"\0" * end)
+    if compressor:
+        yield compressor.flush()
+
+
+def _stage_7z_members(files: list, src_dir: str):
+    """7z가 읽을 수 있도록 입력을 src_dir에 배치합니다. 디스크에 있는 입력은 하드 링크로 복사를 생략합니다."""
+    used = set()
+    for f in files:
+        dest = os.path.join(src_dir, unique_name(f.name, used))
+        if hasattr(f, 'temporary_file_path'):
+            try:
+                os.link(f.temporary_file_path(), dest)
+                continue
+            except OSError:
+                pass  # 다른 파일 시스템이면 복사
+        with open(dest, 'wb') as dst:
+            for chunk in _member_chunks(f):
+                dst.write(chunk)
+
+
+def build_7z(files: list, workspace, level: int, threads: int) -> str:
+    """
+    7z 아카이브를 작업 디렉터리에 만들고 경로를 반환합니다.
+    7z 형식은 끝에 쓴 헤더가 앞쪽 시작 헤더의 오프셋을 가리키므로 스트리밍할 수 없어 파일로 만듭니다.
+    """
+    src_dir = workspace.mkdir('src')
+    _stage_7z_members(files, src_dir)
+    workspace.check_quota()
+
+    output_path = workspace.file_path('archive.7z')
+    with converter_slot('7z') as slot, stage('encode'):
+        try:
+            run_process(
+                [SEVEN_ZIP_COMMAND, 'a', '-t7z', f'-mx={level}', f'-mmt={threads}', '-bd', '-y',
+                 output_path, os.path.join(src_dir, '*')],
+                cancel_check=workspace.guard(),
+                timeout=converter_timeout('7z'),
+                cpus=converter_cpus(slot)
+            )
+        except FileNotFoundError:
+            raise ArchiveError("7z 압축 프로그램을 사용할 수 없습니다.", status=501)
+    return output_path
+
+
+def create_archive(files: list, fmt: str) -> dict:
+    """
+    입력 파일들을 fmt 형식으로 묶어 'archives' 버킷에 업로드하고 결과를 반환합니다.
+    ZIP/TAR/TAR.GZ는 만들어지는 대로 chunked 업로드하므로 아카이브 전체를 메모리나 디스크에 모으지 않습니다.
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise ArchiveError(f"format은 {', '.join(ARCHIVE_FORMATS)} 중 하나여야 합니다.")
+
+    total_size = sum(f.size or 0 for f in files)
+    level, threads = compression_settings(total_size, fmt)
+    ext, content_type = ARCHIVE_FORMATS[fmt]
+    filename = f"{uuid.uuid4()}{ext}"
+
+    if fmt == '7z':
+        # 원본 배치(하드 링크가 안 되면 복사) + 결과 파일
+        with scratch_workspace(size_hint=total_size * 2, prefix="archive") as workspace:
+            try:
+                output_path = build_7z(files, workspace, level, threads)
+            except subprocess.CalledProcessError as e:
+                stderr = (e.stderr or b"").decode("utf-8", errors="ignore")
+                raise ArchiveError(f"7z 압축 실패: {stderr}", status=500)
+            url = upload_archive_file("created", filename, output_path, content_type)
+    else:
+        if fmt == 'zip':
+            chunks = zip_chunks(files, level)
+        else:
+            chunks = tar_chunks(files, level if fmt == 'tar.gz' else None)
+        # 압축과 업로드가 번갈아 진행되므로 처리 시간은 upload 단계에 함께 기록됨
+        url = upload_archive_stream("created", filename, filter(None, chunks), content_type)
+
+    return {'archive_url': url, 'format': fmt, 'level': level, 'threads': threads, 'files': len(files)}
+
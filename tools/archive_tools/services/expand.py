@@ -0,0 +1,75 @@
+# tools/archive_tools/services/expand.py
+
+import os
+import weakref
+import mimetypes
+import posixpath
+from django.core.files.uploadedfile import UploadedFile
+from tools.common.scratch import open_workspace, staged_upload_path
+from tools.archive_tools.services.extract import archive_kind, iter_members, max_extracted_size
+
+
+class _ExtractDir:
+    """
+    아카이브 하나를 푼 스크래치 작업 디렉터리. 이 디렉터리의 항목 파일 객체가 모두 사라지면 삭제하고 예약한 용량을 반환합니다.
+    풀릴 수 있는 최대 크기(size_hint)를 스크래치 한도에 미리 예약하므로 다른 작업과 함께 용량 한도가 적용됩니다.
+    """
+
+    def __init__(self, size_hint: int):
+        workspace = open_workspace(size_hint=size_hint, prefix="extract")
+        self.path = workspace.path
+        self.guard = workspace.guard
+        weakref.finalize(self, workspace.close)
+
+
+class ExtractedFile(UploadedFile):
+    """
+    아카이브에서 푼 항목을 일반 업로드 파일처럼 다룰 수 있게 감싼 객체입니다.
+    temporary_file_path()로 풀린 파일 경로를 그대로 제공하므로 도구 뷰에서 추가 복사가 없습니다.
+    항목이 많은 아카이브에서 파일 디스크립터가 쌓이지 않도록 파일은 처음 읽을 때 엽니다.
+    """
+
+    def __init__(self, name: str, path: str, extract_dir: _ExtractDir):
+        self._path = path
+        self._extract_dir = extract_dir  # 파일 객체가 살아 있는 동안 디렉터리를 유지
+        filename = posixpath.basename(name)
+        super().__init__(
+            file=None,
+            name=filename,
+            content_type=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+            size=os.path.getsize(path),
+        )
+        self.member_name = name
+
+    @property
+    def file(self):
+        if self._file is None:
+            self._file = open(self._path, 'rb')
+        return self._file
+
+    @file.setter
+    def file(self, value):
+        self._file = value
+
+    def temporary_file_path(self):
+        return self._path
+
+
+def expand_archives(files: list) -> list:
+    """
+    입력 파일 중 아카이브(zip, tar 계열, 7z, rar)를 항목 파일들로 바꾼 목록을 반환합니다.
+    항목은 아카이브마다 스크래치 디렉터리에 풀리며, 중간 업로드 없이 바로 다른 도구의 입력으로 사용됩니다.
+    아카이브가 아닌 파일과 아카이브 안의 아카이브는 그대로 둡니다. 한도 초과 등은 ArchiveError, 스크래치 용량 부족은 ScratchQuotaExceeded를 발생시킵니다.
+    """
+    expanded = []
+    for f in files:
+        if archive_kind(f.name) is None:
+            expanded.append(f)
+            continue
+
+        suffix = os.path.splitext(f.name)[1].lower()
+        with staged_upload_path(f, suffix=suffix) as archive_path:
+            extract_dir = _ExtractDir(max_extracted_size(archive_path, f.name))
+            for name, path in iter_members(archive_path, f.name, extract_dir.path, extract_dir.guard()):
+                expanded.append(ExtractedFile(name, path, extract_dir))
+    return expanded
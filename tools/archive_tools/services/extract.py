@@ -0,0 +1,292 @@
+# tools/archive_tools/services/extract.py
+
+import os
+import stat
+import uuid
+import mimetypes
+import tarfile
+import zipfile
+import posixpath
+import subprocess
+from django.conf import settings
+from tools.common.governor import converter_slot, converter_timeout
+from tools.common.process import run_process
+from tools.common.metrics import stage
+from tools.common.scratch import scratch_workspace, staged_upload_path
+from tools.archive_tools.services.uploader import upload_archive_file
+
+# 압축 해제 결과 전체 크기 한도 (선언된 크기와 실제로 풀린 바이트 모두 검사)
+ARCHIVE_MAX_TOTAL_SIZE = getattr(settings, 'ARCHIVE_MAX_TOTAL_SIZE', 4 * 1024 ** 3)
+
+# 항목 수 한도
+ARCHIVE_MAX_MEMBERS = getattr(settings, 'ARCHIVE_MAX_MEMBERS', 10000)
+
+# 압축률(풀린 크기 / 압축된 크기) 한도 - 항목별(ZIP/7z)과 아카이브 전체에 적용
+ARCHIVE_MAX_RATIO = getattr(settings, 'ARCHIVE_MAX_RATIO', 200)
+
+# 이 크기보다 작게 풀리는 항목/아카이브는 압축률을 검사하지 않음 (작은 텍스트는 정상적으로도 압축률이 높음)
+ARCHIVE_RATIO_MIN_SIZE = getattr(settings, 'ARCHIVE_RATIO_MIN_SIZE', 1024 * 1024)
+
+# 항목을 풀어 기록하는 단위
+CHUNK_SIZE = 256 * 1024
+
+# 7z/RAR 처리에 사용하는 명령 (p7zip)
+SEVEN_ZIP_COMMAND = getattr(settings, 'SEVEN_ZIP_COMMAND', '7z')
+
+_TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+class ArchiveError(Exception):
+    """아카이브를 처리할 수 없는 경우 (status: 응답할 HTTP 상태 코드, 한도 초과는 413)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def archive_kind(filename: str):
+    """파일 이름으로 아카이브 종류('zip', 'tar', '7z')를 반환합니다. 아카이브가 아니면 None."""
+    name = (filename or '').lower()
+    if name.endswith('.zip'):
+        return 'zip'
+    if name.endswith(_TAR_SUFFIXES):
+        return 'tar'
+    if name.endswith(('.7z', '.rar')):
+        return '7z'
+    return None
+
+
+class _Budget:
+    """풀린 바이트/항목 수를 누적하며 한도를 넘으면 ArchiveError(413)를 발생시킵니다."""
+
+    def __init__(self, archive_size: int):
+        self.archive_size = max(archive_size, 1)
+        self.total = 0
+        self.members = 0
+
+    def add_member(self, declared_size: int = 0, compressed_size: int = None):
+        self.members += 1
+        if self.members > ARCHIVE_MAX_MEMBERS:
+            raise ArchiveError(f"항목 수가 한도({ARCHIVE_MAX_MEMBERS}개)를 넘습니다.", status=413)
+        if self.total + declared_size > ARCHIVE_MAX_TOTAL_SIZE:
+            raise ArchiveError(f"풀린 크기가 한도({ARCHIVE_MAX_TOTAL_SIZE} bytes)를 넘습니다.", status=413)
+        if compressed_size is not None:
+            _check_ratio(declared_size, compressed_size)
+
+    def consume(self, amount: int):
+        self.total += amount
+        if self.total > ARCHIVE_MAX_TOTAL_SIZE:
+            raise ArchiveError(f"풀린 크기가 한도({ARCHIVE_MAX_TOTAL_SIZE} bytes)를 넘습니다.", status=413)
+        _check_ratio(self.total, self.archive_size)
+
+
+def _check_ratio(size: int, compressed_size: int):
+    if size > ARCHIVE_RATIO_MIN_SIZE and size > ARCHIVE_MAX_RATIO * max(compressed_size, 1):
+        raise ArchiveError(f"압축률이 한도({ARCHIVE_MAX_RATIO}:1)를 넘습니다 (압축 폭탄 의심).", status=413)
+
+
+def safe_member_name(name: str):
+    """
+    항목 경로를 상대 경로로 정리해 반환합니다.
+    절대 경로, 상위 디렉터리(..) 탈출, 빈 이름은 None을 반환하여 건너뛰게 합니다.
+    """
+    name = (name or '').replace('\\', '/')
+    if name.startswith('/') or (len(name) > 1 and name[1] == ':'):
+        return None
+    normalized = posixpath.normpath(name)
+    if normalized in ('', '.') or normalized == '..' or normalized.startswith('../'):
+        return None
+    return normalized
+
+
+def _copy(src, dest_path: str, budget: _Budget, declared_size: int = None):
+    """src를 청크 단위로 dest_path에 기록하며 한도를 검사합니다. 선언된 크기보다 많이 풀리면 중단합니다."""
+    written = 0
+    with open(dest_path, 'wb') as dest:
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                return written
+            written += len(chunk)
+            if declared_size is not None and written > declared_size:
+                raise ArchiveError("항목이 선언된 크기보다 크게 풀립니다 (손상 또는 압축 폭탄).", status=413)
+            budget.consume(len(chunk))
+            dest.write(chunk)
+
+
+def _iter_zip(archive_path: str, out_dir: str, budget: _Budget):
+    try:
+        archive = zipfile.ZipFile(archive_path)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise ArchiveError(f"ZIP 파일을 읽을 수 없습니다: {e}")
+
+    with archive:
+        for index, info in enumerate(archive.infolist()):
+            name = safe_member_name(info.filename)
+            if name is None or info.is_dir():
+                continue
+            if stat.S_ISLNK(info.external_attr >> 16):
+                continue  # 심볼릭 링크는 풀지 않음
+            if info.flag_bits & 0x1:
+                raise ArchiveError("암호화된 ZIP 항목은 지원하지 않습니다.")
+            budget.add_member(info.file_size, info.compress_size)
+
+            path = os.path.join(out_dir, f"{index:06d}")
+            try:
+                with archive.open(info) as src:
+                    _copy(src, path, budget, info.file_size)
+            except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, EOFError) as e:
+                raise ArchiveError(f"ZIP 항목을 풀 수 없습니다 ({name}): {e}")
+            yield name, path
+
+
+def _iter_tar(archive_path: str, out_dir: str, budget: _Budget):
+    # 'r|*' 스트림 모드: 앞에서부터 한 번만 읽으므로 압축 해제 상태를 항목 하나 분량으로 유지
+    try:
+        archive = tarfile.open(archive_path, mode='r|*')
+    except (tarfile.TarError, OSError) as e:
+        raise ArchiveError(f"TAR 파일을 읽을 수 없습니다: {e}")
+
+    with archive:
+        try:
+            for index, member in enumerate(archive):
+                name = safe_member_name(member.name)
+                if name is None or not member.isfile():
+                    continue  # 디렉터리, 링크, 장치 파일은 풀지 않음
+                budget.add_member(member.size)
+
+                path = os.path.join(out_dir, f"{index:06d}")
+                _copy(archive.extractfile(member), path, budget, member.size)
+                yield name, path
+        except (tarfile.TarError, EOFError, OSError) as e:
+            raise ArchiveError(f"TAR 항목을 풀 수 없습니다: {e}")
+
+
+def _list_7z(archive_path: str) -> list:
+    """7z l -slt 출력에서 (경로, 크기, 압축된 크기, 디렉터리 여부) 목록을 만듭니다."""
+    result = run_process([SEVEN_ZIP_COMMAND, 'l', '-slt', '-ba', '-p', archive_path],
+                         timeout=converter_timeout('7z'))
+    entries, current = [], {}
+    for line in result.stdout.decode('utf-8', errors='replace').splitlines() + ['']:
+        if not line.strip():
+            if 'Path' in current:
+                entries.append(current)
+            current = {}
+            continue
+        key, _, value = line.partition(' = ')
+        current[key.strip()] = value.strip()
+    return entries
+
+
+def _iter_7z(archive_path: str, out_dir: str, budget: _Budget, cancel_check=None):
+    """
+    7z/RAR은 p7zip으로 처리합니다. 목록의 선언된 크기로 한도를 먼저 검사한 뒤 전체를 풀고,
+    실제로 풀린 파일 크기를 다시 검사합니다 (7z 형식은 헤더의 크기로 압축을 해제하므로 선언값을 넘지 않음).
+    """
+    with converter_slot('7z'):
+        try:
+            entries = _list_7z(archive_path)
+        except subprocess.CalledProcessError as e:
+            raise ArchiveError(f"아카이브를 읽을 수 없습니다: {(e.stderr or b'').decode('utf-8', 'ignore')}")
+        except FileNotFoundError:
+            raise ArchiveError("7z 압축 프로그램을 사용할 수 없습니다.", status=501)
+
+        declared = []
+        for entry in entries:
+            name = safe_member_name(entry.get('Path'))
+            if name is None or entry.get('Folder') == '+' or 'D' in entry.get('Attributes', '')[:1]:
+                continue
+            if entry.get('Encrypted') == '+':
+                raise ArchiveError("암호화된 아카이브는 지원하지 않습니다.")
+            size = int(entry.get('Size') or 0)
+            packed = entry.get('Packed Size')
+            budget.add_member(size, int(packed) if packed and packed != '0' else None)
+            budget.total += size
+            declared.append(name)
+        if budget.total > ARCHIVE_MAX_TOTAL_SIZE:
+            raise ArchiveError(f"풀린 크기가 한도({ARCHIVE_MAX_TOTAL_SIZE} bytes)를 넘습니다.", status=413)
+        _check_ratio(budget.total, budget.archive_size)
+
+        extract_dir = os.path.join(out_dir, 'x')
+        try:
+            with stage('decode'):
+                run_process([SEVEN_ZIP_COMMAND, 'x', '-y', '-p', f"-o{extract_dir}", archive_path],
+                            cancel_check=cancel_check, timeout=converter_timeout('7z'))
+        except subprocess.CalledProcessError as e:
+            raise ArchiveError(f"아카이브를 풀 수 없습니다: {(e.stderr or b'').decode('utf-8', 'ignore')}")
+
+    real_root = os.path.realpath(extract_dir)
+    actual = 0
+    for name in declared:
+        path = os.path.join(extract_dir, name)
+        if not os.path.realpath(path).startswith(real_root + os.sep) or not os.path.isfile(path) \
+                or os.path.islink(path):
+            continue
+        actual += os.path.getsize(path)
+        if actual > ARCHIVE_MAX_TOTAL_SIZE:
+            raise ArchiveError(f"풀린 크기가 한도({ARCHIVE_MAX_TOTAL_SIZE} bytes)를 넘습니다.", status=413)
+        yield name, path
+
+
+def max_extracted_size(archive_path: str, filename: str) -> int:
+    """
+    풀었을 때 디스크에 쓰일 수 있는 최대 크기 (스크래치 용량 예약용).
+    ZIP은 중앙 디렉터리에 선언된 크기 합계, 그 외는 _Budget이 허용하는 상한(전체 한도와 압축률 한도 중 작은 값)입니다.
+    """
+    archive_size = os.path.getsize(archive_path)
+    limit = min(ARCHIVE_MAX_TOTAL_SIZE, max(ARCHIVE_MAX_RATIO * archive_size, ARCHIVE_RATIO_MIN_SIZE))
+    if archive_kind(filename) == 'zip':
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                return min(limit, sum(info.file_size for info in archive.infolist()))
+        except (zipfile.BadZipFile, OSError):
+            pass  # 읽을 수 없는 ZIP은 iter_members()에서 ArchiveError로 보고
+    return limit
+
+
+def iter_members(archive_path: str, filename: str, out_dir: str, cancel_check=None):
+    """
+    아카이브의 일반 파일 항목을 하나씩 out_dir에 풀면서 (항목 경로, 풀린 파일 경로)를 내보냅니다.
+
+    항목은 청크 단위로 디스크에 기록되므로 아카이브나 항목 전체를 메모리에 올리지 않습니다.
+    항목 수, 풀린 전체 크기, 압축률이 한도를 넘으면(압축 폭탄) ArchiveError(413)를 발생시키며,
+    절대 경로/상위 디렉터리 탈출 항목과 링크·장치 파일은 건너뜁니다. 중첩된 아카이브는 풀지 않습니다.
+    cancel_check는 7z 프로세스 실행 중 호출됩니다 (예: out_dir 작업 공간의 guard()).
+    """
+    kind = archive_kind(filename)
+    budget = _Budget(os.path.getsize(archive_path))
+    if kind == 'zip':
+        yield from _iter_zip(archive_path, out_dir, budget)
+    elif kind == 'tar':
+        yield from _iter_tar(archive_path, out_dir, budget)
+    elif kind == '7z':
+        yield from _iter_7z(archive_path, out_dir, budget, cancel_check)
+    else:
+        raise ArchiveError("지원하지 않는 아카이브 형식입니다 (zip, tar, tar.gz, tar.bz2, tar.xz, 7z, rar).")
+
+
+def extract_archive(uploaded_file) -> list:
+    """
+    업로드된 아카이브를 풀어 항목마다 'archives' 버킷에 업로드하고 [{name, size, url}] 목록을 반환합니다.
+    ZIP/TAR는 항목 하나를 풀어 올린 뒤 바로 지우므로 작업 디렉터리에는 한 번에 항목 하나만 남습니다.
+    """
+    folder = f"extracted/{uuid.uuid4().hex}"
+    suffix = os.path.splitext(uploaded_file.name)[1].lower()
+    results = []
+
+    with staged_upload_path(uploaded_file, suffix=suffix) as archive_path, \
+            scratch_workspace(size_hint=uploaded_file.size or 0, prefix="extract") as workspace:
+        for name, path in iter_members(archive_path, uploaded_file.name, workspace.path, workspace.guard()):
+            workspace.check_quota()
+            directory, filename = posixpath.split(name)
+            size = os.path.getsize(path)
+            url = upload_archive_file(
+                folder=posixpath.join(folder, directory) if directory else folder,
+                filename=filename,
+                file_path=path,
+                content_type=mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            )
+            results.append({'name': name, 'size': size, 'url': url})
+            os.remove(path)
+
+    return results
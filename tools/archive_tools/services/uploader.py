@@ -0,0 +1,39 @@
+# tools/archive_tools/services/uploader.py
+
+from tools.common.storage import upload_file_to_supabase, upload_stream_to_supabase
+
+def upload_archive_file(
+        folder: str,
+        filename: str,
+        file_path: str,
+        content_type: str = "application/octet-stream"
+        ) -> str:
+    """
+    디스크의 파일(7z 결과, 압축을 푼 항목)을 Supabase의 'archives' 버킷에 업로드
+    """
+    return upload_file_to_supabase(
+        bucket="archives",
+        folder=folder,
+        filename=filename,
+        file_path=file_path,
+        content_type=content_type
+    )
+
+
+def upload_archive_stream(
+        folder: str,
+        filename: str,
+        chunks,
+        content_type: str = "application/octet-stream"
+        ) -> str:
+    """
+    만들어지는 아카이브 스트림(ZIP/TAR)을 'archives' 버킷에 바로 업로드
+    """
+    return upload_stream_to_supabase(
+        bucket="archives",
+        folder=folder,
+        filename=filename,
+        chunks=chunks,
+        content_type=content_type
+    )
+
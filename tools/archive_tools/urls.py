@@ -0,0 +1,13 @@
+# tools/archive_tools/urls.py
+
+from django.urls import path
+from .views import async_views
+from .views.create import create_archive_view
+from .views.extract import extract_archive_view
+from tools.common.aio import pick_view
+
+# ASYNC_VIEWS=true(ASGI 배포)면 같은 URL에 views/async_views.py의 비동기 뷰를 연결
+urlpatterns = [
+    path('create/', pick_view(create_archive_view, async_views.create_archive_view)),      # 파일들을 ZIP/TAR/TAR.GZ/7z로 묶기
+    path('extract/', pick_view(extract_archive_view, async_views.extract_archive_view)),   # 아카이브 풀기 (항목별 URL 반환)
+]
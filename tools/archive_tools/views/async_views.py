@@ -0,0 +1,42 @@
+# tools/archive_tools/views/async_views.py
+
+from django.http import JsonResponse
+from tools.common.inputs import read_input_files
+from tools.common.aio import async_tool_view, run_io
+from tools.archive_tools.services.create import create_archive, ARCHIVE_FORMATS
+from tools.archive_tools.services.extract import extract_archive, archive_kind
+from tools.archive_tools.views.errors import archive_error_response
+
+
+@async_tool_view
+async def create_archive_view(request):
+    """
+    create_archive_view의 비동기 버전 (ASYNC_VIEWS=True일 때 /api/archive/create/에 연결)
+    압축(zlib, 7z 대기)과 업로드가 한 흐름으로 이어지므로 전체를 I/O 실행기에서 실행합니다.
+    """
+    files = await read_input_files(request, 'files')
+    fmt = request.POST.get('format', 'zip').lower()
+
+    if not files:
+        return JsonResponse({'error': '파일이 필요합니다.'}, status=400)
+    if fmt not in ARCHIVE_FORMATS:
+        return JsonResponse({'error': f'format은 {", ".join(ARCHIVE_FORMATS)} 중 하나여야 합니다.'}, status=400)
+
+    try:
+        return JsonResponse(await run_io(create_archive, files, fmt))
+    except Exception as e:
+        return archive_error_response(e, '압축')
+
+
+@async_tool_view
+async def extract_archive_view(request):
+    """extract_archive_view의 비동기 버전"""
+    files = await read_input_files(request, 'file')
+    uploaded_file = files[0] if files else None
+    if not uploaded_file or archive_kind(uploaded_file.name) is None:
+        return JsonResponse({'error': 'ZIP, TAR, 7z 또는 RAR 파일이 필요합니다.'}, status=400)
+
+    try:
+        return JsonResponse({'files': await run_io(extract_archive, uploaded_file)})
+    except Exception as e:
+        return archive_error_response(e, '압축 해제')
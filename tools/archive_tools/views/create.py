@@ -0,0 +1,53 @@
+# tools/archive_tools/views/create.py
+
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_files
+from tools.archive_tools.services.create import create_archive, ARCHIVE_FORMATS
+from tools.archive_tools.views.errors import archive_error_response
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter(
+            name='files',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_FILE,
+            description='묶을 파일들',
+            required=True,
+            multiple=True
+        ),
+        openapi.Parameter(
+            name='format',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_STRING,
+            enum=list(ARCHIVE_FORMATS),
+            description='아카이브 형식 (기본: zip)',
+            required=False
+        )
+    ],
+    responses={200: '아카이브 URL, 사용한 압축 수준/스레드 수 반환'}
+)
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def create_archive_view(request):
+    """
+    업로드된 파일들을 ZIP/TAR/TAR.GZ/7z로 묶어 Supabase에 업로드합니다.
+    압축 수준과 스레드 수는 입력 전체 크기로 정해지며, ZIP/TAR 계열은 만들면서 바로 업로드합니다.
+    """
+    files = get_input_files(request, 'files')
+    fmt = request.POST.get('format', 'zip').lower()
+
+    if not files:
+        return JsonResponse({'error': '파일이 필요합니다.'}, status=400)
+    if fmt not in ARCHIVE_FORMATS:
+        return JsonResponse({'error': f'format은 {", ".join(ARCHIVE_FORMATS)} 중 하나여야 합니다.'}, status=400)
+
+    try:
+        return JsonResponse(create_archive(files, fmt))
+    except Exception as e:
+        return archive_error_response(e, '압축')
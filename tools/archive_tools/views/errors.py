@@ -0,0 +1,22 @@
+# tools/archive_tools/views/errors.py
+
+import subprocess
+from django.http import JsonResponse
+from tools.common.scratch import ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.common.logging_utils import log_exception
+from tools.archive_tools.services.extract import ArchiveError
+
+
+def archive_error_response(e: Exception, action: str):
+    """아카이브 뷰 공통 예외 → 응답 변환 (동기/비동기 뷰 공용)"""
+    if isinstance(e, ArchiveError):
+        return JsonResponse({'error': str(e)}, status=e.status)
+    if isinstance(e, ConverterBusy):
+        return busy_response(e)
+    if isinstance(e, subprocess.TimeoutExpired):
+        return JsonResponse({'error': f'{action} 시간이 초과되었습니다.'}, status=504)
+    if isinstance(e, ScratchQuotaExceeded):
+        return JsonResponse({'error': str(e)}, status=507)
+    log_exception(e, f"Archive {action} error")
+    return JsonResponse({'error': f'{action} 실패: {str(e)}'}, status=500)
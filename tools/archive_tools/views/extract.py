@@ -0,0 +1,40 @@
+# tools/archive_tools/views/extract.py
+
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_file
+from tools.archive_tools.services.extract import extract_archive, archive_kind
+from tools.archive_tools.views.errors import archive_error_response
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter(
+            name='file',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_FILE,
+            description='풀 아카이브 (zip, tar, tar.gz, tar.bz2, tar.xz, 7z, rar)',
+            required=True
+        )
+    ],
+    responses={200: '풀린 항목의 이름/크기/URL 목록 반환'}
+)
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def extract_archive_view(request):
+    """
+    업로드된 아카이브를 풀어 항목마다 Supabase에 업로드합니다.
+    항목 수, 풀린 크기, 압축률이 한도를 넘으면(압축 폭탄) 413을 반환합니다.
+    """
+    uploaded_file = get_input_file(request, 'file')
+    if not uploaded_file or archive_kind(uploaded_file.name) is None:
+        return JsonResponse({'error': 'ZIP, TAR, 7z 또는 RAR 파일이 필요합니다.'}, status=400)
+
+    try:
+        return JsonResponse({'files': extract_archive(uploaded_file)})
+    except Exception as e:
+        return archive_error_response(e, '압축 해제')
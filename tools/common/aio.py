@@ -0,0 +1,210 @@
+# tools/common/aio.py
+
+import os
+import time
+import signal
+import asyncio
+import functools
+import contextvars
+import subprocess
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework.exceptions import APIException
+from tools.common.governor import acquire_converter, release_converter
+from tools.common.threads import cores_per_worker
+from tools.common.process import pin_process, ProcessCancelled, CANCEL_POLL_INTERVAL
+from tools.common.metrics import stage, record_subprocess
+
+# True면 도구 URL에 비동기 뷰를 연결 (ASGI 서버로 실행할 때 사용)
+ASYNC_VIEWS = getattr(settings, 'ASYNC_VIEWS', False)
+
+# 이미지 디코딩/인코딩, PDF 처리 등 CPU 작업용 스레드 수 (기본: 워커에 배정된 코어 수)
+ASYNC_CPU_WORKERS = getattr(settings, 'ASYNC_CPU_WORKERS', None) or cores_per_worker()
+
+# multipart 파싱, 파일 해시, 작업 등록 등 블로킹 I/O용 스레드 수
+ASYNC_IO_WORKERS = getattr(settings, 'ASYNC_IO_WORKERS', 32)
+
+# 변환기 슬롯 대기용 스레드 수 (슬롯 대기열 한도가 있으므로 이 이상 동시에 기다리지 않음)
+ASYNC_ADMISSION_WORKERS = getattr(settings, 'ASYNC_ADMISSION_WORKERS', 64)
+
+# 외부 프로세스 stdout을 읽는 단위
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_cpu_pool = ThreadPoolExecutor(max_workers=ASYNC_CPU_WORKERS, thread_name_prefix='filepick-cpu')
+_io_pool = ThreadPoolExecutor(max_workers=ASYNC_IO_WORKERS, thread_name_prefix='filepick-io')
+_admission_pool = ThreadPoolExecutor(max_workers=ASYNC_ADMISSION_WORKERS, thread_name_prefix='filepick-admission')
+
+
+def _run_in(executor, fn, *args, **kwargs):
+    # 현재 컨텍스트(엔드포인트 라벨 등)를 복사해 실행하므로 스레드 안의 stage()/record_bytes()도 같은 라벨로 기록됨
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+async def run_cpu(fn, *args, **kwargs):
+    """CPU 작업(PIL, PyPDF2 등)을 크기가 제한된 CPU 실행기에서 실행하고 결과를 기다립니다."""
+    return await _run_in(_cpu_pool, fn, *args, **kwargs)
+
+
+async def run_io(fn, *args, **kwargs):
+    """블로킹 I/O(multipart 파싱, 파일 복사 등)를 I/O 실행기에서 실행하고 결과를 기다립니다."""
+    return await _run_in(_io_pool, fn, *args, **kwargs)
+
+
+@asynccontextmanager
+async def aconverter_slot(name: str):
+    """
+    converter_slot()의 비동기 버전. 슬롯 대기는 별도 스레드에서 하므로 이벤트 루프를 막지 않습니다.
+    대기 중에 요청이 취소되면, 뒤늦게 잡힌 슬롯은 즉시 반환합니다.
+    """
+    future = _run_in(_admission_pool, acquire_converter, name)
+    with stage('queue_wait'):
+        try:
+            lease = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(_release_abandoned)
+            raise
+    try:
+        yield lease.slot
+    finally:
+        release_converter(lease)
+
+
+def _release_abandoned(future):
+    if not future.cancelled() and future.exception() is None:
+        release_converter(future.result())
+
+
+def _kill_group(process):
+    """start_new_session=True로 실행한 프로세스의 그룹 전체(soffice.bin 등 자식 포함)를 종료합니다."""
+    if process.returncode is None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+async def arun_process(command: list, timeout: float = None, cpus=None, cancel_check=None) -> subprocess.CompletedProcess:
+    """
+    run_process()의 비동기 버전. asyncio 서브프로세스로 실행하므로 종료를 기다리는 동안 스레드를 점유하지 않습니다.
+
+    - timeout초를 넘기면 프로세스 그룹을 강제 종료하고 subprocess.TimeoutExpired를 발생시킵니다.
+    - 요청이 취소되면(클라이언트 연결 종료 등) 프로세스 그룹을 종료한 뒤 취소를 전달합니다.
+    - cancel_check가 주어지면 CANCEL_POLL_INTERVAL초마다 호출해, True면 ProcessCancelled를,
+      예외(스크래치 한도 초과 등)를 발생시키면 그 예외를 프로세스 그룹을 종료한 뒤 전달합니다.
+    - 종료 코드가 0이 아니면 stderr를 담은 subprocess.CalledProcessError를 발생시킵니다.
+    """
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True
+    )
+    pin_process(process, cpus)
+    deadline = time.monotonic() + timeout if timeout else None
+    communicate = asyncio.ensure_future(process.communicate())
+    try:
+        while not communicate.done():
+            wait = CANCEL_POLL_INTERVAL if cancel_check else None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                wait = remaining if wait is None else min(wait, remaining)
+            await asyncio.wait({communicate}, timeout=wait)
+            if not communicate.done() and cancel_check and cancel_check():
+                raise ProcessCancelled(f"프로세스 취소됨: {command[0]}")
+        stdout, stderr = communicate.result()
+    except BaseException:
+        # 시간 초과, 취소 요청, 요청 취소(CancelledError), cancel_check의 예외 모두 프로세스 그룹을 종료한 뒤 전달
+        _kill_group(process)
+        communicate.cancel()
+        await process.wait()
+        raise
+    finally:
+        record_subprocess(os.path.basename(str(command[0])), time.perf_counter() - started)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+async def aiter_process_stdout(command: list, chunk_size: int = STREAM_CHUNK_SIZE, timeout: float = None, cpus=None):
+    """
+    외부 프로세스의 stdout을 청크 단위로 내보내는 비동기 제너레이터 (iter_ffmpeg_stdout()의 비동기 버전).
+    소비자가 중간에 멈추면(업로드 실패 등) 프로세스 그룹을 종료합니다.
+    contextlib.aclosing()으로 감싸 사용해야 종료 처리가 바로 실행됩니다.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True
+    )
+    pin_process(process, cpus)
+    # stderr 파이프가 가득 차 ffmpeg가 멈추지 않도록 동시에 읽음
+    stderr_task = asyncio.ensure_future(process.stderr.read())
+
+    def remaining():
+        return None if deadline is None else max(0.0, deadline - loop.time())
+
+    try:
+        while True:
+            chunk = await asyncio.wait_for(process.stdout.read(chunk_size), remaining())
+            if not chunk:
+                break
+            yield chunk
+        await asyncio.wait_for(process.wait(), remaining())
+        stderr = await stderr_task
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr)
+    except asyncio.TimeoutError:
+        raise subprocess.TimeoutExpired(command, timeout)
+    finally:
+        _kill_group(process)
+        await process.wait()
+        stderr_task.cancel()
+        record_subprocess(os.path.basename(str(command[0])), time.perf_counter() - started)
+
+
+def async_tool_view(view):
+    """
+    비동기 도구 뷰 데코레이터.
+    DRF @api_view는 비동기 함수를 지원하지 않으므로 일반 Django 뷰로 등록하며,
+    DRF와 같게 POST만 허용하고 CSRF 검사를 생략하며 APIException(예: InvalidUploadReference)을 해당 상태 코드로 응답합니다.
+    """
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            return await view(request, *args, **kwargs)
+        except APIException as e:
+            response = JsonResponse({'error': str(e.detail)}, status=e.status_code)
+            if getattr(e, 'wait', None):
+                response['Retry-After'] = str(int(e.wait))
+            return response
+
+    return csrf_exempt(require_POST(wrapper))
+
+
+def pick_view(sync_view, async_view):
+    """URL 설정용: ASYNC_VIEWS면 비동기 뷰, 아니면 동기 뷰를 반환합니다 (두 뷰는 같은 URL/응답 형식)."""
+    return async_view if ASYNC_VIEWS else sync_view
+
+
+def executor_metrics() -> dict:
+    """비동기 뷰 실행기별 스레드 수와 대기 중인 작업 수를 반환합니다."""
+    return {
+        name: {'workers': pool._max_workers, 'queued': pool._work_queue.qsize()}
+        for name, pool in (('cpu', _cpu_pool), ('io', _io_pool), ('admission', _admission_pool))
+    }
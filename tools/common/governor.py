@@ -0,0 +1,270 @@
+# tools/common/governor.py
+
+import os
+import math
+import time
+import fcntl
+import tempfile
+import threading
+from contextlib import contextmanager
+from django.conf import settings
+from django.http import JsonResponse
+from tools.common.metrics import stage
+
+# 변환기별 동시 실행 수 (settings.CONVERTER_LIMITS로 재정의 가능)
+DEFAULT_LIMITS = {
+    'ffmpeg': max(1, (os.cpu_count() or 1) // 2),
+    'soffice': 2,
+    'pdftoppm': max(1, (os.cpu_count() or 1) // 2),
+    '7z': max(1, (os.cpu_count() or 1) // 2),
+}
+
+# 변환기별 외부 프로세스 최대 실행 시간 (초, settings.CONVERTER_TIMEOUTS로 재정의 가능)
+DEFAULT_TIMEOUTS = {
+    'ffmpeg': 60 * 60,
+    'soffice': 5 * 60,
+    'pdftoppm': 5 * 60,
+    '7z': 30 * 60,
+    'ffprobe': 60,
+}
+
+# 슬롯을 기다릴 수 있는 최대 요청 수 (변환기별) / 최대 대기 시간 (초)
+CONVERTER_QUEUE_SIZE = getattr(settings, 'CONVERTER_QUEUE_SIZE', 8)
+CONVERTER_WAIT_TIMEOUT = getattr(settings, 'CONVERTER_WAIT_TIMEOUT', 30)
+
+# True면 파일 잠금으로 같은 호스트의 모든 워커 프로세스가 한도를 공유
+CONVERTER_HOST_WIDE = getattr(settings, 'CONVERTER_HOST_WIDE', False)
+CONVERTER_LOCK_DIR = getattr(settings, 'CONVERTER_LOCK_DIR', os.path.join(tempfile.gettempdir(), 'filepick-locks'))
+
+# 호스트 전체 슬롯 잠금 재시도 간격 (초)
+HOST_LOCK_POLL_INTERVAL = 0.1
+
+_local = threading.local()
+_governors = {}
+_governors_lock = threading.Lock()
+
+
+class ConverterBusy(Exception):
+    """
+    변환기 동시 실행 한도로 요청을 받을 수 없는 경우.
+    대기열이 가득 차면 status=429, 대기 시간이 초과되면 status=503이며 retry_after(초)를 함께 제공합니다.
+    """
+
+    def __init__(self, message: str, status: int, retry_after: int):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ConverterSlot:
+    """converter_slot()이 제공하는 슬롯 정보. index는 0 ~ limit-1 사이의 슬롯 번호입니다 (CPU 고정에 사용)."""
+
+    def __init__(self, name: str, index: int, limit: int, host_wide: bool):
+        self.name = name
+        self.index = index
+        self.limit = limit
+        self.host_wide = host_wide
+
+
+class _Governor:
+    """
+    변환기 하나의 동시 실행 슬롯을 관리합니다.
+    프로세스 안에서는 Condition으로 대기열을 관리하고, 호스트 전체 모드에서는 슬롯마다 잠금 파일을 둡니다.
+    """
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = max(1, limit)
+        self._cond = threading.Condition()
+        self._free_indices = list(range(self.limit))
+        self.active = 0
+        self.waiting = 0
+        self.acquired_total = 0
+        self.rejected_total = 0
+        self.timeouts_total = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.avg_hold_seconds = 0.0
+
+    def retry_after(self) -> int:
+        """대기 중인 요청이 모두 처리될 때까지의 예상 시간 (초, 1~60)."""
+        estimate = (self.waiting + 1) / self.limit * (self.avg_hold_seconds or 1)
+        return int(min(60, max(1, math.ceil(estimate))))
+
+    def acquire(self, patient: bool):
+        started = time.monotonic()
+        deadline = None if patient else started + CONVERTER_WAIT_TIMEOUT
+
+        with self._cond:
+            if self.active >= self.limit:
+                if not patient and self.waiting >= CONVERTER_QUEUE_SIZE:
+                    self.rejected_total += 1
+                    raise ConverterBusy(
+                        f"{self.name} 변환 요청이 많습니다. 잠시 후 다시 시도해 주세요.", 429, self.retry_after()
+                    )
+                self.waiting += 1
+                try:
+                    while self.active >= self.limit:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.timeouts_total += 1
+                            raise ConverterBusy(
+                                f"{self.name} 변환 대기 시간이 초과되었습니다.", 503, self.retry_after()
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self.waiting -= 1
+            self.active += 1
+            index = min(self._free_indices)
+            self._free_indices.remove(index)
+
+        lock_file, host_index = None, None
+        if CONVERTER_HOST_WIDE:
+            try:
+                lock_file, host_index = self._acquire_host_slot(deadline)
+            except BaseException:
+                self._release_local(index)
+                raise
+
+        waited = time.monotonic() - started
+        with self._cond:
+            self.acquired_total += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        slot = ConverterSlot(self.name, index if host_index is None else host_index, self.limit, host_index is not None)
+        return slot, lock_file, index
+
+    def release(self, lock_file, index: int, held: float):
+        if lock_file is not None:
+            lock_file.close()  # 파일을 닫으면 flock도 해제됨
+        with self._cond:
+            # 최근 실행 시간의 지수 이동 평균 (Retry-After 추정용)
+            self.avg_hold_seconds = held if not self.avg_hold_seconds else 0.8 * self.avg_hold_seconds + 0.2 * held
+        self._release_local(index)
+
+    def _release_local(self, index: int):
+        with self._cond:
+            self.active -= 1
+            self._free_indices.append(index)
+            self._cond.notify()
+
+    def _acquire_host_slot(self, deadline):
+        """잠금 파일 limit개 중 비어 있는 하나를 잡을 때까지 재시도합니다."""
+        os.makedirs(CONVERTER_LOCK_DIR, exist_ok=True)
+        while True:
+            for index in range(self.limit):
+                lock_file = open(os.path.join(CONVERTER_LOCK_DIR, f"{self.name}.{index}.lock"), 'a')
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return lock_file, index
+                except BlockingIOError:
+                    lock_file.close()
+            if deadline is not None and time.monotonic() >= deadline:
+                with self._cond:
+                    self.timeouts_total += 1
+                raise ConverterBusy(f"{self.name} 변환 대기 시간이 초과되었습니다.", 503, self.retry_after())
+            time.sleep(HOST_LOCK_POLL_INTERVAL)
+
+    def metrics(self) -> dict:
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'active': self.active,
+                'waiting': self.waiting,
+                'acquired_total': self.acquired_total,
+                'rejected_total': self.rejected_total,
+                'timeouts_total': self.timeouts_total,
+                'wait_seconds_total': round(self.wait_seconds_total, 3),
+                'wait_seconds_max': round(self.wait_seconds_max, 3),
+                'avg_hold_seconds': round(self.avg_hold_seconds, 3),
+            }
+
+
+def _get_governor(name: str) -> _Governor:
+    with _governors_lock:
+        if name not in _governors:
+            _governors[name] = _Governor(name, converter_limit(name))
+        return _governors[name]
+
+
+@contextmanager
+def converter_slot(name: str):
+    """
+    변환기(name: 'ffmpeg', 'soffice' 등)의 실행 슬롯을 하나 잡고 블록을 실행합니다.
+
+    - 슬롯이 모두 사용 중이면 최대 CONVERTER_WAIT_TIMEOUT초 동안 대기열에서 기다립니다.
+    - 대기열(CONVERTER_QUEUE_SIZE)이 가득 차면 즉시 ConverterBusy(429), 대기 시간이 지나면 ConverterBusy(503).
+    - patient_admission() 블록 안(비동기 작업 워커)에서는 대기열 한도와 대기 시간 제한 없이 기다립니다.
+    블록에는 ConverterSlot(슬롯 번호 등)이 전달됩니다.
+    """
+    with stage('queue_wait'):
+        lease = acquire_converter(name)
+    try:
+        yield lease.slot
+    finally:
+        release_converter(lease)
+
+
+class ConverterLease:
+    """acquire_converter()로 잡은 슬롯. release_converter()로 반환해야 합니다."""
+
+    def __init__(self, governor: _Governor, slot: ConverterSlot, lock_file, index: int):
+        self.governor = governor
+        self.slot = slot
+        self.lock_file = lock_file
+        self.index = index
+        self.started = time.monotonic()
+
+
+def acquire_converter(name: str, patient: bool = None) -> ConverterLease:
+    """
+    converter_slot()의 슬롯 획득 부분만 수행합니다 (블록 밖에서 슬롯을 관리해야 하는 비동기 뷰용).
+    patient가 None이면 현재 스레드의 patient_admission() 여부를 따릅니다.
+    """
+    if patient is None:
+        patient = getattr(_local, 'patient', False)
+    governor = _get_governor(name)
+    slot, lock_file, index = governor.acquire(patient=patient)
+    return ConverterLease(governor, slot, lock_file, index)
+
+
+def release_converter(lease: ConverterLease):
+    lease.governor.release(lease.lock_file, lease.index, time.monotonic() - lease.started)
+
+
+@contextmanager
+def patient_admission():
+    """
+    이 스레드의 converter_slot()이 거절 대신 슬롯이 날 때까지 기다리도록 합니다.
+    작업 큐 자체가 대기열 역할을 하는 비동기 작업 실행에 사용합니다.
+    """
+    previous = getattr(_local, 'patient', False)
+    _local.patient = True
+    try:
+        yield
+    finally:
+        _local.patient = previous
+
+
+def converter_limit(name: str) -> int:
+    """변환기의 동시 실행 한도를 반환합니다."""
+    return {**DEFAULT_LIMITS, **getattr(settings, 'CONVERTER_LIMITS', {})}.get(name, 1)
+
+
+def converter_timeout(name: str):
+    """변환기의 외부 프로세스 최대 실행 시간(초)을 반환합니다. 제한이 없으면 None."""
+    return {**DEFAULT_TIMEOUTS, **getattr(settings, 'CONVERTER_TIMEOUTS', {})}.get(name)
+
+
+def governor_metrics() -> dict:
+    """변환기별 슬롯 사용/대기열 깊이/대기 시간 통계를 반환합니다."""
+    with _governors_lock:
+        governors = list(_governors.values())
+    return {governor.name: governor.metrics() for governor in governors}
+
+
+def busy_response(error: ConverterBusy):
+    """ConverterBusy를 Retry-After 헤더가 있는 JSON 응답으로 변환합니다."""
+    response = JsonResponse({'error': str(error), 'retry_after': error.retry_after}, status=error.status)
+    response['Retry-After'] = str(error.retry_after)
+    return response
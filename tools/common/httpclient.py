@@ -0,0 +1,258 @@
+# tools/common/httpclient.py
+
+import time
+import random
+import asyncio
+import weakref
+import threading
+import httpx
+from django.conf import settings
+from tools.common.metrics import REGISTRY, Counter, Histogram
+
+# 저장소 HTTP 클라이언트 설정 (keep-alive 연결 풀 + HTTP/2 다중화)
+STORAGE_HTTP2 = getattr(settings, 'STORAGE_HTTP2', True)
+STORAGE_MAX_CONNECTIONS = getattr(settings, 'STORAGE_MAX_CONNECTIONS', 20)
+STORAGE_MAX_KEEPALIVE = getattr(settings, 'STORAGE_MAX_KEEPALIVE', 10)
+STORAGE_KEEPALIVE_EXPIRY = getattr(settings, 'STORAGE_KEEPALIVE_EXPIRY', 30.0)
+
+# 호출별 제한 시간 (초): 연결 / 응답 읽기 / 본문 쓰기 / 풀에서 연결을 기다리는 시간
+STORAGE_CONNECT_TIMEOUT = getattr(settings, 'STORAGE_CONNECT_TIMEOUT', 5.0)
+STORAGE_READ_TIMEOUT = getattr(settings, 'STORAGE_READ_TIMEOUT', 60.0)
+STORAGE_WRITE_TIMEOUT = getattr(settings, 'STORAGE_WRITE_TIMEOUT', 60.0)
+STORAGE_POOL_TIMEOUT = getattr(settings, 'STORAGE_POOL_TIMEOUT', 10.0)
+
+# 재시도 횟수(첫 시도 제외)와 지수 백오프 (full jitter: 0 ~ min(MAX, BASE * 2^n) 사이 무작위 대기)
+STORAGE_RETRIES = getattr(settings, 'STORAGE_RETRIES', 3)
+STORAGE_BACKOFF_BASE = getattr(settings, 'STORAGE_BACKOFF_BASE', 0.2)
+STORAGE_BACKOFF_MAX = getattr(settings, 'STORAGE_BACKOFF_MAX', 5.0)
+
+# 객체를 내려받을 때 파일에 기록하는 단위
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# 일시적인 오류로 보고 재시도하는 응답 코드
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+STORAGE_REQUEST_DURATION = REGISTRY.register(Histogram(
+    'filepick_storage_request_duration_seconds', '저장소 HTTP 요청 시간 (시도 단위)', ['method', 'status']))
+STORAGE_RETRIES_TOTAL = REGISTRY.register(Counter(
+    'filepick_storage_retries_total', '저장소 요청 재시도 수 (원인별)', ['reason']))
+STORAGE_FAILURES_TOTAL = REGISTRY.register(Counter(
+    'filepick_storage_failures_total', '재시도 후에도 실패한 저장소 요청 수 (원인별)', ['reason']))
+
+_client = None
+_client_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+class StorageRequestError(Exception):
+    """저장소 요청이 실패한 경우 (재시도 후에도 실패했거나 재시도할 수 없는 오류)"""
+
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+
+
+class StorageObjectTooLarge(Exception):
+    """내려받는 객체가 허용 크기를 넘은 경우"""
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=STORAGE_MAX_CONNECTIONS,
+        max_keepalive_connections=STORAGE_MAX_KEEPALIVE,
+        keepalive_expiry=STORAGE_KEEPALIVE_EXPIRY
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=STORAGE_CONNECT_TIMEOUT,
+        read=STORAGE_READ_TIMEOUT,
+        write=STORAGE_WRITE_TIMEOUT,
+        pool=STORAGE_POOL_TIMEOUT
+    )
+
+
+def storage_client() -> httpx.Client:
+    """프로세스에서 공유하는 저장소용 HTTP 클라이언트 (처음 사용할 때 생성)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(http2=STORAGE_HTTP2, limits=_limits(), timeout=_timeout())
+        return _client
+
+
+def async_storage_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에서 공유하는 저장소용 비동기 HTTP 클라이언트 (루프마다 하나씩 생성)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(http2=STORAGE_HTTP2, limits=_limits(), timeout=_timeout())
+    return client
+
+
+def backoff_delay(attempt: int, retry_after: str = None) -> float:
+    """
+    attempt번째 재시도(0부터) 전 대기 시간 (초).
+    응답에 Retry-After(초)가 있으면 STORAGE_BACKOFF_MAX 안에서 그 값을 따릅니다.
+    """
+    if retry_after:
+        try:
+            return min(STORAGE_BACKOFF_MAX, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(STORAGE_BACKOFF_MAX, STORAGE_BACKOFF_BASE * (2 ** attempt)))
+
+
+def _retry_reason(response: httpx.Response = None, error: Exception = None):
+    """재시도할 원인 이름을 반환합니다. 재시도하면 안 되는 결과면 None."""
+    if error is not None:
+        # 연결/읽기/쓰기/풀 대기 시간 초과와 네트워크 오류는 일시적인 문제로 봄
+        return type(error).__name__ if isinstance(error, httpx.TransportError) else None
+    if response.status_code in RETRY_STATUSES:
+        return f"http_{response.status_code}"
+    return None
+
+
+def _track(delta: int):
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight += delta
+
+
+def _observe(method: str, started: float, response):
+    STORAGE_REQUEST_DURATION.observe(time.perf_counter() - started, method=method,
+                                     status=response.status_code if response is not None else 'error')
+
+
+def _retry_delay(attempt: int, attempts: int, response, error) -> float:
+    """
+    실패한 시도 뒤 재시도 전 대기 시간을 반환합니다.
+    재시도할 수 없는 오류이거나 마지막 시도였으면 StorageRequestError를 발생시킵니다.
+    """
+    reason = _retry_reason(response, error)
+    if reason is None or attempt == attempts - 1:
+        STORAGE_FAILURES_TOTAL.inc(reason=reason or _failure_name(response, error))
+        raise _storage_error(response, error) from error
+    STORAGE_RETRIES_TOTAL.inc(reason=reason)
+    return backoff_delay(attempt, response.headers.get('Retry-After') if response is not None else None)
+
+
+def request_with_retry(method: str, url: str, headers: dict, body=None, replayable: bool = True) -> httpx.Response:
+    """
+    공유 클라이언트로 요청을 보내고, 일시적인 오류면 지수 백오프(jitter)로 재시도합니다.
+
+    body는 시도마다 새 본문(bytes, 파일 객체 또는 bytes 청크 iterable)을 반환하는 함수입니다.
+    한 번만 읽을 수 있는 본문(예: ffmpeg stdout)은 replayable=False로 넘기면 재시도하지 않습니다.
+    재시도 후에도 실패하면 StorageRequestError를 발생시킵니다.
+    """
+    attempts = 1 + (STORAGE_RETRIES if replayable else 0)
+    for attempt in range(attempts):
+        content = body() if body else None
+        response, error = None, None
+        started = time.perf_counter()
+        _track(1)
+        try:
+            response = storage_client().request(method, url, headers=headers, content=content)
+        except httpx.HTTPError as e:
+            error = e
+        finally:
+            _track(-1)
+            if hasattr(content, 'close'):
+                content.close()
+        _observe(method, started, response)
+
+        if error is None and response.status_code < 400:
+            return response
+        time.sleep(_retry_delay(attempt, attempts, response, error))
+
+
+async def arequest_with_retry(method: str, url: str, headers: dict, body=None,
+                              replayable: bool = True) -> httpx.Response:
+    """request_with_retry()의 비동기 버전. body는 bytes 또는 async iterable을 반환하는 함수입니다."""
+    attempts = 1 + (STORAGE_RETRIES if replayable else 0)
+    for attempt in range(attempts):
+        content = body() if body else None
+        response, error = None, None
+        started = time.perf_counter()
+        _track(1)
+        try:
+            response = await async_storage_client().request(method, url, headers=headers, content=content)
+        except httpx.HTTPError as e:
+            error = e
+        finally:
+            _track(-1)
+            if hasattr(content, 'aclose'):
+                await content.aclose()
+        _observe(method, started, response)
+
+        if error is None and response.status_code < 400:
+            return response
+        await asyncio.sleep(_retry_delay(attempt, attempts, response, error))
+
+
+def download_with_retry(url: str, headers: dict, file, max_bytes: int = None) -> int:
+    """
+    GET 응답 본문을 file(쓰기 가능한 바이너리 파일)에 청크 단위로 기록하고 받은 바이트 수를 반환합니다.
+
+    전송 중 끊기면 받은 위치부터 Range 요청으로 이어 받고, 서버가 206으로 응답하지 않으면 처음부터 다시 받습니다.
+    max_bytes를 넘으면 StorageObjectTooLarge를 발생시킵니다.
+    """
+    attempts = 1 + STORAGE_RETRIES
+    written = 0
+    for attempt in range(attempts):
+        request_headers = dict(headers, Range=f"bytes={written}-") if written else headers
+        response, error = None, None
+        started = time.perf_counter()
+        _track(1)
+        try:
+            with storage_client().stream('GET', url, headers=request_headers) as response:
+                if response.status_code >= 400:
+                    response.read()
+                else:
+                    if written and response.status_code != 206:
+                        file.seek(0)
+                        file.truncate()
+                        written = 0
+                    for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if max_bytes is not None and written > max_bytes:
+                            raise StorageObjectTooLarge(f"객체가 최대 크기({max_bytes} bytes)를 초과합니다.")
+                        file.write(chunk)
+        except httpx.HTTPError as e:
+            error = e
+        finally:
+            _track(-1)
+        _observe('GET', started, response)
+
+        if error is None and response.status_code < 400:
+            return written
+        time.sleep(_retry_delay(attempt, attempts, response, error))
+
+
+def _failure_name(response, error) -> str:
+    return type(error).__name__ if error is not None else f"http_{response.status_code}"
+
+
+def _storage_error(response, error) -> StorageRequestError:
+    if error is not None:
+        return StorageRequestError(f"저장소 요청 실패: {error!r}")
+    return StorageRequestError(f"저장소 요청 실패 ({response.status_code}): {response.text}", response.status_code)
+
+
+def pool_metrics() -> dict:
+    """
+    저장소 연결 풀 상태 (in_flight가 max_connections에 가까우면 풀이 포화된 상태).
+    HTTP/2 연결은 요청 여러 개를 동시에 처리하므로 in_flight가 connections보다 클 수 있습니다.
+    """
+    values = {'in_flight': _in_flight, 'max_connections': STORAGE_MAX_CONNECTIONS}
+    client = _client
+    if client is not None:
+        # httpx는 연결 풀을 공개 API로 노출하지 않으므로 내부 transport의 httpcore 풀을 조회
+        pool = getattr(getattr(client, '_transport', None), '_pool', None)
+        connections = list(getattr(pool, 'connections', []))
+        values['connections'] = len(connections)
+        values['idle_connections'] = sum(1 for connection in connections if connection.is_idle())
+    return values
@@ -0,0 +1,83 @@
+# tools/common/inputs.py
+
+import subprocess
+from rest_framework.exceptions import APIException
+from tools.uploads.services.sessions import UploadSessionError, open_completed_upload
+from tools.uploads.services.direct import open_direct_upload
+from tools.archive_tools.services.extract import ArchiveError
+from tools.archive_tools.services.expand import expand_archives
+from tools.common.aio import run_io
+from tools.common.governor import ConverterBusy
+from tools.common.scratch import ScratchQuotaExceeded
+
+
+class InvalidUploadReference(APIException):
+    """
+    upload_id/object_key로 참조한 업로드를 사용할 수 없거나 extract=true로 풀 수 없는 아카이브인 경우
+    (DRF가 해당 상태 코드로 응답)
+    """
+    status_code = 400
+    default_detail = '업로드를 사용할 수 없습니다.'
+
+    def __init__(self, detail, status_code, retry_after: int = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.wait = retry_after  # DRF 예외 처리기가 Retry-After 헤더로 보냄
+
+
+def _expand(files: list) -> list:
+    """extract=true 처리. 도구 뷰의 try 블록 밖에서 호출되므로 실패를 모두 InvalidUploadReference로 바꿉니다."""
+    try:
+        return expand_archives(files)
+    except ArchiveError as e:
+        raise InvalidUploadReference(str(e), e.status)
+    except ConverterBusy as e:
+        raise InvalidUploadReference(str(e), e.status, retry_after=e.retry_after)
+    except subprocess.TimeoutExpired:
+        raise InvalidUploadReference('압축 해제 시간이 초과되었습니다.', 504)
+    except ScratchQuotaExceeded as e:
+        raise InvalidUploadReference(str(e), 507)
+
+
+def get_input_files(request, field: str) -> list:
+    """
+    도구 뷰의 입력 파일 목록을 반환합니다.
+
+    multipart로 직접 올린 파일(field)과, 재개 가능한 업로드(/api/uploads/)로 미리 올려 둔 파일을
+    upload_id(여러 개 가능, 쉼표 구분)로 참조한 것, 저장소에 직접 올린(/api/uploads/direct/) 객체를
+    object_key(여러 개 가능, 쉼표 구분)로 참조한 것을 함께 반환합니다.
+    extract=true면 입력 중 아카이브(zip, tar 계열, 7z, rar)를 풀어 항목 파일들을 대신 반환합니다.
+    참조된 업로드가 없거나 완료되지 않았거나 아카이브를 풀 수 없으면 InvalidUploadReference를 발생시킵니다
+    (압축 해제 중 변환기 슬롯 부족은 429/503 + Retry-After, 시간 초과는 504, 스크래치 부족은 507).
+    """
+    files = list(request.FILES.getlist(field))
+    for value in request.POST.getlist('upload_id'):
+        for upload_id in filter(None, (v.strip() for v in value.split(','))):
+            try:
+                files.append(open_completed_upload(upload_id))
+            except UploadSessionError as e:
+                raise InvalidUploadReference(str(e), e.status)
+    for value in request.POST.getlist('object_key'):
+        for object_key in filter(None, (v.strip() for v in value.split(','))):
+            try:
+                files.append(open_direct_upload(object_key))
+            except UploadSessionError as e:
+                raise InvalidUploadReference(str(e), e.status)
+    if request.POST.get('extract', '').lower() == 'true':
+        files = _expand(files)
+    return files
+
+
+def get_input_file(request, field: str):
+    """단일 파일 입력 버전. 입력이 없으면 None을 반환합니다."""
+    files = get_input_files(request, field)
+    return files[0] if files else None
+
+
+async def read_input_files(request, field: str) -> list:
+    """
+    get_input_files()의 비동기 버전.
+    ASGI 핸들러가 요청 본문을 이미 이벤트 루프에서 받아 두었으므로, 여기서는 multipart 파싱만 I/O 실행기에서 수행합니다.
+    저장소에서 내려받는 object_key 입력도 I/O 실행기에서 처리됩니다.
+    """
+    return await run_io(get_input_files, request, field)
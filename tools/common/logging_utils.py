@@ -3,6 +3,7 @@
 import logging
 import traceback
 from django.http import JsonResponse
+from tools.common.metrics import record_error
 
 # 기본 로깅 설정
 logger = logging.getLogger("filepick")
@@ -20,7 +21,9 @@ if not logger.handlers:
 def log_exception(error: Exception, context: str = ""):
     """
     예외 로그를 기록하고 콘솔에 스택트레이스를 출력합니다.
+    현재 엔드포인트의 오류 수(filepick_errors_total)에도 예외 타입별로 더합니다.
     """
+    record_error(error)
     logger.error(f"[ERROR] {context} - {str(error)}")
     traceback_str = traceback.format_exc()
     logger.debug(traceback_str)
@@ -0,0 +1,238 @@
+# tools/common/metrics.py
+"""
+프로세스 내 메트릭(카운터/히스토그램)과 Prometheus 텍스트 형식 출력.
+
+요청 처리 경로에서는 잠금 한 번과 리스트 증가만 수행하므로 오버헤드가 무시할 수준이며,
+Django에 의존하지 않아 벤치마크/스크립트에서도 그대로 import할 수 있습니다.
+값은 워커 프로세스별로 집계됩니다 (/metrics는 요청을 처리한 워커의 값을 반환).
+"""
+
+import time
+import bisect
+import threading
+import contextvars
+from contextlib import ContextDecorator
+
+# 초 단위 지연 시간 히스토그램 구간
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# 현재 요청의 엔드포인트 이름 (MetricsMiddleware가 설정)
+_current_endpoint = contextvars.ContextVar('metrics_endpoint', default='-')
+_error_recorded = contextvars.ContextVar('metrics_error_recorded', default=False)
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def _format_labels(self, key: tuple, extra: dict = None) -> str:
+        pairs = list(zip(self.label_names, key)) + list((extra or {}).items())
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{self._format_labels(key)} {_number(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def render(self) -> list:
+        with self._lock:
+            items = [(key, (list(state[0]), state[1], state[2])) for key, state in self._values.items()]
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else _number(bound)
+                lines.append(f"{self.name}_bucket{self._format_labels(key, {'le': le})} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, prefix: str, fn):
+        """
+        호출 시점의 값을 gauge로 내보내는 수집 함수를 등록합니다.
+        fn()은 {'이름': 값} 또는 {'라벨값': {'이름': 값}} 형태의 dict를 반환해야 합니다.
+        """
+        self._collectors.append((prefix, fn))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for prefix, fn in self._collectors:
+            try:
+                lines.extend(_render_collected(prefix, fn()))
+            except Exception:
+                continue
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.register(Histogram(
+    'filepick_request_duration_seconds', '엔드포인트별 요청 처리 시간', ['endpoint']))
+REQUESTS = REGISTRY.register(Counter(
+    'filepick_requests_total', '엔드포인트/상태 코드별 요청 수', ['endpoint', 'status']))
+STAGE_DURATION = REGISTRY.register(Histogram(
+    'filepick_stage_duration_seconds', '엔드포인트/단계별 처리 시간 (upload_parse, decode, process, encode, upload 등)',
+    ['endpoint', 'stage']))
+BYTES = REGISTRY.register(Counter(
+    'filepick_bytes_total', '엔드포인트별 입력(in)/출력(out) 바이트', ['endpoint', 'direction']))
+SUBPROCESS_DURATION = REGISTRY.register(Histogram(
+    'filepick_subprocess_duration_seconds', '외부 프로세스 실행 시간', ['command']))
+SUBPROCESS_CPU = REGISTRY.register(Counter(
+    'filepick_subprocess_cpu_seconds_total', '외부 프로세스 CPU 시간 (user/system)', ['command', 'mode']))
+ERRORS = REGISTRY.register(Counter(
+    'filepick_errors_total', '엔드포인트/예외 타입별 오류 수', ['endpoint', 'type']))
+
+
+class stage(ContextDecorator):
+    """
+    처리 단계의 소요 시간을 현재 엔드포인트 라벨로 기록합니다.
+
+        with stage('decode'):
+            img = Image.open(f)
+
+        @stage('upload')
+        def upload_to_supabase(...): ...
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._started = None
+
+    def _recreate_cm(self):
+        # 데코레이터로 쓸 때 호출마다 새 인스턴스를 사용 (동시 호출 간 시작 시각 공유 방지)
+        return stage(self.name)
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        STAGE_DURATION.observe(time.perf_counter() - self._started, endpoint=_current_endpoint.get(), stage=self.name)
+        return False
+
+
+def set_endpoint(name: str):
+    """현재 컨텍스트의 엔드포인트 라벨을 설정하고 reset_endpoint()에 넘길 토큰을 반환합니다."""
+    return _current_endpoint.set(name), _error_recorded.set(False)
+
+
+def reset_endpoint(token):
+    endpoint_token, error_token = token
+    _current_endpoint.reset(endpoint_token)
+    _error_recorded.reset(error_token)
+
+
+def current_endpoint() -> str:
+    return _current_endpoint.get()
+
+
+def record_bytes(direction: str, amount: int):
+    if amount:
+        BYTES.inc(amount, endpoint=_current_endpoint.get(), direction=direction)
+
+
+def record_error(error):
+    """예외(또는 타입 이름 문자열)를 현재 엔드포인트의 오류 수에 더합니다."""
+    type_name = error if isinstance(error, str) else type(error).__name__
+    ERRORS.inc(endpoint=_current_endpoint.get(), type=type_name)
+    _error_recorded.set(True)
+
+
+def error_recorded() -> bool:
+    """현재 요청에서 이미 오류가 기록되었는지 여부 (5xx 응답 중복 집계 방지)."""
+    return _error_recorded.get()
+
+
+def record_subprocess(command: str, wall: float, rusage=None):
+    SUBPROCESS_DURATION.observe(wall, command=command)
+    if rusage is not None:
+        SUBPROCESS_CPU.inc(rusage.ru_utime, command=command, mode='user')
+        SUBPROCESS_CPU.inc(rusage.ru_stime, command=command, mode='system')
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+def _render_collected(prefix: str, values: dict) -> list:
+    # 같은 이름의 시계열이 한 묶음으로 출력되도록 이름별로 모음
+    families = {}
+    for key, value in values.items():
+        if isinstance(value, dict):
+            for name, sub_value in value.items():
+                families.setdefault(name, []).append((f'{{name="{_escape(key)}"}}', sub_value))
+        else:
+            families.setdefault(key, []).append(('', value))
+
+    lines = []
+    for name, samples in families.items():
+        samples = [(labels, v) for labels, v in samples if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        if not samples:
+            continue
+        lines.append(f"# TYPE {prefix}_{name} gauge")
+        lines.extend(f"{prefix}_{name}{labels} {_number(v)}" for labels, v in samples)
+    return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,111 @@
+# tools/common/middleware.py
+
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+from tools.common.logging_utils import log_exception, log_info
+from tools.common.profiling import profiling_enabled, profile_mode, RequestProfile
+from tools.common.metrics import (
+    REQUEST_DURATION, REQUESTS, set_endpoint, reset_endpoint, current_endpoint,
+    record_bytes, record_error, error_recorded
+)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 엔드포인트(URL 패턴) 라벨로 처리 시간, 상태 코드, 입력 바이트, 오류 수를 기록합니다.
+    엔드포인트 라벨은 뷰 안의 stage()/record_bytes() 기록에도 함께 사용됩니다.
+    ASGI에서는 비동기로 동작하여 요청마다 스레드를 거치지 않습니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # 비동기 요청 처리 중 라벨이 같은 태스크의 컨텍스트에 설정되도록 process_view도 코루틴으로 둠
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        token = set_endpoint('-')
+        try:
+            response = self.get_response(request)
+            self._record(request, response, started)
+            return response
+        finally:
+            reset_endpoint(token)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        token = set_endpoint('-')
+        try:
+            response = await self.get_response(request)
+            self._record(request, response, started)
+            return response
+        finally:
+            reset_endpoint(token)
+
+    def _record(self, request, response, started: float):
+        endpoint = current_endpoint()
+        if endpoint != '-':
+            record_bytes('in', int(request.META.get('CONTENT_LENGTH') or 0))
+            if response.status_code >= 500 and not error_recorded():
+                record_error(f"http_{response.status_code}")
+        REQUEST_DURATION.observe(time.perf_counter() - started, endpoint=endpoint)
+        REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        match = request.resolver_match
+        if match is not None:
+            # 경로 변수 값 대신 URL 패턴을 라벨로 사용하여 시계열 수가 늘어나지 않게 함
+            set_endpoint('/' + match.route if match.route else (match.view_name or '-'))
+        return None
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return MetricsMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    def process_exception(self, request, exception):
+        record_error(exception)
+        return None
+
+
+class ProfilingMiddleware:
+    """
+    관리자 헤더(X-Profile: <PROFILING_TOKEN>[:memory]) 또는 PROFILING_SAMPLE_RATE 비율로 선택된 요청을
+    cProfile(선택적으로 tracemalloc)로 감싸 실행하고, 프로파일과 입력 특성을 덤프 파일로 남깁니다.
+    PROFILING_TOKEN과 PROFILING_SAMPLE_RATE가 모두 비어 있으면 미들웨어 자체가 로드되지 않습니다.
+    cProfile은 스레드 단위로 동작하므로 비동기(ASGI) 요청 처리에서는 로드되지 않습니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not profiling_enabled():
+            raise MiddlewareNotUsed()
+        if iscoroutinefunction(get_response):
+            # 동기 미들웨어로 남겨 두면 ASGI 요청이 모두 한 스레드를 거치게 되므로 로드하지 않음
+            log_info("비동기 요청 처리에서는 요청 프로파일링을 사용하지 않습니다.")
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = profile_mode(request)
+        if mode is None:
+            return self.get_response(request)
+
+        profile = RequestProfile(mode)
+        with profile:
+            response = self.get_response(request)
+        if profile.started:
+            try:
+                name = profile.save(request, response, current_endpoint())
+                response['X-Profile-Id'] = name
+                log_info(f"프로파일 저장: {name} ({request.path}, {profile.elapsed:.3f}s)")
+            except Exception as e:
+                log_exception(e, "프로파일 저장 실패")
+        return response
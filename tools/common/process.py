@@ -0,0 +1,136 @@
+# tools/common/process.py
+
+import os
+import time
+import signal
+import tempfile
+import threading
+import subprocess
+from collections import deque
+from tools.common.metrics import record_subprocess
+
+# 취소 여부를 확인하는 주기 (초)
+CANCEL_POLL_INTERVAL = 0.5
+
+# stderr 줄 처리기를 쓸 때 오류 메시지로 보관할 최대 줄 수
+STDERR_TAIL_LINES = 200
+
+
+class ProcessCancelled(Exception):
+    """외부 프로세스 실행 중 취소 요청이 들어와 프로세스를 종료한 경우"""
+
+
+class ProcessWatcher:
+    """
+    별도 스레드에서 os.wait4()로 프로세스 종료를 기다리며 종료 코드와 CPU 사용량(rusage)을 받습니다.
+    종료되면 실행 시간과 user/system CPU 시간을 메트릭(filepick_subprocess_*)에 기록합니다.
+    """
+
+    def __init__(self, process: subprocess.Popen, command: list):
+        self.process = process
+        self.command = os.path.basename(str(command[0]))
+        self.rusage = None
+        self._started = time.perf_counter()
+        self._finished = threading.Event()
+        threading.Thread(target=self._wait, daemon=True).start()
+
+    def _wait(self):
+        try:
+            _, status, self.rusage = os.wait4(self.process.pid, 0)
+            self.process.returncode = os.waitstatus_to_exitcode(status)
+        except ChildProcessError:
+            self.process.wait()
+        finally:
+            record_subprocess(self.command, time.perf_counter() - self._started, self.rusage)
+            self._finished.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """프로세스가 종료되면 True, timeout 안에 종료되지 않으면 False를 반환합니다."""
+        return self._finished.wait(timeout)
+
+    def kill(self):
+        """
+        프로세스와 그 자식들(soffice.bin 등)을 함께 강제 종료하고 종료될 때까지 기다립니다.
+        start_new_session=True로 실행한 프로세스는 프로세스 그룹 전체에 SIGKILL을 보냅니다.
+        """
+        if self.process.returncode is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        self._finished.wait()
+
+
+def pin_process(process: subprocess.Popen, cpus):
+    """프로세스를 지정한 CPU 묶음에서만 실행되도록 고정합니다 (지원하지 않는 플랫폼에서는 무시)."""
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(process.pid, cpus)
+        except OSError:
+            pass
+
+
+def run_process(command: list, cancel_check=None, on_stderr_line=None,
+                timeout: float = None, cpus=None) -> subprocess.CompletedProcess:
+    """
+    외부 프로세스(ffmpeg, soffice 등)를 실행하고 종료를 기다립니다.
+
+    stdout/stderr는 임시 파일로 받아 파이프 버퍼 교착을 피하고,
+    cancel_check()가 True를 반환하면 프로세스를 강제 종료한 뒤 ProcessCancelled를 발생시키고,
+    cancel_check()가 예외(스크래치 한도 초과 등)를 발생시키면 프로세스를 종료한 뒤 그 예외를 그대로 전달합니다.
+    on_stderr_line이 주어지면 stderr를 별도 스레드에서 한 줄씩 전달하며(예: ffmpeg -progress 파싱),
+    처리기가 True를 반환하지 않은 줄만 오류 메시지용으로 보관합니다.
+    timeout(초)을 넘기면 프로세스 그룹 전체를 종료하고 subprocess.TimeoutExpired를 발생시킵니다.
+    cpus(CPU 번호 목록)가 주어지면 프로세스를 해당 CPU에 고정합니다.
+    종료 코드가 0이 아니면 subprocess.CalledProcessError를 발생시킵니다.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=stdout_file,
+            stderr=subprocess.PIPE if on_stderr_line else stderr_file,
+            start_new_session=True
+        )
+        pin_process(process, cpus)
+        watcher = ProcessWatcher(process, command)
+
+        reader = None
+        stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        if on_stderr_line:
+            def drain():
+                for raw in process.stderr:
+                    line = raw.decode("utf-8", errors="ignore").rstrip()
+                    if line and not on_stderr_line(line):
+                        stderr_tail.append(line)
+            reader = threading.Thread(target=drain, daemon=True)
+            reader.start()
+
+        try:
+            while not watcher.wait(CANCEL_POLL_INTERVAL):
+                try:
+                    cancelled = cancel_check and cancel_check()
+                except BaseException:
+                    watcher.kill()
+                    raise
+                if cancelled:
+                    watcher.kill()
+                    raise ProcessCancelled(f"프로세스 취소됨: {command[0]}")
+                if deadline is not None and time.monotonic() >= deadline:
+                    watcher.kill()
+                    raise subprocess.TimeoutExpired(command, timeout)
+            returncode = process.returncode
+        finally:
+            if reader:
+                reader.join()
+                process.stderr.close()
+
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        stdout = stdout_file.read()
+        stderr = "\n".join(stderr_tail).encode("utf-8") if reader else stderr_file.read()
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(command, returncode, stdout=stdout, stderr=stderr)
@@ -0,0 +1,242 @@
+# tools/common/profiling.py
+
+import os
+import io
+import hmac
+import json
+import time
+import uuid
+import random
+import cProfile
+import pstats
+import tempfile
+import threading
+import tracemalloc
+from django.conf import settings
+
+# 프로파일 덤프 디렉터리와 보관 개수 (오래된 것부터 삭제)
+PROFILING_DIR = getattr(settings, 'PROFILING_DIR', os.path.join(tempfile.gettempdir(), 'filepick-profiles'))
+PROFILING_MAX_DUMPS = getattr(settings, 'PROFILING_MAX_DUMPS', 50)
+
+# 요청 헤더 X-Profile 값이 이 토큰과 같으면 프로파일링 ("<토큰>:memory"면 메모리 할당도 기록)
+PROFILING_TOKEN = getattr(settings, 'PROFILING_TOKEN', '')
+PROFILING_HEADER = 'HTTP_X_PROFILE'
+
+# 헤더 없이 무작위로 프로파일링할 요청 비율 (0.0 ~ 1.0) / 샘플링된 요청의 메모리 할당 기록 여부
+PROFILING_SAMPLE_RATE = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+PROFILING_TRACEMALLOC = getattr(settings, 'PROFILING_TRACEMALLOC', False)
+
+# 덤프에 기록할 누적 시간 상위 함수 / 메모리 할당 상위 위치 수
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 20
+
+# cProfile/tracemalloc은 프로세스 전체에서 하나만 활성화할 수 있으므로 동시에 한 요청만 프로파일링
+_active = threading.Lock()
+
+_DUMP_NAME_CHARS = set('0123456789abcdefghijklmnopqrstuvwxyz-_.')
+
+
+def profiling_enabled() -> bool:
+    return bool(PROFILING_TOKEN) or PROFILING_SAMPLE_RATE > 0
+
+
+def profile_mode(request):
+    """
+    요청을 프로파일링할지 결정합니다.
+    반환값: None(안 함) / 'cpu' / 'memory'(cProfile + tracemalloc)
+    """
+    header = request.META.get(PROFILING_HEADER)
+    if header and PROFILING_TOKEN:
+        token, _, option = header.partition(':')
+        if hmac.compare_digest(token.encode(), PROFILING_TOKEN.encode()):
+            return 'memory' if option == 'memory' else 'cpu'
+    if PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE:
+        return 'memory' if PROFILING_TRACEMALLOC else 'cpu'
+    return None
+
+
+class RequestProfile:
+    """
+    요청 하나를 cProfile(선택적으로 tracemalloc)로 감싸 실행하고 결과를 덤프 파일로 저장합니다.
+    다른 요청이 이미 프로파일링 중이면 아무것도 하지 않습니다 (started=False).
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.started = False
+        self._profiler = None
+        self._started_at = 0.0
+
+    def __enter__(self):
+        if not _active.acquire(blocking=False):
+            return self
+        self.started = True
+        if self.mode == 'memory':
+            tracemalloc.start(10)
+        self._profiler = cProfile.Profile()
+        self._started_at = time.perf_counter()
+        try:
+            self._profiler.enable()
+        except ValueError:
+            # 다른 프로파일러(디버거 등)가 이미 활성화된 경우
+            self._stop_tracing()
+            self.started = False
+            _active.release()
+        return self
+
+    def __exit__(self, *exc):
+        if not self.started:
+            return False
+        self._profiler.disable()
+        self.elapsed = time.perf_counter() - self._started_at
+        self.memory = None
+        try:
+            if self.mode == 'memory':
+                self.memory = _memory_summary()
+        finally:
+            self._stop_tracing()
+            _active.release()
+        return False
+
+    def _stop_tracing(self):
+        if self.mode == 'memory' and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def save(self, request, response, endpoint: str) -> str:
+        """프로파일(.prof)과 요청 메타데이터(.json)를 저장하고 덤프 이름을 반환합니다."""
+        os.makedirs(PROFILING_DIR, exist_ok=True)
+        now = time.time()
+        # 이름순 정렬이 생성 순서가 되도록 밀리초까지 포함
+        name = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}-{uuid.uuid4().hex[:6]}"
+        self._profiler.dump_stats(os.path.join(PROFILING_DIR, f"{name}.prof"))
+
+        summary = io.StringIO()
+        pstats.Stats(self._profiler, stream=summary).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+
+        meta = {
+            'name': name,
+            'created_at': now,
+            'endpoint': endpoint,
+            'method': request.method,
+            'path': request.path,
+            'status': getattr(response, 'status_code', None),
+            'elapsed_seconds': round(self.elapsed, 4),
+            'mode': self.mode,
+            'inputs': describe_inputs(request),
+            'memory': self.memory,
+            'top_functions': summary.getvalue(),
+        }
+        tmp_path = os.path.join(PROFILING_DIR, f".{name}.json.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, os.path.join(PROFILING_DIR, f"{name}.json"))
+
+        _trim_dumps()
+        return name
+
+
+def _memory_summary() -> dict:
+    """최대 메모리 사용량과 할당 위치별 상위 목록 (tracemalloc은 프로세스 전체 할당을 기록합니다)."""
+    current, peak = tracemalloc.get_traced_memory()
+    stats = tracemalloc.take_snapshot().statistics('lineno')[:TOP_ALLOCATIONS]
+    return {
+        'current_bytes': current,
+        'peak_bytes': peak,
+        'top_allocations': [
+            {'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             'bytes': stat.size, 'count': stat.count}
+            for stat in stats
+        ],
+    }
+
+
+def describe_inputs(request) -> list:
+    """
+    업로드 파일의 내용 없이 크기/형식/이미지 크기/PDF 페이지 수만 기록합니다.
+    (사용자 파일은 보관할 수 없으므로 재현에 필요한 특성만 남김)
+    """
+    inputs = []
+    try:
+        uploaded = list(request.FILES.lists())
+    except Exception:
+        return inputs
+    for field, files in uploaded:
+        for f in files:
+            info = {
+                'field': field,
+                'extension': os.path.splitext(f.name)[1].lower(),
+                'size': f.size,
+                'content_type': getattr(f, 'sniffed_content_type', None) or f.content_type,
+            }
+            try:
+                info.update(_inspect_file(f, info['content_type']))
+            except Exception:
+                pass
+            inputs.append(info)
+    return inputs
+
+
+def _inspect_file(f, content_type: str) -> dict:
+    details = {}
+    f.seek(0)
+    if content_type and content_type.startswith('image/'):
+        from PIL import Image
+        with Image.open(f) as img:
+            details = {'width': img.width, 'height': img.height, 'mode': img.mode,
+                       'frames': getattr(img, 'n_frames', 1)}
+    elif content_type == 'application/pdf':
+        from PyPDF2 import PdfReader
+        reader = PdfReader(f)
+        details = {'pages': len(reader.pages), 'encrypted': reader.is_encrypted}
+    f.seek(0)
+    return details
+
+
+def _trim_dumps():
+    """PROFILING_MAX_DUMPS개를 넘는 오래된 덤프를 삭제합니다."""
+    names = list_dump_names()
+    for name in names[PROFILING_MAX_DUMPS:]:
+        for ext in ('.prof', '.json'):
+            try:
+                os.remove(os.path.join(PROFILING_DIR, name + ext))
+            except OSError:
+                pass
+
+
+def list_dump_names() -> list:
+    """저장된 덤프 이름 목록 (최신순)"""
+    try:
+        entries = os.listdir(PROFILING_DIR)
+    except OSError:
+        return []
+    return sorted((e[:-5] for e in entries if e.endswith('.json') and not e.startswith('.')), reverse=True)
+
+
+def list_dumps() -> list:
+    """저장된 덤프의 메타데이터 목록 (최신순, 함수별 통계 제외)"""
+    dumps = []
+    for name in list_dump_names():
+        meta = read_dump_meta(name)
+        if meta is not None:
+            meta.pop('top_functions', None)
+            dumps.append(meta)
+    return dumps
+
+
+def read_dump_meta(name: str):
+    path = dump_path(name, '.json')
+    if path is None:
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def dump_path(name: str, ext: str):
+    """덤프 파일 경로를 반환합니다. 이름이 올바르지 않거나 파일이 없으면 None."""
+    if not name or not set(name) <= _DUMP_NAME_CHARS or name.startswith('.'):
+        return None
+    path = os.path.join(PROFILING_DIR, name + ext)
+    return path if os.path.isfile(path) else None
@@ -0,0 +1,89 @@
+# tools/common/progress.py
+
+import re
+import time
+from contextlib import contextmanager
+from django.core.cache import caches
+from tools.common.process import ProcessCancelled
+
+# 진행률 저장용 캐시 별칭 (settings.CACHES['progress'], 워커 프로세스 간 공유)
+PROGRESS_CACHE = 'progress'
+
+# 같은 단계 내 진행률 갱신 최소 간격 (초) - 이보다 잦은 갱신은 합쳐서 기록
+PROGRESS_INTERVAL = 0.5
+
+# 진행률 기록 보관 시간 (초)
+PROGRESS_TTL = 60 * 60
+
+# 더 이상 갱신되지 않는 종료 단계
+FINAL_STAGES = ('done', 'failed', 'cancelled')
+
+_KEY_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+def _cache():
+    return caches[PROGRESS_CACHE]
+
+
+def get_progress(key: str):
+    """저장된 진행 상태 dict를 반환합니다. 없으면 None."""
+    return _cache().get(f"progress:{key}")
+
+
+class ProgressReporter:
+    """
+    변환 한 건의 진행 상태(stage, percent 등)를 기록합니다.
+
+    단계(stage)가 바뀌면 즉시 기록하고, 같은 단계의 진행률 갱신은
+    PROGRESS_INTERVAL 간격으로 합쳐(coalesce) 기록하여 변환 작업을 방해하지 않습니다.
+    key가 None이면 아무것도 기록하지 않습니다 (진행률을 요청하지 않은 경우).
+    """
+
+    def __init__(self, key: str = None, interval: float = PROGRESS_INTERVAL):
+        self.key = key
+        self.interval = interval
+        self._stage = None
+        self._last_write = 0.0
+
+    def update(self, stage: str, percent: float = None, **extra):
+        if self.key is None:
+            return
+        now = time.monotonic()
+        if stage == self._stage and now - self._last_write < self.interval:
+            return
+
+        state = {'stage': stage, 'updated_at': time.time()}
+        if percent is not None:
+            state['percent'] = round(max(0.0, min(percent, 100.0)), 1)
+        state.update(extra)
+
+        self._stage = stage
+        self._last_write = now
+        _cache().set(f"progress:{self.key}", state, PROGRESS_TTL)
+
+    @contextmanager
+    def tracking(self):
+        """
+        블록이 정상 종료되면 'done', 취소되면 'cancelled', 예외가 발생하면 'failed'를 기록합니다.
+        """
+        try:
+            yield self
+        except ProcessCancelled:
+            self.update('cancelled')
+            raise
+        except Exception as e:
+            self.update('failed', error=str(e))
+            raise
+        else:
+            self.update('done', percent=100)
+
+
+def progress_from_request(request):
+    """
+    요청의 progress_id(클라이언트가 만든 UUID 등)로 ProgressReporter를 만듭니다.
+    값이 없거나 형식이 잘못되면 아무것도 기록하지 않는 ProgressReporter를 반환합니다.
+    """
+    key = request.POST.get('progress_id') or request.GET.get('progress_id')
+    if not key or not _KEY_PATTERN.match(key):
+        return ProgressReporter(None)
+    return ProgressReporter(key)
@@ -0,0 +1,311 @@
+# tools/common/scratch.py
+
+import os
+import time
+import uuid
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from django.conf import settings
+from tools.common.logging_utils import log_exception, log_info
+
+# 디스크 스크래치 루트 / tmpfs 스크래치 루트
+SCRATCH_DIR = getattr(settings, 'SCRATCH_DIR', os.path.join(tempfile.gettempdir(), 'filepick-scratch'))
+SCRATCH_TMPFS_DIR = getattr(settings, 'SCRATCH_TMPFS_DIR', '/dev/shm/filepick-scratch')
+
+# 이 크기(예상 사용량) 이하의 작업은 tmpfs에 배치
+SCRATCH_TMPFS_MAX_SIZE = getattr(settings, 'SCRATCH_TMPFS_MAX_SIZE', 64 * 1024 * 1024)
+
+# 작업 하나 / 전체 스크래치 사용량 한도 (바이트)
+SCRATCH_JOB_QUOTA = getattr(settings, 'SCRATCH_JOB_QUOTA', 20 * 1024 ** 3)
+SCRATCH_GLOBAL_QUOTA = getattr(settings, 'SCRATCH_GLOBAL_QUOTA', 100 * 1024 ** 3)
+
+# 고아 디렉터리 정리 주기 / 소유 프로세스가 살아 있어도 삭제하는 최대 보관 시간 (초)
+SCRATCH_SWEEP_INTERVAL = getattr(settings, 'SCRATCH_SWEEP_INTERVAL', 10 * 60)
+SCRATCH_MAX_AGE = getattr(settings, 'SCRATCH_MAX_AGE', 6 * 60 * 60)
+
+# 외부 프로세스가 기록하는 동안 작업 디렉터리 사용량을 확인하는 주기 (초, guard() 참고)
+SCRATCH_QUOTA_POLL_INTERVAL = getattr(settings, 'SCRATCH_QUOTA_POLL_INTERVAL', 2)
+
+# 청크 복사 단위
+CHUNK_SIZE = 256 * 1024
+
+_lock = threading.Lock()
+_sweeper_started = False
+_stats = {
+    'workspaces_active': 0,
+    'workspaces_created_total': 0,
+    'tmpfs_placements_total': 0,
+    'quota_rejections_total': 0,
+    'orphans_removed_total': 0,
+    'bytes_reserved': 0,
+    'bytes_used_disk': 0,
+    'bytes_used_tmpfs': 0,
+    # 예약으로 잡히지 않은 사용량: 다른 프로세스/고아 디렉터리 + 이 프로세스 작업의 예약 초과분
+    'bytes_used_unreserved': 0,
+}
+# 이 프로세스가 연 작업 디렉터리 경로 -> 예약 크기 (전체 한도 계산 시 이중 집계 방지)
+_reservations = {}
+
+
+class ScratchQuotaExceeded(Exception):
+    """작업 또는 전체 스크래치 용량 한도를 넘은 경우"""
+
+
+class ScratchWorkspace:
+    """
+    작업 하나가 사용하는 임시 디렉터리입니다. scratch_workspace()로 생성하며 블록을 벗어나면 삭제됩니다.
+    수명이 블록이 아니라 객체에 묶인 경우에는 open_workspace()로 만들고 close()로 정리합니다.
+    """
+
+    def __init__(self, path: str, on_tmpfs: bool, quota: int, reserved: int = 0):
+        self.path = path
+        self.on_tmpfs = on_tmpfs
+        self.quota = quota
+        self._reserved = reserved
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+    def close(self):
+        """디렉터리를 삭제하고 예약한 용량을 반환합니다. 여러 번 호출해도 한 번만 정리합니다."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        shutil.rmtree(self.path, ignore_errors=True)
+        with _lock:
+            _stats['workspaces_active'] -= 1
+            _stats['bytes_reserved'] -= self._reserved
+            _reservations.pop(self.path, None)
+
+    def file_path(self, name: str) -> str:
+        """작업 디렉터리 안의 파일 경로를 반환합니다 (파일은 만들지 않음)."""
+        return os.path.join(self.path, os.path.basename(name))
+
+    def mkstemp(self, suffix: str = "") -> str:
+        """작업 디렉터리 안에 빈 임시 파일을 만들고 경로를 반환합니다."""
+        fd, path = tempfile.mkstemp(suffix=suffix, dir=self.path)
+        os.close(fd)
+        return path
+
+    def mkdir(self, name: str) -> str:
+        path = os.path.join(self.path, os.path.basename(name))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def stage_upload(self, uploaded_file, suffix: str = "") -> str:
+        """
+        업로드 파일의 디스크 경로를 반환합니다.
+        이미 디스크에 있는 업로드는 그 경로를 그대로 쓰고, 메모리 업로드만 청크 단위로 작업 디렉터리에 기록합니다.
+        """
+        if hasattr(uploaded_file, 'temporary_file_path'):
+            return uploaded_file.temporary_file_path()
+
+        path = self.mkstemp(suffix=suffix)
+        with open(path, 'wb') as dst:
+            for chunk in uploaded_file.chunks(CHUNK_SIZE):
+                dst.write(chunk)
+        self.check_quota()
+        return path
+
+    def usage(self) -> int:
+        return _dir_size(self.path)
+
+    def check_quota(self):
+        """
+        현재 사용량이 작업 한도를 넘으면 ScratchQuotaExceeded를 발생시킵니다.
+        호출한 시점의 사용량만 보므로, 외부 프로세스가 기록하는 동안에는 guard()로 주기적으로 검사합니다.
+        """
+        used = self.usage()
+        if used > self.quota:
+            with _lock:
+                _stats['quota_rejections_total'] += 1
+            raise ScratchQuotaExceeded(f"작업 스크래치 용량 한도 초과 ({used} > {self.quota} bytes)")
+
+    def guard(self, cancel_check=None):
+        """
+        run_process()/arun_process()에 넘길 cancel_check를 만듭니다.
+        원래 cancel_check에 더해 SCRATCH_QUOTA_POLL_INTERVAL초마다 작업 디렉터리 사용량을 확인하고,
+        한도를 넘으면 ScratchQuotaExceeded를 발생시켜 기록 중인 프로세스를 종료시킵니다
+        (한도를 넘어 기록되는 양은 확인 주기 동안 쓴 양 이내).
+        """
+        next_check = time.monotonic() + SCRATCH_QUOTA_POLL_INTERVAL
+
+        def check() -> bool:
+            nonlocal next_check
+            if time.monotonic() >= next_check:
+                self.check_quota()
+                next_check = time.monotonic() + SCRATCH_QUOTA_POLL_INTERVAL
+            return bool(cancel_check and cancel_check())
+        return check
+
+
+@contextmanager
+def scratch_workspace(size_hint: int = 0, prefix: str = "job"):
+    """
+    작업용 스크래치 디렉터리를 만들고, 블록이 끝나면 성공/실패와 관계없이 삭제합니다.
+
+    - 예상 사용량(size_hint)이 SCRATCH_TMPFS_MAX_SIZE 이하이고 tmpfs에 여유가 있으면 tmpfs, 아니면 디스크에 배치
+    - size_hint가 작업 한도(SCRATCH_JOB_QUOTA)나 전체 한도(SCRATCH_GLOBAL_QUOTA)의 남은 용량을 넘으면
+      ScratchQuotaExceeded를 발생시킵니다.
+    - 디렉터리 이름에 PID를 넣어, 프로세스가 비정상 종료해도 주기적 정리(sweeper)가 찾아 지울 수 있게 합니다.
+    """
+    workspace = open_workspace(size_hint, prefix)
+    try:
+        yield workspace
+    finally:
+        workspace.close()
+
+
+def open_workspace(size_hint: int = 0, prefix: str = "job") -> ScratchWorkspace:
+    """
+    scratch_workspace()와 같은 배치/용량 예약으로 작업 디렉터리를 만들어 반환합니다.
+    호출한 쪽이 close()로 정리해야 합니다 (예: weakref.finalize로 객체 수명에 묶는 경우).
+    """
+    _ensure_sweeper()
+    size_hint = max(int(size_hint or 0), 0)
+
+    # 이 프로세스의 작업은 예약 크기로, 예약을 넘겨 쓴 양과 다른 프로세스 사용량은 정리 주기마다 측정한 값으로 집계
+    with _lock:
+        used = _stats['bytes_reserved'] + _stats['bytes_used_unreserved']
+        if size_hint > SCRATCH_JOB_QUOTA or used + size_hint > SCRATCH_GLOBAL_QUOTA:
+            _stats['quota_rejections_total'] += 1
+            raise ScratchQuotaExceeded("스크래치 공간이 부족합니다. 잠시 후 다시 시도해 주세요.")
+        _stats['bytes_reserved'] += size_hint
+
+    root = _choose_root(size_hint)
+    on_tmpfs = root == SCRATCH_TMPFS_DIR
+    path = os.path.join(root, f"{prefix}-{os.getpid()}-{uuid.uuid4().hex[:12]}")
+
+    # 디렉터리를 만들기 전에 등록해 두어야 정리 스레드가 다른 프로세스 사용량으로 세지 않음
+    with _lock:
+        _reservations[path] = size_hint
+    try:
+        os.makedirs(path)
+    except BaseException:
+        with _lock:
+            _stats['bytes_reserved'] -= size_hint
+            _reservations.pop(path, None)
+        raise
+    with _lock:
+        _stats['workspaces_active'] += 1
+        _stats['workspaces_created_total'] += 1
+        if on_tmpfs:
+            _stats['tmpfs_placements_total'] += 1
+    return ScratchWorkspace(path, on_tmpfs, SCRATCH_JOB_QUOTA, reserved=size_hint)
+
+
+@contextmanager
+def staged_upload_path(uploaded_file, suffix: str = ""):
+    """
+    업로드 파일을 외부 프로그램(ffmpeg, soffice 등)이 읽을 수 있는 디스크 경로로 제공합니다.
+    이미 디스크에 스풀된 업로드는 그대로 사용하고, 메모리 업로드만 스크래치 공간에 기록 후 블록 종료 시 삭제합니다.
+    """
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        yield uploaded_file.temporary_file_path()
+        return
+    with scratch_workspace(size_hint=uploaded_file.size or 0, prefix="upload") as workspace:
+        yield workspace.stage_upload(uploaded_file, suffix=suffix)
+
+
+def scratch_metrics() -> dict:
+    """스크래치 사용량/배치/정리 통계를 반환합니다."""
+    with _lock:
+        return dict(_stats)
+
+
+def sweep_orphans() -> int:
+    """
+    소유 프로세스가 종료되었거나 SCRATCH_MAX_AGE보다 오래된 스크래치 디렉터리를 삭제하고,
+    디스크/tmpfs 사용량 통계를 갱신합니다. 삭제한 디렉터리 수를 반환합니다.
+
+    이 프로세스가 연 작업 디렉터리는 이미 bytes_reserved로 집계되므로, 예약을 넘겨 쓴 양만
+    bytes_used_unreserved에 더합니다 (다른 프로세스의 디렉터리는 사용량 전체).
+    """
+    removed = 0
+    now = time.time()
+    usage = {}
+    unreserved = 0
+
+    for root in (SCRATCH_DIR, SCRATCH_TMPFS_DIR):
+        total = 0
+        names = os.listdir(root) if os.path.isdir(root) else []
+        # 목록을 읽은 뒤에 스냅샷: 목록에 있는 이 프로세스의 디렉터리는 반드시 등록되어 있음
+        with _lock:
+            owned = dict(_reservations)
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                pid = int(name.split('-')[1])
+                age = now - os.path.getmtime(path)
+            except (IndexError, ValueError, OSError):
+                continue
+            if not _pid_alive(pid) or age > SCRATCH_MAX_AGE:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+                continue
+            size = _dir_size(path)
+            total += size
+            unreserved += max(size - owned[path], 0) if path in owned else size
+        usage[root] = total
+
+    with _lock:
+        _stats['orphans_removed_total'] += removed
+        _stats['bytes_used_disk'] = usage[SCRATCH_DIR]
+        _stats['bytes_used_tmpfs'] = usage[SCRATCH_TMPFS_DIR]
+        _stats['bytes_used_unreserved'] = unreserved
+    if removed:
+        log_info(f"스크래치 고아 디렉터리 {removed}개 삭제")
+    return removed
+
+
+def _choose_root(size_hint: int) -> str:
+    if size_hint <= SCRATCH_TMPFS_MAX_SIZE and SCRATCH_TMPFS_DIR:
+        try:
+            os.makedirs(SCRATCH_TMPFS_DIR, exist_ok=True)
+            if shutil.disk_usage(SCRATCH_TMPFS_DIR).free > size_hint * 2:
+                return SCRATCH_TMPFS_DIR
+        except OSError:
+            pass
+    os.makedirs(SCRATCH_DIR, exist_ok=True)
+    return SCRATCH_DIR
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _ensure_sweeper():
+    global _sweeper_started
+    with _lock:
+        if _sweeper_started:
+            return
+        _sweeper_started = True
+    threading.Thread(target=_sweep_loop, name="scratch-sweeper", daemon=True).start()
+
+
+def _sweep_loop():
+    while True:
+        try:
+            sweep_orphans()
+        except Exception as e:
+            log_exception(e, "스크래치 정리 실패")
+        time.sleep(SCRATCH_SWEEP_INTERVAL)
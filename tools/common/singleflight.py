@@ -0,0 +1,351 @@
+# tools/common/singleflight.py
+
+import os
+import json
+import time
+import fcntl
+import hashlib
+import tempfile
+import asyncio
+import importlib
+import threading
+from django.conf import settings
+from tools.common.governor import ConverterBusy
+from tools.common.process import ProcessCancelled
+
+# 프로세스 간 중복 제거용 잠금/결과 파일 디렉터리
+SINGLEFLIGHT_DIR = getattr(settings, 'SINGLEFLIGHT_DIR', os.path.join(tempfile.gettempdir(), 'filepick-singleflight'))
+
+# 같은 작업을 기다리는 최대 시간 (초)
+SINGLEFLIGHT_WAIT_TIMEOUT = getattr(settings, 'SINGLEFLIGHT_WAIT_TIMEOUT', 10 * 60)
+
+# 다른 프로세스가 남긴 결과 파일을 재사용할 수 있는 시간 (초) - 실행 중 합류하지 못한 요청용
+SINGLEFLIGHT_RESULT_TTL = getattr(settings, 'SINGLEFLIGHT_RESULT_TTL', 30)
+
+# 프로세스 간 잠금 재시도 간격 (초)
+LOCK_POLL_INTERVAL = 0.2
+
+# 해시 계산 시 읽기 단위
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 먼저 시작한 요청에만 해당하는 일시적 실패 - 공유하지 않고 기다리던 요청이 직접 다시 실행
+# (변환기 슬롯 부족, 먼저 시작한 요청의 클라이언트 취소)
+TRANSIENT_ERRORS = (ConverterBusy, ProcessCancelled)
+
+_calls = {}
+_async_calls = {}
+_calls_lock = threading.Lock()
+_stats = {'leaders_total': 0, 'coalesced_total': 0, 'wait_timeouts_total': 0}
+_last_purge = 0.0
+
+
+class SingleFlightTimeout(Exception):
+    """같은 작업의 결과를 기다리다 시간이 초과된 경우"""
+
+
+class SingleFlightError(Exception):
+    """
+    다른 워커 프로세스에서 실행된 같은 작업이 실패했고, 원래 예외 타입을 다시 만들 수 없는 경우
+    (원래 예외 타입 이름을 error_type으로 제공)
+    """
+
+    def __init__(self, message: str, error_type: str = ''):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def content_hash(uploaded_file) -> str:
+    """
+    업로드 파일의 BLAKE2b 해시를 반환합니다.
+    업로드 핸들러가 이미 계산한 값(content_hash)이 있으면 그대로 쓰고, 없으면 파일을 읽어 계산합니다.
+    """
+    value = getattr(uploaded_file, 'content_hash', None)
+    if value:
+        return value
+
+    hasher = hashlib.blake2b(digest_size=32)
+    if isinstance(uploaded_file, str):
+        with open(uploaded_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    for chunk in uploaded_file.chunks(HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+    uploaded_file.seek(0)
+    uploaded_file.content_hash = hasher.hexdigest()
+    return uploaded_file.content_hash
+
+
+def flight_key(operation: str, inputs: list, params: dict = None) -> str:
+    """작업 이름 + 입력 파일(또는 경로) 해시 + 매개변수로 중복 제거 키를 만듭니다."""
+    payload = json.dumps([operation, [content_hash(f) for f in inputs], params or {}], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()
+
+
+def single_flight(key: str, fn, timeout: float = None):
+    """
+    같은 key의 작업이 이미 실행 중이면 그 결과를 기다려 함께 반환하고, 없으면 fn()을 실행합니다.
+
+    - 같은 프로세스의 스레드끼리는 메모리에서, 같은 호스트의 워커 프로세스끼리는
+      SINGLEFLIGHT_DIR의 잠금 파일(flock)과 결과 파일로 합류합니다.
+    - 먼저 시작한 요청의 예외는 기다리던 요청에도 같은 타입으로 전달됩니다
+      (다른 프로세스의 예외는 결과 파일에 담긴 타입/메시지/속성(status 등)으로 다시 만들어 전달).
+      단, TRANSIENT_ERRORS(슬롯 부족, 취소)는 전달하지 않고 기다리던 요청이 fn()을 직접 실행합니다.
+    - timeout(기본 SINGLEFLIGHT_WAIT_TIMEOUT)초 안에 결과가 나오지 않으면 SingleFlightTimeout을 발생시킵니다.
+    fn의 반환값은 JSON으로 직렬화할 수 있어야 합니다 (예: 업로드 URL, 결과 dict).
+    """
+    timeout = SINGLEFLIGHT_WAIT_TIMEOUT if timeout is None else timeout
+
+    with _calls_lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _calls[key] = _Call()
+            _stats['leaders_total'] += 1
+        else:
+            _stats['coalesced_total'] += 1
+
+    if not leader:
+        started = time.monotonic()
+        if not call.event.wait(timeout):
+            _count('wait_timeouts_total')
+            raise SingleFlightTimeout("같은 작업의 결과를 기다리는 시간이 초과되었습니다.")
+        if isinstance(call.error, TRANSIENT_ERRORS):
+            return single_flight(key, fn, max(timeout - (time.monotonic() - started), 0))
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = _run_across_processes(key, fn, timeout)
+        return call.result
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        call.event.set()
+        with _calls_lock:
+            _calls.pop(key, None)
+
+
+async def asingle_flight(key: str, fn, timeout: float = None):
+    """
+    single_flight()의 비동기 버전. fn은 코루틴을 반환하는 함수입니다.
+    같은 이벤트 루프의 요청끼리만 합류하며, 워커 프로세스 간 합류(잠금 파일)는 하지 않습니다.
+    """
+    timeout = SINGLEFLIGHT_WAIT_TIMEOUT if timeout is None else timeout
+
+    future = _async_calls.get(key)
+    if future is not None:
+        _count('coalesced_total')
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            _count('wait_timeouts_total')
+            raise SingleFlightTimeout("같은 작업의 결과를 기다리는 시간이 초과되었습니다.")
+        except TRANSIENT_ERRORS:
+            return await asingle_flight(key, fn, max(timeout - (time.monotonic() - started), 0))
+
+    future = _async_calls[key] = asyncio.get_running_loop().create_future()
+    _count('leaders_total')
+    try:
+        result = await fn()
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # 기다리는 요청이 없어도 경고가 남지 않도록 예외를 확인 처리
+        raise
+    finally:
+        _async_calls.pop(key, None)
+
+
+def _count(name: str):
+    with _calls_lock:
+        _stats[name] += 1
+
+
+def singleflight_metrics() -> dict:
+    with _calls_lock:
+        return dict(_stats, in_flight=len(_calls) + len(_async_calls))
+
+
+def _run_across_processes(key: str, fn, timeout: float):
+    os.makedirs(SINGLEFLIGHT_DIR, exist_ok=True)
+    lock_path = os.path.join(SINGLEFLIGHT_DIR, f"{key}.lock")
+    result_path = os.path.join(SINGLEFLIGHT_DIR, f"{key}.json")
+    started = time.time()
+    deadline = time.monotonic() + timeout
+
+    lock_file, waited = _acquire_lock(lock_path, deadline)
+    with lock_file:
+        try:
+            # 다른 프로세스가 방금 끝낸 결과가 있으면 재사용 (일시적 실패는 기록되지 않으므로 직접 실행)
+            outcome = _read_result(result_path, since=started if waited else started - SINGLEFLIGHT_RESULT_TTL)
+            if outcome is not None:
+                if waited:
+                    _count('coalesced_total')
+                if outcome.get('ok'):
+                    return outcome['result']
+                if waited:
+                    raise _rebuild_error(outcome)
+
+            try:
+                result = fn()
+            except TRANSIENT_ERRORS:
+                raise
+            except Exception as e:
+                _write_result(result_path, _error_outcome(e))
+                raise
+            _write_result(result_path, {'ok': True, 'result': result})
+            return result
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            _purge_expired()
+
+
+def _acquire_lock(lock_path: str, deadline: float) -> tuple:
+    """
+    잠금 파일을 열어 flock을 잡고 (파일 객체, 기다렸는지 여부)를 반환합니다.
+    연 뒤 잠그기 전에 _purge_expired()가 파일을 지웠을 수 있으므로, 잠근 파일이 아직 그 경로의 파일인지
+    (inode 비교) 확인하고 아니면 다시 엽니다. 그렇지 않으면 지워진 파일과 새 파일을 각각 잠근 두 프로세스가 함께 실행됩니다.
+    """
+    waited = False
+    while True:
+        lock_file = open(lock_path, 'a')
+        try:
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    waited = True
+                    if time.monotonic() >= deadline:
+                        _count('wait_timeouts_total')
+                        raise SingleFlightTimeout("같은 작업의 결과를 기다리는 시간이 초과되었습니다.")
+                    time.sleep(LOCK_POLL_INTERVAL)
+            try:
+                current = os.stat(lock_path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current == os.fstat(lock_file.fileno()).st_ino:
+                return lock_file, waited
+        except BaseException:
+            lock_file.close()
+            raise
+        lock_file.close()
+
+
+def _error_outcome(e: Exception) -> dict:
+    """예외를 결과 파일에 기록할 형태로 바꿉니다 (타입 경로, 메시지, JSON으로 담을 수 있는 속성)."""
+    attrs, byte_attrs = {}, []
+    for name, value in vars(e).items():
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='replace')
+            byte_attrs.append(name)
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        attrs[name] = value
+    return {
+        'ok': False,
+        'error': str(e),
+        'error_type': f"{type(e).__module__}.{type(e).__qualname__}",
+        'args': [a for a in e.args if isinstance(a, (str, int, float))],
+        'attrs': attrs,
+        'byte_attrs': byte_attrs,
+    }
+
+
+def _rebuild_error(outcome: dict) -> Exception:
+    """
+    결과 파일의 실패 정보로 원래 타입의 예외를 다시 만듭니다 (status, retry_after, stderr 등 속성 포함).
+    타입을 찾을 수 없으면 SingleFlightError를 반환합니다.
+    """
+    error_type = outcome.get('error_type', '')
+    module_name, _, qualname = error_type.rpartition('.')
+    try:
+        cls = importlib.import_module(module_name)
+        for part in qualname.split('.'):
+            cls = getattr(cls, part)
+    except (ImportError, AttributeError, ValueError):
+        cls = None
+    if not (isinstance(cls, type) and issubclass(cls, Exception)):
+        return SingleFlightError(outcome.get('error', ''), error_type)
+
+    error = cls.__new__(cls)
+    error.args = tuple(outcome.get('args') or [outcome.get('error', '')])
+    attrs = dict(outcome.get('attrs') or {})
+    for name in outcome.get('byte_attrs') or []:
+        if isinstance(attrs.get(name), str):
+            attrs[name] = attrs[name].encode('utf-8')
+    try:
+        error.__dict__.update(attrs)
+    except AttributeError:
+        pass
+    return error
+
+
+def _read_result(path: str, since: float):
+    try:
+        if os.path.getmtime(path) < since:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_result(path: str, outcome: dict):
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=SINGLEFLIGHT_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(outcome, f, default=str)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError):
+        pass
+
+
+def _purge_expired():
+    """
+    보관 시간이 지난 결과 파일과, 아무도 잡고 있지 않은 오래된 잠금 파일을 삭제합니다.
+    잠금 파일은 잡은 상태에서 지우며, 지우기 직전에 파일을 연 프로세스는 _acquire_lock()의 inode 확인으로 다시 엽니다.
+    디렉터리 검사는 SINGLEFLIGHT_RESULT_TTL 간격으로만 수행합니다.
+    """
+    global _last_purge
+    now = time.time()
+    with _calls_lock:
+        if now - _last_purge < SINGLEFLIGHT_RESULT_TTL:
+            return
+        _last_purge = now
+
+    cutoff = now - SINGLEFLIGHT_RESULT_TTL * 2
+    try:
+        entries = list(os.scandir(SINGLEFLIGHT_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime >= cutoff:
+                continue
+            if entry.name.endswith('.json'):
+                os.remove(entry.path)
+            elif entry.name.endswith('.lock'):
+                with open(entry.path, 'a') as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    os.remove(entry.path)
+        except (OSError, BlockingIOError):
+            continue
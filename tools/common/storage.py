@@ -1,16 +1,171 @@
 # tools/common/storage.py
 
 import os
-import tempfile
-from supabase import create_client
+import threading
+from urllib.parse import quote
+from django.conf import settings
+from tools.common.metrics import stage, record_bytes
+from tools.common.aio import run_io
+from tools.common.httpclient import (
+    request_with_retry, arequest_with_retry, download_with_retry, StorageRequestError, StorageObjectTooLarge
+)
 
 # Supabase 환경 변수에서 URL과 서비스 키를 불러옵니다.
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
-# Supabase 클라이언트 초기화
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+# 저장소 백엔드: 'supabase'(기본) 또는 'memory'(벤치마크/로컬 실행용, 업로드 내용을 프로세스 메모리에 보관)
+STORAGE_BACKEND = getattr(settings, 'STORAGE_BACKEND', 'supabase')
 
+# 비동기 업로드 시 파일을 읽어 보내는 단위
+ASYNC_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+class SupabaseStorage:
+    """
+    Supabase Storage 백엔드.
+    Storage REST API를 공유 HTTP 클라이언트(keep-alive, HTTP/2)로 직접 호출하고, public URL은 로컬에서 만듭니다.
+    같은 경로로 다시 보내도 결과가 같도록 x-upsert로 업로드하므로 일시적인 오류는 재시도할 수 있습니다.
+    """
+
+    def _object_url(self, bucket: str, path: str) -> str:
+        return f"{SUPABASE_URL}/storage/v1/object/{bucket}/{quote(path)}"
+
+    def _auth_headers(self) -> dict:
+        return {"Authorization": f"Bearer {SUPABASE_KEY}", "apikey": SUPABASE_KEY}
+
+    def _headers(self, content_type: str, length: int = None) -> dict:
+        headers = dict(self._auth_headers(), **{"Content-Type": content_type, "x-upsert": "true"})
+        if length is not None:
+            headers["Content-Length"] = str(length)
+        return headers
+
+    def upload_bytes(self, bucket: str, path: str, content: bytes, content_type: str):
+        content = bytes(content)
+        request_with_retry("POST", self._object_url(bucket, path), self._headers(content_type), lambda: content)
+
+    def upload_file(self, bucket: str, path: str, file_path: str, content_type: str):
+        # 시도마다 파일을 다시 열어 처음부터 전송 (httpx가 파일 크기로 Content-Length를 설정)
+        request_with_retry("POST", self._object_url(bucket, path), self._headers(content_type),
+                           lambda: open(file_path, "rb"))
+
+    def upload_stream(self, bucket: str, path: str, chunks, content_type: str):
+        # 한 번만 읽을 수 있는 스트림이므로 재시도하지 않음
+        request_with_retry("POST", self._object_url(bucket, path), self._headers(content_type),
+                           lambda: chunks, replayable=False)
+
+    def public_url(self, bucket: str, path: str) -> str:
+        return f"{SUPABASE_URL}/storage/v1/object/public/{bucket}/{quote(path)}"
+
+    def create_signed_upload(self, bucket: str, path: str) -> str:
+        """
+        클라이언트가 서비스 키 없이 path에 한 번 업로드할 수 있는 서명된 URL을 발급합니다.
+        클라이언트는 이 URL로 파일 본문을 PUT합니다 (Supabase 기본 유효 시간 2시간).
+        """
+        response = request_with_retry(
+            "POST", f"{SUPABASE_URL}/storage/v1/object/upload/sign/{bucket}/{quote(path)}",
+            self._headers("application/json"), lambda: b"{}"
+        )
+        # 응답의 url은 /storage/v1 기준 상대 경로 (예: /object/upload/sign/incoming/...?token=...)
+        return f"{SUPABASE_URL}/storage/v1{response.json()['url']}"
+
+    def download(self, bucket: str, path: str, file, max_bytes: int = None) -> int:
+        """비공개 버킷의 객체를 file에 스트리밍으로 기록하고 받은 바이트 수를 반환합니다."""
+        return download_with_retry(
+            f"{SUPABASE_URL}/storage/v1/object/authenticated/{bucket}/{quote(path)}",
+            self._auth_headers(), file, max_bytes
+        )
+
+    async def aupload(self, bucket: str, path: str, content, content_type: str):
+        """
+        비동기 뷰용 업로드. content는 bytes, AsyncFile 또는 bytes 청크를 내보내는 async iterable입니다.
+        bytes와 파일은 재시도하고, async iterable은 한 번만 읽을 수 있으므로 재시도하지 않습니다.
+        """
+        url = self._object_url(bucket, path)
+        if isinstance(content, AsyncFile):
+            await arequest_with_retry("POST", url, self._headers(content_type, content.size), content.open)
+        elif isinstance(content, (bytes, bytearray)):
+            await arequest_with_retry("POST", url, self._headers(content_type), lambda: content)
+        else:
+            await arequest_with_retry("POST", url, self._headers(content_type), lambda: content, replayable=False)
+
+
+class MemoryStorage:
+    """
+    업로드 내용을 프로세스 메모리(dict)에 보관하는 백엔드입니다.
+    벤치마크에서 네트워크 왕복 없이 뷰의 처리 시간과 출력 크기만 측정할 때 사용합니다.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self._lock = threading.Lock()
+
+    def upload_bytes(self, bucket: str, path: str, content: bytes, content_type: str):
+        with self._lock:
+            self.objects[(bucket, path)] = (bytes(content), content_type)
+
+    def upload_file(self, bucket: str, path: str, file_path: str, content_type: str):
+        with open(file_path, "rb") as f:
+            self.upload_bytes(bucket, path, f.read(), content_type)
+
+    def upload_stream(self, bucket: str, path: str, chunks, content_type: str):
+        self.upload_bytes(bucket, path, b"".join(chunks), content_type)
+
+    async def aupload(self, bucket: str, path: str, content, content_type: str):
+        if isinstance(content, AsyncFile):
+            content = content.open()
+        if not isinstance(content, (bytes, bytearray, memoryview)):
+            content = b"".join([chunk async for chunk in content])
+        self.upload_bytes(bucket, path, content, content_type)
+
+    def public_url(self, bucket: str, path: str) -> str:
+        return f"memory://{bucket}/{path}"
+
+    def create_signed_upload(self, bucket: str, path: str) -> str:
+        # 클라이언트가 프로세스 메모리에 직접 올릴 방법이 없으므로 지원하지 않음 (upload_bytes로 미리 넣어 사용)
+        raise StorageRequestError("memory 백엔드는 서명된 업로드 URL을 발급하지 않습니다.", 501)
+
+    def download(self, bucket: str, path: str, file, max_bytes: int = None) -> int:
+        with self._lock:
+            stored = self.objects.get((bucket, path))
+        if stored is None:
+            raise StorageRequestError(f"객체가 없습니다: {bucket}/{path}", 404)
+        content = stored[0]
+        if max_bytes is not None and len(content) > max_bytes:
+            raise StorageObjectTooLarge(f"객체가 최대 크기({max_bytes} bytes)를 초과합니다.")
+        file.write(content)
+        return len(content)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(len(content) for content, _ in self.objects.values())
+
+    def clear(self):
+        with self._lock:
+            self.objects.clear()
+
+
+def get_storage():
+    """설정된 저장소 백엔드를 반환합니다 (처음 사용할 때 생성)."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = MemoryStorage() if STORAGE_BACKEND == 'memory' else SupabaseStorage()
+        return _backend
+
+
+def set_storage(backend):
+    """저장소 백엔드를 교체합니다 (벤치마크/부하 테스트용). 이전 백엔드를 반환합니다."""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+        return previous
+
+
+@stage('upload')
 def upload_to_supabase(
     bucket: str,           # 예: "images", "pdf-files"
     folder: str,           # 예: "resized", "compressed"
@@ -34,25 +189,133 @@ def upload_to_supabase(
     """
     # Supabase 내 전체 경로 구성 (예: converted/abc1234.png)
     path = f"{folder}/{filename}"
+    storage = get_storage()
+    storage.upload_bytes(bucket, path, content, content_type)
+    record_bytes('out', len(content))
 
-    # 임시 파일로 저장 (Supabase 라이브러리가 파일 경로 기반으로 업로드함)
-    with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name  # 경로 기억해두기
+    # 성공한 경우 public URL 반환
+    return storage.public_url(bucket, path)
 
-    # Supabase 업로드 실행
-    res = supabase.storage.from_(bucket).upload(
-        path=path,
-        file=tmp_file_path,
-        file_options={"content-type": content_type}
-    )
 
-    # 업로드 이후 임시 파일 삭제
-    os.remove(tmp_file_path)
+@stage('upload')
+def upload_file_to_supabase(
+    bucket: str,
+    folder: str,
+    filename: str,
+    file_path: str,        # 디스크에 있는 업로드 대상 파일 경로
+    content_type: str = "application/octet-stream"
+) -> str:
+    """
+    디스크에 있는 파일을 메모리로 읽지 않고 경로 그대로 Supabase Storage에 업로드합니다.
+    (변환 결과 파일을 다시 읽어 임시 파일로 복사하는 과정을 생략)
+    """
+    path = f"{folder}/{filename}"
+    storage = get_storage()
+    storage.upload_file(bucket, path, file_path, content_type)
+    record_bytes('out', os.path.getsize(file_path))
+    return storage.public_url(bucket, path)
 
-    # 업로드 실패 시 에러 반환
-    if hasattr(res, "error") and res.error:
-        raise Exception(f"Supabase 업로드 실패: {res.error}")
 
-    # 성공한 경우 public URL 반환
-    return supabase.storage.from_(bucket).get_public_url(path)
+@stage('upload')
+def upload_stream_to_supabase(
+    bucket: str,
+    folder: str,
+    filename: str,
+    chunks,                # bytes 청크를 내보내는 iterable (예: ffmpeg stdout)
+    content_type: str = "application/octet-stream"
+) -> str:
+    """
+    청크 단위 데이터를 chunked 전송으로 Supabase Storage에 바로 업로드합니다.
+    전체 파일을 메모리나 디스크에 모으지 않으므로 최대 메모리 사용량이 청크 크기로 제한됩니다.
+    """
+    path = f"{folder}/{filename}"
+    sent = 0
+
+    def counted():
+        nonlocal sent
+        for chunk in chunks:
+            sent += len(chunk)
+            yield chunk
+
+    storage = get_storage()
+    storage.upload_stream(bucket, path, counted(), content_type)
+    record_bytes('out', sent)
+    return storage.public_url(bucket, path)
+
+
+def create_signed_upload_url(bucket: str, path: str) -> str:
+    """bucket/path에 클라이언트가 직접 업로드할 서명된 URL을 반환합니다."""
+    return get_storage().create_signed_upload(bucket, path)
+
+
+@stage('download')
+def download_from_supabase(bucket: str, path: str, file, max_bytes: int = None) -> int:
+    """
+    저장소의 객체를 file(쓰기 가능한 바이너리 파일)에 청크 단위로 내려받고 받은 바이트 수를 반환합니다.
+    객체가 없으면 StorageRequestError(status=400/404), max_bytes를 넘으면 StorageObjectTooLarge를 발생시킵니다.
+    """
+    received = get_storage().download(bucket, path, file, max_bytes)
+    record_bytes('in', received)
+    return received
+
+
+class AsyncFile:
+    """비동기 업로드할 디스크 파일. open()은 시도마다 처음부터 읽는 async 청크 iterable을 반환합니다."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.size = os.path.getsize(file_path)
+
+    async def _chunks(self):
+        # 파일 읽기는 블로킹이므로 청크마다 I/O 실행기에서 읽음
+        with open(self.file_path, "rb") as f:
+            while True:
+                chunk = await run_io(f.read, ASYNC_UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    def open(self):
+        return self._chunks()
+
+
+async def aupload_to_supabase(bucket: str, folder: str, filename: str, content: bytes,
+                              content_type: str = "application/octet-stream") -> str:
+    """upload_to_supabase()의 비동기 버전. 업로드 왕복 동안 스레드를 점유하지 않습니다."""
+    path = f"{folder}/{filename}"
+    storage = get_storage()
+    with stage('upload'):
+        await storage.aupload(bucket, path, bytes(content), content_type)
+    record_bytes('out', len(content))
+    return storage.public_url(bucket, path)
+
+
+async def aupload_file_to_supabase(bucket: str, folder: str, filename: str, file_path: str,
+                                   content_type: str = "application/octet-stream") -> str:
+    """upload_file_to_supabase()의 비동기 버전. 파일을 청크 단위로 읽어 chunked 전송합니다."""
+    path = f"{folder}/{filename}"
+    storage = get_storage()
+    with stage('upload'):
+        upload = AsyncFile(file_path)
+        await storage.aupload(bucket, path, upload, content_type)
+    record_bytes('out', upload.size)
+    return storage.public_url(bucket, path)
+
+
+async def aupload_stream_to_supabase(bucket: str, folder: str, filename: str, chunks,
+                                     content_type: str = "application/octet-stream") -> str:
+    """upload_stream_to_supabase()의 비동기 버전. chunks는 bytes 청크를 내보내는 async iterable입니다."""
+    path = f"{folder}/{filename}"
+    sent = 0
+
+    async def counted():
+        nonlocal sent
+        async for chunk in chunks:
+            sent += len(chunk)
+            yield chunk
+
+    storage = get_storage()
+    with stage('upload'):
+        await storage.aupload(bucket, path, counted(), content_type)
+    record_bytes('out', sent)
+    return storage.public_url(bucket, path)
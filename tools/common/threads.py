@@ -0,0 +1,65 @@
+# tools/common/threads.py
+
+import os
+from django.conf import settings
+from tools.common.governor import converter_limit, CONVERTER_HOST_WIDE
+
+
+def available_cpus() -> list:
+    """이 프로세스가 사용할 수 있는 CPU 번호 목록 (컨테이너/taskset의 affinity 반영)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def cpu_budget() -> int:
+    return max(1, getattr(settings, 'CPU_BUDGET', len(available_cpus())))
+
+
+def cores_per_worker() -> int:
+    """호스트의 워커 프로세스 하나에 배정된 코어 수."""
+    return max(1, cpu_budget() // max(1, getattr(settings, 'WORKER_PROCESSES', 1)))
+
+
+def converter_threads(name: str) -> int:
+    """
+    변환기 프로세스 하나가 사용할 스레드 수 (ffmpeg -threads 등).
+
+    호스트에서 동시에 실행될 수 있는 프로세스 수(슬롯 한도 × 워커 수, 호스트 전체 슬롯이면 슬롯 한도)로
+    CPU 예산을 나눠, 모든 슬롯이 동시에 사용 중이어도 코어 수를 넘지 않게 합니다.
+    """
+    concurrent = converter_limit(name)
+    if not CONVERTER_HOST_WIDE:
+        concurrent *= max(1, getattr(settings, 'WORKER_PROCESSES', 1))
+    return max(1, cpu_budget() // concurrent)
+
+
+def converter_cpus(slot) -> list:
+    """
+    CPU_PINNING이 켜져 있으면 슬롯 번호에 해당하는 CPU 묶음을 반환합니다 (없으면 None).
+    슬롯 번호가 호스트 전체에서 유일한 경우(CONVERTER_HOST_WIDE)에만 고정하며,
+    워커별 슬롯은 워커끼리 번호가 겹치므로 고정하지 않습니다.
+    """
+    if not getattr(settings, 'CPU_PINNING', False) or slot is None or not slot.host_wide:
+        return None
+    cpus = available_cpus()
+    per_slot = max(1, len(cpus) // slot.limit)
+    start = (slot.index * per_slot) % len(cpus)
+    return cpus[start:start + per_slot]
+
+
+def pool_size(requested: int) -> int:
+    """스레드 풀 크기를 워커에 배정된 코어 수 이하로 제한합니다."""
+    return max(1, min(requested, cores_per_worker()))
+
+
+def thread_budget() -> dict:
+    """현재 스레드 예산 설정을 반환합니다 (메트릭/디버깅용)."""
+    return {
+        'cpu_budget': cpu_budget(),
+        'worker_processes': getattr(settings, 'WORKER_PROCESSES', 1),
+        'cores_per_worker': cores_per_worker(),
+        'ffmpeg_threads': converter_threads('ffmpeg'),
+        'library_threads': int(os.environ.get('OMP_NUM_THREADS', 0)) or None,
+        'cpu_pinning': getattr(settings, 'CPU_PINNING', False),
+    }
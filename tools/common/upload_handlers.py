@@ -0,0 +1,184 @@
+# tools/common/upload_handlers.py
+
+import io
+import os
+import shutil
+import hashlib
+import time
+import tempfile
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile, InMemoryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from tools.common.metrics import STAGE_DURATION, current_endpoint
+
+# MIME 판별에 사용할 파일 앞부분 크기
+SNIFF_BYTES = 512
+
+# 확장자로 세분화하는 ZIP 기반 문서 형식
+_ZIP_DOCUMENT_TYPES = {
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+}
+
+# 확장자로 세분화하는 OLE(구 MS Office) 문서 형식
+_OLE_DOCUMENT_TYPES = {
+    '.doc': 'application/msword',
+    '.xls': 'application/vnd.ms-excel',
+    '.ppt': 'application/vnd.ms-powerpoint',
+}
+
+
+def sniff_content_type(head: bytes, filename: str = "") -> str:
+    """
+    파일 앞부분의 매직 바이트로 실제 MIME 타입을 판별합니다.
+    클라이언트가 보낸 Content-Type과 달리 내용 기반이므로 검증에 사용할 수 있습니다.
+    판별할 수 없으면 'application/octet-stream'을 반환합니다.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'image/gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+        return 'audio/wav'
+    if head.startswith(b'BM'):
+        return 'image/bmp'
+    if head[:4] in (b'II*\x00', b'MM\x00*'):
+        return 'image/tiff'
+    if head.startswith(b'\x00\x00\x01\x00'):
+        return 'image/x-icon'
+    if head.startswith(b'%PDF-'):
+        return 'application/pdf'
+    if head.startswith(b'PK\x03\x04'):
+        return _ZIP_DOCUMENT_TYPES.get(ext, 'application/zip')
+    if head.startswith(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'):
+        return _OLE_DOCUMENT_TYPES.get(ext, 'application/x-ole-storage')
+    if head.startswith(b'7z\xbc\xaf\x27\x1c'):
+        return 'application/x-7z-compressed'
+    if head.startswith(b'Rar!\x1a\x07'):
+        return 'application/vnd.rar'
+    if head.startswith(b'\x1f\x8b'):
+        return 'application/gzip'
+    if head.startswith(b'\x1a\x45\xdf\xa3'):
+        return 'video/x-matroska'
+    if head[4:8] == b'ftyp':
+        brand = head[8:12]
+        if brand == b'qt  ':
+            return 'video/quicktime'
+        if brand in (b'M4A ', b'M4B '):
+            return 'audio/mp4'
+        return 'video/mp4'
+    if head.startswith(b'ID3') or head[:2] in (b'\xff\xfb', b'\xff\xf3', b'\xff\xf2'):
+        return 'audio/mpeg'
+    return 'application/octet-stream'
+
+
+def choose_upload_dir(size_hint: int):
+    """
+    업로드 크기에 따라 저장 위치를 고릅니다.
+    UPLOAD_TMPFS_MAX_SIZE 이하이고 tmpfs에 여유 공간이 있으면 tmpfs(/dev/shm),
+    그 외에는 UPLOAD_SCRATCH_DIR(기본: 시스템 임시 디렉터리)를 사용합니다.
+    """
+    tmpfs_dir = getattr(settings, 'UPLOAD_TMPFS_DIR', None)
+    tmpfs_max = getattr(settings, 'UPLOAD_TMPFS_MAX_SIZE', 0)
+    if tmpfs_dir and size_hint <= tmpfs_max and os.path.isdir(tmpfs_dir) and os.access(tmpfs_dir, os.W_OK):
+        try:
+            if shutil.disk_usage(tmpfs_dir).free > size_hint * 2:
+                return tmpfs_dir
+        except OSError:
+            pass
+    return getattr(settings, 'UPLOAD_SCRATCH_DIR', None) or tempfile.gettempdir()
+
+
+class ScratchUploadedFile(UploadedFile):
+    """
+    스크래치 디렉터리에 기록된 업로드 파일입니다.
+    temporary_file_path()로 디스크 경로를 제공하여 ffmpeg/soffice/PyMuPDF가 복사 없이 열 수 있습니다.
+    파일을 닫으면 삭제됩니다.
+    """
+
+    def __init__(self, name, content_type, size, charset, directory, content_type_extra=None):
+        _, ext = os.path.splitext(name)
+        file = tempfile.NamedTemporaryFile(suffix=".upload" + ext, dir=directory)
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+
+    def temporary_file_path(self):
+        return self.file.name
+
+    def close(self):
+        try:
+            return self.file.close()
+        except FileNotFoundError:
+            # 다른 곳으로 옮겨진 경우
+            pass
+
+
+class ScratchFileUploadHandler(FileUploadHandler):
+    """
+    multipart 파트를 받는 즉시 기록하는 업로드 핸들러입니다.
+
+    - 요청 크기가 FILE_UPLOAD_MAX_MEMORY_SIZE 이하이면 메모리, 그보다 크면 스크래치 디렉터리
+      (UPLOAD_TMPFS_MAX_SIZE 이하는 tmpfs)에 바로 기록하여 전체 파일을 메모리에 올리지 않습니다.
+    - 바이트가 도착하는 대로 BLAKE2b 해시(content_hash)와 매직 바이트 기반 MIME(sniffed_content_type)을 계산합니다.
+    """
+    chunk_size = getattr(settings, 'UPLOAD_CHUNK_SIZE', 256 * 1024)
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        self.request_length = content_length or 0
+        self.parse_started = time.perf_counter()
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.blake2b(digest_size=32)
+        self.head = b""
+        self.in_memory = self.request_length <= settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        if self.in_memory:
+            self.file = io.BytesIO()
+        else:
+            self.file = ScratchUploadedFile(
+                self.file_name, self.content_type, 0, self.charset,
+                choose_upload_dir(self.request_length), self.content_type_extra
+            )
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file.write(raw_data)
+        self.hasher.update(raw_data)
+        if len(self.head) < SNIFF_BYTES:
+            self.head += raw_data[:SNIFF_BYTES - len(self.head)]
+        # 이후 핸들러로 전달하지 않음
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        if self.in_memory:
+            uploaded = InMemoryUploadedFile(
+                file=self.file,
+                field_name=self.field_name,
+                name=self.file_name,
+                content_type=self.content_type,
+                size=file_size,
+                charset=self.charset,
+                content_type_extra=self.content_type_extra
+            )
+        else:
+            uploaded = self.file
+            uploaded.size = file_size
+
+        uploaded.content_hash = self.hasher.hexdigest()
+        uploaded.sniffed_content_type = sniff_content_type(self.head, self.file_name)
+        return uploaded
+
+    def upload_complete(self):
+        # multipart 본문 수신/기록에 걸린 시간 (upload_parse 단계)
+        started = getattr(self, 'parse_started', None)
+        if started is not None:
+            STAGE_DURATION.observe(time.perf_counter() - started, endpoint=current_endpoint(), stage='upload_parse')
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file') and not self.in_memory:
+            self.file.close()
@@ -0,0 +1,179 @@
+# tools/common/zipstream.py
+
+import os
+import time
+import zipfile
+from django.http import StreamingHttpResponse
+from tools.common.aio import run_cpu
+from tools.common.metrics import current_endpoint, set_endpoint, reset_endpoint, record_bytes
+
+# 이미 압축된 형식은 다시 압축해도 거의 줄지 않으므로 STORED(무압축)로 저장
+STORED_EXTENSIONS = {
+    '.jpg', '.jpeg', '.png', '.webp', '.gif', '.pdf',
+    '.mp4', '.mov', '.mp3', '.m4a', '.zip', '.gz', '.7z', '.docx', '.xlsx', '.pptx',
+}
+
+# 디스크 파일을 읽어 ZIP에 기록하는 단위
+ZIP_CHUNK_SIZE = 256 * 1024
+
+
+class _Sink:
+    """
+    ZipFile이 기록한 바이트를 모아 두었다가 drain()으로 꺼내 가는 쓰기 전용 객체입니다.
+    tell()/seek()가 없으므로 ZipFile은 헤더를 되돌아가 고치지 않고 항목 뒤에 데이터 디스크립터를 붙입니다.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def unique_name(name: str, used: set) -> str:
+    """경로를 뺀 파일 이름을 반환하며, 이미 사용한 이름이면 "이름 (2).확장자"처럼 번호를 붙입니다."""
+    name = os.path.basename(name.replace('\\', '/')) or 'file'
+    stem, ext = os.path.splitext(name)
+    candidate, n = name, 1
+    while candidate in used:
+        n += 1
+        candidate = f"{stem} ({n}){ext}"
+    used.add(candidate)
+    return candidate
+
+
+class ZipStream:
+    """
+    항목을 추가할 때마다 그 항목의 ZIP 바이트를 바로 돌려주는 ZIP 작성기입니다.
+    보관 중인 데이터는 현재 항목과 중앙 디렉터리뿐이므로 아카이브 전체를 메모리에 모으지 않습니다.
+    compresslevel은 DEFLATE 항목의 압축 수준(0~9, None이면 zlib 기본값)입니다.
+    """
+
+    def __init__(self, compresslevel: int = None):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, 'w', allowZip64=True)
+        self._names = set()
+        self._compresslevel = compresslevel
+
+    def _entry(self, name: str, size: int) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(unique_name(name, self._names), date_time=time.localtime()[:6])
+        info.file_size = size  # 4GB를 넘을 항목이면 ZipFile이 ZIP64 헤더를 사용
+        info.external_attr = 0o644 << 16
+        if os.path.splitext(info.filename)[1].lower() in STORED_EXTENSIONS:
+            info.compress_type = zipfile.ZIP_STORED
+        else:
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info._compresslevel = self._compresslevel
+        return info
+
+    def add(self, name: str, content) -> bytes:
+        """메모리에 있는 결과(bytes, memoryview 등)를 항목으로 추가하고 생성된 ZIP 바이트를 반환합니다."""
+        content = memoryview(content)
+        with self._zip.open(self._entry(name, content.nbytes), 'w') as dest:
+            dest.write(content)
+        return self._sink.drain()
+
+    def add_chunks(self, name: str, size: int, chunks):
+        """bytes 청크 iterable(size 바이트)을 항목으로 추가하며, 생성된 ZIP 바이트를 청크마다 내보냅니다."""
+        with self._zip.open(self._entry(name, size), 'w') as dest:
+            for chunk in chunks:
+                dest.write(chunk)
+                yield self._sink.drain()
+        yield self._sink.drain()
+
+    def add_file(self, name: str, file_path: str):
+        """디스크 파일을 청크 단위로 읽어 항목으로 추가합니다 (add_chunks() 참고)."""
+        with open(file_path, 'rb') as src:
+            yield from self.add_chunks(name, os.path.getsize(file_path), iter(lambda: src.read(ZIP_CHUNK_SIZE), b""))
+
+    def close(self) -> bytes:
+        """중앙 디렉터리를 기록하고 마지막 ZIP 바이트를 반환합니다."""
+        self._zip.close()
+        return self._sink.drain()
+
+
+def wants_bundle(request) -> bool:
+    """bundle=zip이면 결과 URL 목록 대신 ZIP 스트림으로 응답합니다."""
+    return request.POST.get('bundle', '').lower() == 'zip'
+
+
+def stream_zip(entries):
+    """
+    (파일 이름, 내용) 쌍을 내보내는 iterable을 받아, 항목이 만들어질 때마다 ZIP 바이트를 내보냅니다.
+    내용은 bytes 계열이거나 디스크 파일 경로(str)입니다.
+    """
+    archive = ZipStream()
+    for name, content in entries:
+        if isinstance(content, str):
+            yield from archive.add_file(name, content)
+        else:
+            yield archive.add(name, content)
+    yield archive.close()
+
+
+async def astream_zip(entries):
+    """stream_zip()의 비동기 버전. entries는 async iterable이며 CRC/압축 계산은 CPU 실행기에서 수행합니다."""
+    archive = ZipStream()
+    async for name, content in entries:
+        if isinstance(content, str):
+            chunks = archive.add_file(name, content)
+            while True:
+                chunk = await run_cpu(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        else:
+            yield await run_cpu(archive.add, name, content)
+    yield archive.close()
+
+
+def _labelled(chunks, endpoint: str):
+    # 응답 본문은 뷰(와 미들웨어)가 끝난 뒤에 만들어지므로 메트릭 라벨을 다시 설정
+    token = set_endpoint(endpoint)
+    try:
+        for chunk in chunks:
+            if chunk:
+                record_bytes('out', len(chunk))
+                yield chunk
+    finally:
+        reset_endpoint(token)
+
+
+async def _alabelled(chunks, endpoint: str):
+    token = set_endpoint(endpoint)
+    try:
+        async for chunk in chunks:
+            if chunk:
+                record_bytes('out', len(chunk))
+                yield chunk
+    finally:
+        reset_endpoint(token)
+
+
+def _zip_response(streaming_content, filename: str) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(streaming_content, content_type='application/zip')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['X-Accel-Buffering'] = 'no'  # 프록시(nginx) 버퍼링 비활성화
+    return response
+
+
+def zip_response(entries, filename: str) -> StreamingHttpResponse:
+    """
+    entries의 결과를 ZIP으로 묶어 스트리밍하는 응답을 반환합니다.
+    첫 결과가 만들어지는 즉시 전송을 시작하므로 첫 바이트까지의 시간은 첫 파일 처리 시간과 같습니다.
+    """
+    return _zip_response(_labelled(stream_zip(entries), current_endpoint()), filename)
+
+
+def azip_response(entries, filename: str) -> StreamingHttpResponse:
+    """zip_response()의 비동기 버전 (ASGI에서 async iterable 본문으로 전송)"""
+    return _zip_response(_alabelled(astream_zip(entries), current_endpoint()), filename)
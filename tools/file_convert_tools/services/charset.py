@@ -0,0 +1,145 @@
+# tools/file_convert_tools/services/charset.py
+
+import os
+import uuid
+import codecs
+import mimetypes
+from django.conf import settings
+from tools.file_convert_tools.services.uploader import upload_converted_stream
+
+# 입력을 읽어 변환하는 단위 (메모리 사용량은 이 크기의 몇 배로 고정)
+CHARSET_CHUNK_SIZE = getattr(settings, 'CHARSET_CHUNK_SIZE', 1024 * 1024)
+
+# 인코딩 자동 감지에 사용하는 앞부분 크기
+CHARSET_DETECT_BYTES = getattr(settings, 'CHARSET_DETECT_BYTES', 64 * 1024)
+
+# 자동 감지 후보 (앞에서부터 시도, 앞부분을 오류 없이 디코딩하는 첫 인코딩을 선택)
+CHARSET_DETECT_CANDIDATES = getattr(settings, 'CHARSET_DETECT_CANDIDATES', ('utf-8', 'cp949'))
+
+# 디코딩/인코딩 오류 처리 방식
+# strict: 오류 위치와 함께 실패, replace: 대체 문자(� 또는 ?), ignore: 건너뜀
+ERROR_POLICIES = ('strict', 'replace', 'ignore')
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),  # UTF-16 LE BOM과 앞 2바이트가 같으므로 먼저 검사
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+_ASCII = bytes(range(128))
+
+
+class CharsetError(Exception):
+    """문자셋 변환을 할 수 없는 경우 (status: 응답할 HTTP 상태 코드)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def normalize_encoding(name: str) -> str:
+    """인코딩 이름을 Python 코덱 이름으로 정규화합니다 (예: "EUC-KR" → "euc_kr"). 모르는 이름이면 CharsetError."""
+    try:
+        return codecs.lookup(name.strip()).name
+    except (LookupError, AttributeError):
+        raise CharsetError(f"지원하지 않는 인코딩입니다: {name}")
+
+
+def detect_encoding(head: bytes) -> str:
+    """
+    파일 앞부분으로 인코딩을 추정합니다. BOM이 있으면 BOM을 따르고,
+    없으면 CHARSET_DETECT_CANDIDATES를 차례로 디코딩해 보아 오류가 없는 첫 인코딩을 반환합니다.
+    앞부분이 멀티바이트 문자 중간에서 잘렸을 수 있으므로 마지막 불완전한 바이트는 오류로 보지 않습니다.
+    """
+    for bom, name in _BOMS:
+        if head.startswith(bom):
+            return normalize_encoding(name)
+    for name in CHARSET_DETECT_CANDIDATES:
+        try:
+            codecs.getincrementaldecoder(name)().decode(head, final=False)
+            return normalize_encoding(name)
+        except UnicodeDecodeError:
+            continue
+    raise CharsetError("인코딩을 감지하지 못했습니다. source를 지정해 주세요.", status=422)
+
+
+def _ascii_compatible(name: str) -> bool:
+    # ASCII 바이트를 같은 바이트로 주고받는 인코딩 (UTF-16/32, BOM을 붙이는 utf-8-sig, ISO-2022 계열 등은 제외)
+    try:
+        return _ASCII.decode(name) == _ASCII.decode('ascii') and _ASCII.decode('ascii').encode(name) == _ASCII
+    except (UnicodeError, LookupError):
+        return False
+
+
+def transcode_chunks(chunks, source: str, target: str, errors: str = 'strict'):
+    """
+    bytes 청크 iterable을 source에서 target 인코딩으로 바꾸며 청크 단위로 내보냅니다.
+
+    증분 디코더가 청크 경계에서 잘린 멀티바이트 문자를 다음 청크까지 보관하므로 경계와 관계없이 정확합니다.
+    두 인코딩이 모두 ASCII 호환이면, 디코더에 남은 바이트가 없고 청크 전체가 ASCII인 경우 변환 없이 그대로 내보냅니다
+    (영문/숫자 위주의 CSV, 로그에서 대부분의 청크가 이 경로로 처리됨).
+    errors='strict'에서 변환할 수 없는 바이트/문자를 만나면 위치를 담은 CharsetError(422)를 발생시킵니다.
+    """
+    decoder = codecs.getincrementaldecoder(source)(errors)
+    encoder = codecs.getincrementalencoder(target)(errors)
+    passthrough = _ascii_compatible(source) and _ascii_compatible(target)
+    offset = 0
+
+    for chunk in chunks:
+        if passthrough and chunk.isascii() and not decoder.getstate()[0]:
+            yield chunk
+        else:
+            buffered = len(decoder.getstate()[0])  # 이전 청크에서 넘어온 바이트
+            try:
+                text = decoder.decode(chunk)
+            except UnicodeDecodeError as e:
+                raise CharsetError(f"{offset - buffered + e.start}바이트 위치를 {source}(으)로 읽을 수 없습니다.", status=422)
+            try:
+                data = encoder.encode(text)
+            except UnicodeEncodeError as e:
+                raise CharsetError(f"문자 {e.object[e.start:e.end]!r}를 {target}(으)로 표현할 수 없습니다.", status=422)
+            if data:
+                yield data
+        offset += len(chunk)
+
+    try:
+        tail = encoder.encode(decoder.decode(b"", final=True), final=True)
+    except UnicodeDecodeError:
+        raise CharsetError(f"파일 끝의 멀티바이트 문자가 잘려 있습니다 ({source}).", status=422)
+    if tail:
+        yield tail
+
+
+def convert_charset(uploaded_file, target: str, source: str = None, errors: str = 'strict') -> dict:
+    """
+    업로드된 텍스트 파일의 문자셋을 바꿔 'converted-files' 버킷에 스트리밍 업로드합니다.
+    source가 없으면 앞부분(CHARSET_DETECT_BYTES)으로 감지합니다. 입력 크기와 관계없이 메모리 사용량은 일정합니다.
+    """
+    if errors not in ERROR_POLICIES:
+        raise CharsetError(f"errors는 {', '.join(ERROR_POLICIES)} 중 하나여야 합니다.")
+    target = normalize_encoding(target)
+    detected = not source
+    if detected:
+        head = next(iter(uploaded_file.chunks(CHARSET_DETECT_BYTES)), b"")
+        source = detect_encoding(head)
+    else:
+        source = normalize_encoding(source)
+
+    stem, ext = os.path.splitext(os.path.basename(uploaded_file.name))
+    filename = f"{stem}_{uuid.uuid4().hex[:8]}{ext}"
+    content_type = mimetypes.guess_type(uploaded_file.name)[0] or 'text/plain'
+
+    public_url = upload_converted_stream(
+        folder="charset",
+        filename=filename,
+        chunks=transcode_chunks(uploaded_file.chunks(CHARSET_CHUNK_SIZE), source, target, errors),
+        content_type=f"{content_type}; charset={target.replace('_', '-')}"
+    )
+    return {
+        'converted_url': public_url,
+        'source_encoding': source,
+        'target_encoding': target,
+        'detected': detected,
+    }
@@ -0,0 +1,155 @@
+# tools/file_convert_tools/services/ffmpeg_runner.py
+
+import re
+import time
+import threading
+import subprocess
+from tools.common.process import run_process, pin_process, ProcessWatcher, ProcessCancelled, CANCEL_POLL_INTERVAL
+
+# ffmpeg 입출력 청크 크기 (64KB)
+CHUNK_SIZE = 64 * 1024
+
+# ffmpeg -progress 출력 줄 (예: "out_time_us=1234567", "progress=continue")
+_PROGRESS_LINE = re.compile(r'^([a-z0-9_]+)=(\S*)$')
+
+
+class FfmpegProgressParser:
+    """
+    ffmpeg -progress 출력(key=value 줄)을 해석하여 ProgressReporter에 전달합니다.
+    out_time을 프로브한 전체 길이(duration)와 비교해 퍼센트를 계산합니다.
+    """
+
+    def __init__(self, reporter, duration: float = 0):
+        self.reporter = reporter
+        self.duration = duration or 0
+        self._values = {}
+
+    def feed(self, line: str) -> bool:
+        """진행률 줄이면 처리하고 True, 아니면(오류 메시지 등) False를 반환합니다."""
+        match = _PROGRESS_LINE.match(line)
+        if not match:
+            return False
+
+        key, value = match.groups()
+        self._values[key] = value
+        if key == 'progress':
+            self._emit()
+        return True
+
+    def _emit(self):
+        try:
+            out_time = int(self._values.get('out_time_us', 0)) / 1_000_000
+        except ValueError:
+            out_time = 0.0
+        try:
+            total_size = int(self._values.get('total_size', 0))
+        except ValueError:
+            total_size = 0
+
+        percent = out_time / self.duration * 100 if self.duration else None
+        self.reporter.update(
+            'converting',
+            percent=percent,
+            out_time=round(out_time, 2),
+            total_size=total_size,
+            speed=self._values.get('speed')
+        )
+
+
+def with_progress(command: list) -> list:
+    """ffmpeg 명령에 진행률 출력 옵션(-progress pipe:2)을 추가합니다."""
+    return command[:1] + ['-progress', 'pipe:2', '-nostats'] + command[1:]
+
+
+def run_ffmpeg(command: list, cancel_check=None, progress=None, duration: float = 0, timeout: float = None,
+               cpus=None):
+    """
+    ffmpeg를 실행합니다. progress(ProgressReporter)가 주어지면 -progress 출력을
+    stderr 읽기 스레드에서 파싱하므로 변환 자체는 막히지 않습니다.
+    timeout(초)을 넘기면 프로세스를 종료하고 subprocess.TimeoutExpired를 발생시킵니다.
+    """
+    if progress is None or progress.key is None:
+        return run_process(command, cancel_check=cancel_check, timeout=timeout, cpus=cpus)
+
+    parser = FfmpegProgressParser(progress, duration)
+    return run_process(with_progress(command), cancel_check=cancel_check, on_stderr_line=parser.feed,
+                       timeout=timeout, cpus=cpus)
+
+
+def iter_ffmpeg_stdout(command: list, chunk_size: int = CHUNK_SIZE, progress=None, duration: float = 0,
+                       timeout: float = None, cpus=None, cancel_check=None):
+    """
+    ffmpeg를 실행하고 stdout(pipe:1) 출력을 청크 단위로 내보냅니다.
+
+    stderr는 별도 스레드에서 읽어 파이프 버퍼가 가득 차 프로세스가 멈추지 않도록 하며,
+    progress가 주어지면 같은 스레드에서 -progress 출력을 파싱합니다.
+    timeout(초)을 넘기면 프로세스를 종료하고 subprocess.TimeoutExpired를 발생시킵니다.
+    cancel_check는 청크 사이에서 CANCEL_POLL_INTERVAL 간격으로 확인하며, run_process()와 같이
+    True를 반환하면 프로세스를 종료하고 ProcessCancelled를, 예외를 발생시키면 종료 후 그 예외를 전달합니다.
+    정상 종료 코드가 아니면 subprocess.CalledProcessError를 발생시킵니다.
+    """
+    parser = None
+    if progress is not None and progress.key is not None:
+        parser = FfmpegProgressParser(progress, duration)
+        command = with_progress(command)
+
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True
+    )
+    pin_process(process, cpus)
+    watcher = ProcessWatcher(process, command)
+    stderr_chunks = []
+
+    def drain():
+        for raw in process.stderr:
+            if parser and parser.feed(raw.decode("utf-8", errors="ignore").rstrip()):
+                continue
+            stderr_chunks.append(raw)
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+
+    # 실행 시간 제한: 시간이 지나면 별도 타이머 스레드에서 프로세스를 종료
+    timed_out = threading.Event()
+    watchdog = None
+    if timeout:
+        def expire():
+            if process.returncode is None:
+                timed_out.set()
+                watcher.kill()
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+
+    finished = False
+    next_check = time.monotonic() + CANCEL_POLL_INTERVAL
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            if cancel_check and time.monotonic() >= next_check:
+                if cancel_check():
+                    raise ProcessCancelled(f"프로세스 취소됨: {command[0]}")
+                next_check = time.monotonic() + CANCEL_POLL_INTERVAL
+            yield chunk
+        finished = True
+    finally:
+        # 소비 측이 중간에 중단한 경우 프로세스를 정리
+        if watchdog:
+            watchdog.cancel()
+        if not finished:
+            watcher.kill()
+        process.stdout.close()
+        watcher.wait()
+        returncode = process.returncode
+        reader.join()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, stderr=b"".join(stderr_chunks))
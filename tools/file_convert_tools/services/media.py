@@ -0,0 +1,383 @@
+# tools/file_convert_tools/services/media.py
+
+import os
+import json
+import math
+import uuid
+import subprocess
+from contextlib import aclosing
+from django.conf import settings
+from tools.common.scratch import scratch_workspace
+from tools.common.governor import converter_slot, converter_timeout
+from tools.common.threads import converter_threads, converter_cpus, cores_per_worker
+from tools.common.metrics import stage
+from tools.common.aio import run_io, arun_process, aiter_process_stdout, aconverter_slot
+from tools.file_convert_tools.services.uploader import (
+    upload_converted_file, upload_converted_stream, aupload_converted_file, aupload_converted_stream
+)
+from tools.common.progress import ProgressReporter
+from tools.file_convert_tools.services.ffmpeg_runner import iter_ffmpeg_stdout, run_ffmpeg
+from tools.file_convert_tools.services.segmented import probe_keyframes, choose_split_points, transcode_segmented
+
+# MP4 컨테이너에 재인코딩 없이 그대로 담을 수 있는 코덱 목록
+MP4_VIDEO_CODECS = {'h264', 'hevc', 'mpeg4', 'av1'}
+MP4_AUDIO_CODECS = {'aac', 'mp3', 'alac', 'ac3', 'eac3'}
+
+# 오디오 추출 시 허용하는 비트레이트
+AUDIO_BITRATES = ('96k', '128k', '160k', '192k', '256k', '320k')
+
+
+def probe_command(path: str) -> list:
+    """ffprobe로 컨테이너/스트림 정보를 JSON으로 출력하는 명령"""
+    return [
+        "ffprobe", "-v", "error",
+        "-print_format", "json",
+        "-show_format", "-show_streams",
+        path
+    ]
+
+
+@stage('probe')
+def probe_media(path: str) -> dict:
+    """
+    ffprobe로 미디어 파일의 컨테이너/스트림 정보를 조회합니다.
+
+    반환 예:
+        {'duration': 12.5, 'video_codec': 'h264', 'audio_codec': 'aac', 'streams': [...]}
+    """
+    result = subprocess.run(probe_command(path), check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            timeout=converter_timeout('ffprobe'))
+    return parse_probe(result.stdout)
+
+
+async def aprobe_media(path: str) -> dict:
+    """probe_media()의 비동기 버전"""
+    with stage('probe'):
+        result = await arun_process(probe_command(path), timeout=converter_timeout('ffprobe'))
+    return parse_probe(result.stdout)
+
+
+def parse_probe(output: bytes) -> dict:
+    """ffprobe JSON 출력에서 길이와 대표 비디오/오디오 코덱을 추출합니다."""
+    data = json.loads(output or b"{}")
+
+    streams = data.get("streams", [])
+    video = next(
+        (s for s in streams
+         if s.get("codec_type") == "video" and not s.get("disposition", {}).get("attached_pic")),
+        None
+    )
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+    try:
+        duration = float(data.get("format", {}).get("duration", 0))
+    except (TypeError, ValueError):
+        duration = 0.0
+
+    return {
+        'duration': duration,
+        'video_codec': video.get("codec_name") if video else None,
+        'audio_codec': audio.get("codec_name") if audio else None,
+        'streams': streams,
+    }
+
+
+def build_mp4_command(input_path: str, output_path: str, info: dict, threads: int = None) -> tuple:
+    """
+    프로브 결과를 바탕으로 MOV → MP4 변환 명령을 구성합니다.
+
+    MP4 호환 코덱은 스트림 복사(-c copy)로 컨테이너만 바꾸고,
+    호환되지 않는 스트림만 재인코딩합니다. threads가 주어지면 인코더 스레드 수를 제한합니다.
+    비디오 스트림이 없으면(오디오만 있거나 커버 이미지뿐인 파일) ValueError를 발생시킵니다.
+    반환값: (ffmpeg 명령 리스트, 'remux' | 'partial' | 'transcode')
+    """
+    video_codec = info.get('video_codec')
+    audio_codec = info.get('audio_codec')
+    if not video_codec:
+        raise ValueError("비디오 스트림이 없습니다.")
+
+    command = ['ffmpeg', '-y', '-i', input_path, '-map', '0:v:0', '-map', '0:a:0?']
+    copied, encoded = 0, 0
+
+    # 비디오 스트림
+    if video_codec in MP4_VIDEO_CODECS:
+        command += ['-c:v', 'copy']
+        if video_codec == 'hevc':
+            command += ['-tag:v', 'hvc1']  # Apple 기기 재생 호환
+        copied += 1
+    else:
+        command += ['-c:v', 'libx264', '-preset', 'fast', '-crf', '23', '-pix_fmt', 'yuv420p']
+        encoded += 1
+
+    # 오디오 스트림 (없으면 생략)
+    if audio_codec:
+        if audio_codec in MP4_AUDIO_CODECS:
+            command += ['-c:a', 'copy']
+            copied += 1
+        else:
+            command += ['-c:a', 'aac', '-b:a', '192k']
+            encoded += 1
+
+    if threads:
+        command += ['-threads', str(threads)]
+
+    # moov atom을 앞으로 옮겨 점진적 재생(progressive playback) 지원
+    command += ['-movflags', '+faststart', output_path]
+
+    if not encoded:
+        mode = 'remux'
+    elif copied:
+        mode = 'partial'
+    else:
+        mode = 'transcode'
+    return command, mode
+
+
+def should_segment(info: dict) -> bool:
+    """
+    세그먼트 병렬 인코딩 대상인지 판단합니다.
+    비디오 재인코딩이 필요하고, 길이가 SEGMENTED_TRANSCODE_MIN_DURATION 이상이며 워커가 2개 이상일 때만 사용합니다.
+    """
+    return (
+        info.get('video_codec') not in MP4_VIDEO_CODECS
+        and info.get('duration', 0) >= settings.SEGMENTED_TRANSCODE_MIN_DURATION
+        and settings.SEGMENTED_TRANSCODE_WORKERS > 1
+    )
+
+
+def convert_mov_file(input_path: str, cancel_check=None, progress: ProgressReporter = None) -> dict:
+    """
+    디스크에 있는 MOV 파일을 MP4로 변환(또는 remux)하여 업로드합니다.
+    progress가 주어지면 probing → converting(%) → uploading 단계를 기록합니다.
+    mode: remux(스트림 복사) / partial(일부 스트림만 인코딩) / transcode / segmented(병렬 세그먼트 인코딩)
+    반환 예: {'url': 'https://...', 'mode': 'remux'}
+    """
+    progress = progress or ProgressReporter(None)
+    # 출력 + (세그먼트 모드의) 분할/인코딩 중간 파일을 위해 입력 크기의 3배를 예약
+    with scratch_workspace(size_hint=os.path.getsize(input_path) * 3, prefix="mov") as workspace:
+        output_path = workspace.file_path("output.mp4")
+
+        # 코덱을 확인하여 스트림 복사(remux) 가능 여부 판단
+        progress.update('probing')
+        info = probe_media(input_path)
+        command, mode = build_mp4_command(input_path, output_path, info, threads=converter_threads('ffmpeg'))
+
+        # 긴 영상은 키프레임 경계로 나눠 여러 프로세스에서 동시에 인코딩
+        split_points = []
+        if should_segment(info):
+            split_points = choose_split_points(probe_keyframes(input_path), info['duration'])
+
+        # ffmpeg 동시 실행 한도 안에서만 인코딩 (업로드는 슬롯 밖에서 수행), 기록 중에도 작업 스크래치 한도를 적용
+        cancel_check = workspace.guard(cancel_check)
+        with converter_slot('ffmpeg') as slot, stage('convert'):
+            cpus = converter_cpus(slot)
+            if split_points:
+                mode = 'segmented'
+                progress.update('converting', percent=0, mode=mode)
+                audio_args = (['-c:a', 'copy'] if info.get('audio_codec') in MP4_AUDIO_CODECS
+                              else ['-c:a', 'aac', '-b:a', '192k'])
+                transcode_segmented(
+                    input_path, output_path, info,
+                    workers=settings.SEGMENTED_TRANSCODE_WORKERS,
+                    audio_args=audio_args,
+                    split_points=split_points,
+                    cancel_check=cancel_check,
+                    progress=progress,
+                    workdir=workspace.mkdir("segments"),
+                    timeout=converter_timeout('ffmpeg'),
+                    # 세그먼트 모드는 긴 영상에만 사용하므로 워커에 배정된 코어(고정 시 슬롯의 CPU 묶음)를 나눠 씀
+                    threads=len(cpus) if cpus else cores_per_worker(),
+                    cpus=cpus
+                )
+            else:
+                progress.update('converting', percent=0, mode=mode)
+                run_ffmpeg(command, cancel_check=cancel_check, progress=progress, duration=info['duration'],
+                           timeout=converter_timeout('ffmpeg'), cpus=cpus)
+
+        workspace.check_quota()
+        progress.update('uploading')
+        url = upload_converted_file(
+            folder='mov-to-mp4',
+            filename=f"{uuid.uuid4()}.mp4",
+            file_path=output_path,
+            content_type="video/mp4"
+        )
+    return {'url': url, 'mode': mode}
+
+
+def parse_timecode(value) -> float:
+    """
+    '90', '90.5', '01:30', '00:01:30.5' 형식의 시간을 초 단위로 변환합니다.
+    형식이 잘못되었거나 음수·무한대·NaN이거나, 분/초 자리가 60 이상이면 ValueError를 발생시킵니다.
+    """
+    parts = str(value).strip().split(':')
+    if not 1 <= len(parts) <= 3:
+        raise ValueError(f"잘못된 시간 형식입니다: {value}")
+    seconds = 0.0
+    for index, part in enumerate(parts):
+        number = float(part)
+        # 맨 앞 자리만 60 이상을 허용 ('90' 초, '90:00' 분)
+        if not math.isfinite(number) or number < 0 or (index > 0 and number >= 60):
+            raise ValueError(f"잘못된 시간 형식입니다: {value}")
+        seconds = seconds * 60 + number
+    if not math.isfinite(seconds):
+        raise ValueError(f"잘못된 시간 형식입니다: {value}")
+    return seconds
+
+
+def build_audio_command(input_path: str, info: dict, output_format: str = 'mp3', bitrate_mode: str = 'cbr',
+                        bitrate: str = '192k', vbr_quality: int = 2, start: float = None,
+                        duration: float = None) -> tuple:
+    """
+    오디오 추출 명령을 구성합니다 (출력 경로/파이프 인자는 호출하는 쪽에서 추가).
+    반환값: (ffmpeg 명령 리스트, 'copy' | 'encode', content_type, 추출 구간 길이(초))
+    """
+    if not info['audio_codec']:
+        raise ValueError("오디오 스트림이 없습니다.")
+
+    command = ["ffmpeg", "-nostdin", "-loglevel", "error", "-threads", str(converter_threads('ffmpeg'))]
+    if start:
+        command += ["-ss", f"{start:.3f}"]
+    if duration:
+        command += ["-t", f"{duration:.3f}"]
+    command += ["-i", input_path, "-map", "0:a:0", "-vn"]  # 오디오 스트림만 추출
+
+    clip_length = duration or max(info['duration'] - (start or 0), 0)
+
+    if output_format == 'm4a':
+        if info['audio_codec'] == 'aac':
+            command += ["-c:a", "copy"]
+            mode = 'copy'
+        else:
+            command += ["-c:a", "aac", "-b:a", bitrate]
+            mode = 'encode'
+        command += ["-movflags", "+faststart"]
+        content_type = "audio/mp4"
+    else:
+        command += ["-c:a", "libmp3lame"]
+        command += ["-q:a", str(vbr_quality)] if bitrate_mode == 'vbr' else ["-b:a", bitrate]
+        mode = 'encode'
+        content_type = "audio/mpeg"
+
+    return command, mode, content_type, clip_length
+
+
+def extract_audio(input_path: str, base_name: str, output_format: str = 'mp3', bitrate_mode: str = 'cbr',
+                  bitrate: str = '192k', vbr_quality: int = 2, start: float = None, duration: float = None,
+                  cancel_check=None, progress: ProgressReporter = None) -> dict:
+    """
+    동영상에서 오디오를 추출하여 업로드합니다.
+
+    - output_format='m4a': 원본이 AAC면 재인코딩 없이 스트림 복사(-c:a copy), 아니면 AAC로 인코딩
+    - output_format='mp3': CBR(-b:a bitrate) 또는 VBR(-q:a vbr_quality)로 인코딩
+    - start/duration(초)은 -i 앞에 두어 필요한 구간만 읽고 처리합니다.
+    CBR MP3는 ffmpeg stdout을 그대로 업로드 스트림으로 전달하고, VBR MP3(Xing 헤더 기록)와
+    M4A(faststart)는 탐색 가능한 임시 파일로 받은 뒤 경로 그대로 업로드합니다.
+    반환 예: {'url': 'https://...', 'format': 'm4a', 'mode': 'copy'}
+    """
+    progress = progress or ProgressReporter(None)
+    progress.update('probing')
+    info = probe_media(input_path)
+    command, mode, content_type, clip_length = build_audio_command(
+        input_path, info, output_format, bitrate_mode, bitrate, vbr_quality, start, duration
+    )
+    filename = f"{base_name}.{output_format}"
+
+    progress.update('converting', percent=0, mode=mode)
+
+    if output_format == 'mp3' and bitrate_mode != 'vbr':
+        # 인코딩과 업로드가 동시에 진행되므로 업로드가 끝날 때까지 ffmpeg 슬롯을 유지
+        with converter_slot('ffmpeg') as slot, stage('convert'):
+            url = upload_converted_stream(
+                folder="audio",
+                filename=filename,
+                chunks=iter_ffmpeg_stdout(command + ["-f", "mp3", "pipe:1"], progress=progress, duration=clip_length,
+                                          timeout=converter_timeout('ffmpeg'), cpus=converter_cpus(slot),
+                                          cancel_check=cancel_check),
+                content_type=content_type
+            )
+    else:
+        # 최대 비트레이트(320kbps) 기준 출력 크기를 예약 (짧은 클립은 tmpfs에 배치됨)
+        with scratch_workspace(size_hint=int(clip_length * 320_000 / 8), prefix="audio") as workspace:
+            output_path = workspace.file_path(filename)
+            with converter_slot('ffmpeg') as slot, stage('convert'):
+                run_ffmpeg(command + ["-y", output_path], cancel_check=workspace.guard(cancel_check), progress=progress,
+                           duration=clip_length, timeout=converter_timeout('ffmpeg'), cpus=converter_cpus(slot))
+            progress.update('uploading')
+            url = upload_converted_file(
+                folder="audio",
+                filename=filename,
+                file_path=output_path,
+                content_type=content_type
+            )
+
+    return {'url': url, 'format': output_format, 'mode': mode}
+
+
+async def aconvert_mov_file(input_path: str) -> dict:
+    """
+    convert_mov_file()의 비동기 버전. ffmpeg는 asyncio 서브프로세스로 실행하고 결과는 비동기 HTTP로 업로드합니다.
+    세그먼트 병렬 인코딩 대상(긴 영상 재인코딩)은 여러 프로세스를 관리하는 동기 구현을 I/O 실행기에서 그대로 사용합니다.
+    """
+    info = await aprobe_media(input_path)
+    if should_segment(info):
+        return await run_io(convert_mov_file, input_path)
+
+    with scratch_workspace(size_hint=os.path.getsize(input_path) * 2, prefix="mov") as workspace:
+        output_path = workspace.file_path("output.mp4")
+        command, mode = build_mp4_command(input_path, output_path, info, threads=converter_threads('ffmpeg'))
+        # 진행률을 읽지 않으므로 통계 출력을 꺼 stderr가 쌓이지 않게 함
+        command[1:1] = ["-nostdin", "-nostats", "-loglevel", "error"]
+
+        async with aconverter_slot('ffmpeg') as slot:
+            with stage('convert'):
+                await arun_process(command, timeout=converter_timeout('ffmpeg'), cpus=converter_cpus(slot),
+                                   cancel_check=workspace.guard())
+
+        workspace.check_quota()
+        url = await aupload_converted_file(
+            folder='mov-to-mp4',
+            filename=f"{uuid.uuid4()}.mp4",
+            file_path=output_path,
+            content_type="video/mp4"
+        )
+    return {'url': url, 'mode': mode}
+
+
+async def aextract_audio(input_path: str, base_name: str, output_format: str = 'mp3', bitrate_mode: str = 'cbr',
+                         bitrate: str = '192k', vbr_quality: int = 2, start: float = None,
+                         duration: float = None) -> dict:
+    """extract_audio()의 비동기 버전. CBR MP3는 ffmpeg stdout을 비동기 업로드 스트림으로 바로 전달합니다."""
+    info = await aprobe_media(input_path)
+    command, mode, content_type, clip_length = build_audio_command(
+        input_path, info, output_format, bitrate_mode, bitrate, vbr_quality, start, duration
+    )
+    filename = f"{base_name}.{output_format}"
+
+    if output_format == 'mp3' and bitrate_mode != 'vbr':
+        # 인코딩과 업로드가 동시에 진행되므로 업로드가 끝날 때까지 ffmpeg 슬롯을 유지
+        async with aconverter_slot('ffmpeg') as slot:
+            stream = aiter_process_stdout(command + ["-f", "mp3", "pipe:1"],
+                                          timeout=converter_timeout('ffmpeg'), cpus=converter_cpus(slot))
+            async with aclosing(stream) as chunks:
+                url = await aupload_converted_stream(
+                    folder="audio",
+                    filename=filename,
+                    chunks=chunks,
+                    content_type=content_type
+                )
+    else:
+        with scratch_workspace(size_hint=int(clip_length * 320_000 / 8), prefix="audio") as workspace:
+            output_path = workspace.file_path(filename)
+            async with aconverter_slot('ffmpeg') as slot:
+                with stage('convert'):
+                    await arun_process(command + ["-y", output_path], timeout=converter_timeout('ffmpeg'),
+                                       cpus=converter_cpus(slot), cancel_check=workspace.guard())
+            url = await aupload_converted_file(
+                folder="audio",
+                filename=filename,
+                file_path=output_path,
+                content_type=content_type
+            )
+
+    return {'url': url, 'format': output_format, 'mode': mode}
@@ -0,0 +1,88 @@
+# tools/file_convert_tools/services/office.py
+
+import os
+import uuid
+from pathlib import Path
+from tools.common.process import run_process
+from tools.common.aio import arun_process, aconverter_slot
+from tools.common.progress import ProgressReporter
+from tools.common.scratch import scratch_workspace
+from tools.common.governor import converter_slot, converter_timeout
+from tools.common.threads import converter_cpus
+from tools.common.metrics import stage
+from tools.file_convert_tools.services.uploader import upload_converted_file, aupload_converted_file
+
+# 실행마다 새로 만드는 LibreOffice 사용자 프로필의 예상 크기 (스크래치 예약에 더함)
+SOFFICE_PROFILE_SIZE = 32 * 1024 * 1024
+
+
+def soffice_command(input_path: str, output_dir: str) -> list:
+    """
+    LibreOffice로 문서를 output_dir 아래의 같은 이름 PDF로 변환하는 명령.
+    사용자 프로필은 output_dir/lo-profile에 따로 만듭니다. 기본 프로필(~/.config/libreoffice)을 함께 쓰면
+    동시에 실행된 soffice가 먼저 뜬 프로세스에 변환을 넘기고 바로 끝나거나 프로필 잠금으로 실패합니다.
+    """
+    return [
+        "soffice",
+        f"-env:UserInstallation={Path(output_dir, 'lo-profile').as_uri()}",
+        "--headless",
+        "--convert-to", "pdf",
+        "--outdir", output_dir,
+        input_path
+    ]
+
+
+def converted_pdf_path(input_path: str, output_dir: str) -> str:
+    """soffice가 output_dir에 만든 PDF 파일 경로"""
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, base_name + ".pdf")
+
+
+def convert_office_to_pdf(input_path: str, folder: str, cancel_check=None,
+                          progress: ProgressReporter = None) -> str:
+    """
+    LibreOffice(soffice)로 문서(DOCX, PPT, XLS 등)를 PDF로 변환하고 Supabase에 업로드합니다.
+    변환 결과는 스크래치 작업 디렉터리에 만들어 성공/실패와 관계없이 삭제되며, 업로드된 public URL을 반환합니다.
+    LibreOffice는 진행률을 제공하지 않으므로 converting → uploading 단계만 기록합니다.
+    """
+    progress = progress or ProgressReporter(None)
+    # PDF 결과는 보통 원본과 비슷하거나 작으므로 입력 크기의 2배 + 프로필 크기를 예약
+    with scratch_workspace(size_hint=os.path.getsize(input_path) * 2 + SOFFICE_PROFILE_SIZE, prefix="office") as workspace:
+        output_dir = workspace.path
+        # soffice 동시 실행 한도 안에서만 변환 (시간 제한을 넘기면 자식 프로세스까지 종료)
+        with converter_slot('soffice') as slot, stage('convert'):
+            progress.update('converting')
+            run_process(soffice_command(input_path, output_dir), cancel_check=workspace.guard(cancel_check),
+                        timeout=converter_timeout('soffice'), cpus=converter_cpus(slot))
+
+        # 변환된 파일 경로
+        converted_path = converted_pdf_path(input_path, output_dir)
+
+        # Supabase에 업로드
+        progress.update('uploading')
+        filename = f"{uuid.uuid4()}.pdf"
+        return upload_converted_file(
+            folder=folder,
+            filename=filename,
+            file_path=converted_path,
+            content_type="application/pdf"
+        )
+
+
+async def aconvert_office_to_pdf(input_path: str, folder: str) -> str:
+    """
+    convert_office_to_pdf()의 비동기 버전.
+    soffice는 asyncio 서브프로세스로 실행하며, 요청이 취소되면 soffice 프로세스 그룹도 함께 종료됩니다.
+    """
+    with scratch_workspace(size_hint=os.path.getsize(input_path) * 2 + SOFFICE_PROFILE_SIZE, prefix="office") as workspace:
+        async with aconverter_slot('soffice') as slot:
+            with stage('convert'):
+                await arun_process(soffice_command(input_path, workspace.path), timeout=converter_timeout('soffice'),
+                                   cpus=converter_cpus(slot), cancel_check=workspace.guard())
+
+        return await aupload_converted_file(
+            folder=folder,
+            filename=f"{uuid.uuid4()}.pdf",
+            file_path=converted_pdf_path(input_path, workspace.path),
+            content_type="application/pdf"
+        )
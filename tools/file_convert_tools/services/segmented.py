@@ -0,0 +1,141 @@
+# tools/file_convert_tools/services/segmented.py
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+from tools.common.process import run_process
+
+# 세그먼트 하나의 목표 길이 (초) - 실제 분할은 이보다 뒤의 키프레임에서 이루어짐
+SEGMENT_TARGET_SECONDS = 30
+
+# 세그먼트 인코딩 옵션 (단일 프로세스 변환과 동일한 품질)
+VIDEO_ENCODE_ARGS = ['-c:v', 'libx264', '-preset', 'fast', '-crf', '23', '-pix_fmt', 'yuv420p']
+
+
+def probe_keyframes(path: str, read_intervals: str = None) -> list:
+    """
+    첫 번째 비디오 스트림의 키프레임 시각(초) 목록을 반환합니다.
+    디코딩 없이 패킷 플래그만 읽으므로 긴 영상도 빠르게 조회됩니다.
+    read_intervals(예: "120%150")가 주어지면 해당 구간으로 탐색해 그 구간의 패킷만 읽습니다
+    (시작 지점 직전 키프레임부터 읽으므로 구간 앞의 키프레임 하나가 포함될 수 있음).
+    """
+    command = ["ffprobe", "-v", "error", "-select_streams", "v:0"]
+    if read_intervals:
+        command += ["-read_intervals", read_intervals]
+    result = run_process(command + [
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        path
+    ])
+
+    keyframes = []
+    for line in result.stdout.decode("utf-8", errors="ignore").splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags:
+            try:
+                keyframes.append(float(pts_time))
+            except ValueError:
+                continue
+    return sorted(keyframes)
+
+
+def choose_split_points(keyframes: list, duration: float, target: float = SEGMENT_TARGET_SECONDS) -> list:
+    """
+    GOP 경계(키프레임)에서 약 target초 간격으로 분할 지점을 고릅니다.
+    마지막 세그먼트가 너무 짧아지지 않도록 끝부분 target/2 이내의 지점은 제외합니다.
+    """
+    points = []
+    last = 0.0
+    for t in keyframes:
+        if t - last >= target and duration - t >= target / 2:
+            points.append(t)
+            last = t
+    return points
+
+
+def transcode_segmented(input_path: str, output_path: str, info: dict, workers: int, workdir: str,
+                        audio_args: list = None, split_points: list = None,
+                        cancel_check=None, progress=None,
+                        timeout: float = None, threads: int = None, cpus=None) -> int:
+    """
+    입력을 키프레임 경계에서 스트림 복사로 분할하고, 세그먼트들을 동시에 인코딩한 뒤
+    concat demuxer로 무손실 병합하여 faststart MP4를 만듭니다.
+
+    - 각 세그먼트 인코딩은 별도 ffmpeg 프로세스이며 동시에 최대 workers개만 실행됩니다.
+      하나가 실패하면 실행 중인 나머지 프로세스도 종료하고 첫 실패를 그대로 발생시킵니다.
+    - 오디오는 분할하지 않고 한 번만 처리(audio_args, 기본 AAC 192k)하여 마지막에 합칩니다.
+    - timeout(초)은 각 ffmpeg 프로세스의 최대 실행 시간입니다.
+    - threads는 전체 세그먼트 인코딩이 나눠 쓸 스레드 수(기본: 전체 코어 수), cpus는 고정할 CPU 목록입니다.
+    - 중간 파일은 workdir(스크래치 작업 공간 안의 디렉터리)에 만들며, 정리는 호출 측 담당입니다.
+    반환값: 인코딩한 세그먼트 수
+    """
+    if split_points is None:
+        split_points = choose_split_points(probe_keyframes(input_path), info.get('duration', 0))
+
+    # 세그먼트 ffmpeg마다 스레드 예산을 나눠 사용 (전체 예산을 넘지 않도록)
+    threads_per_worker = max(1, (threads or os.cpu_count() or 1) // max(1, workers))
+
+    # 1) 비디오만 키프레임 경계에서 스트림 복사로 분할
+    split_command = ['ffmpeg', '-y', '-i', input_path, '-map', '0:v:0', '-an', '-c', 'copy', '-f', 'segment']
+    if split_points:
+        split_command += ['-segment_times', ','.join(f"{t:.6f}" for t in split_points)]
+    split_command += ['-reset_timestamps', '1', os.path.join(workdir, 'src_%05d.mkv')]
+    run_process(split_command, cancel_check=cancel_check, timeout=timeout, cpus=cpus)
+
+    sources = sorted(f for f in os.listdir(workdir) if f.startswith('src_'))
+    encoded = [os.path.join(workdir, name.replace('src_', 'enc_')) for name in sources]
+
+    commands = [
+        ['ffmpeg', '-y', '-i', os.path.join(workdir, src)] + VIDEO_ENCODE_ARGS
+        + ['-threads', str(threads_per_worker), '-an', dst]
+        for src, dst in zip(sources, encoded)
+    ]
+
+    # 2) 오디오는 원본에서 한 번만 처리
+    audio_path = None
+    if info.get('audio_codec'):
+        audio_path = os.path.join(workdir, 'audio.mka')
+        commands.append(
+            ['ffmpeg', '-y', '-i', input_path, '-map', '0:a:0', '-vn']
+            + (audio_args or ['-c:a', 'aac', '-b:a', '192k'])
+            + [audio_path]
+        )
+
+    # 3) 세그먼트 인코딩을 제한된 수의 프로세스로 동시 실행
+    # 하나가 실패하면 failed를 설정해 실행 중인 형제 프로세스도 run_process의 취소 검사로 종료시킴
+    failed = threading.Event()
+
+    def segment_cancelled() -> bool:
+        return failed.is_set() or bool(cancel_check and cancel_check())
+
+    total = len(commands)
+    done_count = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="segment") as pool:
+        futures = [pool.submit(run_process, command, segment_cancelled, None, timeout, cpus) for command in commands]
+        pending = set(futures)
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_EXCEPTION)
+            for future in finished:
+                if future.exception():
+                    failed.set()
+                    for other in pending:
+                        other.cancel()
+                    raise future.exception()
+                done_count += 1
+                if progress is not None:
+                    progress.update('converting', percent=done_count / total * 100,
+                                    segments=f"{done_count}/{total}")
+
+    # 4) concat demuxer로 무손실 병합 + 오디오 합치기
+    list_path = os.path.join(workdir, 'concat.txt')
+    with open(list_path, 'w') as f:
+        for path in encoded:
+            f.write(f"file '{path}'\n")
+
+    concat_command = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', list_path]
+    if audio_path:
+        concat_command += ['-i', audio_path, '-map', '0:v:0', '-map', '1:a:0']
+    concat_command += ['-c', 'copy', '-movflags', '+faststart', output_path]
+    run_process(concat_command, cancel_check=cancel_check, timeout=timeout, cpus=cpus)
+
+    return len(encoded)
@@ -0,0 +1,223 @@
+# tools/file_convert_tools/services/trim.py
+
+import os
+import uuid
+from django.conf import settings
+from tools.common.scratch import scratch_workspace
+from tools.common.governor import converter_slot, converter_timeout
+from tools.common.threads import converter_threads, converter_cpus
+from tools.common.metrics import stage
+from tools.common.progress import ProgressReporter
+from tools.file_convert_tools.services.media import probe_media, MP4_VIDEO_CODECS, MP4_AUDIO_CODECS
+from tools.file_convert_tools.services.segmented import probe_keyframes
+from tools.file_convert_tools.services.ffmpeg_runner import run_ffmpeg
+from tools.file_convert_tools.services.uploader import upload_converted_file
+
+# 컷 지점 주변에서 키프레임을 찾는 범위 (초) - 원본 전체가 아니라 이 구간의 패킷만 읽음
+TRIM_KEYFRAME_WINDOW = getattr(settings, 'TRIM_KEYFRAME_WINDOW', 20)
+
+# 자르기 방식
+# fast: 시작점을 직전 키프레임으로 당겨 전체를 스트림 복사 (재인코딩 없음)
+# precise: 경계의 불완전한 GOP만 재인코딩하고 가운데는 스트림 복사
+TRIM_MODES = ('fast', 'precise')
+
+# 경계 구간 재인코딩 옵션 (H.264/HEVC 원본과 이어 붙일 수 있도록 같은 코덱으로 인코딩)
+# (인코딩 옵션, 가운데 복사 구간의 Annex B 변환 필터, 이어 붙인 MP4의 샘플 엔트리 태그)
+# 재인코딩한 경계와 원본 구간은 SPS/PPS가 다르므로, 파라미터 셋을 샘플 안(in-band)에서 읽도록 하는
+# avc3/hev1로 표시합니다. avc1/hvc1이면 디코더가 첫 파라미터 셋만 사용해 가운데 구간이 깨질 수 있습니다.
+BOUNDARY_ENCODERS = {
+    'h264': (['-c:v', 'libx264', '-preset', 'fast', '-crf', '18'], 'h264_mp4toannexb', 'avc3'),
+    'hevc': (['-c:v', 'libx265', '-preset', 'fast', '-crf', '20'], 'hevc_mp4toannexb', 'hev1'),
+}
+
+# 키프레임 시각을 같은 값으로 보는 오차 (초)
+_EPSILON = 0.001
+
+
+def _audio_args(info: dict) -> list:
+    return ['-c:a', 'copy'] if info.get('audio_codec') in MP4_AUDIO_CODECS else ['-c:a', 'aac', '-b:a', '192k']
+
+
+def _ts(seconds: float) -> str:
+    return f"{seconds:.6f}"
+
+
+def keyframes_between(path: str, start: float, end: float) -> list:
+    """start~end(초) 사이의 키프레임 시각 목록. 해당 구간만 탐색해 읽으므로 원본 길이와 관계없이 빠릅니다."""
+    keyframes = probe_keyframes(path, read_intervals=f"{_ts(max(start, 0))}%{_ts(end)}")
+    return [t for t in keyframes if start - _EPSILON <= t <= end + _EPSILON]
+
+
+def _pix_fmt(info: dict) -> str:
+    video = next((s for s in info.get('streams', []) if s.get('codec_type') == 'video'), {})
+    return video.get('pix_fmt') or 'yuv420p'
+
+
+def build_copy_command(input_path: str, output_path: str, info: dict, start: float, duration: float) -> list:
+    """start(키프레임)부터 duration초를 스트림 복사로 잘라 faststart MP4로 만드는 명령 (입력 탐색 -ss)"""
+    return [
+        'ffmpeg', '-y', '-ss', _ts(start), '-i', input_path, '-t', _ts(duration),
+        '-map', '0:v:0', '-map', '0:a:0?', '-c:v', 'copy', *_audio_args(info),
+        '-avoid_negative_ts', 'make_zero', '-movflags', '+faststart', output_path
+    ]
+
+
+def build_transcode_command(input_path: str, output_path: str, info: dict, start: float, duration: float,
+                            threads: int = None) -> list:
+    """구간 전체를 H.264로 재인코딩하는 명령 (MP4에 복사할 수 없는 코덱이거나 구간 안에 키프레임이 없을 때)"""
+    command = [
+        'ffmpeg', '-y', '-ss', _ts(start), '-i', input_path, '-t', _ts(duration),
+        '-map', '0:v:0', '-map', '0:a:0?',
+        '-c:v', 'libx264', '-preset', 'fast', '-crf', '23', '-pix_fmt', 'yuv420p', *_audio_args(info)
+    ]
+    if threads:
+        command += ['-threads', str(threads)]
+    return command + ['-movflags', '+faststart', output_path]
+
+
+def plan_precise(input_path: str, start: float, end: float) -> tuple:
+    """
+    precise 모드의 (첫 키프레임, 마지막 키프레임)을 고릅니다.
+    [start, 첫 키프레임)과 [마지막 키프레임, end)만 재인코딩하고 그 사이는 스트림 복사합니다.
+    구간 안에 쓸 수 있는 키프레임이 없으면 None을 반환합니다 (구간 전체 재인코딩).
+    """
+    head = keyframes_between(input_path, start, min(start + TRIM_KEYFRAME_WINDOW, end))
+    if not head:
+        return None
+    first = head[0]
+    tail = keyframes_between(input_path, max(end - TRIM_KEYFRAME_WINDOW, first), end)
+    last = max([t for t in tail if t < end - _EPSILON] or [first])
+    if last - first <= _EPSILON:
+        return None
+    return first, last
+
+
+def _precise_commands(input_path: str, workdir: str, info: dict, start: float, end: float,
+                      first: float, last: float, threads: int) -> tuple:
+    """
+    경계 재인코딩/가운데 복사/오디오 명령과 concat 목록 파일 경로를 만듭니다.
+    부분 파일은 SPS/PPS가 스트림 안에 들어가는 MPEG-TS(Annex B)로 만들어, 인코더 설정이 달라도 이어 붙일 수 있게 합니다.
+    """
+    encode_args, bsf, _ = BOUNDARY_ENCODERS[info['video_codec']]
+    encode_args = encode_args + ['-pix_fmt', _pix_fmt(info), '-threads', str(threads)]
+
+    parts, commands = [], []
+    if first - start > _EPSILON:
+        parts.append(os.path.join(workdir, 'head.ts'))
+        commands.append(['ffmpeg', '-y', '-ss', _ts(start), '-i', input_path, '-t', _ts(first - start),
+                         '-map', '0:v:0', '-an', *encode_args, '-f', 'mpegts', parts[-1]])
+
+    parts.append(os.path.join(workdir, 'middle.ts'))
+    commands.append(['ffmpeg', '-y', '-ss', _ts(first), '-i', input_path, '-t', _ts(last - first),
+                     '-map', '0:v:0', '-an', '-c:v', 'copy', '-bsf:v', bsf, '-f', 'mpegts', parts[-1]])
+
+    if end - last > _EPSILON:
+        parts.append(os.path.join(workdir, 'tail.ts'))
+        commands.append(['ffmpeg', '-y', '-ss', _ts(last), '-i', input_path, '-t', _ts(end - last),
+                         '-map', '0:v:0', '-an', *encode_args, '-f', 'mpegts', parts[-1]])
+
+    # 오디오 프레임은 짧으므로(AAC 약 21ms) 경계와 관계없이 구간 전체를 한 번에 처리
+    audio_path = None
+    if info.get('audio_codec'):
+        audio_path = os.path.join(workdir, 'audio.mka')
+        commands.append(['ffmpeg', '-y', '-ss', _ts(start), '-i', input_path, '-t', _ts(end - start),
+                         '-map', '0:a:0', '-vn', *_audio_args(info), audio_path])
+
+    list_path = os.path.join(workdir, 'concat.txt')
+    with open(list_path, 'w') as f:
+        for path in parts:
+            f.write(f"file '{path}'\n")
+    return commands, list_path, audio_path
+
+
+def trim_video(input_path: str, start: float, end: float = None, duration: float = None, mode: str = 'fast',
+               cancel_check=None, progress: ProgressReporter = None) -> dict:
+    """
+    동영상의 start~end(또는 start부터 duration초) 구간을 잘라 faststart MP4로 업로드합니다.
+    필요한 구간만 탐색해 읽으므로 처리 비용은 원본 길이가 아니라 잘라낸 구간 길이에 비례합니다.
+
+    - fast: 시작점을 직전 키프레임으로 당기고 전체를 스트림 복사 (실제 시작 시각을 start로 반환)
+    - precise: 요청한 시각에 정확히 자르며, 경계의 GOP만 재인코딩 (H.264/HEVC 원본)
+    MP4에 복사할 수 없는 코덱이거나 구간 안에 키프레임이 없으면 구간 전체를 재인코딩합니다 (mode='transcode').
+    반환 예: {'url': 'https://...', 'mode': 'copy', 'start': 12.0, 'duration': 30.0, 'reencoded_seconds': 0}
+    """
+    progress = progress or ProgressReporter(None)
+    progress.update('probing')
+    info = probe_media(input_path)
+    if not info.get('video_codec'):
+        raise ValueError("비디오 스트림이 없습니다.")
+
+    total = info.get('duration') or 0
+    if end is None:
+        end = start + duration if duration else total
+    if total:
+        end = min(end, total)
+    if start >= end:
+        raise ValueError("start는 end(또는 영상 길이)보다 작아야 합니다.")
+
+    threads = converter_threads('ffmpeg')
+    plan = None
+    if mode == 'precise' and info['video_codec'] in BOUNDARY_ENCODERS:
+        plan = plan_precise(input_path, start, end)
+    elif mode == 'fast' and info['video_codec'] in MP4_VIDEO_CODECS:
+        before = keyframes_between(input_path, max(start - TRIM_KEYFRAME_WINDOW, 0), start)
+        start = max(before) if before else start  # 못 찾으면 ffmpeg 입력 탐색이 직전 키프레임으로 맞춤
+
+    # 출력(구간 길이에 비례)과 precise 모드의 부분 파일을 위해 원본 중 구간 비율의 3배를 예약
+    ratio = (end - start) / total if total else 1
+    size_hint = int(os.path.getsize(input_path) * min(1, ratio) * 3)
+
+    with scratch_workspace(size_hint=size_hint, prefix="trim") as workspace:
+        output_path = workspace.file_path("output.mp4")
+        # 기록 중에도 작업 스크래치 한도를 적용
+        cancel_check = workspace.guard(cancel_check)
+        with converter_slot('ffmpeg') as slot, stage('convert'):
+            cpus = converter_cpus(slot)
+            timeout = converter_timeout('ffmpeg')
+            if plan:
+                result_mode = 'precise'
+                first, last = plan
+                reencoded = (first - start) + (end - last)
+                progress.update('converting', percent=0, mode=result_mode)
+                commands, list_path, audio_path = _precise_commands(
+                    input_path, workspace.mkdir("parts"), info, start, end, first, last, threads
+                )
+                for index, command in enumerate(commands):
+                    run_ffmpeg(command, cancel_check=cancel_check, timeout=timeout, cpus=cpus)
+                    progress.update('converting', percent=(index + 1) / (len(commands) + 1) * 100)
+
+                concat_command = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', list_path]
+                if audio_path:
+                    concat_command += ['-i', audio_path, '-map', '0:v:0', '-map', '1:a:0']
+                concat_command += ['-c', 'copy', '-tag:v', BOUNDARY_ENCODERS[info['video_codec']][2]]
+                concat_command += ['-movflags', '+faststart', output_path]
+                run_ffmpeg(concat_command, cancel_check=cancel_check, timeout=timeout, cpus=cpus)
+            elif mode == 'fast' and info['video_codec'] in MP4_VIDEO_CODECS:
+                result_mode, reencoded = 'copy', 0
+                progress.update('converting', percent=0, mode=result_mode)
+                run_ffmpeg(build_copy_command(input_path, output_path, info, start, end - start),
+                           cancel_check=cancel_check, progress=progress, duration=end - start,
+                           timeout=timeout, cpus=cpus)
+            else:
+                result_mode, reencoded = 'transcode', end - start
+                progress.update('converting', percent=0, mode=result_mode)
+                run_ffmpeg(build_transcode_command(input_path, output_path, info, start, end - start, threads),
+                           cancel_check=cancel_check, progress=progress, duration=end - start,
+                           timeout=timeout, cpus=cpus)
+
+        workspace.check_quota()
+        progress.update('uploading')
+        url = upload_converted_file(
+            folder='trim',
+            filename=f"{uuid.uuid4()}.mp4",
+            file_path=output_path,
+            content_type="video/mp4"
+        )
+
+    return {
+        'url': url,
+        'mode': result_mode,
+        'start': round(start, 3),
+        'duration': round(end - start, 3),
+        'reencoded_seconds': round(reencoded, 3),
+    }
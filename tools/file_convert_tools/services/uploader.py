@@ -1,6 +1,8 @@
 # tools/file_convert_tools/services/uploader.py
 
-from tools.common.storage import upload_to_supabase
+from tools.common.storage import (
+    upload_file_to_supabase, upload_stream_to_supabase, aupload_file_to_supabase, aupload_stream_to_supabase
+)
 
 def upload_converted_file(
         folder: str, 
@@ -11,11 +13,52 @@ def upload_converted_file(
     """
     변환된 파일을 Supabase의 'converted-files' 버킷에 업로드
     """
-    with open(file_path, "rb") as f:
-        return upload_to_supabase(
-            bucket="converted-files",  # ← Supabase의 파일 변환 전용 버킷
-            folder=folder,
-            filename=filename,
-            content=f.read(),
-            content_type=content_type
-        )
+    return upload_file_to_supabase(
+        bucket="converted-files",  # ← Supabase의 파일 변환 전용 버킷
+        folder=folder,
+        filename=filename,
+        file_path=file_path,
+        content_type=content_type
+    )
+
+
+def upload_converted_stream(
+        folder: str,
+        filename: str,
+        chunks,
+        content_type: str = "application/octet-stream"
+        ) -> str:
+    """
+    변환 결과 스트림(예: ffmpeg stdout)을 'converted-files' 버킷에 바로 업로드
+    """
+    return upload_stream_to_supabase(
+        bucket="converted-files",
+        folder=folder,
+        filename=filename,
+        chunks=chunks,
+        content_type=content_type
+    )
+
+
+async def aupload_converted_file(folder: str, filename: str, file_path: str,
+                                 content_type: str = "application/pdf") -> str:
+    """upload_converted_file()의 비동기 버전"""
+    return await aupload_file_to_supabase(
+        bucket="converted-files",
+        folder=folder,
+        filename=filename,
+        file_path=file_path,
+        content_type=content_type
+    )
+
+
+async def aupload_converted_stream(folder: str, filename: str, chunks,
+                                   content_type: str = "application/octet-stream") -> str:
+    """upload_converted_stream()의 비동기 버전 (chunks는 async iterable)"""
+    return await aupload_stream_to_supabase(
+        bucket="converted-files",
+        folder=folder,
+        filename=filename,
+        chunks=chunks,
+        content_type=content_type
+    )
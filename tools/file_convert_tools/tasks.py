@@ -0,0 +1,30 @@
+# tools/file_convert_tools/tasks.py
+"""
+비동기 작업 큐(tools.jobs)에서 실행되는 파일 변환 작업 함수들입니다.
+각 함수는 task(context, inputs, **params) 형태이며 뷰의 동기 응답과 같은 결과 dict를 반환합니다.
+"""
+
+from tools.file_convert_tools.services.office import convert_office_to_pdf
+from tools.file_convert_tools.services.media import convert_mov_file, extract_audio
+from tools.file_convert_tools.services.trim import trim_video
+
+
+def office_to_pdf(context, inputs, folder):
+    url = convert_office_to_pdf(
+        inputs[0]['path'], folder=folder, cancel_check=context.is_cancelled, progress=context.progress
+    )
+    return {'converted_url': url}
+
+
+def mov_to_mp4(context, inputs):
+    return convert_mov_file(inputs[0]['path'], cancel_check=context.is_cancelled, progress=context.progress)
+
+
+def mp4_to_mp3(context, inputs, base_name, options):
+    return extract_audio(
+        inputs[0]['path'], base_name, cancel_check=context.is_cancelled, progress=context.progress, **options
+    )
+
+
+def trim(context, inputs, options):
+    return trim_video(inputs[0]['path'], cancel_check=context.is_cancelled, progress=context.progress, **options)
@@ -1,14 +1,21 @@
 from django.urls import path
+from .views import async_views
 from .views.docx_to_pdf import convert_docx_to_pdf
 from .views.ppt_to_pdf import convert_ppt_to_pdf
 from .views.excel_to_pdf import convert_excel_to_pdf
 from .views.mp4_to_mp3 import convert_mp4_to_mp3
 from .views.mov_to_mp4 import convert_mov_to_mp4
+from .views.charset import convert_charset_view
+from .views.trim import trim_video_view
+from tools.common.aio import pick_view
 
+# ASYNC_VIEWS=true(ASGI 배포)면 같은 URL에 views/async_views.py의 비동기 뷰를 연결
 urlpatterns = [
-    path('docx-to-pdf/', convert_docx_to_pdf, name='convert-docx-to-pdf'),
-    path('ppt-to-pdf/', convert_ppt_to_pdf, name='convert-ppt-to-pdf'), 
-    path('excel-to-pdf/', convert_excel_to_pdf, name='convert-excel-to-pdf'), 
-    path('mp4-to-mp3/', convert_mp4_to_mp3, name='convert-mp4-to-mp3'),
-    path('mov-to-mp4/', convert_mov_to_mp4, name='convert-mov-to-mp4'),
+    path('docx-to-pdf/', pick_view(convert_docx_to_pdf, async_views.convert_docx_to_pdf), name='convert-docx-to-pdf'),
+    path('ppt-to-pdf/', pick_view(convert_ppt_to_pdf, async_views.convert_ppt_to_pdf), name='convert-ppt-to-pdf'),
+    path('excel-to-pdf/', pick_view(convert_excel_to_pdf, async_views.convert_excel_to_pdf), name='convert-excel-to-pdf'),
+    path('mp4-to-mp3/', pick_view(convert_mp4_to_mp3, async_views.convert_mp4_to_mp3), name='convert-mp4-to-mp3'),
+    path('mov-to-mp4/', pick_view(convert_mov_to_mp4, async_views.convert_mov_to_mp4), name='convert-mov-to-mp4'),
+    path('charset/', pick_view(convert_charset_view, async_views.convert_charset_view), name='convert-charset'),
+    path('trim/', pick_view(trim_video_view, async_views.trim_video_view), name='convert-trim'),
 ]
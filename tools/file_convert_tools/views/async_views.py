@@ -0,0 +1,204 @@
+# tools/file_convert_tools/views/async_views.py
+
+import os
+import uuid
+import subprocess
+from django.http import JsonResponse
+from tools.common.inputs import read_input_files
+from tools.common.aio import async_tool_view, run_io
+from tools.common.scratch import staged_upload_path, ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.common.singleflight import asingle_flight, flight_key, SingleFlightTimeout
+from tools.file_convert_tools.services.office import aconvert_office_to_pdf
+from tools.file_convert_tools.services.media import aconvert_mov_file, aextract_audio
+from tools.file_convert_tools.services.charset import convert_charset, CharsetError
+from tools.file_convert_tools.views.charset import charset_options
+from tools.file_convert_tools.views.mp4_to_mp3 import audio_options
+from tools.file_convert_tools.services.trim import trim_video
+from tools.file_convert_tools.views.trim import trim_options, VIDEO_EXTENSIONS
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
+
+
+async def _read_input_file(request, field: str):
+    files = await read_input_files(request, field)
+    return files[0] if files else None
+
+
+def _error_response(e: Exception, tool: str):
+    """변환 뷰 공통 예외 → 응답 변환 (동기 뷰와 같은 상태 코드)"""
+    if isinstance(e, SingleFlightTimeout):
+        return JsonResponse({'error': str(e)}, status=504)
+    if isinstance(e, ConverterBusy):
+        return busy_response(e)
+    if isinstance(e, subprocess.TimeoutExpired):
+        return JsonResponse({'error': '변환 시간이 초과되었습니다.'}, status=504)
+    if isinstance(e, ScratchQuotaExceeded):
+        return JsonResponse({'error': str(e)}, status=507)
+    if isinstance(e, subprocess.CalledProcessError):
+        stderr = (e.stderr or b"").decode("utf-8", errors="ignore")
+        return JsonResponse({'error': f'{tool} 변환 실패: {stderr}'}, status=500)
+    return JsonResponse({'error': f'변환 실패: {str(e)}'}, status=500)
+
+
+async def _office_to_pdf(request, extensions: tuple, folder: str, error: str):
+    uploaded_file = await _read_input_file(request, 'file')
+    if not uploaded_file or not uploaded_file.name.lower().endswith(extensions):
+        return JsonResponse({'error': error}, status=400)
+
+    # 비동기 모드: 작업 ID를 즉시 반환
+    if wants_async(request):
+        job = await run_io(
+            submit_job,
+            "tools.file_convert_tools.tasks.office_to_pdf",
+            queue="document",
+            files=[uploaded_file],
+            params={'folder': folder}
+        )
+        return job_accepted(job)
+
+    try:
+        suffix = os.path.splitext(uploaded_file.name)[1].lower()
+
+        async def convert():
+            with staged_upload_path(uploaded_file, suffix=suffix) as input_path:
+                return await aconvert_office_to_pdf(input_path, folder=folder)
+
+        key = await run_io(flight_key, folder, [uploaded_file])
+        public_url = await asingle_flight(key, convert)
+        return JsonResponse({'converted_url': public_url})
+
+    except Exception as e:
+        return _error_response(e, 'LibreOffice')
+
+
+@async_tool_view
+async def convert_docx_to_pdf(request):
+    """convert_docx_to_pdf의 비동기 버전 (ASYNC_VIEWS=True일 때 /api/convert/docx-to-pdf/에 연결)"""
+    return await _office_to_pdf(request, ('.docx',), "docx-to-pdf", 'DOCX 파일이 필요합니다.')
+
+
+@async_tool_view
+async def convert_ppt_to_pdf(request):
+    """convert_ppt_to_pdf의 비동기 버전"""
+    return await _office_to_pdf(request, ('.ppt', '.pptx'), "ppt-to-pdf", 'PPT 또는 PPTX 파일이 필요합니다.')
+
+
+@async_tool_view
+async def convert_excel_to_pdf(request):
+    """convert_excel_to_pdf의 비동기 버전"""
+    return await _office_to_pdf(request, ('.xls', '.xlsx'), "excel-to-pdf", 'XLS 또는 XLSX 파일이 필요합니다.')
+
+
+@async_tool_view
+async def convert_mov_to_mp4(request):
+    """convert_mov_to_mp4의 비동기 버전"""
+    file = await _read_input_file(request, 'file')
+    if not file or not file.name.lower().endswith('.mov'):
+        return JsonResponse({'error': 'MOV 파일만 업로드 가능합니다.'}, status=400)
+
+    try:
+        if wants_async(request):
+            job = await run_io(submit_job, "tools.file_convert_tools.tasks.mov_to_mp4", queue="media", files=[file])
+            return job_accepted(job)
+
+        async def convert():
+            with staged_upload_path(file, suffix=".mov") as temp_mov_path:
+                return await aconvert_mov_file(temp_mov_path)
+
+        key = await run_io(flight_key, "mov-to-mp4", [file])
+        return JsonResponse(await asingle_flight(key, convert))
+
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    except Exception as e:
+        return _error_response(e, 'FFmpeg')
+
+
+@async_tool_view
+async def convert_mp4_to_mp3(request):
+    """convert_mp4_to_mp3의 비동기 버전"""
+    uploaded_file = await _read_input_file(request, 'file')
+    if not uploaded_file or os.path.splitext(uploaded_file.name)[-1].lower() != '.mp4':
+        return JsonResponse({'error': 'MP4 파일만 지원됩니다.'}, status=400)
+
+    try:
+        options = audio_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    base_name = f"{os.path.splitext(uploaded_file.name)[0]}_{uuid.uuid4()}"
+
+    try:
+        if wants_async(request):
+            job = await run_io(
+                submit_job,
+                "tools.file_convert_tools.tasks.mp4_to_mp3",
+                queue="media",
+                files=[uploaded_file],
+                params={'base_name': base_name, 'options': options}
+            )
+            return job_accepted(job)
+
+        async def extract():
+            with staged_upload_path(uploaded_file, suffix=".mp4") as input_path:
+                return await aextract_audio(input_path, base_name, **options)
+
+        key = await run_io(flight_key, "mp4-to-audio", [uploaded_file], options)
+        return JsonResponse(await asingle_flight(key, extract))
+
+    except Exception as e:
+        return _error_response(e, 'FFmpeg')
+
+
+@async_tool_view
+async def convert_charset_view(request):
+    """
+    convert_charset_view의 비동기 버전
+    디코딩/인코딩과 청크 업로드가 한 흐름으로 이어지므로 전체를 I/O 실행기에서 실행합니다.
+    """
+    uploaded_file = await _read_input_file(request, 'file')
+    if not uploaded_file:
+        return JsonResponse({'error': '파일이 필요합니다.'}, status=400)
+
+    try:
+        return JsonResponse(await run_io(convert_charset, uploaded_file, **charset_options(request)))
+    except CharsetError as e:
+        return JsonResponse({'error': str(e)}, status=e.status)
+    except Exception as e:
+        return _error_response(e, 'charset')
+
+
+@async_tool_view
+async def trim_video_view(request):
+    """
+    trim_video_view의 비동기 버전
+    precise 모드는 여러 ffmpeg 프로세스를 차례로 실행하므로 동기 구현을 I/O 실행기에서 그대로 사용합니다.
+    """
+    uploaded_file = await _read_input_file(request, 'file')
+    if not uploaded_file or not uploaded_file.name.lower().endswith(VIDEO_EXTENSIONS):
+        return JsonResponse({'error': f'동영상 파일({", ".join(VIDEO_EXTENSIONS)})이 필요합니다.'}, status=400)
+
+    try:
+        options = trim_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'start, end, duration, mode 형식이 잘못되었습니다: {e}'}, status=400)
+
+    try:
+        if wants_async(request):
+            job = await run_io(submit_job, "tools.file_convert_tools.tasks.trim", queue="media",
+                               files=[uploaded_file], params={'options': options})
+            return job_accepted(job)
+
+        suffix = os.path.splitext(uploaded_file.name)[1].lower()
+
+        async def trim():
+            with staged_upload_path(uploaded_file, suffix=suffix) as input_path:
+                return await run_io(trim_video, input_path, **options)
+
+        key = await run_io(flight_key, "trim", [uploaded_file], options)
+        return JsonResponse(await asingle_flight(key, trim))
+
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    except Exception as e:
+        return _error_response(e, 'FFmpeg')
@@ -0,0 +1,48 @@
+# tools/file_convert_tools/views/charset.py
+
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_file
+from tools.file_convert_tools.services.charset import convert_charset, CharsetError, ERROR_POLICIES
+
+
+def charset_options(request) -> dict:
+    """요청에서 문자셋 변환 옵션을 읽습니다 (source가 비어 있거나 auto면 자동 감지)."""
+    source = request.POST.get('source', '').strip()
+    return {
+        'target': request.POST.get('target', 'utf-8'),
+        'source': None if source.lower() in ('', 'auto') else source,
+        'errors': request.POST.get('errors', 'strict').lower(),
+    }
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter('file', openapi.IN_FORM, type=openapi.TYPE_FILE, description='텍스트 파일 (CSV, TXT, 로그 등)', required=True),
+        openapi.Parameter('target', openapi.IN_FORM, type=openapi.TYPE_STRING, description='변환할 인코딩 (예: utf-8, utf-8-sig, cp949, euc-kr)', default='utf-8'),
+        openapi.Parameter('source', openapi.IN_FORM, type=openapi.TYPE_STRING, description='원본 인코딩 (비우거나 auto면 앞부분으로 감지)', default='auto'),
+        openapi.Parameter('errors', openapi.IN_FORM, type=openapi.TYPE_STRING, enum=list(ERROR_POLICIES), description='변환할 수 없는 바이트/문자 처리 방식', default='strict'),
+    ],
+    responses={200: '변환된 파일 URL과 원본/대상 인코딩 반환'}
+)
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def convert_charset_view(request):
+    """
+    텍스트 파일의 문자셋을 청크 단위로 변환해 Supabase에 스트리밍 업로드합니다.
+    파일 크기와 관계없이 메모리 사용량이 일정하며, 멀티바이트 문자가 청크 경계에 걸려도 정확히 변환합니다.
+    """
+    uploaded_file = get_input_file(request, 'file')
+    if not uploaded_file:
+        return JsonResponse({'error': '파일이 필요합니다.'}, status=400)
+
+    try:
+        return JsonResponse(convert_charset(uploaded_file, **charset_options(request)))
+    except CharsetError as e:
+        return JsonResponse({'error': str(e)}, status=e.status)
+    except Exception as e:
+        return JsonResponse({'error': f'변환 실패: {str(e)}'}, status=500)
@@ -1,13 +1,17 @@
 import os
-import uuid
-import tempfile
 import subprocess
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from tools.file_convert_tools.services.uploader import upload_converted_file
+from tools.common.inputs import get_input_file
+from tools.file_convert_tools.services.office import convert_office_to_pdf
+from tools.common.scratch import staged_upload_path, ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.common.progress import progress_from_request
+from tools.common.singleflight import single_flight, flight_key, SingleFlightTimeout
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
 
 @swagger_auto_schema(
     method='post',
@@ -18,6 +22,20 @@ from tools.file_convert_tools.services.uploader import upload_converted_file
             type=openapi.TYPE_FILE,
             description='Excel 파일 (XLS 또는 XLSX)',
             required=True
+        ),
+        openapi.Parameter(
+            name='async',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_BOOLEAN,
+            description='true면 작업 ID를 즉시 반환 (/api/jobs/<id>/로 조회)',
+            required=False
+        ),
+        openapi.Parameter(
+            name='progress_id',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_STRING,
+            description='진행률 조회용 ID (예: UUID, /api/jobs/<progress_id>/progress/로 조회)',
+            required=False
         )
     ],
     responses={200: '변환된 PDF 파일 URL'}
@@ -28,44 +46,43 @@ def convert_excel_to_pdf(request):
     """
     업로드된 Excel(XLS, XLSX) 파일을 PDF로 변환하여 Supabase에 업로드합니다.
     """
-    uploaded_file = request.FILES.get('file')
+    uploaded_file = get_input_file(request, 'file')
     if not uploaded_file or not uploaded_file.name.lower().endswith(('.xls', '.xlsx')):
         return JsonResponse({'error': 'XLS 또는 XLSX 파일이 필요합니다.'}, status=400)
 
-    try:
-        # 임시 파일 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp_input:
-            tmp_input.write(uploaded_file.read())
-            input_path = tmp_input.name
-
-        # LibreOffice로 변환 수행
-        output_dir = tempfile.mkdtemp()
-        command = [
-            "soffice", "--headless", "--convert-to", "pdf",
-            "--outdir", output_dir,
-            input_path
-        ]
-        subprocess.run(command, check=True)
+    # 비동기 모드: 작업 ID를 즉시 반환
+    if wants_async(request):
+        job = submit_job(
+            "tools.file_convert_tools.tasks.office_to_pdf",
+            queue="document",
+            files=[uploaded_file],
+            params={'folder': "excel-to-pdf"}
+        )
+        return job_accepted(job)
 
-        # 변환된 PDF 파일 경로
-        base_name = os.path.splitext(os.path.basename(input_path))[0]
-        output_path = os.path.join(output_dir, f"{base_name}.pdf")
+    try:
+        suffix = os.path.splitext(uploaded_file.name)[1].lower()
+        progress = progress_from_request(request)
 
-        # Supabase 업로드
-        filename = f"{uuid.uuid4()}.pdf"
-        public_url = upload_converted_file(
-            folder="excel-to-pdf",
-            filename=filename,
-            file_path=output_path,
-            content_type="application/pdf"
-        )
+        def convert():
+            with staged_upload_path(uploaded_file, suffix=suffix) as input_path:
+                # LibreOffice로 변환 후 Supabase에 업로드
+                return convert_office_to_pdf(input_path, folder="excel-to-pdf", progress=progress)
 
-        # 정리
-        os.remove(input_path)
-        os.remove(output_path)
+        # 같은 문서의 동시 변환 요청은 한 번만 변환하고 결과 URL을 공유
+        with progress.tracking():
+            public_url = single_flight(flight_key("excel-to-pdf", [uploaded_file]), convert)
 
         return JsonResponse({'converted_url': public_url})
 
+    except SingleFlightTimeout as e:
+        return JsonResponse({'error': str(e)}, status=504)
+    except ConverterBusy as e:
+        return busy_response(e)
+    except subprocess.TimeoutExpired:
+        return JsonResponse({'error': '변환 시간이 초과되었습니다.'}, status=504)
+    except ScratchQuotaExceeded as e:
+        return JsonResponse({'error': str(e)}, status=507)
     except subprocess.CalledProcessError as e:
         return JsonResponse({'error': f'LibreOffice 변환 실패: {str(e)}'}, status=500)
     except Exception as e:
@@ -1,50 +1,51 @@
-import os
-import tempfile
 import subprocess
 from django.http import JsonResponse
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
-from tools.file_convert_tools.services.uploader import upload_converted_file
+from tools.common.inputs import get_input_file
+from tools.file_convert_tools.services.media import convert_mov_file
+from tools.common.scratch import staged_upload_path, ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.common.progress import progress_from_request
+from tools.common.singleflight import single_flight, flight_key, SingleFlightTimeout
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
 
 @api_view(['POST'])
 @parser_classes([MultiPartParser])
 def convert_mov_to_mp4(request):
-    try:
-        file = request.FILES['file']
-        if not file.name.lower().endswith('.mov'):
-            return JsonResponse({'error': 'MOV 파일만 업로드 가능합니다.'}, status=400)
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mov") as temp_mov:
-            temp_mov.write(file.read())
-            temp_mov_path = temp_mov.name
+    file = get_input_file(request, 'file')
+    if not file or not file.name.lower().endswith('.mov'):
+        return JsonResponse({'error': 'MOV 파일만 업로드 가능합니다.'}, status=400)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_mp4:
-            temp_mp4_path = temp_mp4.name
+    try:
+        # 비동기 모드: 작업 ID를 즉시 반환
+        if wants_async(request):
+            job = submit_job("tools.file_convert_tools.tasks.mov_to_mp4", queue="media", files=[file])
+            return job_accepted(job)
 
-        ffmpeg_cmd = [
-            'ffmpeg',
-            '-i', temp_mov_path,
-            '-c:v', 'libx264',  # 비디오 코덱
-            '-preset', 'fast',
-            '-crf', '23',
-            '-c:a', 'aac',      # 오디오 코덱
-            '-b:a', '192k',
-            temp_mp4_path
-        ]
-        subprocess.run(ffmpeg_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # 코덱을 확인해 remux/재인코딩 후 결과 파일을 경로 그대로 업로드
+        progress = progress_from_request(request)
 
-        output_url = upload_converted_file(
-            folder='mov-to-mp4',
-            filename=os.path.basename(temp_mp4_path),
-            file_path=temp_mp4_path,
-            content_type="video/mp4"
-        )
+        def convert():
+            with staged_upload_path(file, suffix=".mov") as temp_mov_path:
+                return convert_mov_file(temp_mov_path, progress=progress)
 
-        os.remove(temp_mov_path)
-        os.remove(temp_mp4_path)
+        # 같은 영상의 동시 변환 요청은 한 번만 변환하고 결과를 공유
+        with progress.tracking():
+            result = single_flight(flight_key("mov-to-mp4", [file]), convert)
 
-        return JsonResponse({'url': output_url})
+        return JsonResponse(result)
     
+    except SingleFlightTimeout as e:
+        return JsonResponse({'error': str(e)}, status=504)
+    except ConverterBusy as e:
+        return busy_response(e)
+    except subprocess.TimeoutExpired:
+        return JsonResponse({'error': '변환 시간이 초과되었습니다.'}, status=504)
+    except ScratchQuotaExceeded as e:
+        return JsonResponse({'error': str(e)}, status=507)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
     except subprocess.CalledProcessError as e:
         return JsonResponse({'error': f'FFmpeg 오류: {e.stderr.decode("utf-8", errors="ignore")}'}, status=500)
     except Exception as e:
@@ -2,56 +2,111 @@
 
 import os
 import uuid
-import tempfile
 import subprocess
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
-from tools.file_convert_tools.services.uploader import upload_converted_file
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_file
+from tools.common.progress import progress_from_request
+from tools.common.singleflight import single_flight, flight_key, SingleFlightTimeout
+from tools.file_convert_tools.services.media import extract_audio, parse_timecode, AUDIO_BITRATES
+from tools.common.scratch import staged_upload_path, ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
 
 
+def audio_options(request) -> dict:
+    """요청에서 오디오 추출 옵션을 읽습니다. 형식이 잘못되었으면 ValueError를 발생시킵니다."""
+    options = {
+        'output_format': request.POST.get('format', 'mp3').lower(),
+        'bitrate_mode': request.POST.get('bitrate_mode', 'cbr').lower(),
+        'bitrate': request.POST.get('bitrate', '192k').lower(),
+    }
+    if options['output_format'] not in ('mp3', 'm4a'):
+        raise ValueError("format은 mp3 또는 m4a만 가능합니다.")
+    if options['bitrate_mode'] not in ('cbr', 'vbr'):
+        raise ValueError("bitrate_mode는 cbr 또는 vbr만 가능합니다.")
+    if options['bitrate'] not in AUDIO_BITRATES:
+        raise ValueError(f"bitrate는 {', '.join(AUDIO_BITRATES)} 중 하나여야 합니다.")
+    try:
+        options['vbr_quality'] = int(request.POST.get('vbr_quality', 2))
+        options['start'] = parse_timecode(request.POST['start']) if request.POST.get('start') else None
+        options['duration'] = parse_timecode(request.POST['duration']) if request.POST.get('duration') else None
+    except ValueError:
+        raise ValueError("vbr_quality, start, duration 형식이 잘못되었습니다.")
+    if not 0 <= options['vbr_quality'] <= 9:
+        raise ValueError("vbr_quality는 0~9 사이여야 합니다.")
+    return options
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter('file', openapi.IN_FORM, type=openapi.TYPE_FILE, description='MP4 파일', required=True),
+        openapi.Parameter('format', openapi.IN_FORM, type=openapi.TYPE_STRING, description='mp3 또는 m4a (AAC 원본은 재인코딩 없이 추출)', default='mp3'),
+        openapi.Parameter('bitrate_mode', openapi.IN_FORM, type=openapi.TYPE_STRING, description='MP3 인코딩 방식 (cbr, vbr)', default='cbr'),
+        openapi.Parameter('bitrate', openapi.IN_FORM, type=openapi.TYPE_STRING, description='CBR/AAC 비트레이트 (96k ~ 320k)', default='192k'),
+        openapi.Parameter('vbr_quality', openapi.IN_FORM, type=openapi.TYPE_INTEGER, description='VBR 품질 (0=최고 ~ 9=최저)', default=2),
+        openapi.Parameter('start', openapi.IN_FORM, type=openapi.TYPE_STRING, description='추출 시작 시각 (초 또는 HH:MM:SS)'),
+        openapi.Parameter('duration', openapi.IN_FORM, type=openapi.TYPE_STRING, description='추출 길이 (초 또는 HH:MM:SS)'),
+        openapi.Parameter('async', openapi.IN_FORM, type=openapi.TYPE_BOOLEAN, description='true면 작업 ID를 즉시 반환'),
+    ],
+    responses={200: '추출된 오디오 파일 URL'}
+)
 @api_view(['POST'])
 @parser_classes([MultiPartParser])
 def convert_mp4_to_mp3(request):
-    try:
-        uploaded_file = request.FILES['file']
-        file_ext = os.path.splitext(uploaded_file.name)[-1].lower()
-
-        if file_ext != '.mp4':
-            return JsonResponse({'error': 'MP4 파일만 지원됩니다.'}, status=400)
+    """
+    MP4 동영상에서 오디오를 추출합니다.
+    M4A 요청 시 AAC 원본은 재인코딩 없이 복사하고, MP3는 CBR/VBR 옵션으로 인코딩합니다.
+    """
+    uploaded_file = get_input_file(request, 'file')
+    if not uploaded_file or os.path.splitext(uploaded_file.name)[-1].lower() != '.mp4':
+        return JsonResponse({'error': 'MP4 파일만 지원됩니다.'}, status=400)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_input:
-            temp_input.write(uploaded_file.read())
-            temp_input_path = temp_input.name
+    try:
+        options = audio_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as temp_output:
-            temp_output_path = temp_output.name
+    try:
+        file_id = str(uuid.uuid4())
+        base_name = f"{os.path.splitext(uploaded_file.name)[0]}_{file_id}"
 
-        # FFmpeg를 이용한 MP3 추출
-        command = [
-            "ffmpeg", "-i", temp_input_path,
-            "-map", "a",  # 오디오 스트림만 추출
-            "-acodec", "libmp3lame", "-y", temp_output_path
-        ]
+        # 비동기 모드: 작업 ID를 즉시 반환
+        if wants_async(request):
+            job = submit_job(
+                "tools.file_convert_tools.tasks.mp4_to_mp3",
+                queue="media",
+                files=[uploaded_file],
+                params={'base_name': base_name, 'options': options}
+            )
+            return job_accepted(job)
 
-        subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # 업로드 파일 경로를 그대로 입력으로 사용 (CBR MP3는 stdout으로 받아 바로 업로드)
+        progress = progress_from_request(request)
 
-        # 업로드 및 응답
-        file_id = str(uuid.uuid4())
-        filename = f"{os.path.splitext(uploaded_file.name)[0]}_{file_id}.mp3"
-        url = upload_converted_file(
-            folder="audio",
-            filename=filename,
-            file_path=temp_output_path,
-            content_type="audio/mpeg"
-        )
+        def extract():
+            with staged_upload_path(uploaded_file, suffix=".mp4") as input_path:
+                return extract_audio(input_path, base_name, progress=progress, **options)
 
-        os.remove(temp_input_path)
-        os.remove(temp_output_path)
+        # 같은 영상/옵션의 동시 요청은 한 번만 추출하고 결과를 공유 (파일명은 먼저 시작한 요청 기준)
+        with progress.tracking():
+            result = single_flight(flight_key("mp4-to-audio", [uploaded_file], options), extract)
 
-        return JsonResponse({'url': url})
+        return JsonResponse(result)
 
+    except SingleFlightTimeout as e:
+        return JsonResponse({'error': str(e)}, status=504)
+    except ConverterBusy as e:
+        return busy_response(e)
+    except subprocess.TimeoutExpired:
+        return JsonResponse({'error': '변환 시간이 초과되었습니다.'}, status=504)
+    except ScratchQuotaExceeded as e:
+        return JsonResponse({'error': str(e)}, status=507)
     except subprocess.CalledProcessError as e:
-        return JsonResponse({'error': f'변환 실패: {e.stderr.decode("utf-8")}'}, status=500)
+        return JsonResponse({'error': f'변환 실패: {e.stderr.decode("utf-8", errors="ignore")}'}, status=500)
     except Exception as e:
         return JsonResponse({'error': f'변환 실패: {str(e)}'}, status=500)
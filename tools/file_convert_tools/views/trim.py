@@ -0,0 +1,99 @@
+# tools/file_convert_tools/views/trim.py
+
+import os
+import subprocess
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_file
+from tools.common.progress import progress_from_request
+from tools.common.singleflight import single_flight, flight_key, SingleFlightTimeout
+from tools.file_convert_tools.services.media import parse_timecode
+from tools.file_convert_tools.services.trim import trim_video, TRIM_MODES
+from tools.common.scratch import staged_upload_path, ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
+
+# 자르기를 지원하는 동영상 확장자
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.m4v', '.mkv', '.webm', '.avi', '.ts')
+
+
+def trim_options(request) -> dict:
+    """요청에서 자르기 옵션을 읽습니다. 형식이 잘못되었으면 ValueError를 발생시킵니다."""
+    mode = request.POST.get('mode', 'fast').lower()
+    if mode not in TRIM_MODES:
+        raise ValueError(f"mode는 {', '.join(TRIM_MODES)} 중 하나여야 합니다.")
+    if not request.POST.get('start'):
+        raise ValueError("start는 필수입니다.")
+    return {
+        'start': parse_timecode(request.POST['start']),
+        'end': parse_timecode(request.POST['end']) if request.POST.get('end') else None,
+        'duration': parse_timecode(request.POST['duration']) if request.POST.get('duration') else None,
+        'mode': mode,
+    }
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter('file', openapi.IN_FORM, type=openapi.TYPE_FILE, description='동영상 파일', required=True),
+        openapi.Parameter('start', openapi.IN_FORM, type=openapi.TYPE_STRING, description='시작 시각 (초 또는 HH:MM:SS)', required=True),
+        openapi.Parameter('end', openapi.IN_FORM, type=openapi.TYPE_STRING, description='끝 시각 (초 또는 HH:MM:SS, 없으면 duration 또는 영상 끝)'),
+        openapi.Parameter('duration', openapi.IN_FORM, type=openapi.TYPE_STRING, description='자를 길이 (초 또는 HH:MM:SS)'),
+        openapi.Parameter('mode', openapi.IN_FORM, type=openapi.TYPE_STRING, enum=list(TRIM_MODES), description='fast: 키프레임 기준 스트림 복사, precise: 경계 GOP만 재인코딩', default='fast'),
+        openapi.Parameter('async', openapi.IN_FORM, type=openapi.TYPE_BOOLEAN, description='true면 작업 ID를 즉시 반환'),
+    ],
+    responses={200: '잘라낸 MP4 URL, 실제 시작 시각/길이, 재인코딩한 길이'}
+)
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def trim_video_view(request):
+    """
+    동영상의 지정 구간을 faststart MP4로 잘라냅니다.
+    기본(fast)은 재인코딩 없는 스트림 복사이며, precise는 경계의 GOP만 재인코딩해 요청한 시각에 정확히 자릅니다.
+    """
+    uploaded_file = get_input_file(request, 'file')
+    if not uploaded_file or not uploaded_file.name.lower().endswith(VIDEO_EXTENSIONS):
+        return JsonResponse({'error': f'동영상 파일({", ".join(VIDEO_EXTENSIONS)})이 필요합니다.'}, status=400)
+
+    try:
+        options = trim_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'start, end, duration, mode 형식이 잘못되었습니다: {e}'}, status=400)
+
+    try:
+        # 비동기 모드: 작업 ID를 즉시 반환
+        if wants_async(request):
+            job = submit_job("tools.file_convert_tools.tasks.trim", queue="media", files=[uploaded_file],
+                             params={'options': options})
+            return job_accepted(job)
+
+        progress = progress_from_request(request)
+        suffix = os.path.splitext(uploaded_file.name)[1].lower()
+
+        def trim():
+            with staged_upload_path(uploaded_file, suffix=suffix) as input_path:
+                return trim_video(input_path, progress=progress, **options)
+
+        # 같은 영상/구간의 동시 요청은 한 번만 자르고 결과를 공유
+        with progress.tracking():
+            result = single_flight(flight_key("trim", [uploaded_file], options), trim)
+
+        return JsonResponse(result)
+
+    except SingleFlightTimeout as e:
+        return JsonResponse({'error': str(e)}, status=504)
+    except ConverterBusy as e:
+        return busy_response(e)
+    except subprocess.TimeoutExpired:
+        return JsonResponse({'error': '변환 시간이 초과되었습니다.'}, status=504)
+    except ScratchQuotaExceeded as e:
+        return JsonResponse({'error': str(e)}, status=507)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    except subprocess.CalledProcessError as e:
+        return JsonResponse({'error': f'변환 실패: {(e.stderr or b"").decode("utf-8", errors="ignore")}'}, status=500)
+    except Exception as e:
+        return JsonResponse({'error': f'변환 실패: {str(e)}'}, status=500)
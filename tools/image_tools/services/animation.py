@@ -0,0 +1,221 @@
+# tools/image_tools/services/animation.py
+
+import io
+import math
+import uuid
+from PIL import Image, ImageChops, ImageOps, GifImagePlugin
+from django.conf import settings
+from tools.common.metrics import stage
+from tools.common.scratch import scratch_workspace
+from tools.common.governor import converter_slot, converter_timeout
+from tools.common.threads import converter_threads, converter_cpus
+from tools.common.process import run_process
+from tools.file_convert_tools.services.media import probe_media
+from tools.image_tools.services.uploader import upload_image, upload_image_stream, upload_image_file
+
+# 메모리 한도: 프레임 수, 프레임 수 × 가로 × 세로(픽셀 수 합계)
+ANIMATION_MAX_FRAMES = getattr(settings, 'ANIMATION_MAX_FRAMES', 300)
+ANIMATION_MAX_PIXELS = getattr(settings, 'ANIMATION_MAX_PIXELS', 50_000_000)
+
+# 출력 가로 크기 / fps / 동영상 구간 길이(초) 상한
+ANIMATION_MAX_WIDTH = getattr(settings, 'ANIMATION_MAX_WIDTH', 1280)
+ANIMATION_MAX_FPS = 30
+ANIMATION_MAX_DURATION = getattr(settings, 'ANIMATION_MAX_DURATION', 60)
+
+# 공통 팔레트를 만들 때 표본으로 쓰는 프레임 수 / 표본 축소 가로 크기
+PALETTE_SAMPLE_FRAMES = 16
+PALETTE_SAMPLE_WIDTH = 128
+
+# 출력 형식별 Content-Type
+ANIMATION_FORMATS = {'gif': 'image/gif', 'webp': 'image/webp'}
+
+
+class AnimationError(Exception):
+    """애니메이션을 만들 수 없는 경우 (status: 응답할 HTTP 상태 코드, 한도 초과는 413)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def check_budget(frames: int, width: int, height: int):
+    """프레임 수와 프레임 수 × 가로 × 세로가 한도를 넘으면 AnimationError(413)를 발생시킵니다."""
+    if frames > ANIMATION_MAX_FRAMES:
+        raise AnimationError(f"프레임 수({frames})가 한도({ANIMATION_MAX_FRAMES})를 넘습니다. fps나 길이를 줄여 주세요.",
+                             status=413)
+    if frames * width * height > ANIMATION_MAX_PIXELS:
+        raise AnimationError(
+            f"프레임 수 × 크기({frames} × {width}x{height})가 한도({ANIMATION_MAX_PIXELS} 픽셀)를 넘습니다. "
+            "width, fps 또는 길이를 줄여 주세요.", status=413)
+
+
+def frame_duration(fps: float) -> int:
+    """프레임 하나의 표시 시간 (ms). GIF는 10ms 단위이고 20ms 미만은 브라우저가 100ms로 늘리므로 20ms 이상으로 맞춤"""
+    return max(20, int(round(100 / fps)) * 10)
+
+
+def canvas_size(source_size: tuple, width: int) -> tuple:
+    """첫 프레임 비율을 유지한 출력 크기 (확대하지 않음)"""
+    source_width, source_height = source_size
+    width = max(1, min(width, source_width, ANIMATION_MAX_WIDTH))
+    return width, max(1, round(source_height * width / source_width))
+
+
+def load_frame(image_file, size: tuple) -> Image.Image:
+    """이미지를 size에 맞춰(비율 유지, 남는 부분은 채움) RGB 프레임으로 읽습니다. JPEG는 축소 디코딩을 사용합니다."""
+    image_file.seek(0)
+    try:
+        with Image.open(image_file) as img:
+            img.draft('RGB', size)
+            return ImageOps.pad(img.convert('RGB'), size, method=Image.Resampling.LANCZOS)
+    except (OSError, Image.DecompressionBombError) as e:
+        raise AnimationError(f"이미지를 읽을 수 없습니다 ({image_file.name}): {e}")
+
+
+def build_palette(images: list, size: tuple) -> Image.Image:
+    """
+    프레임 전체가 함께 쓸 256색 팔레트를 만듭니다.
+    고르게 고른 표본 프레임을 축소해 한 장으로 이어 붙인 뒤 양자화하므로 프레임 수와 관계없이 비용이 일정합니다.
+    """
+    count = min(len(images), PALETTE_SAMPLE_FRAMES)
+    step = len(images) / count
+    sample_size = canvas_size(size, PALETTE_SAMPLE_WIDTH)
+    mosaic = Image.new('RGB', (sample_size[0], sample_size[1] * count))
+    for i in range(count):
+        mosaic.paste(load_frame(images[int(i * step)], sample_size), (0, i * sample_size[1]))
+    return mosaic.quantize(colors=256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+
+
+def gif_chunks(images: list, size: tuple, duration: int, loop: int = 0):
+    """
+    이미지들을 공통 팔레트 GIF로 인코딩하며 프레임마다 바이트를 내보냅니다.
+
+    Pillow의 save(save_all=True)는 모든 프레임을 모은 뒤 프레임별 팔레트로 기록하지만,
+    여기서는 전역 팔레트 하나를 헤더에 쓰고 프레임을 하나씩 양자화·기록하므로 메모리에 두 프레임만 유지합니다.
+    이전 프레임과 달라진 영역만 잘라 기록하므로(disposal=1) 정지된 배경이 많은 애니메이션이 작아집니다.
+    """
+    palette = build_palette(images, size)
+    canvas = Image.new('P', size)
+    canvas.putpalette(palette.getpalette())
+    header, _ = GifImagePlugin.getheader(canvas, info={'loop': loop, 'duration': duration, 'optimize': False})
+    yield b"".join(header)
+
+    previous = None
+    for image_file in images:
+        frame = load_frame(image_file, size)
+        bbox = (0, 0) + size
+        if previous is not None:
+            # 디더링 오차가 프레임 전체로 퍼지지 않도록 원본 RGB로 바뀐 영역을 구하고 그 영역만 양자화
+            # (같은 프레임이면 1픽셀만 기록)
+            bbox = ImageChops.difference(frame, previous).getbbox() or (0, 0, 1, 1)
+        previous = frame
+        part = frame if bbox == (0, 0) + size else frame.crop(bbox)
+        part = part.quantize(palette=palette, dither=Image.Dither.FLOYDSTEINBERG)
+        yield b"".join(GifImagePlugin.getdata(part, offset=bbox[:2], duration=duration, disposal=1))
+    yield b";"
+
+
+def encode_webp(images: list, size: tuple, duration: int, loop: int = 0, quality: int = 80) -> io.BytesIO:
+    """
+    이미지들을 애니메이션 WebP로 인코딩합니다.
+    Pillow의 WebP 인코더는 프레임 목록을 한 번에 받으므로 프레임이 모두 메모리에 올라가며, 크기는 check_budget()으로 제한됩니다.
+    """
+    frames = [load_frame(image_file, size) for image_file in images]
+    output = io.BytesIO()
+    with stage('encode'):
+        frames[0].save(output, 'WEBP', save_all=True, append_images=frames[1:], duration=duration, loop=loop,
+                       quality=quality, method=4)
+    output.seek(0)
+    return output
+
+
+def animate_images(images: list, fmt: str = 'gif', fps: float = 10, width: int = 480, loop: int = 0) -> dict:
+    """
+    이미지 묶음을 GIF(스트리밍 업로드) 또는 애니메이션 WebP로 만들어 업로드합니다.
+    출력 크기는 첫 이미지 비율을 따르며, 프레임 수 × 크기가 한도를 넘으면 디코딩 전에 거절합니다.
+    """
+    if len(images) < 2:
+        raise AnimationError("이미지가 2장 이상 필요합니다.")
+
+    images[0].seek(0)
+    try:
+        with Image.open(images[0]) as first:
+            size = canvas_size(first.size, width)
+    except OSError as e:
+        raise AnimationError(f"이미지를 읽을 수 없습니다 ({images[0].name}): {e}")
+    check_budget(len(images), *size)
+
+    duration = frame_duration(fps)
+    filename = f"{uuid.uuid4()}.{fmt}"
+    if fmt == 'gif':
+        # 프레임 인코딩과 업로드가 번갈아 진행되므로 처리 시간은 upload 단계에 함께 기록됨
+        url = upload_image_stream("animated", filename, gif_chunks(images, size, duration, loop), "image/gif")
+    else:
+        url = upload_image("animated", filename, encode_webp(images, size, duration, loop).getbuffer(), "image/webp")
+
+    return {'url': url, 'format': fmt, 'source': 'images', 'frames': len(images),
+            'width': size[0], 'height': size[1], 'frame_duration_ms': duration}
+
+
+def _video_size(info: dict, width: int) -> tuple:
+    video = next((s for s in info.get('streams', []) if s.get('codec_type') == 'video'
+                  and not s.get('disposition', {}).get('attached_pic')), None)
+    if not video or not video.get('width'):
+        raise AnimationError("비디오 스트림이 없습니다.")
+    width, height = canvas_size((video['width'], video['height']), width)
+    return width, height - height % 2  # scale=W:-2와 같은 짝수 높이
+
+
+def animate_video(input_path: str, fmt: str = 'gif', fps: float = 10, width: int = 480, loop: int = 0,
+                  start: float = None, duration: float = None) -> dict:
+    """
+    동영상 구간을 GIF 또는 애니메이션 WebP로 만들어 업로드합니다.
+
+    GIF는 ffmpeg 2단계 처리입니다: 1) palettegen으로 구간 전체에 맞는 팔레트를 만들어 작업 디렉터리에 저장하고
+    2) 같은 구간을 다시 읽어 paletteuse로 그 팔레트를 적용합니다. -ss를 -i 앞에 두어 필요한 구간만 디코딩합니다.
+    """
+    info = probe_media(input_path)
+    start = start or 0
+    clip = max(info.get('duration', 0) - start, 0)
+    if duration:
+        clip = min(clip, duration) if clip else duration
+    if clip <= 0:
+        raise AnimationError("start가 영상 길이보다 깁니다.")
+    if clip > ANIMATION_MAX_DURATION:
+        raise AnimationError(f"구간 길이가 한도({ANIMATION_MAX_DURATION}초)를 넘습니다. duration을 지정해 주세요.",
+                             status=413)
+
+    size = _video_size(info, width)
+    frames = math.ceil(clip * fps)
+    check_budget(frames, *size)
+
+    seek = ['-ss', f"{start:.3f}", '-t', f"{clip:.3f}"]
+    scale = f"fps={fps},scale={size[0]}:{size[1]}:flags=lanczos"
+    threads = ['-threads', str(converter_threads('ffmpeg'))]
+
+    # 출력은 프레임당 원본 픽셀 1바이트 이내 (GIF 인덱스 + LZW)
+    with scratch_workspace(size_hint=frames * size[0] * size[1], prefix="animation") as workspace:
+        output_path = workspace.file_path(f"output.{fmt}")
+        guard = workspace.guard()
+        with converter_slot('ffmpeg') as slot, stage('convert'):
+            cpus = converter_cpus(slot)
+            timeout = converter_timeout('ffmpeg')
+            if fmt == 'gif':
+                palette_path = workspace.file_path("palette.png")
+                run_process(['ffmpeg', '-y', *seek, '-i', input_path, *threads,
+                             '-vf', f"{scale},palettegen=stats_mode=diff", palette_path],
+                            cancel_check=guard, timeout=timeout, cpus=cpus)
+                run_process(['ffmpeg', '-y', *seek, '-i', input_path, '-i', palette_path, *threads,
+                             '-lavfi', f"{scale}[x];[x][1:v]paletteuse=dither=bayer:bayer_scale=5:diff_mode=rectangle",
+                             '-loop', str(loop), output_path],
+                            cancel_check=guard, timeout=timeout, cpus=cpus)
+            else:
+                run_process(['ffmpeg', '-y', *seek, '-i', input_path, *threads, '-vf', scale, '-an',
+                             '-c:v', 'libwebp', '-lossless', '0', '-q:v', '75', '-loop', str(loop), output_path],
+                            cancel_check=guard, timeout=timeout, cpus=cpus)
+
+        workspace.check_quota()
+        url = upload_image_file("animated", f"{uuid.uuid4()}.{fmt}", output_path, ANIMATION_FORMATS[fmt])
+
+    return {'url': url, 'format': fmt, 'source': 'video', 'frames': frames,
+            'width': size[0], 'height': size[1], 'frame_duration_ms': frame_duration(fps)}
@@ -0,0 +1,168 @@
+# tools/image_tools/services/transforms.py
+
+import io
+from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
+from tools.common.metrics import stage
+
+# 필터 이름 목록 (apply_image_filter에서 지원)
+FILTERS = ('grayscale', 'sepia', 'sharpen', 'blur', 'contrast', 'brightness', 'edge')
+
+
+def compress_to_jpeg(image_file, quality: int) -> io.BytesIO:
+    """이미지를 지정한 품질의 JPEG로 다시 인코딩합니다."""
+    with stage('decode'):
+        img = Image.open(image_file).convert("RGB")
+    img_io = io.BytesIO()
+    with stage('encode'):
+        img.save(img_io, "JPEG", quality=quality)
+    img_io.seek(0)
+    return img_io
+
+
+def resize_to_png(image_file, width: int, height: int) -> io.BytesIO:
+    """이미지를 지정한 크기로 리사이즈하여 PNG로 인코딩합니다."""
+    with stage('decode'):
+        img = Image.open(image_file)
+        img.load()
+    with stage('process'):
+        resized_img = img.resize((width, height))
+
+    img_io = io.BytesIO()
+    with stage('encode'):
+        resized_img.save(img_io, format='PNG')
+    img_io.seek(0)
+    return img_io
+
+
+def convert_image(image_file, pil_format: str) -> io.BytesIO:
+    """이미지를 RGB로 변환한 뒤 지정한 PIL 포맷(JPEG, PNG, WEBP 등)으로 인코딩합니다."""
+    with stage('decode'):
+        img = Image.open(image_file).convert("RGB")
+    img_io = io.BytesIO()
+    with stage('encode'):
+        img.save(img_io, pil_format)
+    img_io.seek(0)
+    return img_io
+
+
+def convert_page_image(page_path: str, pil_format: str) -> io.BytesIO:
+    """pdftoppm이 렌더링한 페이지 이미지 파일을 지정한 포맷으로 인코딩합니다."""
+    img_io = io.BytesIO()
+    with Image.open(page_path) as page, stage('encode'):
+        page.convert("RGB").save(img_io, pil_format)
+    img_io.seek(0)
+    return img_io
+
+
+def apply_image_filter(image_file, filter_name: str):
+    """
+    이미지에 필터를 적용하여 JPEG로 인코딩합니다.
+    지원하지 않는 필터 이름이면 None을 반환합니다.
+    """
+    if filter_name not in FILTERS:
+        return None
+
+    with stage('decode'):
+        img = Image.open(image_file).convert("RGB")
+    with stage('process'):
+        if filter_name == 'grayscale':
+            img = img.convert('L').convert('RGB')
+
+        elif filter_name == 'sepia':
+            width, height = img.size
+            pixels = img.load()
+            for y in range(height):
+                for x in range(width):
+                    r, g, b = pixels[x, y]
+                    tr = int(0.393 * r + 0.769 * g + 0.189 * b)
+                    tg = int(0.349 * r + 0.686 * g + 0.168 * b)
+                    tb = int(0.272 * r + 0.534 * g + 0.131 * b)
+                    pixels[x, y] = (min(tr, 255), min(tg, 255), min(tb, 255))
+
+        elif filter_name == 'sharpen':
+            img = img.filter(ImageFilter.SHARPEN)
+
+        elif filter_name == 'blur':
+            img = img.filter(ImageFilter.BLUR)
+
+        elif filter_name == 'contrast':
+            img = ImageEnhance.Contrast(img).enhance(1.5)
+
+        elif filter_name == 'brightness':
+            img = ImageEnhance.Brightness(img).enhance(1.3)
+
+        elif filter_name == 'edge':
+            img = img.filter(ImageFilter.FIND_EDGES)
+
+    img_io = io.BytesIO()
+    with stage('encode'):
+        img.save(img_io, "JPEG")
+    img_io.seek(0)
+    return img_io
+
+
+def load_watermark_image(image_file):
+    """워터마크로 쓸 이미지를 RGBA로 엽니다."""
+    return Image.open(image_file).convert("RGBA")
+
+
+def add_watermark_layer(image_file, wm_type: str, text: str, opacity: int, position: str,
+                        wm_img=None) -> io.BytesIO:
+    """이미지에 텍스트 또는 이미지 워터마크를 합성하여 JPEG로 인코딩합니다."""
+    with stage('decode'):
+        base_img = Image.open(image_file).convert("RGBA")
+    watermark_layer = Image.new("RGBA", base_img.size, (0, 0, 0, 0))
+
+    if wm_type == 'text':
+        draw = ImageDraw.Draw(watermark_layer)
+        font_size = int(min(base_img.size) * 0.05)
+        try:
+            font = ImageFont.truetype("/Library/Fonts/Arial.ttf", font_size)
+        except:
+            font = ImageFont.load_default()
+
+        bbox = draw.textbbox((0, 0), text, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        x, y = get_position(position, base_img.size, (text_width, text_height))
+
+        draw.text((x, y), text, fill=(0, 0, 0, opacity), font=font)
+
+    elif wm_type == 'image' and wm_img:
+        wm_resized = wm_img.resize((int(base_img.size[0] * 0.25), int(base_img.size[1] * 0.25)))
+        if opacity < 255:
+            alpha = wm_resized.getchannel('A')
+            new_alpha = alpha.point(lambda p: int(p * (opacity / 255)))
+            wm_resized.putalpha(new_alpha)
+
+        x, y = get_position(position, base_img.size, wm_resized.size)
+        watermark_layer.paste(wm_resized, (x, y), wm_resized)
+
+    with stage('process'):
+        final_img = Image.alpha_composite(base_img, watermark_layer).convert("RGB")
+    img_io = io.BytesIO()
+    with stage('encode'):
+        final_img.save(img_io, "JPEG")
+    img_io.seek(0)
+    return img_io
+
+
+def get_position(position, base_size, wm_size):
+    """
+    워터마크 위치를 계산합니다.
+    """
+    bx, by = base_size
+    wx, wy = wm_size
+
+    if position == 'top-left':
+        return (10, 10)
+    elif position == 'top-right':
+        return (bx - wx - 10, 10)
+    elif position == 'bottom-left':
+        return (10, by - wy - 10)
+    elif position == 'center':
+        return ((bx - wx) // 2, (by - wy) // 2)
+    elif position == 'bottom-right':
+        return (bx - wx - 10, by - wy - 10)
+    else:
+        return (10, 10)
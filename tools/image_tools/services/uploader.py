@@ -1,6 +1,6 @@
 # tools/image_tools/services/uploader.py
 
-from tools.common.storage import upload_to_supabase
+from tools.common.storage import upload_to_supabase, aupload_to_supabase, upload_stream_to_supabase, upload_file_to_supabase
 
 def upload_image(
     folder: str,           # 예: "resized", "compressed"
@@ -26,3 +26,36 @@ def upload_image(
         content=content,
         content_type=content_type
     )
+
+
+async def aupload_image(folder: str, filename: str, content: bytes, content_type: str = "image/jpeg") -> str:
+    """upload_image()의 비동기 버전"""
+    return await aupload_to_supabase(
+        bucket="images",
+        folder=folder,
+        filename=filename,
+        content=content,
+        content_type=content_type
+    )
+
+
+def upload_image_stream(folder: str, filename: str, chunks, content_type: str = "image/gif") -> str:
+    """만들어지는 대로 내보내는 이미지 청크(예: GIF 프레임)를 'images' 버킷에 바로 업로드합니다."""
+    return upload_stream_to_supabase(
+        bucket="images",
+        folder=folder,
+        filename=filename,
+        chunks=chunks,
+        content_type=content_type
+    )
+
+
+def upload_image_file(folder: str, filename: str, file_path: str, content_type: str = "image/gif") -> str:
+    """디스크의 이미지 파일(예: ffmpeg 출력)을 경로 그대로 'images' 버킷에 업로드합니다."""
+    return upload_file_to_supabase(
+        bucket="images",
+        folder=folder,
+        filename=filename,
+        file_path=file_path,
+        content_type=content_type
+    )
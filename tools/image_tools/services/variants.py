@@ -0,0 +1,163 @@
+# tools/image_tools/services/variants.py
+
+import io
+import math
+import uuid
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image, ImageOps, ExifTags
+from django.conf import settings
+from tools.common.metrics import stage
+from tools.common.threads import pool_size
+from tools.image_tools.services.uploader import upload_image
+
+# 기본 출력 폭 (srcset 후보)
+IMAGE_VARIANT_WIDTHS = getattr(settings, 'IMAGE_VARIANT_WIDTHS', (320, 640, 1280, 1920))
+
+# 기본 출력 형식 (앞에서부터 <source> 우선순위, 마지막 형식이 <img src> 대체 이미지)
+IMAGE_VARIANT_FORMATS = getattr(settings, 'IMAGE_VARIANT_FORMATS', ('webp', 'jpeg'))
+
+# 요청 하나의 최대 폭 개수 / 최대 폭
+IMAGE_VARIANT_MAX_WIDTHS = 8
+IMAGE_VARIANT_MAX_WIDTH = 4096
+
+# 인코딩 스레드 수 (워커에 배정된 코어 수 이하로 제한) / 동시 업로드 수
+IMAGE_VARIANT_ENCODE_WORKERS = getattr(settings, 'IMAGE_VARIANT_ENCODE_WORKERS', 4)
+IMAGE_VARIANT_UPLOAD_WORKERS = getattr(settings, 'IMAGE_VARIANT_UPLOAD_WORKERS', 8)
+
+# 형식별 (PIL 포맷, 확장자, Content-Type, 인코딩 옵션)
+VARIANT_FORMATS = {
+    'webp': ('WEBP', 'webp', 'image/webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+    'png': ('PNG', 'png', 'image/png', {}),
+}
+
+# 가로/세로가 바뀌는 EXIF 방향 값
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def variant_widths(source_width: int, widths) -> list:
+    """
+    실제로 만들 폭을 큰 것부터 반환합니다. 원본보다 큰 폭은 만들지 않으며(확대 없음),
+    그런 요청이 있으면 원본 폭을 대신 포함해 가장 큰 후보가 원본 해상도가 되게 합니다.
+    """
+    picked = sorted({w for w in widths if w < source_width}, reverse=True)
+    if any(w >= source_width for w in widths):
+        picked.insert(0, source_width)
+    return picked
+
+
+def decode_source(image_file, largest_width: int) -> Image.Image:
+    """
+    원본을 한 번만 디코딩합니다. JPEG는 가장 큰 출력 폭 이상이 되는 범위에서 축소 디코딩(draft)하고,
+    EXIF 방향을 적용한 뒤 투명도가 있으면 RGBA, 없으면 RGB로 반환합니다.
+    """
+    img = Image.open(image_file)
+    width, height = img.size
+    if img.getexif().get(ExifTags.Base.Orientation, 1) in _TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    if largest_width < width:
+        scale = largest_width / width
+        # draft 크기는 저장된 방향 기준
+        img.draft(None, (math.ceil(img.size[0] * scale), math.ceil(img.size[1] * scale)))
+
+    img = ImageOps.exif_transpose(img)
+    has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+    return img.convert('RGBA' if has_alpha else 'RGB')
+
+
+def iter_downscaled(img: Image.Image, widths: list):
+    """
+    큰 폭부터 차례로 줄인 이미지를 내보냅니다.
+    각 단계는 바로 앞 단계(더 큰 결과)에서 만들므로 뒤로 갈수록 줄일 픽셀 수가 빠르게 줄어듭니다.
+    세로 크기는 원본 비율로 계산해 단계를 거쳐도 비율 오차가 쌓이지 않습니다.
+    """
+    current = img
+    for width in widths:
+        if width != current.width:
+            height = max(1, round(img.height * width / img.width))
+            current = current.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        yield current
+
+
+def encode_variant(img: Image.Image, fmt: str) -> bytes:
+    """이미지 하나를 지정한 형식으로 인코딩합니다. JPEG는 투명 영역을 흰 배경으로 채웁니다."""
+    pil_format, _, _, options = VARIANT_FORMATS[fmt]
+    if pil_format == 'JPEG' and img.mode == 'RGBA':
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel('A'))
+        img = background
+    else:
+        # save()는 이미지 객체에 인코딩 옵션을 기록하므로, 같은 크기를 여러 형식으로 동시에 인코딩할 때 복사본을 사용
+        img = img.copy()
+    output = io.BytesIO()
+    img.save(output, pil_format, **options)
+    return output.getvalue()
+
+
+def render_variants(image_file, widths=None, formats=None):
+    """
+    원본을 한 번 디코딩해 폭 × 형식별 이미지를 인코딩하고, 끝나는 대로 (정보, 바이트)를 내보냅니다.
+    축소는 차례로 진행하면서 각 크기가 나오는 즉시 형식별 인코딩을 스레드 풀에 넘기므로
+    작은 크기를 줄이는 동안 큰 크기의 인코딩이 함께 진행됩니다 (PIL은 축소/인코딩 중 GIL을 놓음).
+    """
+    widths = widths or IMAGE_VARIANT_WIDTHS
+    formats = formats or IMAGE_VARIANT_FORMATS
+
+    with stage('decode'):
+        img = decode_source(image_file, max(widths))
+
+    with ThreadPoolExecutor(max_workers=pool_size(IMAGE_VARIANT_ENCODE_WORKERS),
+                            thread_name_prefix="variant") as pool:
+        futures = {}
+        with stage('process'):
+            for resized in iter_downscaled(img, variant_widths(img.width, widths)):
+                for fmt in formats:
+                    futures[pool.submit(encode_variant, resized, fmt)] = (resized.size, fmt)
+        for future in as_completed(futures):
+            (width, height), fmt = futures[future]
+            yield {'width': width, 'height': height, 'format': fmt}, future.result()
+
+
+def build_srcset(variants: list, fmt: str) -> str:
+    """형식 하나의 srcset 문자열 (예: "https://.../320w.webp 320w, https://.../640w.webp 640w")"""
+    return ", ".join(f"{v['url']} {v['width']}w" for v in sorted(variants, key=lambda v: v['width'])
+                     if v['format'] == fmt)
+
+
+def create_variants(image_file, widths=None, formats=None) -> dict:
+    """
+    이미지 하나로 반응형 이미지 세트를 만들어 'images' 버킷(variants/<id>/)에 업로드하고 srcset 매니페스트를 반환합니다.
+    인코딩이 끝난 이미지부터 바로 업로드를 시작하며, 업로드는 IMAGE_VARIANT_UPLOAD_WORKERS개까지 동시에 진행합니다.
+
+    반환 예:
+        {'width': 1920, 'height': 1280, 'src': '.../1920w.jpg',
+         'srcset': {'webp': '.../320w.webp 320w, ...', 'jpeg': '.../320w.jpg 320w, ...'},
+         'variants': [{'width': 320, 'height': 213, 'format': 'webp', 'bytes': 10240, 'url': '...'}, ...]}
+    """
+    formats = formats or IMAGE_VARIANT_FORMATS
+    folder = f"variants/{uuid.uuid4().hex}"
+    uploads = []
+
+    # 인코딩과 업로드가 겹쳐 진행되므로 인코딩 시간은 별도 단계로 기록하지 않음 (업로드는 upload 단계로 기록됨)
+    with ThreadPoolExecutor(max_workers=IMAGE_VARIANT_UPLOAD_WORKERS, thread_name_prefix="variant-upload") as uploader:
+        for variant, data in render_variants(image_file, widths, formats):
+            _, ext, content_type, _ = VARIANT_FORMATS[variant['format']]
+            variant['bytes'] = len(data)
+            # 요청 컨텍스트(메트릭 엔드포인트 라벨)를 업로드 스레드로 넘김
+            future = uploader.submit(contextvars.copy_context().run, upload_image,
+                                     folder, f"{variant['width']}w.{ext}", data, content_type)
+            uploads.append((variant, future))
+        for variant, future in uploads:
+            variant['url'] = future.result()
+
+    variants = sorted((v for v, _ in uploads), key=lambda v: (formats.index(v['format']), v['width']))
+    largest = max(variants, key=lambda v: v['width'])
+    fallback = max((v for v in variants if v['format'] == formats[-1]), key=lambda v: v['width'])
+    return {
+        'width': largest['width'],
+        'height': largest['height'],
+        'src': fallback['url'],
+        'srcset': {fmt: build_srcset(variants, fmt) for fmt in formats},
+        'variants': variants,
+    }
@@ -1,18 +1,25 @@
 # tools/image_tools/urls.py
 
 from django.urls import path
+from .views import async_views
 from .views.resize import resize_image
 from .views.convert import convert_image_format
 from .views.compress import compress_image
 from .views.filter import apply_filter
 from .views.watermark import add_watermark
 from .views.exif_remove import remove_exif_metadata
+from .views.gif import create_animation
+from .views.variants import create_image_variants
+from tools.common.aio import pick_view
 
+# ASYNC_VIEWS=true(ASGI 배포)면 같은 URL에 views/async_views.py의 비동기 뷰를 연결
 urlpatterns = [
-    path('resize/', resize_image),                  # 이미지 리사이즈
-    path('convert/', convert_image_format),         # 포맷 변환
-    path('compress/', compress_image),              # 이미지 압축
-    path('filter/', apply_filter),                  # 필터 적용
-    path('watermark/', add_watermark),              # 워터마크 삽입
-    path('remove-exif/', remove_exif_metadata),     # EXIF 메타데이터 제거
+    path('resize/', pick_view(resize_image, async_views.resize_image)),                          # 이미지 리사이즈
+    path('convert/', pick_view(convert_image_format, async_views.convert_image_format)),         # 포맷 변환
+    path('compress/', pick_view(compress_image, async_views.compress_image)),                    # 이미지 압축
+    path('filter/', pick_view(apply_filter, async_views.apply_filter)),                          # 필터 적용
+    path('watermark/', pick_view(add_watermark, async_views.add_watermark)),                     # 워터마크 삽입
+    path('remove-exif/', pick_view(remove_exif_metadata, async_views.remove_exif_metadata)),     # EXIF 메타데이터 제거
+    path('gif/', pick_view(create_animation, async_views.create_animation)),                     # GIF/애니메이션 WebP 생성
+    path('variants/', pick_view(create_image_variants, async_views.create_image_variants)),      # 반응형 이미지 세트 (srcset)
 ]
@@ -0,0 +1,333 @@
+# tools/image_tools/views/async_views.py
+
+import os
+import uuid
+from django.http import JsonResponse
+from tools.common.inputs import read_input_files
+from tools.common.aio import async_tool_view, run_cpu, run_io, arun_process, aconverter_slot
+from tools.common.scratch import scratch_workspace
+from tools.common.governor import converter_timeout, ConverterBusy, busy_response
+from tools.common.metrics import stage
+from tools.common.logging_utils import log_exception
+from tools.common.zipstream import wants_bundle, azip_response
+from tools.image_tools.services.uploader import aupload_image
+from tools.image_tools.services.exif_cleaner import remove_exif
+from tools.image_tools.services.transforms import (
+    compress_to_jpeg, resize_to_png, convert_image, convert_page_image, apply_image_filter,
+    load_watermark_image, add_watermark_layer
+)
+from tools.image_tools.views.convert import SUPPORTED_FORMATS
+from tools.image_tools.views.compress import ALLOWED_EXTENSIONS, QUALITY_MAP
+from tools.image_tools.services.variants import create_variants
+from tools.image_tools.views.variants import variant_options
+from tools.image_tools.views.gif import animation_options, build_animation, animation_error_response, VIDEO_EXTENSIONS
+
+# pdf2image 기본값과 같은 렌더링 해상도
+PDF_RASTER_DPI = 200
+
+
+@async_tool_view
+async def compress_image(request):
+    """compress_image의 비동기 버전 (ASYNC_VIEWS=True일 때 /api/image/compress/에 연결)"""
+    images = await read_input_files(request, 'images')
+    quality_level = request.POST.get('quality', 'medium').lower()
+
+    if not images:
+        return JsonResponse({'error': '압축할 이미지가 없습니다.'}, status=400)
+
+    quality = QUALITY_MAP.get(quality_level, 65)
+
+    if wants_bundle(request):
+        return azip_response(_compressed_entries(images, quality), "compressed.zip")
+
+    compressed_urls = []
+
+    for img_file in images:
+        if os.path.splitext(img_file.name)[1].lower() not in ALLOWED_EXTENSIONS:
+            continue
+        try:
+            img_io = await run_cpu(compress_to_jpeg, img_file, quality)
+            compressed_urls.append(await aupload_image(
+                folder="compressed",
+                filename=f"{uuid.uuid4()}.jpg",
+                content=img_io.getbuffer(),
+                content_type="image/jpeg"
+            ))
+        except Exception as e:
+            log_exception(e, "Compress error")
+            continue
+
+    return JsonResponse({'compressed_urls': compressed_urls})
+
+
+async def _compressed_entries(images, quality: int):
+    for img_file in images:
+        if os.path.splitext(img_file.name)[1].lower() not in ALLOWED_EXTENSIONS:
+            continue
+        try:
+            img_io = await run_cpu(compress_to_jpeg, img_file, quality)
+        except Exception as e:
+            log_exception(e, "Compress error")
+            continue
+        yield f"{os.path.splitext(img_file.name)[0]}.jpg", img_io.getbuffer()
+
+
+@async_tool_view
+async def resize_image(request):
+    """resize_image의 비동기 버전"""
+    images = await read_input_files(request, 'images')
+    if not images:
+        return JsonResponse({'error': 'images는 필수입니다.'}, status=400)
+
+    try:
+        width = int(request.POST.get('width'))
+        height = int(request.POST.get('height'))
+    except Exception:
+        return JsonResponse({'error': 'width와 height는 정수여야 합니다.'}, status=400)
+
+    resized_urls = []
+
+    for img_file in images:
+        try:
+            img_io = await run_cpu(resize_to_png, img_file, width, height)
+            resized_urls.append(await aupload_image(
+                folder="resized",
+                filename=f"{uuid.uuid4()}.png",
+                content=img_io.getbuffer(),
+                content_type="image/png"
+            ))
+        except Exception as e:
+            log_exception(e, "Resize error")
+            continue
+
+    return JsonResponse({'resized_urls': resized_urls})
+
+
+@async_tool_view
+async def convert_image_format(request):
+    """
+    convert_image_format의 비동기 버전.
+    PDF 입력은 pdftoppm을 asyncio 서브프로세스로 실행해 페이지를 렌더링합니다.
+    """
+    images = await read_input_files(request, 'images')
+    target_format = request.POST.get('format', '').upper()
+
+    if not images or target_format not in SUPPORTED_FORMATS:
+        return JsonResponse({'error': '지원하지 않는 포맷이거나 파일이 없습니다.'}, status=400)
+
+    if target_format == 'PDF':
+        return JsonResponse({'error': '이미지 → PDF 변환은 지원하지 않습니다.'}, status=400)
+
+    ext = SUPPORTED_FORMATS[target_format]
+    suffix = target_format.lower()
+
+    if wants_bundle(request):
+        return azip_response(_converted_entries(images, ext, suffix), "converted.zip")
+
+    converted_urls = []
+
+    try:
+        async for _, page, img_io in _converted_images(images, ext):
+            try:
+                converted_urls.append(await aupload_image(
+                    folder="converted",
+                    filename=f"{uuid.uuid4()}_page{page}.{suffix}" if page else f"{uuid.uuid4()}.{suffix}",
+                    content=img_io.getbuffer(),
+                    content_type=f"image/{suffix}"
+                ))
+            except Exception as e:
+                log_exception(e, "Convert error")
+                continue
+    except ConverterBusy as e:
+        return busy_response(e)
+
+    return JsonResponse({'converted_urls': converted_urls})
+
+
+async def _converted_images(images, ext: str, skip_busy: bool = False):
+    """
+    변환 결과를 (입력 파일, 페이지 번호 또는 None, 이미지 데이터) 순서로 내보냅니다.
+    PDF 입력은 pdftoppm을 asyncio 서브프로세스로 실행해 렌더링한 뒤 페이지마다 하나씩 내보냅니다.
+    실패한 파일은 건너뛰며, 변환기가 바쁘면 skip_busy가 아닐 때 ConverterBusy를 그대로 발생시킵니다.
+    """
+    for uploaded_file in images:
+        try:
+            if uploaded_file.name.lower().endswith('.pdf'):
+                with scratch_workspace(size_hint=uploaded_file.size * 20, prefix="raster") as workspace:
+                    pdf_path = await run_io(workspace.stage_upload, uploaded_file, suffix=".pdf")
+                    page_dir = workspace.mkdir("pages")
+                    async with aconverter_slot('pdftoppm'):
+                        with stage('decode'):
+                            await arun_process(
+                                ["pdftoppm", "-r", str(PDF_RASTER_DPI), pdf_path, os.path.join(page_dir, "page")],
+                                timeout=converter_timeout('pdftoppm'),
+                                cancel_check=workspace.guard()
+                            )
+
+                    # pdftoppm은 페이지 번호를 같은 자릿수로 채우므로 이름순 정렬이 페이지 순서와 같음
+                    for i, page_name in enumerate(sorted(os.listdir(page_dir))):
+                        page_path = os.path.join(page_dir, page_name)
+                        img_io = await run_cpu(convert_page_image, page_path, ext)
+                        os.remove(page_path)
+                        yield uploaded_file, i + 1, img_io
+            else:
+                yield uploaded_file, None, await run_cpu(convert_image, uploaded_file, ext)
+
+        except ConverterBusy as e:
+            if not skip_busy:
+                raise
+            log_exception(e, "Convert error")
+        except Exception as e:
+            log_exception(e, "Convert error")
+            continue
+
+
+async def _converted_entries(images, ext: str, suffix: str):
+    # 응답을 이미 보내기 시작했으므로 변환기가 바쁜 파일도 기록만 하고 건너뜀
+    async for uploaded_file, page, img_io in _converted_images(images, ext, skip_busy=True):
+        stem = os.path.splitext(uploaded_file.name)[0]
+        yield (f"{stem}_page{page}.{suffix}" if page else f"{stem}.{suffix}"), img_io.getbuffer()
+
+
+@async_tool_view
+async def apply_filter(request):
+    """apply_filter의 비동기 버전"""
+    images = await read_input_files(request, 'images')
+    filter_name = request.POST.get('filter', 'grayscale').lower()
+
+    if not images:
+        return JsonResponse({'error': '이미지가 없습니다.'}, status=400)
+
+    filtered_urls = []
+
+    for img_file in images:
+        try:
+            img_io = await run_cpu(apply_image_filter, img_file, filter_name)
+            if img_io is None:
+                continue  # 잘못된 필터 이름 무시
+            filtered_urls.append(await aupload_image(
+                folder="filtered",
+                filename=f"{uuid.uuid4()}_{filter_name}.jpg",
+                content=img_io.getbuffer(),
+                content_type="image/jpeg"
+            ))
+        except Exception as e:
+            log_exception(e, "Filter error")
+            continue
+
+    return JsonResponse({'filtered_urls': filtered_urls})
+
+
+@async_tool_view
+async def add_watermark(request):
+    """add_watermark의 비동기 버전"""
+    images = await read_input_files(request, 'images')
+    wm_type = request.POST.get('type', 'text')
+    text = request.POST.get('text', 'FilePick')
+    opacity = int(request.POST.get('opacity', 128))
+    position = request.POST.get('position', 'bottom-right')
+
+    if not images:
+        return JsonResponse({'error': '이미지가 없습니다.'}, status=400)
+
+    wm_img = None
+    if wm_type == 'image' and request.FILES.get('watermark_image'):
+        try:
+            wm_img = await run_cpu(load_watermark_image, request.FILES['watermark_image'])
+        except Exception as e:
+            log_exception(e, "Failed to open watermark image")
+
+    result_urls = []
+
+    for img_file in images:
+        try:
+            img_io = await run_cpu(add_watermark_layer, img_file, wm_type, text, opacity, position, wm_img)
+            result_urls.append(await aupload_image(
+                folder="watermarked",
+                filename=f"{uuid.uuid4()}_watermarked.jpg",
+                content=img_io.getbuffer(),
+                content_type="image/jpeg"
+            ))
+        except Exception as e:
+            log_exception(e, "Watermark error")
+            continue
+
+    return JsonResponse({'watermarked_urls': result_urls})
+
+
+@async_tool_view
+async def remove_exif_metadata(request):
+    """remove_exif_metadata의 비동기 버전"""
+    images = await read_input_files(request, 'images')
+    if not images:
+        return JsonResponse({'error': '파일이 없습니다.'}, status=400)
+
+    cleaned_urls = []
+
+    for img in images:
+        try:
+            with stage('process'):
+                cleaned_io = await run_cpu(remove_exif, img)
+            cleaned_urls.append(await aupload_image(
+                folder="no_exif",
+                filename=f"{uuid.uuid4()}_noexif.{img.name.split('.')[-1].lower()}",
+                content=cleaned_io.getbuffer(),
+                content_type=img.content_type
+            ))
+        except Exception as e:
+            log_exception(e, "EXIF remove error")
+            continue
+
+    return JsonResponse({'cleaned_urls': cleaned_urls})
+
+
+@async_tool_view
+async def create_animation(request):
+    """
+    create_animation의 비동기 버전
+    GIF 프레임 인코딩과 청크 업로드가 한 흐름으로 이어지므로 전체를 I/O 실행기에서 실행합니다.
+    """
+    videos = await read_input_files(request, 'file')
+    video = videos[0] if videos else None
+    images = [] if video else await read_input_files(request, 'images')
+    if video and not video.name.lower().endswith(VIDEO_EXTENSIONS):
+        return JsonResponse({'error': f'동영상 파일({", ".join(VIDEO_EXTENSIONS)})이 필요합니다.'}, status=400)
+    if not video and not images:
+        return JsonResponse({'error': 'images 또는 file이 필요합니다.'}, status=400)
+
+    try:
+        options = animation_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'옵션 형식이 잘못되었습니다: {e}'}, status=400)
+
+    try:
+        return JsonResponse(await run_io(build_animation, video, images, options))
+    except Exception as e:
+        return animation_error_response(e)
+
+
+@async_tool_view
+async def create_image_variants(request):
+    """
+    create_image_variants의 비동기 버전
+    크기별 인코딩과 업로드는 서비스 안의 스레드 풀에서 동시에 진행되므로 이미지 하나를 I/O 실행기에서 처리합니다.
+    """
+    images = await read_input_files(request, 'images')
+    if not images:
+        return JsonResponse({'error': 'images는 필수입니다.'}, status=400)
+
+    try:
+        options = variant_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'widths, formats 형식이 잘못되었습니다: {e}'}, status=400)
+
+    manifests = []
+
+    for img_file in images:
+        try:
+            manifests.append({'name': img_file.name, **await run_io(create_variants, img_file, **options)})
+        except Exception as e:
+            log_exception(e, "Variants error")
+            continue
+
+    return JsonResponse({'images': manifests})
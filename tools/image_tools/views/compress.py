@@ -1,15 +1,27 @@
 # tools/image_tools/views/compress.py
 
 import os
-import io
 import uuid
-from PIL import Image
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
 from tools.image_tools.services.uploader import upload_image
+from tools.common.logging_utils import log_exception
+from tools.common.zipstream import wants_bundle, zip_response
+from tools.image_tools.services.transforms import compress_to_jpeg
+
+# 지원 포맷
+ALLOWED_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp']
+
+# 품질 매핑
+QUALITY_MAP = {
+    'high': 85,
+    'medium': 65,
+    'low': 40
+}
 
 
 @swagger_auto_schema(
@@ -31,6 +43,13 @@ from tools.image_tools.services.uploader import upload_image
             required=False,
             default='medium'
         ),
+        openapi.Parameter(
+            'bundle',
+            openapi.IN_FORM,
+            type=openapi.TYPE_STRING,
+            description='zip이면 URL 목록 대신 결과를 ZIP으로 스트리밍',
+            required=False
+        ),
     ]
 )
 @api_view(['POST'])
@@ -38,36 +57,28 @@ from tools.image_tools.services.uploader import upload_image
 def compress_image(request):
     """
     여러 이미지를 JPEG로 압축하여 Supabase에 업로드하고 public URL 목록을 반환합니다.
+    bundle=zip이면 업로드 없이 압축 결과를 하나씩 ZIP에 담아 바로 스트리밍합니다.
     """
-    images = request.FILES.getlist('images')
+    images = get_input_files(request, 'images')
     quality_level = request.POST.get('quality', 'medium').lower()
 
     if not images:
         return JsonResponse({'error': '압축할 이미지가 없습니다.'}, status=400)
 
-    # 지원 포맷
-    allowed_extensions = ['.jpg', '.jpeg', '.png', '.webp']
+    quality = QUALITY_MAP.get(quality_level, 65)
 
-    # 품질 매핑
-    quality_map = {
-        'high': 85,
-        'medium': 65,
-        'low': 40
-    }
-    quality = quality_map.get(quality_level, 65)
+    if wants_bundle(request):
+        return zip_response(_compressed_entries(images, quality), "compressed.zip")
 
     compressed_urls = []
 
     for img_file in images:
         ext = os.path.splitext(img_file.name)[1].lower()
-        if ext not in allowed_extensions:
+        if ext not in ALLOWED_EXTENSIONS:
             continue
 
         try:
-            img = Image.open(img_file).convert("RGB")
-            img_io = io.BytesIO()
-            img.save(img_io, "JPEG", quality=quality)
-            img_io.seek(0)
+            img_io = compress_to_jpeg(img_file, quality)
 
             filename = f"{uuid.uuid4()}.jpg"
             public_url = upload_image(
@@ -79,7 +90,20 @@ def compress_image(request):
             compressed_urls.append(public_url)
 
         except Exception as e:
-            print("Compress error:", e)
+            log_exception(e, "Compress error")
             continue
 
     return JsonResponse({'compressed_urls': compressed_urls})
+
+
+def _compressed_entries(images, quality: int):
+    """압축 결과를 (ZIP 항목 이름, JPEG 데이터) 순서로 내보냅니다. 실패한 이미지는 건너뜁니다."""
+    for img_file in images:
+        if os.path.splitext(img_file.name)[1].lower() not in ALLOWED_EXTENSIONS:
+            continue
+        try:
+            img_io = compress_to_jpeg(img_file, quality)
+        except Exception as e:
+            log_exception(e, "Compress error")
+            continue
+        yield f"{os.path.splitext(img_file.name)[0]}.jpg", img_io.getbuffer()
@@ -1,14 +1,20 @@
 # tools/image_tools/views/convert.py
 
-import io
+import os
 import uuid
-from PIL import Image
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
+from tools.common.scratch import scratch_workspace
+from tools.common.governor import converter_slot, converter_timeout, ConverterBusy, busy_response
 from tools.image_tools.services.uploader import upload_image
+from tools.common.logging_utils import log_exception
+from tools.common.metrics import stage
+from tools.common.zipstream import wants_bundle, zip_response
+from tools.image_tools.services.transforms import convert_image, convert_page_image
 
 # 지원 포맷 매핑
 SUPPORTED_FORMATS = {
@@ -40,6 +46,13 @@ SUPPORTED_FORMATS = {
             description='변환할 포맷 (예: PNG, JPG)',
             required=True
         ),
+        openapi.Parameter(
+            'bundle',
+            openapi.IN_FORM,
+            type=openapi.TYPE_STRING,
+            description='zip이면 URL 목록 대신 결과(PDF는 페이지별 이미지)를 ZIP으로 스트리밍',
+            required=False
+        ),
     ]
 )
 @api_view(['POST'])
@@ -47,8 +60,9 @@ SUPPORTED_FORMATS = {
 def convert_image_format(request):
     """
     업로드된 이미지 또는 PDF 파일들을 지정된 포맷으로 변환하여 Supabase에 업로드하고 URL을 반환합니다.
+    bundle=zip이면 업로드 없이 변환 결과(페이지)가 나오는 대로 ZIP에 담아 스트리밍합니다.
     """
-    images = request.FILES.getlist('images')
+    images = get_input_files(request, 'images')
     target_format = request.POST.get('format', '').upper()
 
     if not images or target_format not in SUPPORTED_FORMATS:
@@ -59,36 +73,43 @@ def convert_image_format(request):
         return JsonResponse({'error': '이미지 → PDF 변환은 지원하지 않습니다.'}, status=400)
 
     ext = SUPPORTED_FORMATS[target_format]
+
+    if wants_bundle(request):
+        return zip_response(_converted_entries(images, ext, target_format.lower()), "converted.zip")
+
     converted_urls = []
 
     for uploaded_file in images:
         try:
             # PDF 파일 처리
             if uploaded_file.name.lower().endswith('.pdf'):
-                from pdf2image import convert_from_bytes
-                pdf_bytes = uploaded_file.read()
-                pages = convert_from_bytes(pdf_bytes)
-
-                for i, page in enumerate(pages):
-                    img_io = io.BytesIO()
-                    page.convert("RGB").save(img_io, ext)
-                    img_io.seek(0)
-
-                    filename = f"{uuid.uuid4()}_page{i+1}.{target_format.lower()}"
-                    public_url = upload_image(
-                        folder="converted",
-                        filename=filename,
-                        content=img_io.getbuffer(),
-                        content_type=f"image/{target_format.lower()}"
-                    )
-                    converted_urls.append(public_url)
+                from pdf2image import convert_from_path
+
+                # 페이지를 스크래치 디렉터리에 파일로 렌더링한 뒤 한 장씩 열어 메모리 사용량을 페이지 하나로 제한
+                with scratch_workspace(size_hint=uploaded_file.size * 20, prefix="raster") as workspace:
+                    pdf_path = workspace.stage_upload(uploaded_file, suffix=".pdf")
+                    with converter_slot('pdftoppm'), stage('decode'):
+                        page_paths = convert_from_path(pdf_path, output_folder=workspace.path, paths_only=True,
+                                                       timeout=converter_timeout('pdftoppm'))
+                    # pdf2image는 실행 중 취소 훅이 없어 렌더링이 끝난 뒤 한도를 확인
+                    workspace.check_quota()
+
+                    for i, page_path in enumerate(page_paths):
+                        img_io = convert_page_image(page_path, ext)
+                        os.remove(page_path)
+
+                        filename = f"{uuid.uuid4()}_page{i+1}.{target_format.lower()}"
+                        public_url = upload_image(
+                            folder="converted",
+                            filename=filename,
+                            content=img_io.getbuffer(),
+                            content_type=f"image/{target_format.lower()}"
+                        )
+                        converted_urls.append(public_url)
 
             # 일반 이미지 처리
             else:
-                img = Image.open(uploaded_file).convert("RGB")
-                img_io = io.BytesIO()
-                img.save(img_io, ext)
-                img_io.seek(0)
+                img_io = convert_image(uploaded_file, ext)
 
                 filename = f"{uuid.uuid4()}.{target_format.lower()}"
                 public_url = upload_image(
@@ -99,8 +120,41 @@ def convert_image_format(request):
                 )
                 converted_urls.append(public_url)
 
+        except ConverterBusy as e:
+            return busy_response(e)
         except Exception as e:
-            print("Convert error:", e)
+            log_exception(e, "Convert error")
             continue
 
     return JsonResponse({'converted_urls': converted_urls})
+
+
+def _converted_entries(images, ext: str, suffix: str):
+    """
+    변환 결과를 (ZIP 항목 이름, 이미지 데이터) 순서로 내보냅니다. PDF는 페이지마다 하나씩 내보냅니다.
+    응답을 이미 보내기 시작했으므로 변환기가 바쁘거나 실패한 파일은 기록만 하고 건너뜁니다.
+    """
+    for uploaded_file in images:
+        stem = os.path.splitext(uploaded_file.name)[0]
+        try:
+            if uploaded_file.name.lower().endswith('.pdf'):
+                from pdf2image import convert_from_path
+
+                with scratch_workspace(size_hint=uploaded_file.size * 20, prefix="raster") as workspace:
+                    pdf_path = workspace.stage_upload(uploaded_file, suffix=".pdf")
+                    with converter_slot('pdftoppm'), stage('decode'):
+                        page_paths = convert_from_path(pdf_path, output_folder=workspace.path, paths_only=True,
+                                                       timeout=converter_timeout('pdftoppm'))
+                    # pdf2image는 실행 중 취소 훅이 없어 렌더링이 끝난 뒤 한도를 확인
+                    workspace.check_quota()
+
+                    for i, page_path in enumerate(page_paths):
+                        img_io = convert_page_image(page_path, ext)
+                        os.remove(page_path)
+                        yield f"{stem}_page{i+1}.{suffix}", img_io.getbuffer()
+            else:
+                yield f"{stem}.{suffix}", convert_image(uploaded_file, ext).getbuffer()
+
+        except Exception as e:
+            log_exception(e, "Convert error")
+            continue
@@ -6,8 +6,11 @@ from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
 from tools.image_tools.services.exif_cleaner import remove_exif
 from tools.image_tools.services.uploader import upload_image
+from tools.common.logging_utils import log_exception
+from tools.common.metrics import stage
 
 @swagger_auto_schema(
     method='post',
@@ -25,7 +28,7 @@ from tools.image_tools.services.uploader import upload_image
 @api_view(['POST'])
 @parser_classes([MultiPartParser])
 def remove_exif_metadata(request):
-    images = request.FILES.getlist('images')
+    images = get_input_files(request, 'images')
     if not images:
         return JsonResponse({'error': '파일이 없습니다.'}, status=400)
 
@@ -33,7 +36,8 @@ def remove_exif_metadata(request):
 
     for img in images:
         try:
-            cleaned_io = remove_exif(img)
+            with stage('process'):
+                cleaned_io = remove_exif(img)
             filename = f"{uuid.uuid4()}_noexif.{img.name.split('.')[-1].lower()}"
 
             public_url = upload_image(
@@ -44,7 +48,7 @@ def remove_exif_metadata(request):
             )
             cleaned_urls.append(public_url)
         except Exception as e:
-            print("EXIF remove error:", e)
+            log_exception(e, "EXIF remove error")
             continue
 
     return JsonResponse({'cleaned_urls': cleaned_urls})
@@ -0,0 +1,106 @@
+# tools/image_tools/views/gif.py
+
+import os
+import subprocess
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_file, get_input_files
+from tools.common.scratch import staged_upload_path, ScratchQuotaExceeded
+from tools.common.governor import ConverterBusy, busy_response
+from tools.common.logging_utils import log_exception
+from tools.file_convert_tools.services.media import parse_timecode
+from tools.image_tools.services.animation import (
+    animate_images, animate_video, AnimationError, ANIMATION_FORMATS, ANIMATION_MAX_FPS
+)
+
+# 동영상 입력으로 처리하는 확장자
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.m4v', '.mkv', '.webm', '.avi')
+
+
+def animation_options(request) -> dict:
+    """요청에서 애니메이션 옵션을 읽습니다. 형식이 잘못되었으면 ValueError를 발생시킵니다."""
+    fmt = request.POST.get('format', 'gif').lower()
+    if fmt not in ANIMATION_FORMATS:
+        raise ValueError(f"format은 {', '.join(ANIMATION_FORMATS)} 중 하나여야 합니다.")
+    fps = float(request.POST.get('fps', 10))
+    if not 0 < fps <= ANIMATION_MAX_FPS:
+        raise ValueError(f"fps는 0보다 크고 {ANIMATION_MAX_FPS} 이하여야 합니다.")
+    width = int(request.POST.get('width', 480))
+    if width <= 0:
+        raise ValueError("width는 양수여야 합니다.")
+    loop = int(request.POST.get('loop', 0))
+    if loop < 0:
+        raise ValueError("loop는 0 이상이어야 합니다.")
+    return {
+        'fmt': fmt, 'fps': fps, 'width': width, 'loop': loop,
+        'start': parse_timecode(request.POST['start']) if request.POST.get('start') else None,
+        'duration': parse_timecode(request.POST['duration']) if request.POST.get('duration') else None,
+    }
+
+
+def build_animation(video, images: list, options: dict) -> dict:
+    """동영상이 있으면 동영상 구간으로, 없으면 이미지 묶음으로 애니메이션을 만듭니다 (start/duration은 동영상에만 적용)."""
+    if video:
+        suffix = os.path.splitext(video.name)[1].lower()
+        with staged_upload_path(video, suffix=suffix) as input_path:
+            return animate_video(input_path, **options)
+    options = {k: v for k, v in options.items() if k not in ('start', 'duration')}
+    return animate_images(images, **options)
+
+
+def animation_error_response(e: Exception):
+    """애니메이션 생성 중 예외 → 응답 변환 (동기/비동기 뷰 공용)"""
+    if isinstance(e, AnimationError):
+        return JsonResponse({'error': str(e)}, status=e.status)
+    if isinstance(e, ConverterBusy):
+        return busy_response(e)
+    if isinstance(e, subprocess.TimeoutExpired):
+        return JsonResponse({'error': '변환 시간이 초과되었습니다.'}, status=504)
+    if isinstance(e, ScratchQuotaExceeded):
+        return JsonResponse({'error': str(e)}, status=507)
+    if isinstance(e, subprocess.CalledProcessError):
+        return JsonResponse({'error': f'변환 실패: {(e.stderr or b"").decode("utf-8", errors="ignore")}'}, status=500)
+    log_exception(e, "Animation error")
+    return JsonResponse({'error': f'애니메이션 생성 실패: {str(e)}'}, status=500)
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter('images', openapi.IN_FORM, type=openapi.TYPE_FILE, description='프레임 이미지들 (순서대로)', multiple=True),
+        openapi.Parameter('file', openapi.IN_FORM, type=openapi.TYPE_FILE, description='동영상 파일 (images 대신)'),
+        openapi.Parameter('format', openapi.IN_FORM, type=openapi.TYPE_STRING, enum=list(ANIMATION_FORMATS), default='gif'),
+        openapi.Parameter('fps', openapi.IN_FORM, type=openapi.TYPE_NUMBER, description=f'초당 프레임 수 (최대 {ANIMATION_MAX_FPS})', default=10),
+        openapi.Parameter('width', openapi.IN_FORM, type=openapi.TYPE_INTEGER, description='출력 가로 크기 (확대하지 않음)', default=480),
+        openapi.Parameter('loop', openapi.IN_FORM, type=openapi.TYPE_INTEGER, description='반복 횟수 (0: 무한)', default=0),
+        openapi.Parameter('start', openapi.IN_FORM, type=openapi.TYPE_STRING, description='동영상 시작 시각 (초 또는 HH:MM:SS)'),
+        openapi.Parameter('duration', openapi.IN_FORM, type=openapi.TYPE_STRING, description='동영상 구간 길이 (초 또는 HH:MM:SS)'),
+    ],
+    responses={200: '애니메이션 URL, 프레임 수, 크기', 413: '프레임 수 × 크기 한도 초과'}
+)
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def create_animation(request):
+    """
+    이미지 묶음 또는 동영상 구간으로 GIF/애니메이션 WebP를 만듭니다.
+    이미지는 공통 팔레트로 프레임을 하나씩 인코딩하며 업로드하고, 동영상은 ffmpeg palettegen/paletteuse 2단계로 처리합니다.
+    """
+    video = get_input_file(request, 'file')
+    images = [] if video else get_input_files(request, 'images')
+    if video and not video.name.lower().endswith(VIDEO_EXTENSIONS):
+        return JsonResponse({'error': f'동영상 파일({", ".join(VIDEO_EXTENSIONS)})이 필요합니다.'}, status=400)
+    if not video and not images:
+        return JsonResponse({'error': 'images 또는 file이 필요합니다.'}, status=400)
+
+    try:
+        options = animation_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'옵션 형식이 잘못되었습니다: {e}'}, status=400)
+
+    try:
+        return JsonResponse(build_animation(video, images, options))
+    except Exception as e:
+        return animation_error_response(e)
@@ -1,14 +1,15 @@
 # tools/image_tools/views/resize.py
 
-import io
 import uuid
-from PIL import Image
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
 from tools.image_tools.services.uploader import upload_image
+from tools.common.logging_utils import log_exception
+from tools.image_tools.services.transforms import resize_to_png
 
 
 @swagger_auto_schema(
@@ -33,7 +34,7 @@ def resize_image(request):
     여러 이미지를 입력받아 지정된 크기로 리사이즈한 후,
     Supabase Storage에 업로드하고 public URL 목록을 반환합니다.
     """
-    images = request.FILES.getlist('images')
+    images = get_input_files(request, 'images')
     if not images:
         return JsonResponse({'error': 'images는 필수입니다.'}, status=400)
 
@@ -47,13 +48,8 @@ def resize_image(request):
 
     for img_file in images:
         try:
-            img = Image.open(img_file)
-            resized_img = img.resize((width, height))
-
-            # BytesIO에 저장
-            img_io = io.BytesIO()
-            resized_img.save(img_io, format='PNG')
-            img_io.seek(0)
+            # 리사이즈 후 PNG로 인코딩
+            img_io = resize_to_png(img_file, width, height)
 
             # 고유 파일명 생성
             filename = f"{uuid.uuid4()}.png"
@@ -68,7 +64,7 @@ def resize_image(request):
             resized_urls.append(public_url)
 
         except Exception as e:
-            print("Resize error:", e)
+            log_exception(e, "Resize error")
             continue
 
     return JsonResponse({'resized_urls': resized_urls})
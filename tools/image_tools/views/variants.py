@@ -0,0 +1,80 @@
+# tools/image_tools/views/variants.py
+
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import MultiPartParser
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from tools.common.inputs import get_input_files
+from tools.common.logging_utils import log_exception
+from tools.image_tools.services.variants import (
+    create_variants, VARIANT_FORMATS, IMAGE_VARIANT_WIDTHS, IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_MAX_WIDTHS, IMAGE_VARIANT_MAX_WIDTH
+)
+
+
+def variant_options(request) -> dict:
+    """요청에서 폭/형식 목록을 읽습니다. 형식이 잘못되었으면 ValueError를 발생시킵니다."""
+    widths = IMAGE_VARIANT_WIDTHS
+    if request.POST.get('widths'):
+        widths = [int(w) for w in request.POST['widths'].split(',') if w.strip()]
+    if not widths or len(widths) > IMAGE_VARIANT_MAX_WIDTHS:
+        raise ValueError(f"widths는 1~{IMAGE_VARIANT_MAX_WIDTHS}개여야 합니다.")
+    if any(not 0 < w <= IMAGE_VARIANT_MAX_WIDTH for w in widths):
+        raise ValueError(f"widths는 1~{IMAGE_VARIANT_MAX_WIDTH} 사이여야 합니다.")
+
+    formats = IMAGE_VARIANT_FORMATS
+    if request.POST.get('formats'):
+        formats = [f.strip().lower() for f in request.POST['formats'].split(',') if f.strip()]
+        formats = ['jpeg' if f == 'jpg' else f for f in formats]
+    unknown = [f for f in formats if f not in VARIANT_FORMATS]
+    if not formats or unknown:
+        raise ValueError(f"formats는 {', '.join(VARIANT_FORMATS)} 중에서 골라야 합니다.")
+    return {'widths': list(widths), 'formats': list(dict.fromkeys(formats))}
+
+
+@swagger_auto_schema(
+    method='post',
+    manual_parameters=[
+        openapi.Parameter(
+            name='images',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_FILE,
+            description='여러 이미지 파일',
+            required=True,
+            multiple=True
+        ),
+        openapi.Parameter('widths', openapi.IN_FORM, type=openapi.TYPE_STRING,
+                          description=f'출력 폭 목록 (쉼표 구분, 기본: {",".join(map(str, IMAGE_VARIANT_WIDTHS))})'),
+        openapi.Parameter('formats', openapi.IN_FORM, type=openapi.TYPE_STRING,
+                          description=f'출력 형식 목록 ({", ".join(VARIANT_FORMATS)} 중, 쉼표 구분, '
+                                      f'기본: {",".join(IMAGE_VARIANT_FORMATS)}, 마지막 형식이 대체 이미지)'),
+    ],
+    responses={200: '이미지별 srcset 매니페스트'}
+)
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def create_image_variants(request):
+    """
+    이미지마다 여러 폭 × 형식의 반응형 이미지 세트를 만들고 srcset 매니페스트를 반환합니다.
+    원본은 한 번만 디코딩하고, 큰 폭부터 차례로 줄이면서 형식별 인코딩과 업로드를 동시에 진행합니다.
+    """
+    images = get_input_files(request, 'images')
+    if not images:
+        return JsonResponse({'error': 'images는 필수입니다.'}, status=400)
+
+    try:
+        options = variant_options(request)
+    except ValueError as e:
+        return JsonResponse({'error': f'widths, formats 형식이 잘못되었습니다: {e}'}, status=400)
+
+    manifests = []
+
+    for img_file in images:
+        try:
+            manifests.append({'name': img_file.name, **create_variants(img_file, **options)})
+        except Exception as e:
+            log_exception(e, "Variants error")
+            continue
+
+    return JsonResponse({'images': manifests})
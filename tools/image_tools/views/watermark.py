@@ -1,14 +1,15 @@
 # tools/image_tools/views/watermark.py
 
-import io
 import uuid
-from PIL import Image, ImageDraw, ImageFont
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
 from tools.image_tools.services.uploader import upload_image
+from tools.common.logging_utils import log_exception
+from tools.image_tools.services.transforms import load_watermark_image, add_watermark_layer
 
 
 @swagger_auto_schema(
@@ -28,7 +29,7 @@ def add_watermark(request):
     """
     이미지에 텍스트 또는 이미지 워터마크를 삽입한 후 Supabase에 업로드합니다.
     """
-    images = request.FILES.getlist('images')
+    images = get_input_files(request, 'images')
     wm_type = request.POST.get('type', 'text')
     text = request.POST.get('text', 'FilePick')
     opacity = int(request.POST.get('opacity', 128))
@@ -41,47 +42,16 @@ def add_watermark(request):
     wm_img = None
     if wm_type == 'image' and request.FILES.get('watermark_image'):
         try:
-            wm_img = Image.open(request.FILES['watermark_image']).convert("RGBA")
+            wm_img = load_watermark_image(request.FILES['watermark_image'])
         except Exception as e:
-            print("Failed to open watermark image:", e)
+            log_exception(e, "Failed to open watermark image")
             wm_img = None
 
     result_urls = []
 
     for img_file in images:
         try:
-            base_img = Image.open(img_file).convert("RGBA")
-            watermark_layer = Image.new("RGBA", base_img.size, (0, 0, 0, 0))
-
-            if wm_type == 'text':
-                draw = ImageDraw.Draw(watermark_layer)
-                font_size = int(min(base_img.size) * 0.05)
-                try:
-                    font = ImageFont.truetype("/Library/Fonts/Arial.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-
-                bbox = draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                x, y = get_position(position, base_img.size, (text_width, text_height))
-
-                draw.text((x, y), text, fill=(0, 0, 0, opacity), font=font)
-
-            elif wm_type == 'image' and wm_img:
-                wm_resized = wm_img.resize((int(base_img.size[0] * 0.25), int(base_img.size[1] * 0.25)))
-                if opacity < 255:
-                    alpha = wm_resized.getchannel('A')
-                    new_alpha = alpha.point(lambda p: int(p * (opacity / 255)))
-                    wm_resized.putalpha(new_alpha)
-
-                x, y = get_position(position, base_img.size, wm_resized.size)
-                watermark_layer.paste(wm_resized, (x, y), wm_resized)
-
-            final_img = Image.alpha_composite(base_img, watermark_layer).convert("RGB")
-            img_io = io.BytesIO()
-            final_img.save(img_io, "JPEG")
-            img_io.seek(0)
+            img_io = add_watermark_layer(img_file, wm_type, text, opacity, position, wm_img)
 
             filename = f"{uuid.uuid4()}_watermarked.jpg"
             public_url = upload_image(
@@ -93,28 +63,8 @@ def add_watermark(request):
             result_urls.append(public_url)
 
         except Exception as e:
-            print("Watermark error:", e)
+            log_exception(e, "Watermark error")
             continue
 
     return JsonResponse({'watermarked_urls': result_urls})
 
-
-def get_position(position, base_size, wm_size):
-    """
-    워터마크 위치를 계산합니다.
-    """
-    bx, by = base_size
-    wx, wy = wm_size
-
-    if position == 'top-left':
-        return (10, 10)
-    elif position == 'top-right':
-        return (bx - wx - 10, 10)
-    elif position == 'bottom-left':
-        return (10, by - wy - 10)
-    elif position == 'center':
-        return ((bx - wx) // 2, (by - wy) // 2)
-    elif position == 'bottom-right':
-        return (bx - wx - 10, by - wy - 10)
-    else:
-        return (10, 10)
@@ -0,0 +1,337 @@
+# tools/jobs/services/queue.py
+
+import os
+import time
+import errno
+import uuid
+import shutil
+import tempfile
+import threading
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+import httpx
+from tools.common.logging_utils import log_exception, log_info
+from tools.common.process import ProcessCancelled
+from tools.common.governor import patient_admission, ConverterBusy
+from tools.common.threads import pool_size
+from tools.common.progress import ProgressReporter
+from tools.jobs.models import Job
+
+# 큐별 동시 실행 수 (settings.JOB_QUEUES로 재정의 가능)
+DEFAULT_QUEUES = {
+    'media': 2,
+    'document': 2,
+    'pdf': 4,
+}
+
+# 비동기 작업 입력 파일을 보관하는 디렉터리
+JOB_FILES_DIR = getattr(settings, 'JOB_FILES_DIR', os.path.join(tempfile.gettempdir(), 'filepick-jobs'))
+
+# 재시도 대기 시간 = RETRY_BASE_DELAY * 2^(시도 횟수 - 1) 초
+RETRY_BASE_DELAY = 2
+
+# 실행 중 취소 여부를 DB에서 다시 확인하는 최소 간격 (초)
+CANCEL_CHECK_INTERVAL = 1.0
+
+# 실행 중인 작업이 updated_at을 갱신하는 간격 (초)
+JOB_HEARTBEAT_INTERVAL = getattr(settings, 'JOB_HEARTBEAT_INTERVAL', 30)
+
+# 이 시간(초) 동안 갱신이 없는 실행 중 작업은 작업자가 중단된 것으로 보고 회수
+JOB_STALE_AFTER = getattr(settings, 'JOB_STALE_AFTER', 5 * 60)
+
+# 재시도하는 일시적 오류 (그 외 오류는 같은 입력으로 다시 실행해도 실패하므로 바로 실패 처리)
+# 프로세스 시간 초과(TimeoutExpired)는 같은 입력이면 다시 초과하므로 재시도하지 않음
+# (변환기 슬롯 대기 시간 초과는 ConverterBusy로 구분됨)
+TRANSIENT_ERRORS = (ConverterBusy, httpx.TransportError)
+
+# 재시도하는 OSError의 errno (디스크 공간/파일 디스크립터 부족 등 자원 부족)
+# 실행 파일 없음(ENOENT), 권한 오류, Pillow의 이미지 판별 실패 등 그 밖의 OSError는 바로 실패 처리
+TRANSIENT_ERRNOS = {errno.ENOSPC, errno.EAGAIN, errno.EMFILE, errno.ENFILE}
+
+_executors = {}
+_executors_lock = threading.Lock()
+_resumed = False
+
+
+def is_transient(error: Exception) -> bool:
+    """다시 실행하면 성공할 수 있는 오류인지 반환합니다."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    return isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 실행이 중단된 경우"""
+
+
+class JobContext:
+    """
+    작업 함수에 전달되는 실행 컨텍스트입니다.
+    취소 여부 확인(is_cancelled / check_cancelled)과 진행률 기록(progress)을 제공합니다.
+    """
+
+    def __init__(self, job: Job):
+        self.job_id = job.id
+        self.attempt = job.attempts
+        self.progress = ProgressReporter(str(job.id))
+        self._last_check = 0.0
+        self._cancelled = False
+
+    def is_cancelled(self) -> bool:
+        now = time.monotonic()
+        if not self._cancelled and now - self._last_check >= CANCEL_CHECK_INTERVAL:
+            self._last_check = now
+            self._cancelled = Job.objects.filter(pk=self.job_id, cancel_requested=True).exists()
+        return self._cancelled
+
+    def check_cancelled(self):
+        if self.is_cancelled():
+            raise JobCancelled()
+
+
+def wants_async(request) -> bool:
+    """요청에 async=true 옵션이 있는지 확인합니다."""
+    value = request.POST.get('async') or request.GET.get('async') or ''
+    return value.lower() in ('true', '1', 'yes')
+
+
+def job_accepted(job: Job) -> JsonResponse:
+    """작업 접수 응답 (202 Accepted)"""
+    return JsonResponse({
+        'job_id': str(job.id),
+        'status': job.status,
+        'status_url': f"/api/jobs/{job.id}/",
+        'progress_url': f"/api/jobs/{job.id}/progress/",
+        'events_url': f"/api/jobs/{job.id}/events/",
+    }, status=202)
+
+
+def submit_job(task: str, queue: str, files=None, params: dict = None, max_attempts: int = 3) -> Job:
+    """
+    작업을 등록하고 즉시 반환합니다.
+
+    task: 작업 함수의 import 경로 (예: "tools.file_convert_tools.tasks.office_to_pdf")
+          작업 함수는 task(context, inputs, **params) 형태이며 결과 dict를 반환합니다.
+    files: 업로드 파일 목록. 요청이 끝나면 사라지므로 작업 디렉터리에 청크 단위로 복사해 둡니다.
+    """
+    if queue not in _queue_sizes():
+        raise ValueError(f"알 수 없는 큐입니다: {queue}")
+
+    job_id = uuid.uuid4()
+    inputs = []
+    if files:
+        job_dir = os.path.join(JOB_FILES_DIR, str(job_id))
+        os.makedirs(job_dir, exist_ok=True)
+        for idx, uploaded_file in enumerate(files):
+            ext = os.path.splitext(uploaded_file.name)[1].lower()
+            path = os.path.join(job_dir, f"{idx}{ext}")
+            _store_upload(uploaded_file, path)
+            inputs.append({'name': uploaded_file.name, 'path': path})
+
+    job = Job.objects.create(
+        id=job_id,
+        queue=queue,
+        task=task,
+        payload={'inputs': inputs, 'params': params or {}},
+        max_attempts=max_attempts
+    )
+    ProgressReporter(str(job.id)).update('queued')
+    _dispatch(job)
+    return job
+
+
+def _store_upload(uploaded_file, path: str):
+    """
+    업로드 파일을 작업 디렉터리에 보관합니다.
+    디스크에 스풀된 업로드는 같은 파일시스템이면 하드 링크로 복사 없이 보관하고,
+    그 외에는 청크 단위로 복사합니다.
+    """
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        try:
+            os.link(uploaded_file.temporary_file_path(), path)
+            return
+        except OSError:
+            pass
+    with open(path, 'wb') as dst:
+        for chunk in uploaded_file.chunks():
+            dst.write(chunk)
+
+
+def cancel_job(job_id) -> Job:
+    """
+    작업 취소를 요청합니다.
+    대기 중인 작업은 즉시 취소되고, 실행 중인 작업은 다음 취소 확인 시점에 중단됩니다.
+    """
+    Job.objects.filter(pk=job_id).exclude(status__in=Job.FINISHED_STATUSES).update(
+        cancel_requested=True, updated_at=timezone.now()
+    )
+    cancelled = Job.objects.filter(pk=job_id, status=Job.STATUS_QUEUED).update(
+        status=Job.STATUS_CANCELLED, finished_at=timezone.now(), updated_at=timezone.now()
+    )
+    job = Job.objects.get(pk=job_id)
+    if cancelled:
+        ProgressReporter(str(job.id)).update('cancelled')
+        _cleanup_files(job)
+    return job
+
+
+def resume_pending_jobs():
+    """
+    프로세스 재시작 등으로 실행되지 못한 대기 작업을 다시 큐에 넣습니다.
+    실행 권한은 _run_job에서 원자적으로 획득하므로 여러 프로세스가 호출해도 중복 실행되지 않습니다.
+    """
+    reclaim_stale_jobs()
+    for job in Job.objects.filter(status=Job.STATUS_QUEUED):
+        _dispatch(job)
+
+
+def reclaim_stale_jobs() -> int:
+    """
+    실행 중 상태로 JOB_STALE_AFTER초 넘게 갱신이 없는 작업(작업자 종료/재배포로 중단됨)을 회수합니다.
+    시도 횟수가 남았으면 대기 상태로 되돌리고, 모두 썼으면 실패로 끝내 입력 파일을 정리합니다.
+    상태 전환은 조회한 updated_at이 그대로일 때만 하므로 여러 프로세스가 동시에 호출해도 한 번만 회수됩니다.
+    """
+    cutoff = timezone.now() - timedelta(seconds=JOB_STALE_AFTER)
+    reclaimed = 0
+    for job in Job.objects.filter(status=Job.STATUS_RUNNING, updated_at__lt=cutoff):
+        stale = Job.objects.filter(pk=job.pk, status=Job.STATUS_RUNNING, updated_at=job.updated_at)
+        error = "작업자가 실행 중에 중단되었습니다."
+        if job.cancel_requested or job.attempts >= job.max_attempts:
+            status = Job.STATUS_CANCELLED if job.cancel_requested else Job.STATUS_FAILED
+            if stale.update(status=status, error=error, finished_at=timezone.now(), updated_at=timezone.now()):
+                ProgressReporter(str(job.id)).update(_FINAL_STAGE[status])
+                _cleanup_files(job)
+                reclaimed += 1
+        elif stale.update(status=Job.STATUS_QUEUED, error=error, updated_at=timezone.now()):
+            ProgressReporter(str(job.id)).update('queued', attempt=job.attempts)
+            reclaimed += 1
+    if reclaimed:
+        log_info(f"중단된 실행 중 작업 {reclaimed}건 회수")
+    return reclaimed
+
+
+def _queue_sizes() -> dict:
+    return getattr(settings, 'JOB_QUEUES', DEFAULT_QUEUES)
+
+
+def _get_executor(queue: str) -> ThreadPoolExecutor:
+    global _resumed
+    with _executors_lock:
+        executor = _executors.get(queue)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=pool_size(_queue_sizes()[queue]),
+                thread_name_prefix=f"job-{queue}"
+            )
+            _executors[queue] = executor
+        first_start = not _resumed
+        _resumed = True
+
+    if first_start:
+        threading.Thread(target=_resume_in_background, daemon=True).start()
+    return executor
+
+
+def _resume_in_background():
+    try:
+        resume_pending_jobs()
+    except Exception as e:
+        log_exception(e, "대기 작업 복구 실패")
+    finally:
+        close_old_connections()
+
+
+def _dispatch(job: Job, delay: float = 0):
+    executor = _get_executor(job.queue)
+    if delay:
+        timer = threading.Timer(delay, executor.submit, args=(_run_job, job.id))
+        timer.daemon = True
+        timer.start()
+    else:
+        executor.submit(_run_job, job.id)
+
+
+def _run_job(job_id):
+    close_old_connections()
+    try:
+        # 대기 상태인 작업만 원자적으로 실행 상태로 전환 (중복 실행 방지)
+        claimed = Job.objects.filter(pk=job_id, status=Job.STATUS_QUEUED, cancel_requested=False).update(
+            status=Job.STATUS_RUNNING, started_at=timezone.now(), updated_at=timezone.now()
+        )
+        if not claimed:
+            return
+
+        job = Job.objects.get(pk=job_id)
+        job.attempts += 1
+        job.save(update_fields=['attempts', 'updated_at'])
+
+        context = JobContext(job)
+        payload = job.payload or {}
+        heartbeat_stop = threading.Event()
+        threading.Thread(target=_heartbeat, args=(job.id, heartbeat_stop), daemon=True).start()
+        try:
+            task = import_string(job.task)
+            # 작업 큐가 대기열 역할을 하므로 변환기 슬롯은 거절 없이 기다림
+            with patient_admission():
+                result = task(context, payload.get('inputs', []), **payload.get('params', {}))
+        except (JobCancelled, ProcessCancelled):
+            _finish(job, Job.STATUS_CANCELLED)
+            return
+        except Exception as e:
+            log_exception(e, f"작업 실패 ({job.task}, {job.attempts}/{job.max_attempts})")
+            job.error = str(e)
+            if Job.objects.filter(pk=job.id, cancel_requested=True).exists():
+                _finish(job, Job.STATUS_CANCELLED)
+            elif is_transient(e) and job.attempts < job.max_attempts:
+                job.status = Job.STATUS_QUEUED
+                job.save(update_fields=['status', 'error', 'updated_at'])
+                context.progress.update('queued', attempt=job.attempts)
+                _dispatch(job, delay=RETRY_BASE_DELAY * 2 ** (job.attempts - 1))
+            else:
+                _finish(job, Job.STATUS_FAILED)
+            return
+        finally:
+            heartbeat_stop.set()
+
+        job.result = result
+        job.error = ''
+        _finish(job, Job.STATUS_SUCCEEDED)
+        log_info(f"작업 완료: {job.task} ({job.id})")
+    finally:
+        close_old_connections()
+
+
+def _heartbeat(job_id, stop: threading.Event):
+    """작업이 실행되는 동안 updated_at을 주기적으로 갱신해, 살아 있는 작업이 회수되지 않게 합니다."""
+    try:
+        while not stop.wait(JOB_HEARTBEAT_INTERVAL):
+            Job.objects.filter(pk=job_id, status=Job.STATUS_RUNNING).update(updated_at=timezone.now())
+    except Exception as e:
+        log_exception(e, "작업 상태 갱신 실패")
+    finally:
+        close_old_connections()
+
+
+# 작업 최종 상태 → 진행률 단계
+_FINAL_STAGE = {
+    Job.STATUS_SUCCEEDED: 'done',
+    Job.STATUS_FAILED: 'failed',
+    Job.STATUS_CANCELLED: 'cancelled',
+}
+
+
+def _finish(job: Job, status: str):
+    ProgressReporter(str(job.id)).update(_FINAL_STAGE[status], percent=100 if status == Job.STATUS_SUCCEEDED else None)
+    job.status = status
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'finished_at', 'updated_at'])
+    _cleanup_files(job)
+
+
+def _cleanup_files(job: Job):
+    shutil.rmtree(os.path.join(JOB_FILES_DIR, str(job.id)), ignore_errors=True)
@@ -0,0 +1,13 @@
+# tools/jobs/urls.py
+
+from django.urls import path
+from .views.status import job_status, job_result, job_cancel
+from .views.progress import job_progress, job_progress_events
+
+urlpatterns = [
+    path('<uuid:job_id>/', job_status),                 # 작업 상태 조회
+    path('<uuid:job_id>/result/', job_result),          # 작업 결과 조회
+    path('<uuid:job_id>/cancel/', job_cancel),          # 작업 취소
+    path('<slug:key>/progress/', job_progress),         # 진행률 조회 (폴링)
+    path('<slug:key>/events/', job_progress_events),    # 진행률 스트림 (SSE)
+]
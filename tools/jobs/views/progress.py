@@ -0,0 +1,90 @@
+# tools/jobs/views/progress.py
+
+import json
+import time
+import asyncio
+from rest_framework.decorators import api_view
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from drf_yasg.utils import swagger_auto_schema
+from tools.common.progress import get_progress, FINAL_STAGES, PROGRESS_INTERVAL
+from tools.common.aio import ASYNC_VIEWS, run_io
+
+# SSE 연결 최대 유지 시간 (초) - 클라이언트는 끊기면 다시 연결
+SSE_MAX_DURATION = 10 * 60
+
+# 변화가 없을 때 연결 유지를 위한 주석 전송 간격 (초)
+SSE_KEEPALIVE = 15
+
+
+@swagger_auto_schema(method='get', responses={200: '현재 진행 상태', 404: '진행 정보 없음'})
+@api_view(['GET'])
+def job_progress(request, key):
+    """
+    변환 진행 상태(stage, percent 등)를 반환합니다. (폴링용)
+    key는 비동기 작업 ID 또는 동기 요청 시 보낸 progress_id입니다.
+    """
+    state = get_progress(key)
+    if state is None:
+        return JsonResponse({'error': '진행 정보가 없습니다.'}, status=404)
+    return JsonResponse(state)
+
+
+@require_GET
+def job_progress_events(request, key):
+    """
+    변환 진행 상태를 Server-Sent Events로 전달합니다.
+    상태가 바뀔 때만 이벤트를 보내고, 종료 단계(done/failed/cancelled)에 도달하면 스트림을 닫습니다.
+    ASGI(ASYNC_VIEWS)에서는 async 본문을 사용합니다. 동기 iterator 본문은 Django가 끝까지 모은 뒤에야 전송하고,
+    그동안 동기 뷰용 스레드를 sleep 루프로 붙잡기 때문입니다.
+    """
+    stream = _aevent_stream(key) if ASYNC_VIEWS else _event_stream(key)
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # 프록시(nginx) 버퍼링 비활성화
+    return response
+
+
+class _EventTracker:
+    """직전에 보낸 상태를 기억해, 새 상태마다 보낼 이벤트(또는 keep-alive)와 종료 여부를 정합니다."""
+
+    def __init__(self):
+        self.last_state = None
+        self.started = self.last_sent = time.monotonic()
+
+    def expired(self) -> bool:
+        return time.monotonic() - self.started >= SSE_MAX_DURATION
+
+    def feed(self, state) -> tuple:
+        now = time.monotonic()
+        if state is not None and state != self.last_state:
+            self.last_state = state
+            self.last_sent = now
+            return f"data: {json.dumps(state, ensure_ascii=False)}\n\n", state.get('stage') in FINAL_STAGES
+        if now - self.last_sent >= SSE_KEEPALIVE:
+            self.last_sent = now
+            return ": keep-alive\n\n", False
+        return None, False
+
+
+def _event_stream(key):
+    tracker = _EventTracker()
+    while not tracker.expired():
+        message, done = tracker.feed(get_progress(key))
+        if message:
+            yield message
+        if done:
+            return
+        time.sleep(PROGRESS_INTERVAL)
+
+
+async def _aevent_stream(key):
+    """_event_stream()의 비동기 버전 (캐시 조회는 I/O 실행기, 대기는 이벤트 루프에서)"""
+    tracker = _EventTracker()
+    while not tracker.expired():
+        message, done = tracker.feed(await run_io(get_progress, key))
+        if message:
+            yield message
+        if done:
+            return
+        await asyncio.sleep(PROGRESS_INTERVAL)
@@ -0,0 +1,47 @@
+# tools/jobs/views/status.py
+
+from rest_framework.decorators import api_view
+from django.http import JsonResponse
+from drf_yasg.utils import swagger_auto_schema
+from tools.jobs.models import Job
+from tools.jobs.services.queue import cancel_job
+
+
+@swagger_auto_schema(method='get', responses={200: '작업 상태 및 결과'})
+@api_view(['GET'])
+def job_status(request, job_id):
+    """
+    비동기 작업의 상태(queued/running/succeeded/failed/cancelled)와 결과를 반환합니다.
+    """
+    job = Job.objects.filter(pk=job_id).first()
+    if not job:
+        return JsonResponse({'error': '작업을 찾을 수 없습니다.'}, status=404)
+    return JsonResponse(job.to_dict())
+
+
+@swagger_auto_schema(method='get', responses={200: '작업 결과', 409: '아직 완료되지 않은 작업'})
+@api_view(['GET'])
+def job_result(request, job_id):
+    """
+    완료된 작업의 결과만 반환합니다. 아직 끝나지 않았으면 409를 반환합니다.
+    """
+    job = Job.objects.filter(pk=job_id).first()
+    if not job:
+        return JsonResponse({'error': '작업을 찾을 수 없습니다.'}, status=404)
+    if job.status == Job.STATUS_SUCCEEDED:
+        return JsonResponse(job.result or {})
+    if job.status in Job.FINISHED_STATUSES:
+        return JsonResponse({'error': job.error or '작업이 완료되지 않았습니다.', 'status': job.status}, status=410)
+    return JsonResponse({'status': job.status}, status=409)
+
+
+@swagger_auto_schema(method='post', responses={200: '취소 요청 후 작업 상태'})
+@api_view(['POST'])
+def job_cancel(request, job_id):
+    """
+    작업 취소를 요청합니다. 대기 중이면 즉시, 실행 중이면 다음 확인 시점에 중단됩니다.
+    """
+    if not Job.objects.filter(pk=job_id).exists():
+        return JsonResponse({'error': '작업을 찾을 수 없습니다.'}, status=404)
+    job = cancel_job(job_id)
+    return JsonResponse(job.to_dict())
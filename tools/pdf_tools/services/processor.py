@@ -0,0 +1,117 @@
+# tools/pdf_tools/services/processor.py
+
+import io
+import uuid
+from datetime import datetime
+from PyPDF2 import PdfReader, PdfWriter, PdfMerger
+from tools.pdf_tools.services.uploader import upload_pdf, aupload_pdf
+from tools.common.metrics import stage
+from tools.common.aio import run_cpu
+
+
+def make_pdf_filename() -> str:
+    """예: 20250601_123456_abcd.pdf"""
+    short_id = datetime.now().strftime('%Y%m%d_%H%M%S') + '_' + str(uuid.uuid4())[:4]
+    return f"{short_id}.pdf"
+
+
+def build_merged_pdf(files) -> io.BytesIO:
+    """여러 PDF(파일 객체 또는 경로)를 하나로 병합한 결과를 반환합니다."""
+    merger = PdfMerger()
+    with stage('decode'):
+        for f in files:
+            merger.append(f)
+
+    output_buffer = io.BytesIO()
+    with stage('encode'):
+        merger.write(output_buffer)
+    merger.close()
+    output_buffer.seek(0)
+    return output_buffer
+
+
+def build_compressed_pdf(f) -> io.BytesIO:
+    """PDF의 메타데이터를 제거하여 다시 쓴 결과를 반환합니다."""
+    with stage('decode'):
+        reader = PdfReader(f)
+        writer = PdfWriter()
+
+        for page in reader.pages:
+            writer.add_page(page)
+
+    # 압축 효과는 미미하지만, 메타데이터 제거
+    writer.add_metadata({})
+
+    output = io.BytesIO()
+    with stage('encode'):
+        writer.write(output)
+    output.seek(0)
+    return output
+
+
+def build_split_pdf(f, pages: list) -> io.BytesIO:
+    """PDF에서 지정된 페이지(0부터 시작)만 추출한 결과를 반환합니다."""
+    with stage('decode'):
+        reader = PdfReader(f)
+        writer = PdfWriter()
+
+        for i in pages:
+            if 0 <= i < len(reader.pages):
+                writer.add_page(reader.pages[i])
+
+    output_buffer = io.BytesIO()
+    with stage('encode'):
+        writer.write(output_buffer)
+    output_buffer.seek(0)
+    return output_buffer
+
+
+def merge_pdf_files(files) -> str:
+    """
+    여러 PDF(파일 객체 또는 경로)를 병합하여 업로드하고 public URL을 반환합니다.
+    """
+    return upload_pdf(
+        folder="merged",
+        filename=make_pdf_filename(),
+        content=build_merged_pdf(files).getbuffer()
+    )
+
+
+def compress_pdf_file(f) -> str:
+    """
+    PDF의 메타데이터를 제거하여 경량화한 후 업로드하고 public URL을 반환합니다.
+    """
+    return upload_pdf(
+        folder="compressed",
+        filename=make_pdf_filename(),
+        content=build_compressed_pdf(f).getbuffer()
+    )
+
+
+def split_pdf_file(f, pages: list) -> str:
+    """
+    PDF에서 지정된 페이지(0부터 시작)만 추출하여 업로드하고 public URL을 반환합니다.
+    """
+    return upload_pdf(
+        folder="split",
+        filename=make_pdf_filename(),
+        content=build_split_pdf(f, pages).getbuffer()
+    )
+
+
+async def amerge_pdf_files(files) -> str:
+    """merge_pdf_files()의 비동기 버전 (병합은 CPU 실행기, 업로드는 비동기 HTTP)"""
+    output = await run_cpu(build_merged_pdf, files)
+    return await aupload_pdf(folder="merged", filename=make_pdf_filename(), content=output.getbuffer())
+
+
+async def acompress_pdf_file(f) -> str:
+    """compress_pdf_file()의 비동기 버전"""
+    output = await run_cpu(build_compressed_pdf, f)
+    return await aupload_pdf(folder="compressed", filename=make_pdf_filename(), content=output.getbuffer())
+
+
+async def asplit_pdf_file(f, pages: list) -> str:
+    """split_pdf_file()의 비동기 버전"""
+    output = await run_cpu(build_split_pdf, f, pages)
+    return await aupload_pdf(folder="split", filename=make_pdf_filename(), content=output.getbuffer())
@@ -1,6 +1,6 @@
 # tools/pdf_tools/services/uploader.py
 
-from tools.common.storage import upload_to_supabase
+from tools.common.storage import upload_to_supabase, aupload_to_supabase
 
 def upload_pdf(
     folder: str,           # 예: "merged", "split", "compressed"
@@ -24,3 +24,14 @@ def upload_pdf(
         content=content,
         content_type="application/pdf"
     )
+
+
+async def aupload_pdf(folder: str, filename: str, content: bytes) -> str:
+    """upload_pdf()의 비동기 버전"""
+    return await aupload_to_supabase(
+        bucket="pdf-files",
+        folder=folder,
+        filename=filename,
+        content=content,
+        content_type="application/pdf"
+    )
@@ -0,0 +1,34 @@
+# tools/pdf_tools/tasks.py
+"""
+비동기 작업 큐(tools.jobs)에서 실행되는 PDF 작업 함수들입니다.
+각 함수는 task(context, inputs, **params) 형태이며 뷰의 동기 응답과 같은 결과 dict를 반환합니다.
+"""
+
+from tools.common.logging_utils import log_exception
+from tools.pdf_tools.services.processor import merge_pdf_files, compress_pdf_file, split_pdf_file
+
+
+def merge(context, inputs):
+    return {'merged_url': merge_pdf_files([item['path'] for item in inputs])}
+
+
+def compress(context, inputs, quality='medium'):
+    compressed_urls = []
+    for item in inputs:
+        context.check_cancelled()
+        try:
+            compressed_urls.append(compress_pdf_file(item['path']))
+        except Exception as e:
+            log_exception(e, f"PDF 압축 실패: {item['name']}")
+    return {'compressed_urls': compressed_urls}
+
+
+def split(context, inputs, pages):
+    split_urls = []
+    for item in inputs:
+        context.check_cancelled()
+        try:
+            split_urls.append(split_pdf_file(item['path'], pages))
+        except Exception as e:
+            log_exception(e, f"PDF 분할 실패: {item['name']}")
+    return {'split_urls': split_urls}
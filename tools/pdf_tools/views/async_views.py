@@ -0,0 +1,107 @@
+# tools/pdf_tools/views/async_views.py
+
+import os
+from django.http import JsonResponse
+from tools.common.inputs import read_input_files
+from tools.common.aio import async_tool_view, run_io, run_cpu
+from tools.common.singleflight import asingle_flight, flight_key, SingleFlightTimeout
+from tools.pdf_tools.services.processor import amerge_pdf_files, acompress_pdf_file, asplit_pdf_file, build_split_pdf
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
+from tools.common.logging_utils import log_exception
+from tools.common.zipstream import wants_bundle, azip_response
+
+
+@async_tool_view
+async def merge_pdfs(request):
+    """merge_pdfs의 비동기 버전 (ASYNC_VIEWS=True일 때 /api/pdf/merge/에 연결)"""
+    files = await read_input_files(request, 'files')
+
+    if not files or len(files) < 2:
+        return JsonResponse({'error': 'PDF 파일은 최소 2개 이상 필요합니다.'}, status=400)
+
+    # 비동기 모드: 작업 ID를 즉시 반환
+    if wants_async(request):
+        job = await run_io(submit_job, "tools.pdf_tools.tasks.merge", queue="pdf", files=files)
+        return job_accepted(job)
+
+    try:
+        key = await run_io(flight_key, "pdf-merge", files)
+        public_url = await asingle_flight(key, lambda: amerge_pdf_files(files))
+        return JsonResponse({'merged_url': public_url})
+
+    except SingleFlightTimeout as e:
+        return JsonResponse({'error': str(e)}, status=504)
+    except Exception as e:
+        log_exception(e, "Merge error")
+        return JsonResponse({'error': 'PDF 병합 중 오류 발생'}, status=500)
+
+
+@async_tool_view
+async def split_pdfs(request):
+    """split_pdfs의 비동기 버전"""
+    files = await read_input_files(request, 'files')
+    pages_str = request.POST.get('pages', '')
+
+    if not files or not pages_str:
+        return JsonResponse({'error': '파일과 pages는 필수입니다.'}, status=400)
+
+    pages = [int(p.strip()) for p in pages_str.split(',') if p.strip().isdigit()]
+
+    if wants_bundle(request):
+        if wants_async(request):
+            return JsonResponse({'error': 'bundle=zip은 async와 함께 사용할 수 없습니다.'}, status=400)
+        return azip_response(_split_entries(files, pages), "split.zip")
+
+    if wants_async(request):
+        job = await run_io(submit_job, "tools.pdf_tools.tasks.split", queue="pdf", files=files,
+                           params={'pages': pages})
+        return job_accepted(job)
+
+    split_urls = []
+
+    for f in files:
+        try:
+            key = await run_io(flight_key, "pdf-split", [f], {'pages': pages})
+            split_urls.append(await asingle_flight(key, lambda: asplit_pdf_file(f, pages)))
+        except Exception as e:
+            log_exception(e, "Split error")
+            continue
+
+    return JsonResponse({'split_urls': split_urls})
+
+
+async def _split_entries(files, pages: list):
+    for f in files:
+        try:
+            output = await run_cpu(build_split_pdf, f, pages)
+        except Exception as e:
+            log_exception(e, "Split error")
+            continue
+        yield f"{os.path.splitext(f.name)[0]}_split.pdf", output.getbuffer()
+
+
+@async_tool_view
+async def compress_pdfs(request):
+    """compress_pdfs의 비동기 버전"""
+    files = await read_input_files(request, 'files')
+    quality = request.POST.get('quality', 'medium')
+
+    if not files:
+        return JsonResponse({'error': '압축할 파일이 없습니다.'}, status=400)
+
+    if wants_async(request):
+        job = await run_io(submit_job, "tools.pdf_tools.tasks.compress", queue="pdf", files=files,
+                           params={'quality': quality})
+        return job_accepted(job)
+
+    compressed_urls = []
+
+    for f in files:
+        try:
+            key = await run_io(flight_key, "pdf-compress", [f], {'quality': quality})
+            compressed_urls.append(await asingle_flight(key, lambda: acompress_pdf_file(f)))
+        except Exception as e:
+            log_exception(e, "Compress error")
+            continue
+
+    return JsonResponse({'compressed_urls': compressed_urls})
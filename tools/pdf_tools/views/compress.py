@@ -1,15 +1,15 @@
 # tools/pdf_tools/views/compress.py
 
-import io
-import uuid
-from datetime import datetime
-from PyPDF2 import PdfReader, PdfWriter
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from tools.pdf_tools.services.uploader import upload_pdf
+from tools.common.inputs import get_input_files
+from tools.pdf_tools.services.processor import compress_pdf_file
+from tools.common.singleflight import single_flight, flight_key
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
+from tools.common.logging_utils import log_exception
 
 
 @swagger_auto_schema(
@@ -30,6 +30,13 @@ from tools.pdf_tools.services.uploader import upload_pdf
             description='압축 품질 (low, medium, high)',
             required=False,
             default='medium'
+        ),
+        openapi.Parameter(
+            name='async',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_BOOLEAN,
+            description='true면 작업 ID를 즉시 반환 (/api/jobs/<id>/로 조회)',
+            required=False
         )
     ],
     responses={200: '압축된 PDF URL 목록 반환'}
@@ -40,41 +47,28 @@ def compress_pdfs(request):
     """
     PDF 파일들의 메타데이터를 제거하여 경량화한 후 Supabase에 업로드합니다.
     """
-    files = request.FILES.getlist('files')
+    files = get_input_files(request, 'files')
     quality = request.POST.get('quality', 'medium')
 
     if not files:
         return JsonResponse({'error': '압축할 파일이 없습니다.'}, status=400)
 
+    # 비동기 모드: 작업 ID를 즉시 반환
+    if wants_async(request):
+        job = submit_job("tools.pdf_tools.tasks.compress", queue="pdf", files=files, params={'quality': quality})
+        return job_accepted(job)
+
     compressed_urls = []
 
     for f in files:
         try:
-            reader = PdfReader(f)
-            writer = PdfWriter()
-
-            for page in reader.pages:
-                writer.add_page(page)
-
-            # 압축 효과는 미미하지만, 메타데이터 제거
-            writer.add_metadata({})
-
-            output = io.BytesIO()
-            writer.write(output)
-            output.seek(0)
-
-            short_id = datetime.now().strftime('%Y%m%d_%H%M%S') + '_' + str(uuid.uuid4())[:4]
-            filename = f"{short_id}.pdf"
-
-            public_url = upload_pdf(
-                folder="compressed",
-                filename=filename,
-                content=output.getbuffer()
+            public_url = single_flight(
+                flight_key("pdf-compress", [f], {'quality': quality}), lambda: compress_pdf_file(f)
             )
             compressed_urls.append(public_url)
 
         except Exception as e:
-            print("Compress error:", e)
+            log_exception(e, "Compress error")
             continue
 
     return JsonResponse({'compressed_urls': compressed_urls})
@@ -10,7 +10,9 @@ from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
 from tools.pdf_tools.services.uploader import upload_pdf
+from tools.common.logging_utils import log_exception
 
 
 @swagger_auto_schema(
@@ -47,7 +49,7 @@ def encrypt_or_decrypt_pdfs(request):
     """
     PDF 파일에 암호를 설정하거나 해제하여 Supabase에 업로드합니다.
     """
-    files = request.FILES.getlist('files')
+    files = get_input_files(request, 'files')
     mode = request.POST.get('mode')
     password = request.POST.get('password')
 
@@ -95,7 +97,7 @@ def encrypt_or_decrypt_pdfs(request):
         except PdfReadError:
             return JsonResponse({'error': f'PDF 읽기 오류: {f.name}'}, status=400)
         except Exception as e:
-            print("Encrypt/Decrypt error:", e)
+            log_exception(e, "Encrypt/Decrypt error")
             continue
 
     return JsonResponse({'result_urls': result_urls})
@@ -5,6 +5,7 @@ from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_file
 from tools.pdf_tools.services.extractor import extract_text_from_pdf
 
 @swagger_auto_schema(
@@ -26,7 +27,7 @@ def extract_text(request):
     """
     업로드된 PDF 파일에서 텍스트를 추출하여 반환합니다.
     """
-    uploaded_file = request.FILES.get('file')
+    uploaded_file = get_input_file(request, 'file')
     if not uploaded_file:
         return JsonResponse({'error': '파일이 없습니다.'}, status=400)
 
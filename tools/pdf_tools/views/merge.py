@@ -1,15 +1,15 @@
 # tools/pdf_tools/views/merge.py
 
-import io
-import uuid
-from datetime import datetime
-from PyPDF2 import PdfMerger
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from tools.pdf_tools.services.uploader import upload_pdf
+from tools.common.inputs import get_input_files
+from tools.pdf_tools.services.processor import merge_pdf_files
+from tools.common.singleflight import single_flight, flight_key, SingleFlightTimeout
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
+from tools.common.logging_utils import log_exception
 
 
 @swagger_auto_schema(
@@ -22,6 +22,13 @@ from tools.pdf_tools.services.uploader import upload_pdf
             description='병합할 PDF 파일들 (최소 2개)',
             required=True,
             multiple=True
+        ),
+        openapi.Parameter(
+            name='async',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_BOOLEAN,
+            description='true면 작업 ID를 즉시 반환 (/api/jobs/<id>/로 조회)',
+            required=False
         )
     ],
     responses={200: '병합된 PDF 파일의 URL 반환'}
@@ -32,35 +39,24 @@ def merge_pdfs(request):
     """
     업로드된 여러 PDF 파일을 병합하여 Supabase에 저장하고 URL을 반환합니다.
     """
-    files = request.FILES.getlist('files')
+    files = get_input_files(request, 'files')
 
     if not files or len(files) < 2:
         return JsonResponse({'error': 'PDF 파일은 최소 2개 이상 필요합니다.'}, status=400)
 
-    try:
-        # PDF 병합
-        merger = PdfMerger()
-        for f in files:
-            merger.append(f)
-
-        output_buffer = io.BytesIO()
-        merger.write(output_buffer)
-        merger.close()
-        output_buffer.seek(0)
+    # 비동기 모드: 작업 ID를 즉시 반환
+    if wants_async(request):
+        job = submit_job("tools.pdf_tools.tasks.merge", queue="pdf", files=files)
+        return job_accepted(job)
 
-        # 파일명 생성
-        short_id = datetime.now().strftime('%Y%m%d_%H%M%S') + '_' + str(uuid.uuid4())[:4]
-        filename = f"{short_id}.pdf"
-
-        # Supabase 업로드
-        public_url = upload_pdf(
-            folder="merged",
-            filename=filename,
-            content=output_buffer.getbuffer()
-        )
+    try:
+        # PDF 병합 후 Supabase 업로드 (같은 파일 조합의 동시 요청은 한 번만 병합)
+        public_url = single_flight(flight_key("pdf-merge", files), lambda: merge_pdf_files(files))
 
         return JsonResponse({'merged_url': public_url})
 
+    except SingleFlightTimeout as e:
+        return JsonResponse({'error': str(e)}, status=504)
     except Exception as e:
-        print("Merge error:", e)
+        log_exception(e, "Merge error")
         return JsonResponse({'error': 'PDF 병합 중 오류 발생'}, status=500)
@@ -9,7 +9,9 @@ from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from tools.common.inputs import get_input_files
 from tools.pdf_tools.services.uploader import upload_pdf
+from tools.common.logging_utils import log_exception
 
 
 @swagger_auto_schema(
@@ -46,7 +48,7 @@ def rotate_or_delete_pdfs(request):
     """
     각 PDF 파일에 대해 페이지 회전 또는 삭제를 적용하고 Supabase에 업로드합니다.
     """
-    files = request.FILES.getlist('files')
+    files = get_input_files(request, 'files')
     rotate = request.POST.get('rotate')
     delete_pages_str = request.POST.get('delete_pages', '')
 
@@ -98,7 +100,7 @@ def rotate_or_delete_pdfs(request):
             processed_urls.append(public_url)
 
         except Exception as e:
-            print("Rotate/Delete error:", e)
+            log_exception(e, "Rotate/Delete error")
             continue
 
     return JsonResponse({'processed_urls': processed_urls})
@@ -1,15 +1,17 @@
 # tools/pdf_tools/views/split.py
 
-import io
-import uuid
-from datetime import datetime
-from PyPDF2 import PdfReader, PdfWriter
+import os
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser
 from django.http import JsonResponse
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from tools.pdf_tools.services.uploader import upload_pdf
+from tools.common.inputs import get_input_files
+from tools.common.singleflight import single_flight, flight_key
+from tools.common.zipstream import wants_bundle, zip_response
+from tools.pdf_tools.services.processor import split_pdf_file, build_split_pdf
+from tools.jobs.services.queue import wants_async, submit_job, job_accepted
+from tools.common.logging_utils import log_exception
 
 
 @swagger_auto_schema(
@@ -29,17 +31,32 @@ from tools.pdf_tools.services.uploader import upload_pdf
             type=openapi.TYPE_STRING,
             description='분할할 페이지 번호 (예: "0,2")',
             required=True
+        ),
+        openapi.Parameter(
+            name='async',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_BOOLEAN,
+            description='true면 작업 ID를 즉시 반환 (/api/jobs/<id>/로 조회)',
+            required=False
+        ),
+        openapi.Parameter(
+            name='bundle',
+            in_=openapi.IN_FORM,
+            type=openapi.TYPE_STRING,
+            description='zip이면 URL 목록 대신 분할 결과를 ZIP으로 스트리밍',
+            required=False
         )
     ],
-    responses={200: '분할된 PDF URL 목록 반환'}
+    responses={200: '분할된 PDF URL 목록 반환 (bundle=zip이면 ZIP 파일)'}
 )
 @api_view(['POST'])
 @parser_classes([MultiPartParser])
 def split_pdfs(request):
     """
     업로드된 PDF 파일들에서 지정된 페이지만 추출하여 Supabase에 업로드합니다.
+    bundle=zip이면 업로드 없이 추출 결과를 파일마다 ZIP에 담아 스트리밍합니다.
     """
-    files = request.FILES.getlist('files')
+    files = get_input_files(request, 'files')
     pages_str = request.POST.get('pages', '')
 
     if not files or not pages_str:
@@ -50,33 +67,38 @@ def split_pdfs(request):
     except Exception:
         return JsonResponse({'error': 'pages 형식이 잘못되었습니다. 예: "0,2"'}, status=400)
 
+    if wants_bundle(request):
+        if wants_async(request):
+            return JsonResponse({'error': 'bundle=zip은 async와 함께 사용할 수 없습니다.'}, status=400)
+        return zip_response(_split_entries(files, pages), "split.zip")
+
+    # 비동기 모드: 작업 ID를 즉시 반환
+    if wants_async(request):
+        job = submit_job("tools.pdf_tools.tasks.split", queue="pdf", files=files, params={'pages': pages})
+        return job_accepted(job)
+
     split_urls = []
 
     for f in files:
         try:
-            reader = PdfReader(f)
-            writer = PdfWriter()
-
-            for i in pages:
-                if 0 <= i < len(reader.pages):
-                    writer.add_page(reader.pages[i])
-
-            output_buffer = io.BytesIO()
-            writer.write(output_buffer)
-            output_buffer.seek(0)
-
-            short_id = datetime.now().strftime('%Y%m%d_%H%M%S') + '_' + str(uuid.uuid4())[:4]
-            filename = f"{short_id}.pdf"
-
-            public_url = upload_pdf(
-                folder="split",
-                filename=filename,
-                content=output_buffer.getbuffer()
+            public_url = single_flight(
+                flight_key("pdf-split", [f], {'pages': pages}), lambda: split_pdf_file(f, pages)
             )
             split_urls.append(public_url)
 
         except Exception as e:
-            print("Split error:", e)
+            log_exception(e, "Split error")
             continue
 
     return JsonResponse({'split_urls': split_urls})
+
+
+def _split_entries(files, pages: list):
+    """추출 결과를 (ZIP 항목 이름, PDF 데이터) 순서로 내보냅니다. 실패한 파일은 건너뜁니다."""
+    for f in files:
+        try:
+            output = build_split_pdf(f, pages)
+        except Exception as e:
+            log_exception(e, "Split error")
+            continue
+        yield f"{os.path.splitext(f.name)[0]}_split.pdf", output.getbuffer()
@@ -0,0 +1,212 @@
+# tools/uploads/services/direct.py
+
+import os
+import re
+import json
+import time
+import uuid
+import fcntl
+import hashlib
+import tempfile
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from tools.common.storage import create_signed_upload_url, download_from_supabase
+from tools.common.httpclient import StorageRequestError, StorageObjectTooLarge
+from tools.common.upload_handlers import sniff_content_type, SNIFF_BYTES
+from tools.uploads.services.sessions import UploadSessionError, MAX_UPLOAD_SIZE
+
+# 클라이언트가 직접 업로드하는 비공개 버킷
+DIRECT_UPLOAD_BUCKET = getattr(settings, 'DIRECT_UPLOAD_BUCKET', 'incoming')
+
+# 저장소에서 내려받은 입력을 보관하는 디렉터리 (같은 object_key를 여러 도구에서 쓸 때 다시 받지 않음)
+DIRECT_UPLOAD_CACHE_DIR = getattr(
+    settings, 'DIRECT_UPLOAD_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'filepick-direct')
+)
+
+# 내려받은 입력 보관 시간 (초) - 마지막 사용 이후 이 시간이 지나면 삭제
+DIRECT_UPLOAD_CACHE_TTL = getattr(settings, 'DIRECT_UPLOAD_CACHE_TTL', 60 * 60)
+
+# Supabase 서명된 업로드 URL의 유효 시간 (초, 서버 고정값)
+SIGNED_UPLOAD_EXPIRES_IN = 2 * 60 * 60
+
+# object_key 형식: <32자리 hex>/<파일명>
+_KEY_PATTERN = re.compile(r'^[0-9a-f]{32}/[^/\\]{1,255}$')
+
+
+def create_direct_upload(filename: str, size: int = None, content_type: str = '') -> dict:
+    """
+    클라이언트가 저장소에 직접 올릴 object_key와 서명된 업로드 URL을 발급합니다.
+    size는 선택이며, 주면 MAX_UPLOAD_SIZE를 넘는 요청을 미리 거절합니다 (실제 크기는 내려받을 때 다시 검사).
+    """
+    if size is not None and (size < 0 or size > MAX_UPLOAD_SIZE):
+        raise UploadSessionError('size가 허용 범위를 벗어났습니다.', status=413)
+
+    name = os.path.basename((filename or '').replace('\\', '/'))[:255] or 'upload'
+    object_key = f"{uuid.uuid4().hex}/{name}"
+    try:
+        upload_url = create_signed_upload_url(DIRECT_UPLOAD_BUCKET, object_key)
+    except StorageRequestError as e:
+        raise UploadSessionError(f'업로드 URL 발급 실패: {e}', status=e.status if e.status == 501 else 502)
+
+    return {
+        'object_key': object_key,
+        'upload_url': upload_url,
+        'method': 'PUT',
+        # x-upsert를 보내지 않으므로 같은 object_key에 다시 올리면 저장소가 거절 (도구가 읽은 뒤 내용이 바뀌지 않음)
+        'headers': {'Content-Type': content_type or 'application/octet-stream'},
+        'expires_in': SIGNED_UPLOAD_EXPIRES_IN,
+    }
+
+
+def _paths(object_key: str) -> tuple:
+    if not _KEY_PATTERN.match(object_key or ''):
+        raise UploadSessionError('object_key 형식이 잘못되었습니다.', status=400)
+    digest = hashlib.sha256(object_key.encode('utf-8')).hexdigest()[:32]
+    base = os.path.join(DIRECT_UPLOAD_CACHE_DIR, digest)
+    return base + '.data', base + '.json', base + '.lock'
+
+
+def _read_meta(meta_path: str):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_meta(meta_path: str, meta: dict):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(meta_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _lock(lock_path: str):
+    """
+    lock_path에 배타 잠금을 건 파일 객체를 반환합니다.
+    잠금을 기다리는 동안 purge_expired_downloads()가 잠금 파일을 지웠으면(경로가 다른 inode를 가리킴)
+    지워진 파일의 잠금은 다른 프로세스와 공유되지 않으므로 새 파일을 열어 다시 잠급니다.
+    """
+    while True:
+        lock = open(lock_path, 'a')
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if os.fstat(lock.fileno()).st_ino == os.stat(lock_path).st_ino:
+                return lock
+        except FileNotFoundError:
+            pass
+        lock.close()
+
+
+def _fetch(object_key: str, data_path: str) -> dict:
+    """object_key를 임시 파일로 내려받은 뒤 data_path로 옮기고 메타데이터를 반환합니다."""
+    tmp_path = data_path + '.part'
+    try:
+        with open(tmp_path, 'wb') as f:
+            size = download_from_supabase(DIRECT_UPLOAD_BUCKET, object_key, f, max_bytes=MAX_UPLOAD_SIZE)
+        with open(tmp_path, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+        os.replace(tmp_path, data_path)
+    except StorageObjectTooLarge as e:
+        raise UploadSessionError(str(e), status=413)
+    except StorageRequestError as e:
+        # Supabase는 없는 객체에 400({"statusCode": "404"})을 반환하기도 함
+        if e.status in (400, 404):
+            raise UploadSessionError('업로드된 객체를 찾을 수 없습니다.', status=404)
+        raise UploadSessionError(f'업로드된 객체를 가져오지 못했습니다: {e}', status=502)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    filename = object_key.split('/', 1)[1]
+    return {
+        'object_key': object_key,
+        'filename': filename,
+        'length': size,
+        'sniffed_content_type': sniff_content_type(head, filename) if head else None,
+    }
+
+
+class DirectUploadedFile(UploadedFile):
+    """
+    저장소에서 내려받은 직접 업로드 입력을 일반 업로드 파일처럼 다룰 수 있게 감싼 객체입니다.
+    temporary_file_path()로 캐시 파일 경로를 그대로 제공하므로 도구 뷰에서 추가 복사가 없습니다.
+    """
+
+    def __init__(self, meta: dict, data_path: str):
+        super().__init__(
+            file=open(data_path, 'rb'),
+            name=meta['filename'],
+            content_type=meta['sniffed_content_type'] or 'application/octet-stream',
+            size=meta['length'],
+        )
+        self.object_key = meta['object_key']
+        self.sniffed_content_type = meta['sniffed_content_type']
+        self._data_path = data_path
+
+    def temporary_file_path(self):
+        return self._data_path
+
+
+def open_direct_upload(object_key: str) -> DirectUploadedFile:
+    """
+    클라이언트가 직접 올린 객체를 로컬 디스크로 스트리밍해 파일 객체로 엽니다.
+    같은 object_key를 동시에 요청하면 파일 잠금으로 한 번만 내려받고, 이미 받은 객체는 만료 전까지 재사용합니다.
+    """
+    data_path, meta_path, lock_path = _paths(object_key)
+    purge_expired_downloads()
+    os.makedirs(DIRECT_UPLOAD_CACHE_DIR, exist_ok=True)
+
+    with _lock(lock_path) as lock:
+        try:
+            meta = _read_meta(meta_path)
+            if meta is None or meta.get('object_key') != object_key or not os.path.exists(data_path):
+                meta = _fetch(object_key, data_path)
+            meta['expires_at'] = time.time() + DIRECT_UPLOAD_CACHE_TTL
+            _write_meta(meta_path, meta)
+            return DirectUploadedFile(meta, data_path)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def purge_expired_downloads():
+    """
+    보관 시간이 지난 내려받은 입력을 삭제합니다.
+    항목의 잠금 파일을 기다리지 않고(LOCK_NB) 잠가 본 뒤 삭제하며, 다른 요청이 내려받거나 사용을 연장하는 중이면 건너뜁니다.
+    """
+    if not os.path.isdir(DIRECT_UPLOAD_CACHE_DIR):
+        return
+    now = time.time()
+    for name in os.listdir(DIRECT_UPLOAD_CACHE_DIR):
+        if not name.endswith('.json'):
+            continue
+        meta = _read_meta(os.path.join(DIRECT_UPLOAD_CACHE_DIR, name))
+        if meta is None or meta.get('expires_at', 0) >= now:
+            continue
+        base = os.path.join(DIRECT_UPLOAD_CACHE_DIR, name[:-5])
+        try:
+            lock = open(base + '.lock', 'a')
+        except OSError:
+            continue
+        with lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue  # 사용 중인 항목은 다음 정리 때 다시 확인
+            # 목록을 읽은 뒤 잠그기 전에 사용이 연장되었을 수 있으므로 잠근 상태에서 다시 확인
+            meta = _read_meta(base + '.json')
+            if meta is not None and meta.get('expires_at', 0) >= now:
+                continue
+            # 잠금 파일은 잠근 채로 마지막에 삭제 (기다리던 요청은 _lock()에서 새 잠금 파일로 다시 잠금)
+            for path in (base + '.data', base + '.json', base + '.lock'):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,259 @@
+# tools/uploads/services/sessions.py
+
+import os
+import re
+import json
+import time
+import uuid
+import fcntl
+import hashlib
+import tempfile
+import threading
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from tools.common.upload_handlers import sniff_content_type, SNIFF_BYTES
+
+# 재개 가능한 업로드 보관 디렉터리
+UPLOAD_SESSION_DIR = getattr(
+    settings, 'RESUMABLE_UPLOAD_DIR', os.path.join(tempfile.gettempdir(), 'filepick-uploads')
+)
+
+# 업로드 세션 보관 시간 (초) - 마지막 기록 이후 이 시간이 지나면 만료
+UPLOAD_SESSION_TTL = getattr(settings, 'RESUMABLE_UPLOAD_TTL', 24 * 60 * 60)
+
+# 업로드 하나의 최대 크기
+MAX_UPLOAD_SIZE = getattr(settings, 'RESUMABLE_UPLOAD_MAX_SIZE', 10 * 1024 ** 3)
+
+# 요청 본문을 읽어 기록하는 단위
+CHUNK_SIZE = 256 * 1024
+
+_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# 전송 중인 업로드의 BLAKE2b 상태 (upload_id → (다음 오프셋, hasher))
+# hashlib 상태는 파일에 저장할 수 없으므로, 같은 프로세스로 이어지는 PATCH만 이어서 계산하고
+# 다른 워커가 받은 청크가 섞이면 완료 시점에 데이터 파일을 한 번 읽어 계산합니다.
+_hashers = {}
+_hashers_lock = threading.Lock()
+
+
+class UploadSessionError(Exception):
+    """업로드 세션 처리 실패 (status: 응답할 HTTP 상태 코드)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _paths(upload_id: str) -> tuple:
+    if not _ID_PATTERN.match(upload_id or ''):
+        raise UploadSessionError('업로드를 찾을 수 없습니다.', status=404)
+    base = os.path.join(UPLOAD_SESSION_DIR, upload_id)
+    return base + '.part', base + '.json'
+
+
+def _take_hasher(upload_id: str, offset: int):
+    """offset부터 이어서 갱신할 hasher를 반환합니다. 이 프로세스가 앞부분을 모두 보지 못했으면 None."""
+    with _hashers_lock:
+        saved = _hashers.pop(upload_id, None)
+    if offset == 0:
+        return hashlib.blake2b(digest_size=32)
+    if saved and saved[0] == offset:
+        return saved[1]
+    return None
+
+
+def _file_hash(data_path: str) -> str:
+    hasher = hashlib.blake2b(digest_size=32)
+    with open(data_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _write_meta(meta_path: str, meta: dict):
+    # 요청마다 고유한 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않고, 동시 기록이 서로의 임시 파일을 덮어쓰지 않도록 함
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(meta_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def create_session(length: int, filename: str, content_type: str = '') -> dict:
+    """
+    새 업로드 세션을 만들고 메타데이터를 반환합니다.
+    데이터 파일은 빈 파일로 만들어 두고 이후 PATCH 청크를 이어 붙입니다.
+    """
+    if length < 0 or length > MAX_UPLOAD_SIZE:
+        raise UploadSessionError('Upload-Length가 허용 범위를 벗어났습니다.', status=413)
+
+    purge_expired_sessions()
+    os.makedirs(UPLOAD_SESSION_DIR, exist_ok=True)
+
+    upload_id = uuid.uuid4().hex
+    data_path, meta_path = _paths(upload_id)
+    open(data_path, 'wb').close()
+
+    now = time.time()
+    meta = {
+        'upload_id': upload_id,
+        'length': length,
+        'filename': os.path.basename(filename or upload_id),
+        'content_type': content_type or 'application/octet-stream',
+        'sniffed_content_type': None,
+        'created_at': now,
+        'expires_at': now + UPLOAD_SESSION_TTL,
+    }
+    _write_meta(meta_path, meta)
+    return dict(meta, offset=0)
+
+
+def get_session(upload_id: str) -> dict:
+    """세션 메타데이터와 현재 오프셋(받은 바이트 수)을 반환합니다."""
+    data_path, meta_path = _paths(upload_id)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        offset = os.path.getsize(data_path)
+    except (FileNotFoundError, ValueError):
+        raise UploadSessionError('업로드를 찾을 수 없습니다.', status=404)
+
+    if meta['expires_at'] < time.time():
+        delete_session(upload_id)
+        raise UploadSessionError('만료된 업로드입니다.', status=410)
+    return dict(meta, offset=offset)
+
+
+def append_chunk(upload_id: str, offset: int, stream, content_length: int) -> int:
+    """
+    요청 본문(stream)을 데이터 파일 끝에 이어 붙이고 새 오프셋을 반환합니다.
+
+    이어 붙이기만 하므로 완료 후 재조립 복사가 없습니다. 같은 세션의 동시 PATCH는 파일 잠금으로 직렬화되며,
+    클라이언트의 offset이 서버의 현재 크기와 다르면 409를 발생시킵니다.
+    전송이 중간에 끊겨도 받은 바이트까지는 보존되어 HEAD로 확인 후 이어서 보낼 수 있습니다.
+    기록하면서 BLAKE2b 해시를 함께 계산하고, 업로드가 완료되면 메타데이터에 content_hash로 저장합니다.
+    메타데이터는 잠금을 잡은 상태에서 다시 읽고 기록하므로 동시 PATCH가 서로의 변경을 덮어쓰지 않습니다.
+    """
+    data_path, meta_path = _paths(upload_id)
+    # 없는 세션이면 데이터 파일을 새로 만들기 전에 404/410
+    get_session(upload_id)
+
+    with open(data_path, 'ab') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            meta = get_session(upload_id)
+            current = os.fstat(f.fileno()).st_size
+            if offset != current:
+                raise UploadSessionError('Upload-Offset이 일치하지 않습니다.', status=409)
+            if current + content_length > meta['length']:
+                raise UploadSessionError('Upload-Length를 초과하는 데이터입니다.', status=413)
+
+            head = b""
+            hasher = _take_hasher(upload_id, current)
+            remaining = content_length
+            while remaining > 0:
+                chunk = stream.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                f.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                if current == 0 and len(head) < SNIFF_BYTES:
+                    head += chunk[:SNIFF_BYTES - len(head)]
+                remaining -= len(chunk)
+            f.flush()
+            new_offset = os.fstat(f.fileno()).st_size
+
+            if new_offset == meta['length']:
+                meta['content_hash'] = hasher.hexdigest() if hasher is not None else _file_hash(data_path)
+            elif hasher is not None:
+                with _hashers_lock:
+                    _hashers[upload_id] = (new_offset, hasher)
+
+            # 마지막 기록 시점 기준으로 만료 연장, 첫 청크에서 MIME 판별
+            if head:
+                meta['sniffed_content_type'] = sniff_content_type(head, meta['filename'])
+            meta['expires_at'] = time.time() + UPLOAD_SESSION_TTL
+            meta.pop('offset', None)
+            _write_meta(meta_path, meta)
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+    return new_offset
+
+
+def delete_session(upload_id: str):
+    with _hashers_lock:
+        _hashers.pop(upload_id, None)
+    for path in _paths(upload_id):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def purge_expired_sessions():
+    """만료된 세션의 데이터/메타데이터 파일을 삭제합니다."""
+    if not os.path.isdir(UPLOAD_SESSION_DIR):
+        return
+    now = time.time()
+    for name in os.listdir(UPLOAD_SESSION_DIR):
+        if not name.endswith('.json'):
+            continue
+        upload_id = name[:-5]
+        try:
+            with open(os.path.join(UPLOAD_SESSION_DIR, name)) as f:
+                expired = json.load(f)['expires_at'] < now
+        except (OSError, ValueError, KeyError):
+            continue
+        if expired:
+            delete_session(upload_id)
+
+
+class ResumableUploadedFile(UploadedFile):
+    """
+    완료된 재개 가능 업로드를 일반 업로드 파일처럼 다룰 수 있게 감싼 객체입니다.
+    temporary_file_path()로 데이터 파일 경로를 그대로 제공하므로 도구 뷰에서 추가 복사가 없습니다.
+    닫아도 세션 파일은 유지되어 만료 전까지 다른 도구에서도 재사용할 수 있습니다.
+    파일은 처음 읽을 때 열며(경로만 쓰는 도구는 파일 디스크립터를 열지 않음), content_hash는 업로드 중 계산한 값을 제공합니다.
+    """
+
+    def __init__(self, meta: dict, data_path: str):
+        self._data_path = data_path
+        super().__init__(
+            file=None,
+            name=meta['filename'],
+            content_type=meta['content_type'],
+            size=meta['length'],
+        )
+        self.upload_id = meta['upload_id']
+        self.sniffed_content_type = meta.get('sniffed_content_type')
+        self.content_hash = meta.get('content_hash')
+
+    @property
+    def file(self):
+        if self._file is None:
+            self._file = open(self._data_path, 'rb')
+        return self._file
+
+    @file.setter
+    def file(self, value):
+        self._file = value
+
+    def temporary_file_path(self):
+        return self._data_path
+
+
+def open_completed_upload(upload_id: str) -> ResumableUploadedFile:
+    """완료된 업로드를 파일 객체로 엽니다. 아직 전송 중이면 409를 발생시킵니다."""
+    meta = get_session(upload_id)
+    if meta['offset'] != meta['length']:
+        raise UploadSessionError('업로드가 아직 완료되지 않았습니다.', status=409)
+    data_path, _ = _paths(upload_id)
+    return ResumableUploadedFile(meta, data_path)
@@ -0,0 +1,11 @@
+# tools/uploads/urls.py
+
+from django.urls import path
+from .views.resumable import create_upload, upload_detail
+from .views.direct import create_direct
+
+urlpatterns = [
+    path('', create_upload),                        # 업로드 생성 (POST)
+    path('direct/', create_direct),                 # 저장소 직접 업로드 URL 발급 (POST)
+    path('<str:upload_id>/', upload_detail),        # 청크 전송(PATCH) / 진행 확인(HEAD) / 취소(DELETE)
+]
@@ -0,0 +1,44 @@
+# tools/uploads/views/direct.py
+
+import json
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from tools.uploads.services.sessions import UploadSessionError
+from tools.uploads.services.direct import create_direct_upload
+
+
+@csrf_exempt
+@require_POST
+def create_direct(request):
+    """
+    저장소 직접 업로드용 서명된 URL을 발급합니다.
+    요청(JSON 또는 form): filename(필수), size(선택, 바이트), content_type(선택)
+
+    클라이언트는 응답의 upload_url로 파일 본문을 PUT한 뒤, 도구 API를 파일 대신 object_key로 호출합니다.
+    (예: POST /api/convert/mov-to-mp4/ object_key=<object_key>)
+    """
+    if request.content_type == 'application/json':
+        try:
+            params = json.loads(request.body or b'{}')
+        except ValueError:
+            return JsonResponse({'error': 'JSON 본문 형식이 잘못되었습니다.'}, status=400)
+    else:
+        params = request.POST
+
+    filename = params.get('filename')
+    if not filename:
+        return JsonResponse({'error': 'filename은 필수입니다.'}, status=400)
+    try:
+        size = int(params['size']) if params.get('size') not in (None, '') else None
+    except (TypeError, ValueError):
+        return JsonResponse({'error': 'size는 정수여야 합니다.'}, status=400)
+
+    try:
+        upload = create_direct_upload(filename, size, params.get('content_type', ''))
+    except UploadSessionError as e:
+        return JsonResponse({'error': str(e)}, status=e.status)
+
+    response = JsonResponse(upload, status=201)
+    response['Cache-Control'] = 'no-store'
+    return response
@@ -0,0 +1,114 @@
+# tools/uploads/views/resumable.py
+
+import base64
+from datetime import datetime, timezone
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from tools.uploads.services.sessions import (
+    UploadSessionError, MAX_UPLOAD_SIZE,
+    create_session, get_session, append_chunk, delete_session
+)
+
+TUS_VERSION = '1.0.0'
+
+
+def _tus_response(response):
+    response['Tus-Resumable'] = TUS_VERSION
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+def _error(e: UploadSessionError):
+    return _tus_response(JsonResponse({'error': str(e)}, status=e.status))
+
+
+def _expires_header(expires_at: float) -> str:
+    return datetime.fromtimestamp(expires_at, tz=timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
+
+
+def _parse_metadata(header: str) -> dict:
+    """tus Upload-Metadata 헤더 파싱 (예: "filename d29ybGQudHh0,filetype dGV4dC9wbGFpbg==")"""
+    metadata = {}
+    for pair in filter(None, (p.strip() for p in header.split(','))):
+        key, _, value = pair.partition(' ')
+        try:
+            metadata[key] = base64.b64decode(value).decode('utf-8') if value else ''
+        except ValueError:
+            continue
+    return metadata
+
+
+@csrf_exempt
+@require_http_methods(['POST', 'OPTIONS'])
+def create_upload(request):
+    """
+    재개 가능한 업로드를 생성합니다 (tus creation).
+    헤더: Upload-Length(전체 크기), Upload-Metadata(선택, filename/filetype)
+    응답 Location으로 PATCH(청크 전송), HEAD(진행 확인), DELETE(취소)를 보냅니다.
+    """
+    if request.method == 'OPTIONS':
+        response = HttpResponse(status=204)
+        response['Tus-Version'] = TUS_VERSION
+        response['Tus-Max-Size'] = str(MAX_UPLOAD_SIZE)
+        response['Tus-Extension'] = 'creation,termination,expiration'
+        return _tus_response(response)
+
+    try:
+        length = int(request.headers.get('Upload-Length', ''))
+    except ValueError:
+        return _tus_response(JsonResponse({'error': 'Upload-Length 헤더가 필요합니다.'}, status=400))
+
+    metadata = _parse_metadata(request.headers.get('Upload-Metadata', ''))
+    try:
+        session = create_session(length, metadata.get('filename', ''), metadata.get('filetype', ''))
+    except UploadSessionError as e:
+        return _error(e)
+
+    location = f"/api/uploads/{session['upload_id']}/"
+    response = JsonResponse({'upload_id': session['upload_id'], 'location': location}, status=201)
+    response['Location'] = location
+    response['Upload-Expires'] = _expires_header(session['expires_at'])
+    return _tus_response(response)
+
+
+@csrf_exempt
+@require_http_methods(['HEAD', 'PATCH', 'DELETE'])
+def upload_detail(request, upload_id):
+    """
+    HEAD: 현재 Upload-Offset 조회 / PATCH: Upload-Offset 위치에 청크 이어 붙이기 / DELETE: 업로드 취소
+    """
+    try:
+        if request.method == 'DELETE':
+            get_session(upload_id)
+            delete_session(upload_id)
+            return _tus_response(HttpResponse(status=204))
+
+        if request.method == 'HEAD':
+            session = get_session(upload_id)
+            response = HttpResponse(status=200)
+            response['Upload-Offset'] = str(session['offset'])
+            response['Upload-Length'] = str(session['length'])
+            response['Upload-Expires'] = _expires_header(session['expires_at'])
+            return _tus_response(response)
+
+        # PATCH
+        if request.content_type != 'application/offset+octet-stream':
+            return _tus_response(JsonResponse(
+                {'error': 'Content-Type은 application/offset+octet-stream이어야 합니다.'}, status=415
+            ))
+        try:
+            offset = int(request.headers.get('Upload-Offset', ''))
+            content_length = int(request.headers.get('Content-Length', 0))
+        except ValueError:
+            return _tus_response(JsonResponse({'error': 'Upload-Offset 헤더가 필요합니다.'}, status=400))
+
+        new_offset = append_chunk(upload_id, offset, request, content_length)
+        session = get_session(upload_id)
+        response = HttpResponse(status=204)
+        response['Upload-Offset'] = str(new_offset)
+        response['Upload-Expires'] = _expires_header(session['expires_at'])
+        return _tus_response(response)
+
+    except UploadSessionError as e:
+        return _error(e)